@@ -0,0 +1,188 @@
+"""Benchmarks for the properties and queries of ``kedro.pipeline.Pipeline``.
+
+Run them with ``asv run`` or ``asv dev`` from the repository root.
+"""
+import random
+
+from kedro.pipeline import node, pipeline
+
+NODE_COUNTS = [1000, 10000]
+
+
+def _identity(*args):
+    return args[0]
+
+
+def _layered_nodes(node_count: int, width: int = 10):
+    """The nodes of ``width`` parallel chains, where every node also reads
+    the shared free input.
+    """
+    nodes = []
+    for index in range(node_count):
+        chain, depth = index % width, index // width
+        upstream = f"ds_{chain}_{depth - 1}" if depth else "source"
+        nodes.append(
+            node(
+                _identity,
+                [upstream, "source"],
+                f"ds_{chain}_{depth}",
+                name=f"node_{chain}_{depth}",
+            )
+        )
+    return nodes
+
+
+def _random_dag_nodes(node_count: int, fan_in: int = 2, seed: int = 0):
+    """The nodes of a random DAG, where every node reads the outputs of up to
+    ``fan_in`` earlier nodes.
+    """
+    rng = random.Random(seed)
+    nodes = []
+    for index in range(node_count):
+        upstream = (
+            {f"ds_{rng.randrange(index)}" for _ in range(fan_in)} if index else set()
+        )
+        nodes.append(
+            node(
+                _identity,
+                sorted(upstream) or "source",
+                f"ds_{index}",
+                name=f"node_{index}",
+            )
+        )
+    rng.shuffle(nodes)
+    return nodes
+
+
+class TimePipelineProperties:
+    params = NODE_COUNTS
+    param_names = ["node_count"]
+    timeout = 300
+
+    def setup(self, node_count):
+        self.nodes = _layered_nodes(node_count)
+        self.pipeline = pipeline(self.nodes)
+        # the first access computes the index of the pipeline
+        self.pipeline.nodes
+
+    def time_construct(self, node_count):
+        pipeline(self.nodes)
+
+    def time_nodes(self, node_count):
+        self.pipeline.nodes
+
+    def time_grouped_nodes(self, node_count):
+        self.pipeline.grouped_nodes
+
+    def time_node_dependencies(self, node_count):
+        self.pipeline.node_dependencies
+
+    def time_all_inputs(self, node_count):
+        self.pipeline.all_inputs()
+
+    def time_all_outputs(self, node_count):
+        self.pipeline.all_outputs()
+
+    def time_inputs(self, node_count):
+        self.pipeline.inputs()
+
+    def time_outputs(self, node_count):
+        self.pipeline.outputs()
+
+    def time_data_sets(self, node_count):
+        self.pipeline.data_sets()
+
+
+def _modular_pipelines(pipeline_count: int, node_count: int = 50):
+    """``pipeline_count`` modular pipelines of ``node_count`` nodes, each
+    reading the output of the previous one, as built by ``register_pipelines``.
+    """
+    pipelines = []
+    for index in range(pipeline_count):
+        upstream = f"p{index - 1}_out" if index else "source"
+        nodes = [
+            node(
+                _identity,
+                upstream,
+                f"p{index}_{branch}",
+                name=f"p{index}_node_{branch}",
+            )
+            for branch in range(node_count - 1)
+        ]
+        nodes.append(
+            node(
+                _identity,
+                [f"p{index}_{branch}" for branch in range(node_count - 1)],
+                f"p{index}_out",
+                name=f"p{index}_node_out",
+            )
+        )
+        pipelines.append(pipeline(nodes))
+    return pipelines
+
+
+class TimePipelineComposition:
+    params = [50, 200, 800]
+    param_names = ["pipeline_count"]
+    timeout = 300
+
+    def setup(self, pipeline_count):
+        self.pipelines = _modular_pipelines(pipeline_count)
+
+    def time_sum(self, pipeline_count):
+        sum(self.pipelines).nodes
+
+    def time_union(self, pipeline_count):
+        self.pipelines[0].union(*self.pipelines[1:]).nodes
+
+
+class TimePipelineFilter:
+    params = NODE_COUNTS
+    param_names = ["node_count"]
+    timeout = 300
+
+    def setup(self, node_count):
+        nodes = _layered_nodes(node_count)
+        # tag every other chain
+        nodes = [n.tag("even") if i % 2 == 0 else n for i, n in enumerate(nodes)]
+        self.pipeline = pipeline(nodes)
+        self.pipeline.nodes
+        self.middle = f"node_0_{node_count // 20}"
+
+    def time_from_nodes(self, node_count):
+        self.pipeline.filter(from_nodes=[self.middle])
+
+    def time_to_nodes(self, node_count):
+        self.pipeline.filter(to_nodes=[self.middle])
+
+    def time_tags(self, node_count):
+        self.pipeline.filter(tags=["even"])
+
+    def time_from_inputs(self, node_count):
+        self.pipeline.from_inputs("ds_0_0")
+
+    def time_to_outputs(self, node_count):
+        self.pipeline.to_outputs(f"ds_0_{node_count // 10 - 1}")
+
+    def time_combined(self, node_count):
+        self.pipeline.filter(
+            tags=["even"],
+            from_nodes=[self.middle],
+            to_nodes=[f"node_0_{node_count // 10 - 1}"],
+        )
+
+
+class TimeTopologicalSort:
+    params = ([1000, 10000, 50000], ["layered", "random"])
+    param_names = ["node_count", "shape"]
+    timeout = 600
+
+    def setup(self, node_count, shape):
+        if shape == "layered":
+            self.nodes = _layered_nodes(node_count)
+        else:
+            self.nodes = _random_dag_nodes(node_count)
+
+    def time_sort(self, node_count, shape):
+        # constructing a pipeline sorts its nodes
+        pipeline(self.nodes)
@@ -0,0 +1,258 @@
+"""Benchmarks for the scheduling overhead of the ``kedro.runner`` runners.
+
+Run them with ``asv run`` or ``asv dev`` from the repository root. The node
+functions do no work, so the measured time is the runner's own overhead.
+"""
+from multiprocessing.reduction import ForkingPickler
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from kedro.extras.datasets.pandas import CSVDataSet
+from kedro.io import DataCatalog, LambdaDataSet, MemoryDataset
+from kedro.pipeline import node, pipeline
+from kedro.runner import ExecutionPlan, ParallelRunner, SequentialRunner, ThreadRunner
+
+NODE_COUNTS = [100, 1000, 5000]
+
+
+def _identity(*args):
+    return args[0]
+
+
+def _layered_pipeline(node_count: int, width: int = 10):
+    """A pipeline of ``width`` parallel chains, where every node also reads
+    the shared free input, so datasets have one or many consumers.
+    """
+    nodes = []
+    for index in range(node_count):
+        chain, depth = index % width, index // width
+        upstream = f"ds_{chain}_{depth - 1}" if depth else "source"
+        nodes.append(
+            node(
+                _identity,
+                [upstream, "source"],
+                f"ds_{chain}_{depth}",
+                name=f"node_{chain}_{depth}",
+            )
+        )
+    return pipeline(nodes)
+
+
+class TimeExecutionPlan:
+    params = NODE_COUNTS
+    param_names = ["node_count"]
+
+    def setup(self, node_count):
+        self.pipeline = _layered_pipeline(node_count)
+
+    def time_compile(self, node_count):
+        ExecutionPlan(self.pipeline)
+
+    def time_release_bookkeeping(self, node_count):
+        plan = ExecutionPlan.from_pipeline(self.pipeline)
+        load_counts = plan.load_counts()
+        for node_ in plan.nodes:
+            for _ in plan.datasets_to_release(node_, load_counts):
+                pass
+
+
+class TimeRunnerOverhead:
+    params = NODE_COUNTS
+    param_names = ["node_count"]
+    timeout = 300
+
+    def setup(self, node_count):
+        self.pipeline = _layered_pipeline(node_count)
+        ExecutionPlan.from_pipeline(self.pipeline)
+
+    def _run(self, runner):
+        catalog = DataCatalog(feed_dict={"source": 0})
+        runner.run(self.pipeline, catalog)
+
+    def time_sequential_runner(self, node_count):
+        self._run(SequentialRunner())
+
+    def time_thread_runner(self, node_count):
+        self._run(ThreadRunner(max_workers=4))
+
+    def track_sequential_runner_overhead_per_node(self, node_count):
+        """Microseconds of runner overhead per node, which should stay flat
+        as the pipeline grows.
+        """
+        start = perf_counter()
+        self._run(SequentialRunner())
+        return (perf_counter() - start) / node_count * 1e6
+
+    track_sequential_runner_overhead_per_node.unit = "us"
+
+
+def _large_catalog(entry_count: int) -> DataCatalog:
+    """A catalog with ``entry_count`` datasets, of which the benchmark
+    pipelines only use a few.
+    """
+    return DataCatalog(
+        {
+            f"table_{index}": CSVDataSet(filepath=f"data/01_raw/table_{index}.csv")
+            for index in range(entry_count)
+        },
+        feed_dict={"source": 0},
+    )
+
+
+class TimeParallelRunnerSubmit:
+    """Cost of sending a task to a ``ParallelRunner`` worker with a catalog
+    of 2,000 entries. Tasks used to carry the node and the whole catalog,
+    they now carry the run id and the node id.
+    """
+
+    params = [100, 2000]
+    param_names = ["catalog_size"]
+
+    def setup(self, catalog_size):
+        self.pipeline = _layered_pipeline(100)
+        self.catalog = _large_catalog(catalog_size)
+        self.node = self.pipeline.nodes[0]
+
+    def time_serialise_node_and_catalog(self, catalog_size):
+        ForkingPickler.dumps((self.node, self.catalog, False, None))
+
+    def time_serialise_node_id(self, catalog_size):
+        ForkingPickler.dumps(("0" * 32, 0, False, None))
+
+    def track_node_and_catalog_bytes(self, catalog_size):
+        return len(ForkingPickler.dumps((self.node, self.catalog, False, None)))
+
+    def track_node_id_bytes(self, catalog_size):
+        return len(ForkingPickler.dumps(("0" * 32, 0, False, None)))
+
+    track_node_and_catalog_bytes.unit = "bytes"
+    track_node_id_bytes.unit = "bytes"
+
+
+class TimeParallelRunner:
+    params = [100, 2000]
+    param_names = ["catalog_size"]
+    timeout = 300
+
+    def setup(self, catalog_size):
+        self.pipeline = _layered_pipeline(100)
+        self.runner = ParallelRunner(max_workers=4, reuse_workers=True)
+        # start and bootstrap the workers outside of the measurement
+        self.runner.run(self.pipeline, _large_catalog(catalog_size))
+
+    def time_parallel_runner(self, catalog_size):
+        self.runner.run(self.pipeline, _large_catalog(catalog_size))
+
+
+def _double(data):
+    return data * 2
+
+
+class TimeParallelRunnerTransport:
+    """Moving a 400 MB DataFrame along a chain of nodes through the manager
+    process or through shared memory segments.
+    """
+
+    params = [False, True]
+    param_names = ["shared_memory"]
+    timeout = 600
+
+    def setup(self, shared_memory):
+        self.pipeline = pipeline(
+            [node(_double, f"ds_{index}", f"ds_{index + 1}") for index in range(4)]
+        )
+        self.data = pd.DataFrame(np.ones((5_000_000, 10)))
+        self.runner = ParallelRunner(
+            max_workers=2, reuse_workers=True, shared_memory=shared_memory
+        )
+
+    def time_parallel_runner(self, shared_memory):
+        self.runner.run(self.pipeline, DataCatalog(feed_dict={"ds_0": self.data}))
+
+
+class TimeParallelRunnerFusedChains:
+    """Moving 80 MB DataFrames along 4 chains of 10 nodes, with a task per
+    node passing the data through the manager process, or with a task per
+    chain which keeps the data in the worker.
+    """
+
+    params = [False, True]
+    param_names = ["fuse_chains"]
+    timeout = 600
+
+    def setup(self, fuse_chains):
+        self.pipeline = pipeline(
+            [
+                node(_double, f"ds_{chain}_{depth}", f"ds_{chain}_{depth + 1}")
+                for chain in range(4)
+                for depth in range(10)
+            ]
+        )
+        self.data = pd.DataFrame(np.ones((1_000_000, 10)))
+        self.runner = ParallelRunner(
+            max_workers=4, reuse_workers=True, fuse_chains=fuse_chains
+        )
+
+    def time_parallel_runner(self, fuse_chains):
+        catalog = DataCatalog(
+            feed_dict={f"ds_{chain}_0": self.data for chain in range(4)}
+        )
+        self.runner.run(self.pipeline, catalog)
+
+
+def _increment(data):
+    data += 1
+    return data
+
+
+class TimeTransferOwnership:
+    """Moving a 400 MB or a 2 GB DataFrame along a chain of nodes updating it
+    in place, with the default datasets copying it on each save and load, or
+    handing it over to its only consumer.
+    """
+
+    params = [[5_000_000, 25_000_000], [False, True]]
+    param_names = ["row_count", "transfer_ownership"]
+    timeout = 600
+
+    def setup(self, row_count, transfer_ownership):
+        self.pipeline = pipeline(
+            [node(_increment, f"ds_{index}", f"ds_{index + 1}") for index in range(4)]
+        )
+        self.data = pd.DataFrame(np.ones((row_count, 10)))
+
+    def _run(self, transfer_ownership):
+        runner = SequentialRunner(transfer_ownership=transfer_ownership)
+        runner.run(self.pipeline, DataCatalog(feed_dict={"ds_0": self.data}))
+
+    def time_sequential_runner(self, row_count, transfer_ownership):
+        self._run(transfer_ownership)
+
+    def peakmem_sequential_runner(self, row_count, transfer_ownership):
+        self._run(transfer_ownership)
+
+
+class TimeSuggestResumeScenario:
+    params = NODE_COUNTS
+    param_names = ["node_count"]
+    timeout = 300
+
+    def setup(self, node_count):
+        self.pipeline = _layered_pipeline(node_count)
+        # only the shared free input is persisted, so the nearest persistent
+        # ancestors of a failure are at the start of every chain
+        self.catalog = DataCatalog(
+            {name: MemoryDataset() for name in self.pipeline.data_sets()}
+        )
+        self.catalog.add(
+            "source", LambdaDataSet(load=lambda: 0, save=None), replace=True
+        )
+        self.done_nodes = self.pipeline.nodes[: node_count // 2]
+        self.runner = SequentialRunner()
+
+    def time_suggest_resume_scenario(self, node_count):
+        self.runner._suggest_resume_scenario(  # noqa: protected-access
+            self.pipeline, self.done_nodes, self.catalog
+        )
@@ -1,5 +1,6 @@
 """A collection of CLI commands for working with Kedro project."""
 
+import inspect
 import os
 import shutil
 import subprocess
@@ -29,6 +30,9 @@ from kedro.framework.cli.utils import (
 from kedro.framework.project import settings
 from kedro.framework.session import KedroSession
 from kedro.framework.startup import ProjectMetadata
+from kedro.runner.freshness import UNTIMESTAMPED_POLICIES
+from kedro.runner.node_cache import NodeCache
+from kedro.runner.scheduler import SCHEDULERS, NodeTimings
 from kedro.utils import load_obj
 
 NO_DEPENDENCY_MESSAGE = """{module} is not installed. Please make sure {module} is in
@@ -47,6 +51,28 @@ RUNNER_ARG_HELP = """Specify a runner that you want to run the pipeline with.
 Available runners: 'SequentialRunner', 'ParallelRunner' and 'ThreadRunner'."""
 ASYNC_ARG_HELP = """Load and save node inputs and outputs asynchronously
 with threads. If not specified, load and save datasets synchronously."""
+SCHEDULER_ARG_HELP = """Specify the order in which a concurrent runner runs the nodes
+which are ready. 'critical-path' runs the nodes starting the longest chains first,
+estimated from the node durations recorded by earlier runs. Defaults to 'topological'."""
+MAX_MEMORY_ARG_HELP = """Keep the data held in memory between nodes within this
+size, in bytes or with a unit such as 'MB', 'GB' or 'GiB', by spilling it to disk.
+Supported by 'SequentialRunner' and 'ThreadRunner'. If not specified, the memory
+is not limited."""
+CACHE_ARG_HELP = """Restore the outputs of nodes whose code and inputs have not
+changed since an earlier run from the node cache, instead of running them.
+Supported by 'SequentialRunner' and 'ThreadRunner'."""
+CHANGED_ONLY_ARG_HELP = """Only run the nodes whose persisted outputs are missing or
+older than their inputs, and the nodes downstream of them."""
+UNTIMESTAMPED_ARG_HELP = """How '--changed-only' treats persisted datasets which
+report no modification time. 'fresh' considers them up to date, 'stale' always
+runs the nodes reading or writing them. Defaults to 'fresh'."""
+JOURNAL_ARG_HELP = """Record the nodes which complete, and the versions of the
+datasets they save, in a run journal in the session store, so that the run can
+be resumed with '--resume' if it fails."""
+RESUME_ARG_HELP = """Resume the failed run of the session with this id, running only
+the nodes which did not complete and loading the exact versions of the datasets
+saved by the others. The run must have been recorded with '--journal'. The id is
+logged when the run fails."""
 TAG_ARG_HELP = """Construct the pipeline using only nodes which have this tag
 attached. Option can be used multiple times, what results in a
 pipeline constructed from nodes having any of those tags."""
@@ -66,6 +92,10 @@ param_group.param1:value1."""
 INPUT_FILE_HELP = """Name of the requirements file to compile."""
 OUTPUT_FILE_HELP = """Name of the file where compiled requirements should be stored."""
 CONF_SOURCE_HELP = """Path of a directory where project configuration is stored."""
+NODE_TIMINGS_FILE = "node_timings.json"
+NODE_CACHE_DIR = "node_cache"
+# the flags of the options of ``kedro run`` not named after a runner argument
+_RUNNER_OPTION_FLAGS = {"node_cache": "--cache"}
 
 
 # noqa: missing-function-docstring
@@ -360,6 +390,20 @@ def activate_nbstripout(metadata: ProjectMetadata, **kwargs):  # noqa: unused-ar
 )
 @click.option("--runner", "-r", type=str, default=None, help=RUNNER_ARG_HELP)
 @click.option("--async", "is_async", is_flag=True, help=ASYNC_ARG_HELP)
+@click.option(
+    "--scheduler", type=click.Choice(SCHEDULERS), default=None, help=SCHEDULER_ARG_HELP
+)
+@click.option("--max-memory", type=str, default=None, help=MAX_MEMORY_ARG_HELP)
+@click.option("--cache", is_flag=True, help=CACHE_ARG_HELP)
+@click.option("--changed-only", is_flag=True, help=CHANGED_ONLY_ARG_HELP)
+@click.option(
+    "--untimestamped",
+    type=click.Choice(UNTIMESTAMPED_POLICIES),
+    default="fresh",
+    help=UNTIMESTAMPED_ARG_HELP,
+)
+@click.option("--journal", is_flag=True, help=JOURNAL_ARG_HELP)
+@click.option("--resume", type=str, default=None, help=RESUME_ARG_HELP)
 @env_option
 @click.option(
     "--tag",
@@ -418,6 +462,13 @@ def run(  # noqa: too-many-arguments,unused-argument,too-many-locals
     env,
     runner,
     is_async,
+    scheduler,
+    max_memory,
+    cache,
+    changed_only,
+    untimestamped,
+    journal,
+    resume,
     node_names,
     nodes_names,
     to_nodes,
@@ -435,6 +486,13 @@ def run(  # noqa: too-many-arguments,unused-argument,too-many-locals
     """Run the pipeline."""
 
     runner = load_obj(runner or "SequentialRunner", "kedro.runner")
+    runner_kwargs = _get_runner_kwargs(
+        runner,
+        is_async=is_async,
+        scheduler=scheduler,
+        max_memory=max_memory,
+        node_cache=cache or None,
+    )
 
     tag = _get_values_as_tuple(tag)
     node_names = _get_values_as_tuple(node_names)
@@ -450,9 +508,16 @@ def run(  # noqa: too-many-arguments,unused-argument,too-many-locals
     with KedroSession.create(
         env=env, conf_source=conf_source, extra_params=params
     ) as session:
+        store_path = session._get_store_path()  # noqa: protected-access
+        if cache:
+            runner_kwargs["node_cache"] = NodeCache(store_path / NODE_CACHE_DIR)
+        # the durations are recorded by every run, so that the critical-path
+        # scheduler can use them from the first run it is enabled in
+        if "node_timings" in inspect.signature(runner).parameters:
+            runner_kwargs["node_timings"] = NodeTimings(store_path / NODE_TIMINGS_FILE)
         session.run(
             tags=tag,
-            runner=runner(is_async=is_async),
+            runner=runner(**runner_kwargs),
             node_names=node_names,
             from_nodes=from_nodes,
             to_nodes=to_nodes,
@@ -461,4 +526,27 @@ def run(  # noqa: too-many-arguments,unused-argument,too-many-locals
             load_versions=load_version,
             pipeline_name=pipeline,
             namespace=namespace,
+            changed_only=changed_only,
+            untimestamped=untimestamped,
+            journal=journal,
+            resume=resume,
+        )
+
+
+def _get_runner_kwargs(runner_class: type, **options) -> dict:
+    """Returns the options of ``kedro run`` to instantiate the runner with,
+    leaving out the options which are not set.
+
+    Raises:
+        KedroCliError: If the runner does not accept an option which is set.
+    """
+    options = {name: value for name, value in options.items() if value is not None}
+    parameters = inspect.signature(runner_class).parameters
+    unsupported = [name for name in options if name not in parameters]
+    if unsupported:
+        flags = ", ".join(
+            f"'{_RUNNER_OPTION_FLAGS.get(name, '--' + name.replace('_', '-'))}'"
+            for name in unsupported
         )
+        raise KedroCliError(f"{runner_class.__name__} does not support {flags}.")
+    return options
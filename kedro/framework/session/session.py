@@ -28,8 +28,12 @@ from kedro.framework.project import (
     validate_settings,
 )
 from kedro.framework.session.store import BaseSessionStore
+from kedro.io import DataCatalog
 from kedro.io.core import generate_timestamp
-from kedro.runner import AbstractRunner, SequentialRunner
+from kedro.pipeline import Pipeline
+from kedro.runner import AbstractRunner, RunJournal, SequentialRunner
+
+RUN_JOURNAL_FILE = "run_journal.jsonl"
 
 
 def _describe_git(project_path: Path) -> dict[str, dict[str, Any]]:
@@ -312,6 +316,72 @@ class KedroSession:
             self._log_exception(exc_type, exc_value, tb_)
         self.close()
 
+    def _get_store_path(self) -> Path:
+        """Returns the directory of the session store, relative paths being
+        resolved against the project path.
+        """
+        store_path = Path(self._store._path).expanduser()  # noqa: protected-access
+        return self._project_path / store_path
+
+    def _get_run_journal(self, session_id: str) -> RunJournal:
+        return RunJournal(self._get_store_path() / session_id / RUN_JOURNAL_FILE)
+
+    def _run_pipeline(  # noqa: too-many-arguments
+        self,
+        runner: AbstractRunner,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        changed_only: bool,
+        untimestamped: str,
+    ) -> dict[str, Any]:
+        session_id = self.store["session_id"]
+        if changed_only:
+            return runner.run_only_changed(
+                pipeline, catalog, self._hook_manager, session_id, untimestamped
+            )
+        return runner.run(pipeline, catalog, self._hook_manager, session_id)
+
+    def _start_run_journal(self) -> RunJournal:
+        run_journal = self._get_run_journal(self.session_id)
+        run_journal.clear()
+        return run_journal
+
+    def _suggest_resume(self, run_journal: RunJournal) -> None:
+        if run_journal.exists():
+            self._logger.warning(
+                "You can resume the run by adding the following argument to "
+                "your previous command:\n  --resume %s",
+                self.session_id,
+            )
+
+    def _resume(
+        self,
+        resumed_id: str,
+        pipeline: Pipeline,
+        journal: RunJournal,
+        load_versions: dict[str, str] | None,
+    ) -> tuple[Pipeline, dict[str, str]]:
+        resumed_journal = self._get_run_journal(resumed_id)
+        if not resumed_journal.exists():
+            raise KedroSessionError(
+                f"Cannot resume the run of session '{resumed_id}', as no run "
+                f"journal was found at '{resumed_journal.filepath}'. Only the "
+                f"runs recorded with a journal can be resumed."
+            )
+        to_run, resumed_versions = resumed_journal.resume(pipeline)
+        # the nodes completed before are completed in this run too, so that
+        # it can be resumed in turn
+        journal.extend(resumed_journal.load())
+        self._logger.info(
+            "Resuming the run of session '%s'. Skipping %d out of %d nodes "
+            "which completed in it.",
+            resumed_id,
+            len(pipeline.nodes) - len(to_run.nodes),
+            len(pipeline.nodes),
+        )
+        # the versions given explicitly take precedence
+        return to_run, {**resumed_versions, **(load_versions or {})}
+
     def run(  # noqa: too-many-arguments,too-many-locals
         self,
         pipeline_name: str = None,
@@ -324,6 +394,10 @@ class KedroSession:
         to_outputs: Iterable[str] = None,
         load_versions: dict[str, str] = None,
         namespace: str = None,
+        changed_only: bool = False,
+        untimestamped: str = "fresh",
+        journal: bool = False,
+        resume: str = None,
     ) -> dict[str, Any]:
         """Runs the pipeline with a specified runner.
 
@@ -348,13 +422,27 @@ class KedroSession:
             load_versions: An optional flag to specify a particular dataset
                 version timestamp to load.
             namespace: The namespace of the nodes that is being run.
+            changed_only: If True, only run the nodes whose outputs are missing
+                or older than their inputs, and the nodes downstream of them.
+                See ``AbstractRunner.run_only_changed``.
+            untimestamped: How ``changed_only`` treats persisted datasets
+                without a modification time, either ``fresh`` or ``stale``.
+            journal: If True, record the completed nodes and the versions of
+                the datasets they saved in a run journal in the session store,
+                so that the run can be resumed if it fails.
+            resume: The id of a session whose run failed, to run only the nodes
+                which did not complete in it, loading the exact versions of the
+                datasets they saved. The run must have been recorded with
+                ``journal``. The completed nodes producing the datasets held
+                in memory needed by the others run again. The resumed run is
+                recorded too.
         Raises:
             ValueError: If the named or `__default__` pipeline is not
                 defined by `register_pipelines`.
             Exception: Any uncaught exception during the run will be re-raised
                 after being passed to ``on_pipeline_error`` hook.
             KedroSessionError: If more than one run is attempted to be executed during
-                a single session.
+                a single session, or the run to resume was not recorded.
         Returns:
             Any node outputs that cannot be processed by the ``DataCatalog``.
             These are returned in a dictionary, where the keys are defined
@@ -396,6 +484,12 @@ class KedroSession:
             node_namespace=namespace,
         )
 
+        run_journal = self._start_run_journal() if journal or resume else None
+        if resume:
+            filtered_pipeline, load_versions = self._resume(
+                resume, filtered_pipeline, run_journal, load_versions
+            )
+
         record_data = {
             "session_id": session_id,
             "project_path": self._project_path.as_posix(),
@@ -431,9 +525,11 @@ class KedroSession:
             run_params=record_data, pipeline=filtered_pipeline, catalog=catalog
         )
 
+        if run_journal is not None:
+            runner.journal = run_journal
         try:
-            run_result = runner.run(
-                filtered_pipeline, catalog, hook_manager, session_id
+            run_result = self._run_pipeline(
+                runner, filtered_pipeline, catalog, changed_only, untimestamped
             )
             self._run_called = True
         except Exception as error:
@@ -443,7 +539,12 @@ class KedroSession:
                 pipeline=filtered_pipeline,
                 catalog=catalog,
             )
+            if run_journal is not None:
+                self._suggest_resume(run_journal)
             raise
+        finally:
+            if run_journal is not None:
+                runner.journal = None
 
         hook_manager.hook.after_pipeline_run(
             run_params=record_data,
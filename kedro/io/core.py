@@ -4,11 +4,14 @@ saving functionality provided by ``kedro.io``.
 from __future__ import annotations
 
 import abc
+import asyncio
 import copy
+import inspect
 import logging
 import re
 import warnings
 from collections import namedtuple
+from concurrent.futures import Executor
 from datetime import datetime, timezone
 from functools import partial
 from glob import iglob
@@ -244,6 +247,78 @@ class AbstractDataSet(abc.ABC, Generic[_DI, _DO]):
             message = f"Failed while saving data to data set {str(self)}.\n{str(exc)}"
             raise DatasetError(message) from exc
 
+    async def load_async(self, executor: Executor = None) -> _DO:
+        """Loads data without blocking the running event loop. Data sets which
+        can load data with ``asyncio`` implement the ``_load_async`` coroutine
+        method, otherwise ``load`` is called in ``executor``.
+
+        Args:
+            executor: The executor to call ``load`` in, when the data set does
+                not implement ``_load_async``. If not set, the default executor
+                of the event loop is used.
+
+        Returns:
+            Data returned by the provided load method.
+
+        Raises:
+            DatasetError: When underlying load method raises error.
+
+        """
+        if not self._supports_async("_load_async"):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self.load)
+
+        self._logger.debug("Loading %s", str(self))
+
+        try:
+            return await self._load_async()  # type: ignore
+        except DatasetError:
+            raise
+        except Exception as exc:
+            message = (
+                f"Failed while loading data from data set {str(self)}.\n{str(exc)}"
+            )
+            raise DatasetError(message) from exc
+
+    async def save_async(self, data: _DI, executor: Executor = None) -> None:
+        """Saves data without blocking the running event loop. Data sets which
+        can save data with ``asyncio`` implement the ``_save_async`` coroutine
+        method, otherwise ``save`` is called in ``executor``.
+
+        Args:
+            data: the value to be saved by provided save method.
+            executor: The executor to call ``save`` in, when the data set does
+                not implement ``_save_async``. If not set, the default executor
+                of the event loop is used.
+
+        Raises:
+            DatasetError: when underlying save method raises error.
+            FileNotFoundError: when save method got file instead of dir, on Windows.
+            NotADirectoryError: when save method got file instead of dir, on Unix.
+        """
+        if not self._supports_async("_save_async"):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(executor, self.save, data)
+            return
+
+        if data is None:
+            raise DatasetError("Saving 'None' to a 'Dataset' is not allowed")
+
+        try:
+            self._logger.debug("Saving %s", str(self))
+            await self._save_async(data)  # type: ignore
+        except DatasetError:
+            raise
+        except (FileNotFoundError, NotADirectoryError):
+            raise
+        except Exception as exc:
+            message = f"Failed while saving data to data set {str(self)}.\n{str(exc)}"
+            raise DatasetError(message) from exc
+
+    def _supports_async(self, method: str) -> bool:
+        # looked up on the class, as some data sets forward unknown attributes
+        return inspect.iscoroutinefunction(getattr(type(self), method, None))
+
     def __str__(self):
         def _to_str(obj, is_root=False):
             """Returns a string representation where
@@ -637,19 +712,38 @@ class AbstractVersionedDataSet(AbstractDataSet[_DI, _DO], abc.ABC):
             super().save(data)
         except (FileNotFoundError, NotADirectoryError) as err:
             # FileNotFoundError raised in Win, NotADirectoryError raised in Unix
-            _default_version = "YYYY-MM-DDThh.mm.ss.sssZ"
-            raise DatasetError(
-                f"Cannot save versioned dataset '{self._filepath.name}' to "
-                f"'{self._filepath.parent.as_posix()}' because a file with the same "
-                f"name already exists in the directory. This is likely because "
-                f"versioning was enabled on a dataset already saved previously. Either "
-                f"remove '{self._filepath.name}' from the directory or manually "
-                f"convert it into a versioned dataset by placing it in a versioned "
-                f"directory (e.g. with default versioning format "
-                f"'{self._filepath.as_posix()}/{_default_version}/{self._filepath.name}"
-                f"')."
-            ) from err
+            raise self._save_path_conflict_error() from err
+        self._check_save_version(save_version)
+
+    async def save_async(self, data: _DI, executor: Executor = None) -> None:
+        if not self._supports_async("_save_async"):
+            # ``save`` resolves the save version itself
+            await super().save_async(data, executor)
+            return
+
+        self._version_cache.clear()
+        save_version = self.resolve_save_version()  # Make sure last save version is set
+        try:
+            await super().save_async(data, executor)
+        except (FileNotFoundError, NotADirectoryError) as err:
+            raise self._save_path_conflict_error() from err
+        self._check_save_version(save_version)
+
+    def _save_path_conflict_error(self) -> DatasetError:
+        _default_version = "YYYY-MM-DDThh.mm.ss.sssZ"
+        return DatasetError(
+            f"Cannot save versioned dataset '{self._filepath.name}' to "
+            f"'{self._filepath.parent.as_posix()}' because a file with the same "
+            f"name already exists in the directory. This is likely because "
+            f"versioning was enabled on a dataset already saved previously. Either "
+            f"remove '{self._filepath.name}' from the directory or manually "
+            f"convert it into a versioned dataset by placing it in a versioned "
+            f"directory (e.g. with default versioning format "
+            f"'{self._filepath.as_posix()}/{_default_version}/{self._filepath.name}"
+            f"')."
+        )
 
+    def _check_save_version(self, save_version: str | None) -> None:
         load_version = self.resolve_load_version()
         if load_version != save_version:
             warnings.warn(
@@ -11,6 +11,7 @@ import difflib
 import logging
 import re
 from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor
 from typing import Any, Dict, Iterable
 
 from parse import parse
@@ -515,6 +516,67 @@ class DataCatalog:
 
         dataset.save(data)
 
+    async def load_async(
+        self, name: str, version: str = None, executor: Executor = None
+    ) -> Any:
+        """Loads a registered data set without blocking the running event loop.
+        See ``AbstractDataSet.load_async``.
+
+        Args:
+            name: A data set to be loaded.
+            version: Optional argument for concrete data version to be loaded.
+                Works only with versioned datasets.
+            executor: The executor to load data sets which do not support
+                ``asyncio`` in. If not set, the default executor of the event
+                loop is used.
+
+        Returns:
+            The loaded data as configured.
+
+        Raises:
+            DatasetNotFoundError: When a data set with the given name
+                has not yet been registered.
+
+        Example:
+        ::
+
+            >>> import asyncio
+            >>> from kedro.io import DataCatalog, MemoryDataset
+            >>>
+            >>> io = DataCatalog(data_sets={"cars": MemoryDataset([1, 2])})
+            >>> asyncio.run(io.load_async("cars"))
+        """
+        load_version = Version(version, None) if version else None
+        dataset = self._get_dataset(name, version=load_version)
+
+        self._logger.info(
+            "Loading data from '%s' (%s)...", name, type(dataset).__name__
+        )
+
+        return await dataset.load_async(executor)
+
+    async def save_async(self, name: str, data: Any, executor: Executor = None) -> None:
+        """Saves data to a registered data set without blocking the running
+        event loop. See ``AbstractDataSet.save_async``.
+
+        Args:
+            name: A data set to be saved to.
+            data: A data object to be saved as configured in the registered
+                data set.
+            executor: The executor to save data sets which do not support
+                ``asyncio`` in. If not set, the default executor of the event
+                loop is used.
+
+        Raises:
+            DatasetNotFoundError: When a data set with the given name
+                has not yet been registered.
+        """
+        dataset = self._get_dataset(name)
+
+        self._logger.info("Saving data to '%s' (%s)...", name, type(dataset).__name__)
+
+        await dataset.save_async(data, executor)
+
     def exists(self, name: str) -> bool:
         """Checks whether registered data set exists by calling its `exists()`
         method. Raises a warning and returns False if `exists()` is not
@@ -533,6 +595,48 @@ class DataCatalog:
             return False
         return dataset.exists()
 
+    def exists_many(
+        self, names: Iterable[str], max_workers: int = None
+    ) -> dict[str, bool]:
+        """Checks whether several registered data sets exist, concurrently
+        with threads, as checking the existence of remote data usually means
+        waiting on the network. Data sets which are not registered do not
+        exist.
+
+        Args:
+            names: The data sets to be checked.
+            max_workers: The maximum number of threads checking data sets.
+                If not set, calculated automatically by ``ThreadPoolExecutor``.
+
+        Returns:
+            Whether each data set exists, by name.
+
+        Example:
+        ::
+
+            >>> io = DataCatalog.from_config(catalog_config)
+            >>> missing = [
+            >>>     name for name, exists in io.exists_many(io.list()).items()
+            >>>     if not exists
+            >>> ]
+        """
+        data_sets: dict[str, AbstractDataSet | None] = {}
+        # resolve the data sets first, as resolving dataset patterns adds the
+        # resulting data sets to the catalog
+        for name in names:
+            try:
+                data_sets[name] = self._get_dataset(name)
+            except DatasetNotFoundError:
+                data_sets[name] = None
+
+        def exists(data_set: AbstractDataSet | None) -> bool:
+            return data_set is not None and data_set.exists()
+
+        if len(data_sets) <= 1:
+            return {name: exists(data_set) for name, data_set in data_sets.items()}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(zip(data_sets, pool.map(exists, data_sets.values())))
+
     def release(self, name: str):
         """Release any cached data associated with a data set
 
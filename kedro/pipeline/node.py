@@ -329,26 +329,48 @@ class Node:
 
         """
         self._logger.info("Running node: %s", str(self))
+        self._check_run_inputs(inputs)
 
-        outputs = None
+        try:
+            outputs = self._call(inputs)
+            if inspect.iscoroutine(outputs):
+                outputs.close()
+                raise ValueError(
+                    f"Node {str(self)} wraps a coroutine function, which has to "
+                    f"be awaited. Run it with 'Node.run_async()' or 'AsyncRunner'."
+                )
+            return self._outputs_to_dictionary(outputs)
 
-        if not (inputs is None or isinstance(inputs, dict)):
-            raise ValueError(
-                f"Node.run() expects a dictionary or None, "
-                f"but got {type(inputs)} instead"
-            )
+        # purposely catch all exceptions
+        except Exception as exc:
+            self._logger.error("Node '%s' failed with error: \n%s", str(self), str(exc))
+            raise exc
 
-        try:
-            inputs = {} if inputs is None else inputs
-            if not self._inputs:
-                outputs = self._run_with_no_inputs(inputs)
-            elif isinstance(self._inputs, str):
-                outputs = self._run_with_one_input(inputs, self._inputs)
-            elif isinstance(self._inputs, list):
-                outputs = self._run_with_list(inputs, self._inputs)
-            elif isinstance(self._inputs, dict):
-                outputs = self._run_with_dict(inputs, self._inputs)
+    async def run_async(self, inputs: dict[str, Any] = None) -> dict[str, Any]:
+        """Run this node like ``run``, awaiting the result of the node
+        function if it is awaitable, e.g. when the function is defined with
+        ``async def``.
 
+        Args:
+            inputs: Dictionary of inputs as specified at the creation of
+                the node.
+
+        Raises:
+            ValueError: In the same cases as ``run``.
+            Exception: Any exception thrown during execution of the node.
+
+        Returns:
+            All produced node outputs are returned in a dictionary, where the
+            keys are defined by the node outputs.
+
+        """
+        self._logger.info("Running node: %s", str(self))
+        self._check_run_inputs(inputs)
+
+        try:
+            outputs = self._call(inputs)
+            if inspect.isawaitable(outputs):
+                outputs = await outputs
             return self._outputs_to_dictionary(outputs)
 
         # purposely catch all exceptions
@@ -356,6 +378,24 @@ class Node:
             self._logger.error("Node '%s' failed with error: \n%s", str(self), str(exc))
             raise exc
 
+    @staticmethod
+    def _check_run_inputs(inputs: Any):
+        if not (inputs is None or isinstance(inputs, dict)):
+            raise ValueError(
+                f"Node.run() expects a dictionary or None, "
+                f"but got {type(inputs)} instead"
+            )
+
+    def _call(self, inputs: dict[str, Any] | None) -> Any:
+        inputs = {} if inputs is None else inputs
+        if not self._inputs:
+            return self._run_with_no_inputs(inputs)
+        if isinstance(self._inputs, str):
+            return self._run_with_one_input(inputs, self._inputs)
+        if isinstance(self._inputs, list):
+            return self._run_with_list(inputs, self._inputs)
+        return self._run_with_dict(inputs, self._inputs)
+
     def _run_with_no_inputs(self, inputs: dict[str, Any]):
         if inputs:
             raise ValueError(
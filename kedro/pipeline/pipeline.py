@@ -7,18 +7,20 @@ from __future__ import annotations
 
 import copy
 import json
-from collections import Counter, defaultdict
+from collections import ChainMap, Counter, defaultdict
 from itertools import chain
-from typing import Iterable
-
-from toposort import CircularDependencyError as ToposortCircleError
-from toposort import toposort
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, MutableMapping, Sequence
 
 import kedro
 from kedro.pipeline.node import Node, _to_list
 
 TRANSCODING_SEPARATOR = "@"
 
+# nodes are appended to the maps of a pipeline by one composition at a time
+_COMPOSE_LOCK = Lock()
+
 
 def _transcode_split(element: str) -> tuple[str, str]:
     """Split the name by the transcoding separator.
@@ -52,6 +54,8 @@ def _strip_transcoding(element: str) -> str:
         ValueError: Raised if more than one transcoding separator
         is present in the name.
     """
+    if TRANSCODING_SEPARATOR not in element:
+        return element
     return _transcode_split(element)[0]
 
 
@@ -145,26 +149,92 @@ class Pipeline:  # noqa: too-many-public-methods
         _validate_transcoded_inputs_outputs(nodes)
         _tags = set(_to_list(tags))
 
-        nodes = [n.tag(_tags) for n in nodes]
+        if _tags:
+            nodes = [n.tag(_tags) for n in nodes]
 
-        self._nodes_by_name = {node.name: node for node in nodes}
         _validate_unique_outputs(nodes)
         _validate_unique_confirms(nodes)
 
-        # input -> nodes with input
-        self._nodes_by_input: dict[str, set[Node]] = defaultdict(set)
-        for node in nodes:
-            for input_ in node.inputs:
-                self._nodes_by_input[_strip_transcoding(input_)].add(node)
+        self._set_nodes(nodes)
+        self._cached_grouped_nodes = _topologically_sorted(nodes)
 
-        # output -> node with output
-        self._nodes_by_output: dict[str, Node] = {}
-        for node in nodes:
-            for output in node.outputs:
-                self._nodes_by_output[_strip_transcoding(output)] = node
+    def _set_nodes(self, nodes: list[Node]) -> None:
+        """Set the nodes of the pipeline and the maps from names to them."""
+        self._node_maps = _NodeMaps(nodes)
+        self._node_count = len(nodes)
+        self._cached_grouped_nodes: list[list[Node]] | None = None
+        self._cached_index: _PipelineIndex | None = None
+
+    @property
+    def _maps(self) -> _NodeMaps:
+        """The nodes of the pipeline and the maps from names to them, rebuilt
+        from its nodes if nodes of another pipeline were appended to them.
+        """
+        maps = self._node_maps
+        if len(maps.nodes) != self._node_count:
+            maps = _NodeMaps(maps.nodes[: self._node_count])
+            self._node_maps = maps
+        return maps
 
-        self._nodes = nodes
-        self._topo_sorted_nodes = _topologically_sorted(self.node_dependencies)
+    @property
+    def _nodes(self) -> list[Node]:
+        return self._maps.nodes
+
+    @property
+    def _nodes_by_name(self) -> dict[str, Node]:
+        return self._maps.nodes_by_name
+
+    @property
+    def _nodes_by_input(self) -> dict[str, set[Node]]:
+        return self._maps.nodes_by_input
+
+    @property
+    def _nodes_by_output(self) -> dict[str, Node]:
+        return self._maps.nodes_by_output
+
+    @property
+    def _nodes_by_confirm(self) -> dict[str, Node]:
+        return self._maps.nodes_by_confirm
+
+    @property
+    def _transcoded_names(self) -> set[str]:
+        return self._maps.transcoded_names
+
+    def _subset(self, mask: int) -> Pipeline:
+        """Create a new ``Pipeline`` with the nodes of this one whose ids are set
+        in ``mask``. A subset of a valid pipeline is valid, and its groups of
+        nodes follow from the index, so it is neither validated nor sorted again.
+        """
+        grouped_nodes = self._index.grouped_nodes(mask)
+        subset = Pipeline.__new__(Pipeline)
+        subset._set_nodes(  # noqa: protected-access
+            list(chain.from_iterable(grouped_nodes))
+        )
+        subset._cached_grouped_nodes = grouped_nodes  # noqa: protected-access
+        return subset
+
+    @property
+    def _topo_sorted_nodes(self) -> list[list[Node]]:
+        """The nodes grouped in topological order, computed on first use by
+        the pipelines combined with ``union`` which cannot have cycles.
+        """
+        if self._cached_grouped_nodes is None:
+            self._cached_grouped_nodes = _topologically_sorted(self._nodes)
+        return self._cached_grouped_nodes
+
+    @property
+    def _index(self) -> _PipelineIndex:
+        """The adjacency index of the pipeline, computed on first use."""
+        if self._cached_index is None:
+            self._cached_index = _PipelineIndex(self._topo_sorted_nodes)
+        return self._cached_index
+
+    def __getstate__(self):
+        # the index is computed again on first use once unpickled
+        state = self.__dict__.copy()
+        state["_node_maps"] = self._maps
+        state["_cached_index"] = None
+        return state
 
     def __repr__(self):  # pragma: no cover
         """Pipeline ([node1, ..., node10 ...], name='pipeline_name')"""
@@ -181,7 +251,7 @@ class Pipeline:  # noqa: too-many-public-methods
     def __add__(self, other):
         if not isinstance(other, Pipeline):
             return NotImplemented
-        return Pipeline(set(self.nodes + other.nodes))
+        return self.union(other)
 
     def __radd__(self, other):
         if isinstance(other, int) and other == 0:
@@ -201,7 +271,54 @@ class Pipeline:  # noqa: too-many-public-methods
     def __or__(self, other):
         if not isinstance(other, Pipeline):
             return NotImplemented
-        return Pipeline(set(self.nodes + other.nodes))
+        return self.union(other)
+
+    def union(self, *others: Pipeline) -> Pipeline:
+        """Create a new ``Pipeline`` made of the nodes of this pipeline and of
+        all the ``others``, like ``sum`` of the pipelines but in a single step.
+        The already validated nodes and dataset maps of the pipelines are
+        reused, and the nodes of the others are appended to the maps of the
+        largest pipeline, so that the cost scales with the number of nodes
+        added to it rather than with the number of pipelines. ``+`` and ``sum``
+        combine pipelines the same way.
+
+        Example:
+        ::
+
+            >>> from kedro.pipeline import Pipeline
+            >>>
+            >>> pipelines = {"ingestion": ..., "features": ..., "model": ...}
+            >>> default = Pipeline([]).union(*pipelines.values())
+
+        Args:
+            others: The pipelines to combine with this one.
+
+        Raises:
+            TypeError: When any of the ``others`` is not a ``Pipeline``.
+            ValueError: When nodes of different pipelines have the same name
+                without being equal, or when a dataset is used both with and
+                without transcoding.
+            OutputNotUniqueError: When nodes of different pipelines produce
+                the same output.
+            ConfirmNotUniqueError: When nodes of different pipelines confirm
+                the same dataset.
+            CircularDependencyError: When the combined nodes have a circular
+                dependency.
+
+        Returns:
+            A new ``Pipeline`` with the nodes of all the pipelines.
+        """
+        pipelines = [self, *others]
+        for pipe in others:
+            if not isinstance(pipe, Pipeline):
+                raise TypeError(
+                    f"Cannot combine a 'Pipeline' with '{type(pipe).__name__}'."
+                )
+        combined = _compose(pipelines)
+        if combined is None:
+            # report conflicts exactly as constructing the pipeline does
+            combined = Pipeline(set(chain.from_iterable(p.nodes for p in pipelines)))
+        return combined
 
     def all_inputs(self) -> set[str]:
         """All inputs for all nodes in the pipeline.
@@ -210,7 +327,7 @@ class Pipeline:  # noqa: too-many-public-methods
             All node input names as a Set.
 
         """
-        return set.union(set(), *(node.inputs for node in self.nodes))
+        return set(self._index.all_inputs)
 
     def all_outputs(self) -> set[str]:
         """All outputs of all nodes in the pipeline.
@@ -219,13 +336,7 @@ class Pipeline:  # noqa: too-many-public-methods
             All node outputs.
 
         """
-        return set.union(set(), *(node.outputs for node in self.nodes))
-
-    def _remove_intermediates(self, datasets: set[str]) -> set[str]:
-        intermediate = {_strip_transcoding(i) for i in self.all_inputs()} & {
-            _strip_transcoding(o) for o in self.all_outputs()
-        }
-        return {d for d in datasets if _strip_transcoding(d) not in intermediate}
+        return set(self._index.all_outputs)
 
     def inputs(self) -> set[str]:
         """The names of free inputs that must be provided at runtime so that
@@ -237,7 +348,7 @@ class Pipeline:  # noqa: too-many-public-methods
             The set of free input names needed by the pipeline.
 
         """
-        return self._remove_intermediates(self.all_inputs())
+        return set(self._index.inputs)
 
     def outputs(self) -> set[str]:
         """The names of outputs produced when the whole pipeline is run.
@@ -248,7 +359,7 @@ class Pipeline:  # noqa: too-many-public-methods
             The set of final pipeline outputs.
 
         """
-        return self._remove_intermediates(self.all_outputs())
+        return set(self._index.outputs)
 
     def data_sets(self) -> set[str]:
         """The names of all data sets used by the ``Pipeline``,
@@ -258,10 +369,7 @@ class Pipeline:  # noqa: too-many-public-methods
             The set of all pipeline data sets.
 
         """
-        return self.all_outputs() | self.all_inputs()
-
-    def _transcode_compatible_names(self):
-        return {_strip_transcoding(ds) for ds in self.data_sets()}
+        return set(self._index.data_sets)
 
     def describe(self, names_only: bool = True) -> str:
         """Obtain the order of execution and expected free input variables in
@@ -331,13 +439,10 @@ class Pipeline:  # noqa: too-many-public-methods
             Dictionary where keys are nodes and values are sets made up of
             their parent nodes. Independent nodes have this as empty sets.
         """
-        dependencies: dict[Node, set[Node]] = {node: set() for node in self._nodes}
-        for parent in self._nodes:
-            for output in parent.outputs:
-                for child in self._nodes_by_input[_strip_transcoding(output)]:
-                    dependencies[child].add(parent)
-
-        return dependencies
+        return {
+            node: set(parents)
+            for node, parents in self._index.node_dependencies.items()
+        }
 
     @property
     def nodes(self) -> list[Node]:
@@ -349,7 +454,7 @@ class Pipeline:  # noqa: too-many-public-methods
             The list of all pipeline nodes in topological order.
 
         """
-        return list(chain.from_iterable(self._topo_sorted_nodes))
+        return list(self._index.nodes)
 
     @property
     def grouped_nodes(self) -> list[list[Node]]:
@@ -378,7 +483,14 @@ class Pipeline:  # noqa: too-many-public-methods
             A new ``Pipeline``, containing only ``nodes``.
 
         """
-        unregistered_nodes = set(node_names) - set(self._nodes_by_name.keys())
+        self._validate_node_names(node_names)
+        nodes = [self._nodes_by_name[name] for name in node_names]
+        return Pipeline(nodes)
+
+    def _validate_node_names(self, node_names: Iterable[str]) -> None:
+        unregistered_nodes = {
+            name for name in node_names if name not in self._nodes_by_name
+        }
         if unregistered_nodes:
             # check if unregistered nodes are available under namespace
             namespaces = []
@@ -399,8 +511,14 @@ class Pipeline:  # noqa: too-many-public-methods
                 f"Pipeline does not contain nodes named {list(unregistered_nodes)}."
             )
 
-        nodes = [self._nodes_by_name[name] for name in node_names]
-        return Pipeline(nodes)
+    def _mask(self, nodes: Iterable[Node]) -> int:
+        """The bitset of the ids of ``nodes`` in the index of the pipeline."""
+        index = self._index
+        return index.mask(index.node_ids[node] for node in nodes)
+
+    def _named_mask(self, node_names: Iterable[str]) -> int:
+        self._validate_node_names(node_names)
+        return self._mask(self._nodes_by_name[name] for name in node_names)
 
     def only_nodes_with_namespace(self, node_namespace: str) -> Pipeline:
         """Creates a new ``Pipeline`` containing only nodes with the specified
@@ -415,16 +533,19 @@ class Pipeline:  # noqa: too-many-public-methods
         Returns:
             A new ``Pipeline`` containing nodes with the specified namespace.
         """
+        return self._subset(self._namespace_mask(node_namespace))
+
+    def _namespace_mask(self, node_namespace: str) -> int:
         nodes = [
             n
-            for n in self.nodes
+            for n in self._index.nodes
             if n.namespace and n.namespace.startswith(node_namespace)
         ]
         if not nodes:
             raise ValueError(
                 f"Pipeline does not contain nodes with namespace '{node_namespace}'"
             )
-        return Pipeline(nodes)
+        return self._mask(nodes)
 
     def _get_nodes_with_inputs_transcode_compatible(
         self, datasets: set[str]
@@ -441,9 +562,8 @@ class Pipeline:  # noqa: too-many-public-methods
         Returns:
             Set of ``Nodes`` that use the given datasets as inputs.
         """
-        missing = sorted(
-            datasets - self.data_sets() - self._transcode_compatible_names()
-        )
+        index = self._index
+        missing = sorted(datasets - index.data_sets - index.transcode_compatible_names)
         if missing:
             raise ValueError(f"Pipeline does not contain data_sets named {missing}")
 
@@ -472,9 +592,8 @@ class Pipeline:  # noqa: too-many-public-methods
         Returns:
             Set of ``Nodes`` that output to the given datasets.
         """
-        missing = sorted(
-            datasets - self.data_sets() - self._transcode_compatible_names()
-        )
+        index = self._index
+        missing = sorted(datasets - index.data_sets - index.transcode_compatible_names)
         if missing:
             raise ValueError(f"Pipeline does not contain data_sets named {missing}")
 
@@ -514,7 +633,7 @@ class Pipeline:  # noqa: too-many-public-methods
         starting = set(inputs)
         nodes = self._get_nodes_with_inputs_transcode_compatible(starting)
 
-        return Pipeline(nodes)
+        return self._subset(self._mask(nodes))
 
     def from_inputs(self, *inputs: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -538,23 +657,12 @@ class Pipeline:  # noqa: too-many-public-methods
                 copied.
 
         """
-        starting = set(inputs)
-        result: set[Node] = set()
-        next_nodes = self._get_nodes_with_inputs_transcode_compatible(starting)
-
-        while next_nodes:
-            result |= next_nodes
-            outputs = set(chain.from_iterable(node.outputs for node in next_nodes))
-            starting = outputs
-
-            next_nodes = set(
-                chain.from_iterable(
-                    self._nodes_by_input[_strip_transcoding(input_)]
-                    for input_ in starting
-                )
-            )
+        return self._subset(self._from_inputs_mask(inputs))
 
-        return Pipeline(result)
+    def _from_inputs_mask(self, inputs: Iterable[str]) -> int:
+        index = self._index
+        nodes = self._get_nodes_with_inputs_transcode_compatible(set(inputs))
+        return index.descendants(index.node_ids[node] for node in nodes)
 
     def only_nodes_with_outputs(self, *outputs: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes which are directly
@@ -579,7 +687,7 @@ class Pipeline:  # noqa: too-many-public-methods
         starting = set(outputs)
         nodes = self._get_nodes_with_outputs_transcode_compatible(starting)
 
-        return Pipeline(nodes)
+        return self._subset(self._mask(nodes))
 
     def to_outputs(self, *outputs: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes which are directly
@@ -603,22 +711,12 @@ class Pipeline:  # noqa: too-many-public-methods
             required to produce the provided outputs are being copied.
 
         """
-        starting = set(outputs)
-        result: set[Node] = set()
-        next_nodes = self._get_nodes_with_outputs_transcode_compatible(starting)
-
-        while next_nodes:
-            result |= next_nodes
-            inputs = set(chain.from_iterable(node.inputs for node in next_nodes))
-            starting = inputs
-
-            next_nodes = {
-                self._nodes_by_output[_strip_transcoding(output)]
-                for output in starting
-                if _strip_transcoding(output) in self._nodes_by_output
-            }
+        return self._subset(self._to_outputs_mask(outputs))
 
-        return Pipeline(result)
+    def _to_outputs_mask(self, outputs: Iterable[str]) -> int:
+        index = self._index
+        nodes = self._get_nodes_with_outputs_transcode_compatible(set(outputs))
+        return index.ancestors(index.node_ids[node] for node in nodes)
 
     def from_nodes(self, *node_names: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes which depend
@@ -637,9 +735,14 @@ class Pipeline:  # noqa: too-many-public-methods
 
         """
 
-        res = self.only_nodes(*node_names)
-        res += self.from_inputs(*map(_strip_transcoding, res.all_outputs()))
-        return res
+        return self._subset(self._from_nodes_mask(node_names))
+
+    def _from_nodes_mask(self, node_names: Iterable[str]) -> int:
+        self._validate_node_names(node_names)
+        index = self._index
+        return index.descendants(
+            index.node_ids[self._nodes_by_name[name]] for name in node_names
+        )
 
     def to_nodes(self, *node_names: str) -> Pipeline:
         """Create a new ``Pipeline`` object with the nodes required directly
@@ -658,9 +761,86 @@ class Pipeline:  # noqa: too-many-public-methods
 
         """
 
-        res = self.only_nodes(*node_names)
-        res += self.to_outputs(*map(_strip_transcoding, res.all_inputs()))
-        return res
+        return self._subset(self._to_nodes_mask(node_names))
+
+    def _to_nodes_mask(self, node_names: Iterable[str]) -> int:
+        self._validate_node_names(node_names)
+        index = self._index
+        return index.ancestors(
+            index.node_ids[self._nodes_by_name[name]] for name in node_names
+        )
+
+    def ancestors(self, *node_names: str, direct: bool = False) -> list[Node]:
+        """The nodes which the provided nodes depend on, directly or
+        transitively. Unlike ``to_nodes``, it does not create a new
+        ``Pipeline``, so it is cheap to call many times.
+
+        Args:
+            *node_names: A list of node names to find the ancestors of.
+            direct: Whether to only return the nodes producing the inputs of
+                the provided nodes, rather than all the nodes they depend on.
+
+        Raises:
+            ValueError: Raised when any of the given names do not exist in the
+                ``Pipeline`` object.
+
+        Returns:
+            The ancestors of the provided nodes in topological order. They
+            include a provided node only when another one depends on it.
+
+        Example:
+        ::
+
+            >>> pipeline = Pipeline(
+            >>>     [
+            >>>         node(func, "A", "B", name="node1"),
+            >>>         node(func, "B", "C", name="node2"),
+            >>>         node(func, "C", "D", name="node3"),
+            >>>     ]
+            >>> )
+            >>> [n.name for n in pipeline.ancestors("node3")]
+            ['node1', 'node2']
+            >>> [n.name for n in pipeline.ancestors("node3", direct=True)]
+            ['node2']
+        """
+        return self._related_nodes(node_names, self._index.parents, direct)
+
+    def descendants(self, *node_names: str, direct: bool = False) -> list[Node]:
+        """The nodes which depend on the provided nodes, directly or
+        transitively. Unlike ``from_nodes``, it does not create a new
+        ``Pipeline``, so it is cheap to call many times.
+
+        Args:
+            *node_names: A list of node names to find the descendants of.
+            direct: Whether to only return the nodes using the outputs of the
+                provided nodes, rather than all the nodes depending on them.
+
+        Raises:
+            ValueError: Raised when any of the given names do not exist in the
+                ``Pipeline`` object.
+
+        Returns:
+            The descendants of the provided nodes in topological order. They
+            include a provided node only when it depends on another one.
+        """
+        return self._related_nodes(node_names, self._index.children, direct)
+
+    def _related_nodes(
+        self,
+        node_names: Iterable[str],
+        edges: tuple[tuple[int, ...], ...],
+        direct: bool,
+    ) -> list[Node]:
+        self._validate_node_names(node_names)
+        index = self._index
+        node_ids = (index.node_ids[self._nodes_by_name[name]] for name in node_names)
+        related = list(chain.from_iterable(edges[node_id] for node_id in node_ids))
+        if direct:
+            # a few ids, cheaper to sort than to scan a bitset of all the nodes
+            node_ids = sorted(set(related))
+        else:
+            node_ids = index.mask_ids(index.closure(related, edges))
+        return [index.nodes[node_id] for node_id in node_ids]
 
     def only_nodes_with_tags(self, *tags: str) -> Pipeline:
         """Creates a new ``Pipeline`` object with the nodes which contain *any*
@@ -675,9 +855,11 @@ class Pipeline:  # noqa: too-many-public-methods
                 nodes of the current one such that only nodes containing *any*
                 of the tags provided are being copied.
         """
+        return self._subset(self._tags_mask(tags))
+
+    def _tags_mask(self, tags: Iterable[str]) -> int:
         tags = set(tags)
-        nodes = [node for node in self.nodes if tags & node.tags]
-        return Pipeline(nodes)
+        return self._mask(node for node in self._index.nodes if tags & node.tags)
 
     def filter(  # noqa: too-many-arguments
         self,
@@ -731,27 +913,19 @@ class Pipeline:  # noqa: too-many-public-methods
             >>> pipeline.filter(node_names=["node1", "node3"], from_inputs=["A"])
             >>> # Gives a new pipeline object containing node1 and node3.
         """
-        # Use [node_namespace] so only_nodes_with_namespace can follow the same
-        # *filter_args pattern as the other filtering methods, which all take iterables.
-        node_namespace = [node_namespace] if node_namespace else None
-
-        filter_methods = {
-            self.only_nodes_with_tags: tags,
-            self.from_nodes: from_nodes,
-            self.to_nodes: to_nodes,
-            self.only_nodes: node_names,
-            self.from_inputs: from_inputs,
-            self.to_outputs: to_outputs,
-            self.only_nodes_with_namespace: node_namespace,
-        }
-
-        subset_pipelines = {
-            filter_method(*filter_args)  # type: ignore
-            for filter_method, filter_args in filter_methods.items()
-            if filter_args
+        # Each filter selects a set of node ids of the original pipeline, held as
+        # a bitset, and the sets are intersected.
+        filter_masks = {
+            self._tags_mask: tags,
+            self._from_nodes_mask: from_nodes,
+            self._to_nodes_mask: to_nodes,
+            self._named_mask: node_names,
+            self._from_inputs_mask: from_inputs,
+            self._to_outputs_mask: to_outputs,
+            self._namespace_mask: node_namespace,
         }
 
-        # Intersect all the pipelines subsets. We apply each filter to the original
+        # Intersect all the subsets. We apply each filter to the original
         # pipeline object (self) rather than incrementally chaining filter methods
         # together. Hence the order of filtering does not affect the outcome, and the
         # resultant pipeline is unambiguously defined.
@@ -760,15 +934,16 @@ class Pipeline:  # noqa: too-many-public-methods
         # would give different outcomes depending on the order of filter methods:
         # only_nodes and then from_inputs would give node1, while only_nodes and then
         # from_inputs would give node1 and node3.
-        filtered_pipeline = Pipeline(self.nodes)
-        for subset_pipeline in subset_pipelines:
-            filtered_pipeline &= subset_pipeline
+        mask = (1 << len(self._index.nodes)) - 1
+        for filter_mask, filter_args in filter_masks.items():
+            if filter_args:
+                mask &= filter_mask(filter_args)  # type: ignore
 
-        if not filtered_pipeline.nodes:
+        if not mask:
             raise ValueError(
                 "Pipeline contains no nodes after applying all provided filters"
             )
-        return filtered_pipeline
+        return self._subset(mask)
 
     def tag(self, tags: str | Iterable[str]) -> Pipeline:
         """Tags all the nodes in the pipeline.
@@ -801,6 +976,331 @@ class Pipeline:  # noqa: too-many-public-methods
         return json.dumps(pipeline_versioned)
 
 
+class _NodeMaps:
+    """``_NodeMaps`` holds the nodes of a pipeline and the maps from dataset
+    and node names to them. The pipelines combined with ``+`` and ``union``
+    append their nodes to the maps of the largest of them and share them, so
+    nodes are only ever appended. A pipeline owns the first nodes, as many as
+    it has, and its maps are valid as long as no nodes were appended since.
+    """
+
+    def __init__(self, nodes: list[Node]):
+        self.nodes = list(nodes)
+        self.nodes_by_name = {node.name: node for node in nodes}
+
+        # input -> nodes with input
+        self.nodes_by_input: dict[str, set[Node]] = defaultdict(set)
+        for node in nodes:
+            for input_ in node.inputs:
+                self.nodes_by_input[_strip_transcoding(input_)].add(node)
+
+        # output -> node with output
+        self.nodes_by_output: dict[str, Node] = {}
+        for node in nodes:
+            for output in node.outputs:
+                self.nodes_by_output[_strip_transcoding(output)] = node
+
+        # confirmed dataset -> node confirming it
+        self.nodes_by_confirm: dict[str, Node] = {
+            _strip_transcoding(confirm): node
+            for node in nodes
+            for confirm in node.confirms
+        }
+        # names of the datasets used with transcoding, without it
+        self.transcoded_names = {
+            _strip_transcoding(name)
+            for node in nodes
+            for name in chain(node.inputs, node.outputs)
+            if TRANSCODING_SEPARATOR in name
+        }
+
+    def append(  # noqa: too-many-arguments
+        self,
+        nodes: list[Node],
+        nodes_by_name: Mapping[str, Node],
+        nodes_by_input: Mapping[str, set[Node]],
+        nodes_by_output: Mapping[str, Node],
+        nodes_by_confirm: Mapping[str, Node],
+        transcoded_names: set[str],
+    ) -> None:
+        """Append the nodes of other pipelines and their entries in the maps."""
+        self.nodes.extend(nodes)
+        self.nodes_by_name.update(nodes_by_name)
+        self.nodes_by_input.update(nodes_by_input)
+        self.nodes_by_output.update(nodes_by_output)
+        self.nodes_by_confirm.update(nodes_by_confirm)
+        self.transcoded_names |= transcoded_names
+
+
+class _PipelineIndex:
+    """``_PipelineIndex`` is the adjacency index of a ``Pipeline``. Pipelines
+    are immutable, so it is computed once, on first use, and backs the
+    properties and queries of the pipeline. Nodes are identified by their
+    position in topological order, and datasets by their names without
+    transcoding in the producer and consumer maps.
+    """
+
+    def __init__(self, grouped_nodes: list[list[Node]]):
+        nodes = tuple(chain.from_iterable(grouped_nodes))
+        self.nodes = nodes
+        self.node_ids = {node: node_id for node_id, node in enumerate(nodes)}
+
+        producers: dict[str, int] = {}
+        consumers: dict[str, list[int]] = defaultdict(list)
+        for node_id, node in enumerate(nodes):
+            for output in node.outputs:
+                producers[_strip_transcoding(output)] = node_id
+            for input_ in node.inputs:
+                consumers[_strip_transcoding(input_)].append(node_id)
+        self.producers = producers
+        self.consumers = {name: tuple(ids) for name, ids in consumers.items()}
+
+        # a node using its own output with another transcoding does not
+        # depend on itself, as in ``_topologically_sorted``
+        parents = tuple(
+            tuple(
+                sorted(
+                    {
+                        producers[name]
+                        for name in map(_strip_transcoding, node.inputs)
+                        if name in producers
+                    }
+                    - {node_id}
+                )
+            )
+            for node_id, node in enumerate(nodes)
+        )
+        children: list[list[int]] = [[] for _ in nodes]
+        for node_id, parent_ids in enumerate(parents):
+            for parent_id in parent_ids:
+                children[parent_id].append(node_id)
+        self.parents = parents
+        self.children = tuple(tuple(child_ids) for child_ids in children)
+        self.node_dependencies = MappingProxyType(
+            {
+                node: frozenset(nodes[parent_id] for parent_id in parent_ids)
+                for node, parent_ids in zip(nodes, parents)
+            }
+        )
+
+        all_inputs = frozenset(chain.from_iterable(node.inputs for node in nodes))
+        all_outputs = frozenset(chain.from_iterable(node.outputs for node in nodes))
+        intermediate = consumers.keys() & producers.keys()
+        self.all_inputs = all_inputs
+        self.all_outputs = all_outputs
+        self.inputs = frozenset(
+            name for name in all_inputs if _strip_transcoding(name) not in intermediate
+        )
+        self.outputs = frozenset(
+            name for name in all_outputs if _strip_transcoding(name) not in intermediate
+        )
+        self.data_sets = all_inputs | all_outputs
+        self.transcode_compatible_names = frozenset(consumers.keys() | producers.keys())
+        self._ranks: tuple[int, ...] | None = None
+        # the ``ExecutionPlan`` compiled from the index by ``kedro.runner``
+        self.execution_plan: Any = None
+
+    # Sets of nodes are bitsets of their ids: bit ``i`` of an ``int`` is set
+    # when node ``i`` is part of the set.
+
+    def mask(self, node_ids: Iterable[int]) -> int:
+        """The bitset of ``node_ids``."""
+        bits = bytearray(b"0") * len(self.nodes)
+        for node_id in node_ids:
+            bits[node_id] = ord("1")
+        return int(bits[::-1] or b"0", 2)
+
+    def mask_ids(self, mask: int) -> list[int]:
+        """The ids set in the bitset ``mask``, in topological order."""
+        bits = bin(mask)[:1:-1]
+        return [node_id for node_id, bit in enumerate(bits) if bit == "1"]
+
+    def descendants(self, node_ids: Iterable[int]) -> int:
+        """The bitset of ``node_ids`` and of the nodes depending on them."""
+        return self.closure(node_ids, self.children)
+
+    def ancestors(self, node_ids: Iterable[int]) -> int:
+        """The bitset of ``node_ids`` and of the nodes they depend on."""
+        return self.closure(node_ids, self.parents)
+
+    def closure(
+        self, node_ids: Iterable[int], edges: tuple[tuple[int, ...], ...]
+    ) -> int:
+        """The bitset of ``node_ids`` and of the nodes reached from them by
+        following ``edges``, which are ``parents`` or ``children``.
+        """
+        bits = bytearray(b"0") * len(self.nodes)
+        stack = list(node_ids)
+        while stack:
+            node_id = stack.pop()
+            if bits[node_id] != ord("1"):
+                bits[node_id] = ord("1")
+                stack.extend(edges[node_id])
+        return int(bits[::-1] or b"0", 2)
+
+    def grouped_nodes(self, mask: int) -> list[list[Node]]:
+        """The nodes set in ``mask`` in topologically ordered groups, as
+        ``_topologically_sorted`` groups them: each node is in the group after
+        the last of its parents, and the nodes of a group are sorted.
+        """
+        if self._ranks is None:
+            self._ranks = _sort_ranks(self.nodes)
+
+        groups: list[list[int]] = []
+        depths: dict[int, int] = {}
+        for node_id in self.mask_ids(mask):
+            depth = 1 + max(
+                (
+                    depths[parent]
+                    for parent in self.parents[node_id]
+                    if parent in depths
+                ),
+                default=-1,
+            )
+            depths[node_id] = depth
+            if depth == len(groups):
+                groups.append([])
+            groups[depth].append(node_id)
+        return [
+            [
+                self.nodes[node_id]
+                for node_id in sorted(group, key=self._ranks.__getitem__)
+            ]
+            for group in groups
+        ]
+
+
+def _compose(pipelines: list[Pipeline]) -> Pipeline | None:
+    """Combine the nodes and dataset maps of already validated pipelines,
+    starting from the largest one so that only the nodes of the others are
+    visited. They are appended to the maps of the largest pipeline, which the
+    combined pipeline shares, instead of copying them, so that adding
+    pipelines one at a time with ``sum`` costs the same.
+
+    Returns:
+        The combined ``Pipeline``, or ``None`` when the pipelines conflict and
+        must be validated from scratch to report the error.
+    """
+    # pylint: disable=protected-access
+    base = max(pipelines, key=lambda pipe: pipe._node_count)
+    with _COMPOSE_LOCK:
+        # the base owns all the nodes of its maps while the lock is held
+        maps = base._maps
+        # the maps of the base are only updated once no pipeline conflicts
+        nodes: list[Node] = []
+        nodes_by_name = ChainMap({}, maps.nodes_by_name)
+        nodes_by_output = ChainMap({}, maps.nodes_by_output)
+        nodes_by_confirm = ChainMap({}, maps.nodes_by_confirm)
+        nodes_by_input = ChainMap({}, maps.nodes_by_input)
+        transcoded_names: set[str] = set()
+        # a cycle between two pipelines needs dependencies in both directions
+        feeds_base = fed_by_base = False
+
+        for pipe in pipelines:
+            if pipe is base:
+                continue
+            if _transcoding_conflicts(
+                pipe,
+                nodes_by_input,
+                nodes_by_output,
+                maps.transcoded_names,
+                transcoded_names,
+            ):
+                return None
+            transcoded_names |= pipe._transcoded_names
+            if not (
+                _merge_nodes(nodes, nodes_by_name, pipe._nodes_by_name)
+                and _merge_unique(nodes_by_output, pipe._nodes_by_output)
+                and _merge_unique(nodes_by_confirm, pipe._nodes_by_confirm)
+            ):
+                return None
+            feeds_base = feeds_base or any(
+                maps.nodes_by_input.get(name) for name in pipe._nodes_by_output
+            )
+            for name, consumers in pipe._nodes_by_input.items():
+                if consumers:
+                    fed_by_base = fed_by_base or name in maps.nodes_by_output
+                    # the sets of consumers are shared and never modified
+                    current = nodes_by_input.get(name)
+                    nodes_by_input[name] = current | consumers if current else consumers
+
+        maps.append(
+            nodes,
+            nodes_by_name.maps[0],
+            nodes_by_input.maps[0],
+            nodes_by_output.maps[0],
+            nodes_by_confirm.maps[0],
+            transcoded_names,
+        )
+
+    combined = Pipeline.__new__(Pipeline)
+    combined._node_maps = maps
+    combined._node_count = len(maps.nodes)
+    combined._cached_grouped_nodes = None
+    combined._cached_index = None
+    if len(pipelines) > 2 or (feeds_base and fed_by_base):  # noqa: PLR2004
+        # check for circular dependencies now, as the constructor does
+        combined._topo_sorted_nodes  # pylint: disable=pointless-statement
+    return combined
+
+
+def _transcoding_conflicts(  # noqa: too-many-arguments
+    pipe: Pipeline,
+    nodes_by_input: Mapping[str, set[Node]],
+    nodes_by_output: Mapping[str, Node],
+    transcoded_names: set[str],
+    added_transcoded_names: set[str],
+) -> bool:
+    """Whether ``pipe`` uses a dataset with transcoding which the combined
+    pipelines use without it, or the other way around. The names of the
+    datasets the combined pipelines use with transcoding are in either
+    ``transcoded_names`` or ``added_transcoded_names``.
+    """
+    # pylint: disable=protected-access
+    names = {name for name, consumers in pipe._nodes_by_input.items() if consumers}
+    names.update(pipe._nodes_by_output)
+    return any(
+        (bool(nodes_by_input.get(name)) or name in nodes_by_output)
+        and (name in pipe._transcoded_names)
+        != (name in transcoded_names or name in added_transcoded_names)
+        for name in names
+    )
+
+
+def _merge_nodes(
+    nodes: list[Node], nodes_by_name: MutableMapping[str, Node], others: dict[str, Node]
+) -> bool:
+    """Add the nodes of ``others`` missing from ``nodes_by_name`` to both.
+
+    Returns:
+        ``False`` when a different node with the same name is already there.
+    """
+    for name, node in others.items():
+        existing = nodes_by_name.get(name)
+        if existing is None:
+            nodes_by_name[name] = node
+            nodes.append(node)
+        elif existing is not node and existing != node:
+            return False
+    return True
+
+
+def _merge_unique(
+    nodes_by_name: MutableMapping[str, Node], others: dict[str, Node]
+) -> bool:
+    """Add the datasets of ``others`` to ``nodes_by_name``, a map of datasets to
+    the single node producing or confirming them.
+
+    Returns:
+        ``False`` when a dataset is mapped to another node already.
+    """
+    for name, node in others.items():
+        existing = nodes_by_name.setdefault(name, node)
+        if existing is not node and existing != node:
+            return False
+    return True
+
+
 def _validate_duplicate_nodes(nodes_or_pipes: Iterable[Node | Pipeline]):
     seen_nodes: set[str] = set()
     duplicates: dict[Pipeline | None, set[str]] = defaultdict(set)
@@ -884,7 +1384,21 @@ def _validate_transcoded_inputs_outputs(nodes: list[Node]) -> None:
         )
 
 
-def _topologically_sorted(node_dependencies) -> list[list[Node]]:
+def _sort_ranks(nodes: Sequence[Node]) -> tuple[int, ...]:
+    """The position of each node when ``nodes`` are sorted. The key of every
+    node is computed once, instead of for every comparison of two nodes.
+    """
+    order = sorted(
+        range(len(nodes)),
+        key=lambda node_id: nodes[node_id]._unique_key,  # noqa: protected-access
+    )
+    ranks = [0] * len(order)
+    for rank, node_id in enumerate(order):
+        ranks[node_id] = rank
+    return tuple(ranks)
+
+
+def _topologically_sorted(nodes: Sequence[Node]) -> list[list[Node]]:
     """Topologically group and sort (order) nodes such that no node depends on
     a node that appears in the same or a later group.
 
@@ -897,23 +1411,45 @@ def _topologically_sorted(node_dependencies) -> list[list[Node]]:
         be executed first (no dependencies), second set are nodes that should be
         executed on the second step, etc.
     """
-
-    def _circle_error_message(error_data: dict[str, str]) -> str:
-        """Error messages provided by the toposort library will
-        refer to indices that are used as an intermediate step.
-        This method can be used to replace that message with
-        one that refers to the nodes' string representations.
-        """
-        circular = [str(node) for node in error_data.keys()]
-        return f"Circular dependencies exist among these items: {circular}"
-
-    try:
-        # Sort it so it has consistent order when run with SequentialRunner
-        result = [sorted(dependencies) for dependencies in toposort(node_dependencies)]
-        return result
-    except ToposortCircleError as exc:
-        message = _circle_error_message(exc.data)
-        raise CircularDependencyError(message) from exc
+    # Kahn's algorithm on the positions of the nodes, one group at a time
+    producers = {
+        _strip_transcoding(output): node_id
+        for node_id, node in enumerate(nodes)
+        for output in node.outputs
+    }
+    children: list[list[int]] = [[] for _ in nodes]
+    in_degrees = [0] * len(nodes)
+    for node_id, node in enumerate(nodes):
+        parents = {producers.get(_strip_transcoding(input_)) for input_ in node.inputs}
+        # a node using its own output with another transcoding is not a cycle
+        parents.discard(node_id)
+        parents.discard(None)
+        for parent in parents:
+            children[parent].append(node_id)
+        in_degrees[node_id] = len(parents)
+
+    # Sort the groups so they have consistent order when run with SequentialRunner
+    ranks = _sort_ranks(nodes)
+    groups = []
+    group = [node_id for node_id, degree in enumerate(in_degrees) if not degree]
+    while group:
+        group.sort(key=ranks.__getitem__)
+        groups.append(group)
+        next_group = []
+        for node_id in group:
+            for child in children[node_id]:
+                in_degrees[child] -= 1
+                if not in_degrees[child]:
+                    next_group.append(child)
+        group = next_group
+
+    if sum(map(len, groups)) < len(nodes):
+        # the nodes in cycles and the nodes depending on them
+        circular = [str(node) for node, degree in zip(nodes, in_degrees) if degree]
+        raise CircularDependencyError(
+            f"Circular dependencies exist among these items: {circular}"
+        )
+    return [[nodes[node_id] for node_id in group] for group in groups]
 
 
 class CircularDependencyError(Exception):
@@ -2,15 +2,41 @@
 to execute ``Pipeline`` instances.
 """
 
+from .async_runner import AsyncRunner
+from .execution_plan import ExecutionPlan
+from .fusion import find_linear_chains
+from .hybrid_runner import HybridRunner
+from .io_executor import IOExecutor
+from .memory_budget import MemoryBudget
+from .node_cache import NodeCache
 from .parallel_runner import ParallelRunner
+from .prefetcher import Prefetcher
+from .run_cache import RunCache
+from .run_journal import RunJournal
 from .runner import AbstractRunner, run_node
+from .scheduler import CriticalPathScheduler, DependencyScheduler, NodeTimings
 from .sequential_runner import SequentialRunner
 from .thread_runner import ThreadRunner
+from .write_behind import WriteBehind
 
 __all__ = [
     "AbstractRunner",
+    "AsyncRunner",
+    "CriticalPathScheduler",
+    "DependencyScheduler",
+    "ExecutionPlan",
+    "HybridRunner",
+    "IOExecutor",
+    "MemoryBudget",
+    "NodeCache",
+    "NodeTimings",
     "ParallelRunner",
+    "Prefetcher",
+    "RunCache",
+    "RunJournal",
     "SequentialRunner",
     "ThreadRunner",
+    "WriteBehind",
+    "find_linear_chains",
     "run_node",
 ]
@@ -0,0 +1,258 @@
+"""``AsyncRunner`` is an ``AbstractRunner`` implementation. It can be used to
+run the ``Pipeline`` in a single ``asyncio`` event loop, awaiting node
+functions defined with ``async def`` and data sets which support ``asyncio``.
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable
+
+from pluggy import PluginManager
+
+from kedro.io import AbstractDataSet, DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+from kedro.runner.runner import AbstractRunner, _collect_inputs_from_hook, run_node
+from kedro.runner.scheduler import DependencyScheduler
+
+
+class AsyncRunner(AbstractRunner):
+    """``AsyncRunner`` is an ``AbstractRunner`` implementation. It runs all
+    the nodes of the ``Pipeline`` as tasks of a single ``asyncio`` event loop,
+    starting every node as soon as its dependencies have completed.
+
+    Node functions defined with ``async def`` are awaited in the event loop,
+    so many I/O bound nodes can wait on the network at once without a thread
+    each. Data sets which implement the ``_load_async`` and ``_save_async``
+    coroutine methods are loaded and saved in the event loop too. Regular node
+    functions and data sets run in a bounded pool of threads instead, so they
+    do not block the event loop.
+
+    Example:
+    ::
+
+        >>> import aiohttp
+        >>> from kedro.pipeline import node, pipeline
+        >>> from kedro.runner import AsyncRunner
+        >>>
+        >>> async def fetch(url):
+        >>>     async with aiohttp.ClientSession() as session:
+        >>>         async with session.get(url) as response:
+        >>>             return await response.text()
+        >>>
+        >>> p = pipeline([node(fetch, f"url_{i}", f"page_{i}") for i in range(100)])
+        >>> AsyncRunner(max_concurrency=20).run(p, catalog)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        max_concurrency: int = None,
+        is_async: bool = False,
+    ):
+        """Instantiates the runner.
+
+        Args:
+            max_workers: Number of threads to run regular node functions and
+                load and save data sets which do not support ``asyncio`` with.
+                If not set, calculated automatically by ``ThreadPoolExecutor``.
+            max_concurrency: Maximum number of nodes running at the same time.
+                If not set, every node runs as soon as it is ready.
+            is_async: Has no effect, as ``AsyncRunner`` always loads and saves
+                the inputs and outputs of a node concurrently. Accepted for
+                compatibility with the other runners.
+
+        Raises:
+            ValueError: bad parameters passed
+        """
+        super().__init__(is_async=is_async)
+        for value in (max_workers, max_concurrency):
+            if value is not None and value <= 0:
+                raise ValueError("max_workers and max_concurrency should be positive")
+
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency
+
+    def create_default_data_set(self, ds_name: str) -> AbstractDataSet:
+        """Factory method for creating the default dataset for the runner.
+
+        Args:
+            ds_name: Name of the missing dataset.
+
+        Returns:
+            An instance of ``MemoryDataset`` to be used for all
+            unregistered datasets.
+
+        """
+        return MemoryDataset()
+
+    def _run(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager,
+        session_id: str = None,
+    ) -> None:
+        """The abstract interface for running pipelines.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            session_id: The id of the session.
+
+        Raises:
+            Exception: in case of any downstream node failure.
+
+        """
+        coroutine = self._run_async(pipeline, catalog, hook_manager, session_id)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(coroutine)
+            return
+        # An event loop is already running in this thread, e.g. in a notebook,
+        # so the pipeline runs in a new event loop in another thread.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(asyncio.run, coroutine).result()
+
+    async def _run_async(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager,
+        session_id: str = None,
+    ) -> None:
+        plan = ExecutionPlan.from_pipeline(pipeline)
+        nodes = plan.nodes
+        load_counts = plan.load_counts()
+        scheduler = DependencyScheduler(plan)
+        semaphore = (
+            asyncio.Semaphore(self._max_concurrency) if self._max_concurrency else None
+        )
+        done_nodes: set[Node] = set()
+        tasks: dict[asyncio.Task, Node] = {}
+
+        async def run(node: Node) -> Node:
+            if semaphore is None:
+                return await _run_node_coroutine(
+                    node, catalog, hook_manager, executor, session_id
+                )
+            async with semaphore:
+                return await _run_node_coroutine(
+                    node, catalog, hook_manager, executor, session_id
+                )
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            try:
+                while True:
+                    for node in scheduler.pop_ready():
+                        tasks[asyncio.ensure_future(run(node))] = node
+                    if not tasks:
+                        todo_nodes = scheduler.todo_nodes
+                        assert not todo_nodes, (todo_nodes, done_nodes)
+                        break
+                    done, _ = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        node = tasks.pop(task)
+                        task.result()
+                        done_nodes.add(node)
+                        scheduler.complete(node)
+                        self._record_completed(node, catalog)
+                        self._logger.info("Completed node: %s", node.name)
+                        self._logger.info(
+                            "Completed %d out of %d tasks", len(done_nodes), len(nodes)
+                        )
+                        self._release_datasets(node, catalog, load_counts, plan)
+            except Exception:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                self._suggest_resume_scenario(pipeline, done_nodes, catalog)
+                raise
+
+
+def _is_coroutine_function(func: Callable) -> bool:
+    """Check whether ``func`` is a coroutine function, looking through
+    ``functools.partial`` objects and decorators which set ``__wrapped__``.
+    """
+    func = inspect.unwrap(func)
+    while isinstance(func, partial):
+        func = inspect.unwrap(func.func)
+    return inspect.iscoroutinefunction(func)
+
+
+async def _run_node_coroutine(
+    node: Node,
+    catalog: DataCatalog,
+    hook_manager: PluginManager,
+    executor: Executor,
+    session_id: str = None,
+) -> Node:
+    """Run a single ``Node`` in the running event loop, loading its inputs and
+    saving its outputs concurrently. Mirrors ``run_node`` with ``is_async``.
+    """
+    loop = asyncio.get_running_loop()
+    if inspect.isgeneratorfunction(node.func):
+        # chunks of generator nodes are saved one at a time, as they are produced
+        return await loop.run_in_executor(
+            executor, run_node, node, catalog, hook_manager, False, session_id
+        )
+
+    is_async = True
+
+    async def load(name: str) -> Any:
+        hook_manager.hook.before_dataset_loaded(dataset_name=name, node=node)
+        data = await catalog.load_async(name, executor=executor)
+        hook_manager.hook.after_dataset_loaded(dataset_name=name, data=data, node=node)
+        return data
+
+    async def save(name: str, data: Any) -> None:
+        hook_manager.hook.before_dataset_saved(dataset_name=name, data=data, node=node)
+        await catalog.save_async(name, data, executor=executor)
+        hook_manager.hook.after_dataset_saved(dataset_name=name, data=data, node=node)
+
+    values = await asyncio.gather(*(load(name) for name in node.inputs))
+    inputs = dict(zip(node.inputs, values))
+    additional_inputs = _collect_inputs_from_hook(
+        node, catalog, inputs, is_async, hook_manager, session_id=session_id
+    )
+    inputs.update(additional_inputs)
+
+    pending: Awaitable[dict[str, Any]]
+    if _is_coroutine_function(node.func):
+        pending = node.run_async(inputs)
+    else:
+        pending = loop.run_in_executor(executor, node.run, inputs)
+    try:
+        outputs = await pending
+    except Exception as exc:
+        hook_manager.hook.on_node_error(
+            error=exc,
+            node=node,
+            catalog=catalog,
+            inputs=inputs,
+            is_async=is_async,
+            session_id=session_id,
+        )
+        raise exc
+    hook_manager.hook.after_node_run(
+        node=node,
+        catalog=catalog,
+        inputs=inputs,
+        outputs=outputs,
+        is_async=is_async,
+        session_id=session_id,
+    )
+
+    await asyncio.gather(*(save(name, data) for name, data in outputs.items()))
+
+    for name in node.confirms:
+        catalog.confirm(name)
+    return node
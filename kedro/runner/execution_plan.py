@@ -0,0 +1,177 @@
+"""``ExecutionPlan`` is a compiled, read-only view of a ``Pipeline`` which
+holds everything a runner needs to schedule nodes and release data.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from itertools import chain
+from typing import Iterable, Iterator
+
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+
+
+class ExecutionPlan:
+    """``ExecutionPlan`` is compiled once from a ``Pipeline`` and shared by
+    all runners. It gives every node an integer id following the topological
+    order, keeps the parent and child ids of every node, counts how many nodes
+    consume each dataset and precomputes when datasets can be released when
+    nodes run in topological order.
+
+    Use ``ExecutionPlan.from_pipeline`` to get the cached plan of a pipeline.
+
+    Example:
+    ::
+
+        >>> from kedro.pipeline import node, pipeline
+        >>> from kedro.runner import ExecutionPlan
+        >>>
+        >>> p = pipeline([node(len, "a", "b"), node(str, "b", "c")])
+        >>> plan = ExecutionPlan.from_pipeline(p)
+        >>> [n.name for n in plan.nodes]
+        ['len([a]) -> [b]', 'str([b]) -> [c]']
+        >>> plan.release_schedule
+        ((), ('b',))
+    """
+
+    def __init__(self, pipeline: Pipeline):
+        """Compiles the ``ExecutionPlan`` of a ``Pipeline``.
+
+        Args:
+            pipeline: The ``Pipeline`` to compile.
+        """
+        # the node ids and the adjacency follow the index of the pipeline
+        index = pipeline._index  # noqa: protected-access
+        self._nodes = index.nodes
+        self._node_ids = index.node_ids
+        self._node_inputs = tuple(tuple(node.inputs) for node in index.nodes)
+        self._node_outputs = tuple(tuple(node.outputs) for node in index.nodes)
+        self._parents = index.parents
+        self._children = index.children
+
+        # Dependencies on anything other than the pipeline nodes still count
+        # towards the in-degree, so such nodes can never be scheduled.
+        node_dependencies = pipeline.node_dependencies
+        self._in_degrees = tuple(len(node_dependencies[node]) for node in index.nodes)
+
+        self._load_counts = Counter(chain.from_iterable(self._node_inputs))
+        self._free_inputs = index.inputs
+        self._free_outputs = index.outputs
+        self._data_sets = index.data_sets
+        self._group_count = len(pipeline.grouped_nodes)
+        self._release_schedule = self._compile_release_schedule()
+
+    @classmethod
+    def from_pipeline(cls, pipeline: Pipeline) -> ExecutionPlan:
+        """Returns the ``ExecutionPlan`` of a ``Pipeline``, compiling it on
+        first use. ``Pipeline`` objects are immutable, so the compiled plan is
+        kept with the index of the pipeline.
+
+        Args:
+            pipeline: The ``Pipeline`` to get the plan for.
+
+        Returns:
+            The ``ExecutionPlan`` of the pipeline.
+        """
+        index = pipeline._index  # noqa: protected-access
+        if index.execution_plan is None:
+            index.execution_plan = cls(pipeline)
+        return index.execution_plan
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @property
+    def nodes(self) -> tuple[Node, ...]:
+        """The nodes of the plan in topological order. The position of a
+        node in this tuple is its id.
+        """
+        return self._nodes
+
+    @property
+    def free_inputs(self) -> frozenset[str]:
+        """The free inputs of the pipeline, see ``Pipeline.inputs()``."""
+        return self._free_inputs
+
+    @property
+    def free_outputs(self) -> frozenset[str]:
+        """The free outputs of the pipeline, see ``Pipeline.outputs()``."""
+        return self._free_outputs
+
+    @property
+    def data_sets(self) -> frozenset[str]:
+        """All datasets used by the pipeline, see ``Pipeline.data_sets()``."""
+        return self._data_sets
+
+    @property
+    def group_count(self) -> int:
+        """The number of topologically sorted groups of the pipeline."""
+        return self._group_count
+
+    @property
+    def release_schedule(self) -> tuple[tuple[str, ...], ...]:
+        """The datasets which can be released once each node completes, when
+        the nodes run one at a time in topological order. Indexed by node id.
+        """
+        return self._release_schedule
+
+    def node_id(self, node: Node) -> int:
+        """Returns the integer id of a node of the plan."""
+        return self._node_ids[node]
+
+    def node_inputs(self, node_id: int) -> tuple[str, ...]:
+        """Returns the input names of the node with the given id."""
+        return self._node_inputs[node_id]
+
+    def node_outputs(self, node_id: int) -> tuple[str, ...]:
+        """Returns the output names of the node with the given id."""
+        return self._node_outputs[node_id]
+
+    def parents(self, node_id: int) -> tuple[int, ...]:
+        """Returns the ids of the direct parents of a node."""
+        return self._parents[node_id]
+
+    def children(self, node_id: int) -> tuple[int, ...]:
+        """Returns the ids of the direct children of a node."""
+        return self._children[node_id]
+
+    def in_degree(self, node_id: int) -> int:
+        """Returns the number of nodes the node with the given id depends on."""
+        return self._in_degrees[node_id]
+
+    def load_counts(self) -> Counter:
+        """Returns a new counter of the number of nodes consuming each dataset.
+        Runners decrement it as nodes complete using ``datasets_to_release``.
+        """
+        return Counter(self._load_counts)
+
+    def datasets_to_release(self, node: Node, load_counts: Counter) -> Iterator[str]:
+        """Decrements the load counts of the inputs of a completed node and
+        yields every dataset that is no longer needed by the rest of the run.
+        Free inputs and outputs of the pipeline are never released.
+
+        Args:
+            node: The node which completed.
+            load_counts: The counter returned by ``load_counts()`` for this run.
+
+        Yields:
+            The names of the datasets which can be released.
+        """
+        node_id = self._node_ids[node]
+        yield from self._release(node_id, load_counts)
+
+    def _release(self, node_id: int, load_counts: Counter) -> Iterable[str]:
+        for data_set in self._node_inputs[node_id]:
+            load_counts[data_set] -= 1
+            if load_counts[data_set] < 1 and data_set not in self._free_inputs:
+                yield data_set
+        for data_set in self._node_outputs[node_id]:
+            if load_counts[data_set] < 1 and data_set not in self._free_outputs:
+                yield data_set
+
+    def _compile_release_schedule(self) -> tuple[tuple[str, ...], ...]:
+        load_counts = self.load_counts()
+        return tuple(
+            tuple(self._release(node_id, load_counts))
+            for node_id in range(len(self._nodes))
+        )
@@ -0,0 +1,173 @@
+"""Functions to find the nodes of a ``Pipeline`` whose persisted outputs are
+older than their inputs, comparing the modification times the file systems
+of the datasets report.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any
+
+from kedro.io import AbstractDataSet, DataCatalog, MemoryDataset
+from kedro.io.core import get_filepath_str
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+
+UNTIMESTAMPED_POLICIES = ("fresh", "stale")
+
+# keys of the modification time in the ``info`` of the fsspec file systems,
+# e.g. local, S3, Azure and GCS
+_MODIFIED_KEYS = ("mtime", "LastModified", "last_modified", "updated", "modified")
+
+
+def _to_timestamp(value: Any) -> float | None:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def get_last_modified(data_set: AbstractDataSet) -> float | None:
+    """Gets the time the data of a dataset was last modified, from the
+    ``info`` of its fsspec file system. For versioned datasets, this is the
+    time the version to load was saved.
+
+    Args:
+        data_set: The dataset.
+
+    Returns:
+        The modification time as a POSIX timestamp, or None if the dataset
+        does not use an fsspec file system or it reports no modification time.
+    """
+    fs = getattr(data_set, "_fs", None)
+    get_load_path = getattr(data_set, "_get_load_path", None)
+    if fs is None or (get_load_path is None and not hasattr(data_set, "_filepath")):
+        return None
+    try:
+        path = get_load_path() if get_load_path else data_set._filepath  # type: ignore
+        info = fs.info(get_filepath_str(path, getattr(data_set, "_protocol", "")))
+    except Exception:  # pylint: disable=broad-except
+        logging.getLogger(__name__).debug(
+            "Cannot get the modification time of %s.", data_set, exc_info=True
+        )
+        return None
+    for key in _MODIFIED_KEYS:
+        timestamp = _to_timestamp(info.get(key))
+        if timestamp is not None:
+            return timestamp
+    return None
+
+
+def validate_untimestamped(untimestamped: str) -> None:
+    """Checks the policy for persisted datasets without a modification time.
+
+    Raises:
+        ValueError: If the policy is neither ``fresh`` nor ``stale``.
+    """
+    if untimestamped not in UNTIMESTAMPED_POLICIES:
+        raise ValueError(
+            f"Unknown policy '{untimestamped}' for datasets without a "
+            f"modification time. Use one of {list(UNTIMESTAMPED_POLICIES)}."
+        )
+
+
+class _Freshness:
+    """Computes which nodes are stale, visiting the nodes in topological order.
+
+    The effective modification time of a persisted dataset is the one its
+    file system reports. The one of a dataset held in memory is the newest
+    effective modification time of the inputs of the node producing it, as
+    it would be computed from them again.
+    """
+
+    def __init__(self, catalog: DataCatalog, untimestamped: str):
+        self._catalog = catalog
+        self._untimestamped = untimestamped
+        self._times: dict[str, float] = {}
+        self._stale_outputs: set[str] = set()
+
+    def _persisted(self, name: str) -> AbstractDataSet | None:
+        if name not in self._catalog:
+            return None
+        data_set = self._catalog._get_dataset(name)  # noqa: protected-access
+        return None if isinstance(data_set, MemoryDataset) else data_set
+
+    def is_stale(self, node: Node) -> bool:
+        """Whether the node has to run again, recording the effective
+        modification times of its outputs.
+        """
+        newest_input = max(
+            (time for time in map(self._time, node.inputs) if time is not None),
+            default=None,
+        )
+        stale = any(name in self._stale_outputs for name in node.inputs)
+        for name in node.outputs:
+            data_set = self._persisted(name)
+            if data_set is None:
+                if newest_input is not None:
+                    self._times[name] = newest_input
+                # registered datasets held in memory are empty before the run
+                stale = stale or (
+                    name in self._catalog and not self._catalog.exists(name)
+                )
+            elif not stale:
+                stale = self._is_output_stale(name, data_set, newest_input)
+        if stale:
+            self._stale_outputs.update(node.outputs)
+        return stale
+
+    def _is_output_stale(
+        self, name: str, data_set: AbstractDataSet, newest_input: float | None
+    ) -> bool:
+        if not self._catalog.exists(name):
+            return True
+        modified = get_last_modified(data_set)
+        if modified is None:
+            return self._untimestamped == "stale"
+        return newest_input is not None and modified < newest_input
+
+    def _time(self, name: str) -> float | None:
+        if name not in self._times:
+            data_set = self._persisted(name)
+            modified = get_last_modified(data_set) if data_set else None
+            if modified is None and data_set and self._untimestamped == "stale":
+                # an input without a modification time is always newer
+                modified = float("inf")
+            if modified is not None:
+                self._times[name] = modified
+        return self._times.get(name)
+
+
+def find_stale_nodes(
+    pipeline: Pipeline, catalog: DataCatalog, untimestamped: str = "fresh"
+) -> Pipeline:
+    """Finds the nodes whose persisted outputs are missing or older than any of
+    their inputs, and all the nodes downstream of them. Inputs held in memory
+    are as old as the newest of the inputs they are computed from.
+
+    Args:
+        pipeline: The ``Pipeline`` to check.
+        catalog: The ``DataCatalog`` of the datasets of the pipeline.
+        untimestamped: How to treat persisted datasets without a modification
+            time. ``fresh`` considers them up to date with their inputs, and
+            ``stale`` considers them older than their inputs and newer than
+            their outputs. Defaults to ``fresh``.
+
+    Returns:
+        The ``Pipeline`` of the stale nodes.
+
+    Raises:
+        ValueError: If ``untimestamped`` is neither ``fresh`` nor ``stale``.
+    """
+    validate_untimestamped(untimestamped)
+    freshness = _Freshness(catalog, untimestamped)
+    plan = ExecutionPlan.from_pipeline(pipeline)
+    stale = [node for node in plan.nodes if freshness.is_stale(node)]
+    return Pipeline(stale)
@@ -0,0 +1,65 @@
+"""``find_linear_chains`` finds the chains of nodes of an ``ExecutionPlan``
+which a runner can run one after the other as a single task.
+"""
+from __future__ import annotations
+
+from typing import AbstractSet
+
+from kedro.runner.execution_plan import ExecutionPlan
+
+
+def find_linear_chains(
+    plan: ExecutionPlan, in_memory: AbstractSet[str]
+) -> tuple[tuple[int, ...], ...]:
+    """Finds the maximal linear chains of nodes of an ``ExecutionPlan`` which
+    are connected only through datasets held in memory. Running a chain as a
+    single task saves scheduling each of its nodes, and the data passed
+    between them never leaves the process running the chain.
+
+    A node is fused with its parent when it is the only child of the parent,
+    the parent is its only dependency, and the datasets passed between them
+    are in ``in_memory`` and used by no other node.
+
+    Example:
+    ::
+
+        >>> from kedro.pipeline import node, pipeline
+        >>> from kedro.runner import ExecutionPlan, find_linear_chains
+        >>>
+        >>> p = pipeline(
+        >>>     [node(len, "a", "b"), node(str, "b", "c"), node(len, "c", "d")]
+        >>> )
+        >>> find_linear_chains(ExecutionPlan.from_pipeline(p), in_memory={"b"})
+        ((0, 1),)
+
+    Args:
+        plan: The ``ExecutionPlan`` to find the chains of.
+        in_memory: The names of the datasets held in memory, e.g. the default
+            datasets of the runner.
+
+    Returns:
+        The chains of at least two nodes, as node ids in running order.
+    """
+
+    def fusable(parent_id: int, child_id: int) -> bool:
+        if plan.children(parent_id) != (child_id,) or plan.in_degree(child_id) != 1:
+            return False
+        # any other node using the data would be another child of the parent,
+        # and nodes linked through transcoded datasets share no dataset name
+        linked = set(plan.node_outputs(parent_id)) & set(plan.node_inputs(child_id))
+        return bool(linked) and linked <= in_memory
+
+    chains = []
+    for node_id in range(len(plan)):
+        parents = plan.parents(node_id)
+        if len(parents) == 1 and fusable(parents[0], node_id):
+            # the node is part of the chain of its parent
+            continue
+        chain = [node_id]
+        children = plan.children(node_id)
+        while len(children) == 1 and fusable(chain[-1], children[0]):
+            chain.append(children[0])
+            children = plan.children(chain[-1])
+        if len(chain) > 1:
+            chains.append(tuple(chain))
+    return tuple(chains)
@@ -0,0 +1,383 @@
+"""``HybridRunner`` is an ``AbstractRunner`` implementation. It can be
+used to run each node of the ``Pipeline`` in a process pool, in a thread
+pool or in the main thread, depending on the node.
+"""
+from __future__ import annotations
+
+import os
+import uuid
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import ExitStack
+from multiprocessing.reduction import ForkingPickler
+from pickle import PicklingError
+from typing import Any
+
+from pluggy import PluginManager
+
+from kedro.io import AbstractDataSet, DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+from kedro.runner.parallel_runner import (
+    ParallelRunner,
+    ParallelRunnerManager,
+    _create_worker_pool,
+    _run_node_by_id,
+    _SharedMemoryDataset,
+)
+from kedro.runner.runner import AbstractRunner, run_node
+from kedro.runner.scheduler import DependencyScheduler
+
+PROCESS = "process"
+THREAD = "thread"
+MAIN = "main"
+ROUTES = (PROCESS, THREAD, MAIN)
+
+
+class HybridRunner(AbstractRunner):
+    """``HybridRunner`` is an ``AbstractRunner`` implementation. It routes
+    each node of the ``Pipeline`` to a process pool, a thread pool or the
+    main thread, and schedules all of them with a single dependency scheduler.
+
+    Nodes are routed by their tags: a node tagged with one of the keys of
+    ``tag_routes`` goes to the matching route, any other node goes to
+    ``default_route``. By default the tags ``process``, ``thread`` and
+    ``main`` route nodes to the route of the same name. Nodes which would run
+    in a process but use a dataset which can only be used by a single
+    process, i.e. with the ``_SINGLE_PROCESS`` attribute, run in the main
+    thread instead.
+
+    Example:
+    ::
+
+        >>> from kedro.pipeline import node, pipeline
+        >>> from kedro.runner import HybridRunner
+        >>>
+        >>> p = pipeline(
+        >>>     [
+        >>>         node(fetch_pages, "urls", "pages", tags="io"),
+        >>>         node(parse_pages, "pages", "table", tags="cpu"),
+        >>>     ]
+        >>> )
+        >>> runner = HybridRunner(tag_routes={"io": "thread", "cpu": "process"})
+        >>> runner.run(p, catalog)
+    """
+
+    def __init__(  # noqa: too-many-arguments
+        self,
+        max_workers: int = None,
+        max_threads: int = None,
+        is_async: bool = False,
+        default_route: str = THREAD,
+        tag_routes: dict[str, str] = None,
+        io_workers: int = None,
+    ):
+        """Instantiates the runner.
+
+        Args:
+            max_workers: Number of worker processes to spawn for the nodes
+                routed to processes. If not set, the number of CPU cores.
+            max_threads: Number of threads to run the nodes routed to threads
+                with. If not set, calculated automatically by
+                ``ThreadPoolExecutor``.
+            is_async: If True, the node inputs and outputs are loaded and saved
+                asynchronously with threads. Defaults to False.
+            default_route: The route of the nodes which have none of the tags
+                of ``tag_routes``, one of ``process``, ``thread`` or ``main``.
+                Defaults to ``thread``.
+            tag_routes: A mapping from node tags to the route of the nodes
+                with that tag. Defaults to routing the tags ``process``,
+                ``thread`` and ``main`` to the route of the same name.
+            io_workers: The number of threads loading and saving data when
+                ``is_async`` is True, in the main process and in each worker
+                process. If not set, calculated automatically by
+                ``ThreadPoolExecutor``.
+
+        Raises:
+            ValueError: bad parameters passed
+        """
+        super().__init__(is_async=is_async, io_workers=io_workers)
+        tag_routes = (
+            {route: route for route in ROUTES} if tag_routes is None else tag_routes
+        )
+        invalid = sorted(
+            {default_route, *tag_routes.values()}.difference(ROUTES), key=str
+        )
+        if invalid:
+            raise ValueError(
+                f"Invalid routes {invalid}, routes must be one of: {', '.join(ROUTES)}."
+            )
+        for value in (max_workers, max_threads):
+            if value is not None and value <= 0:
+                raise ValueError("max_workers and max_threads should be positive")
+
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_threads = max_threads
+        self._default_route = default_route
+        self._tag_routes = dict(tag_routes)
+        self._manager: ParallelRunnerManager | None = None
+        self._node_routes: dict[Node, str] = {}
+        self._process_data_sets: frozenset[str] = frozenset()
+
+    def create_default_data_set(self, ds_name: str) -> AbstractDataSet:
+        """Factory method for creating the default dataset for the runner.
+
+        Args:
+            ds_name: Name of the missing dataset.
+
+        Returns:
+            A ``_SharedMemoryDataset`` for the datasets used by nodes routed
+            to processes, otherwise a ``MemoryDataset``.
+
+        """
+        if ds_name in self._process_data_sets:
+            return _SharedMemoryDataset(self._manager)  # type: ignore
+        return MemoryDataset()
+
+    def route(self, node: Node, catalog: DataCatalog) -> str:
+        """Returns the route of a node.
+
+        Args:
+            node: The ``Node`` to route.
+            catalog: The ``DataCatalog`` the node loads and saves data with.
+
+        Raises:
+            ValueError: If the tags of the node map to different routes.
+
+        Returns:
+            One of ``process``, ``thread`` or ``main``.
+        """
+        routes = {self._tag_routes[tag] for tag in node.tags if tag in self._tag_routes}
+        if len(routes) > 1:
+            raise ValueError(
+                f"Node '{node.name}' is tagged to run in more than one way: "
+                f"{sorted(routes)}."
+            )
+        route = routes.pop() if routes else self._default_route
+
+        data_sets = catalog._data_sets  # noqa: protected-access
+        if route == PROCESS and any(
+            getattr(data_sets.get(name), "_SINGLE_PROCESS", False)
+            for name in node.inputs + node.outputs
+        ):
+            self._logger.info(
+                "Running node '%s' in the main thread, as it uses datasets "
+                "which cannot be used by multiple processes.",
+                node.name,
+            )
+            route = MAIN
+        return route
+
+    def run(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager = None,
+        session_id: str = None,
+    ) -> dict[str, Any]:
+        """Run the ``Pipeline`` using the datasets provided by ``catalog``
+        and save results back to the same objects.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            session_id: The id of the session.
+
+        Returns:
+            Any node outputs that cannot be processed by the ``DataCatalog``.
+            These are returned in a dictionary, where the keys are defined
+            by the node outputs.
+
+        """
+        self._node_routes = {node: self.route(node, catalog) for node in pipeline.nodes}
+        self._process_data_sets = frozenset(
+            name
+            for node, route in self._node_routes.items()
+            if route == PROCESS
+            for name in node.inputs + node.outputs
+        )
+        if self._process_data_sets:
+            self._manager = ParallelRunnerManager()
+            self._manager.start()  # noqa: consider-using-with
+        try:
+            return super().run(pipeline, catalog, hook_manager, session_id)
+        finally:
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
+            self._node_routes = {}
+            self._process_data_sets = frozenset()
+
+    def _validate_process_nodes(self, catalog: DataCatalog, nodes: list[Node]):
+        """Ensure the nodes routed to processes and their datasets can be sent
+        to other processes, and that their outputs are not saved to memory
+        datasets which would not be synchronised across processes.
+        """
+        ParallelRunner._validate_nodes(nodes)  # noqa: protected-access
+
+        data_sets = catalog._data_sets  # noqa: protected-access
+        unserialisable, memory_datasets = [], []
+        for name in sorted(self._process_data_sets):
+            data_set = data_sets.get(name)
+            try:
+                ForkingPickler.dumps(data_set)
+            except (AttributeError, PicklingError):
+                unserialisable.append(name)
+        for name in sorted({o for n in nodes for o in n.outputs}):
+            if isinstance(data_sets.get(name), MemoryDataset):
+                memory_datasets.append(name)
+
+        if unserialisable:
+            raise AttributeError(
+                f"The following data sets used by nodes running in processes "
+                f"cannot be serialised: {unserialisable}\nRoute these nodes to "
+                f"threads or to the main thread, or make sure the data sets are "
+                f"serialisable."
+            )
+        if memory_datasets:
+            raise AttributeError(
+                f"The following data sets are memory data sets: {memory_datasets}\n"
+                f"HybridRunner does not support output to externally created "
+                f"MemoryDatasets from nodes running in processes."
+            )
+
+    def _start_workers(
+        self,
+        stack: ExitStack,
+        catalog: DataCatalog,
+        plan: ExecutionPlan,
+        routes: list[str],
+    ) -> tuple[ProcessPoolExecutor, str]:
+        """Starts the worker processes and sends them the nodes routed to
+        processes and their datasets, once per run. Tasks then only carry
+        the run id and the node id.
+        """
+        run_payloads = self._manager.dict()  # type: ignore
+        run_id = uuid.uuid4().hex
+        worker_nodes = tuple(
+            node if route == PROCESS else None
+            for node, route in zip(plan.nodes, routes)
+        )
+        worker_catalog = ParallelRunner._worker_catalog(  # noqa: protected-access
+            catalog, self._process_data_sets
+        )
+        run_payloads[run_id] = bytes(
+            ForkingPickler.dumps((worker_catalog, worker_nodes))
+        )
+        max_workers = min(self._max_workers, routes.count(PROCESS))
+        pool = stack.enter_context(_create_worker_pool(max_workers, run_payloads))
+        return pool, run_id
+
+    def _run(  # noqa: too-many-locals,useless-suppression
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager,
+        session_id: str = None,
+    ) -> None:
+        """The abstract interface for running pipelines.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            session_id: The id of the session.
+
+        Raises:
+            AttributeError: When the nodes routed to processes or their data
+                sets cannot be sent to other processes.
+            Exception: in case of any downstream node failure.
+
+        """
+        plan = ExecutionPlan.from_pipeline(pipeline)
+        nodes = plan.nodes
+        routes = [self._node_routes[node] for node in nodes]
+        process_nodes = [n for n, r in zip(nodes, routes) if r == PROCESS]
+        self._validate_process_nodes(catalog, process_nodes)
+
+        load_counts = plan.load_counts()
+        scheduler = DependencyScheduler(plan)
+        done_nodes: set[Node] = set()
+        main_queue: deque[Node] = deque()
+        futures: dict[Future, Node] = {}
+
+        def complete(node: Node) -> None:
+            done_nodes.add(node)
+            scheduler.complete(node)
+            self._record_completed(node, catalog)
+            self._logger.info("Completed node: %s", node.name)
+            self._logger.info(
+                "Completed %d out of %d tasks", len(done_nodes), len(nodes)
+            )
+            self._release_datasets(node, catalog, load_counts, plan)
+
+        with ExitStack() as stack:
+            thread_pool = stack.enter_context(
+                ThreadPoolExecutor(max_workers=self._max_threads)
+            )
+            process_pool, run_id = None, None
+            if process_nodes:
+                process_pool, run_id = self._start_workers(stack, catalog, plan, routes)
+
+            while True:
+                for node in scheduler.pop_ready():
+                    node_id = plan.node_id(node)
+                    if routes[node_id] == MAIN:
+                        main_queue.append(node)
+                    elif routes[node_id] == PROCESS:
+                        future = process_pool.submit(  # type: ignore
+                            _run_node_by_id,
+                            run_id,
+                            node_id,
+                            self._is_async,
+                            session_id,
+                            self._io_workers,
+                        )
+                        futures[future] = node
+                    else:
+                        future = thread_pool.submit(
+                            run_node,
+                            node,
+                            catalog,
+                            hook_manager,
+                            self._is_async,
+                            session_id,
+                            self._io_executor,
+                        )
+                        futures[future] = node
+
+                try:
+                    if main_queue:
+                        # Run one node in the main thread, then hand out the
+                        # nodes it made ready before running the next one.
+                        node = main_queue.popleft()
+                        complete(
+                            run_node(
+                                node,
+                                catalog,
+                                hook_manager,
+                                self._is_async,
+                                session_id,
+                                self._io_executor,
+                            )
+                        )
+                        continue
+                    if not futures:
+                        todo_nodes = scheduler.todo_nodes
+                        assert not todo_nodes, (todo_nodes, done_nodes)
+                        break
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                        complete(futures.pop(future))
+                except Exception:
+                    self._suggest_resume_scenario(pipeline, done_nodes, catalog)
+                    raise
@@ -0,0 +1,97 @@
+"""``IOExecutor`` is the thread pool runners load and save the node inputs and
+outputs in, when loading and saving asynchronously. A single ``IOExecutor`` is
+shared by all the nodes of a run.
+"""
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable
+
+
+class IOExecutor(ThreadPoolExecutor):
+    """``IOExecutor`` is a ``ThreadPoolExecutor`` which keeps track of how many
+    tasks are waiting for a thread, so the size of the pool can be tuned.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import IOExecutor, run_node
+        >>>
+        >>> with IOExecutor(max_workers=8) as io_executor:
+        >>>     for node in pipeline.nodes:
+        >>>         run_node(node, catalog, hook_manager, is_async=True,
+        >>>                  io_executor=io_executor)
+        >>> io_executor.max_queue_depth
+    """
+
+    def __init__(self, max_workers: int = None):
+        """Creates a new instance of ``IOExecutor``.
+
+        Args:
+            max_workers: The maximum number of threads loading and saving data.
+                If not set, calculated automatically by ``ThreadPoolExecutor``.
+
+        Raises:
+            ValueError: If ``max_workers`` is not positive.
+        """
+        super().__init__(max_workers=max_workers, thread_name_prefix="kedro-io")
+        self._lock = Lock()
+        self._task_count = 0
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._total_queue_depth = 0
+
+    @property
+    def max_workers(self) -> int:
+        """The maximum number of threads loading and saving data."""
+        return self._max_workers
+
+    @property
+    def task_count(self) -> int:
+        """The number of tasks submitted so far."""
+        return self._task_count
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of tasks currently waiting for a thread."""
+        return self._queue_depth
+
+    @property
+    def max_queue_depth(self) -> int:
+        """The largest number of tasks which waited for a thread at once."""
+        return self._max_queue_depth
+
+    @property
+    def mean_queue_depth(self) -> float:
+        """The mean number of tasks waiting for a thread when a task is
+        submitted, including the task itself.
+        """
+        return self._total_queue_depth / self._task_count if self._task_count else 0.0
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Schedules ``fn(*args, **kwargs)`` to be run by one of the threads.
+
+        Returns:
+            A ``Future`` representing the result of the call.
+        """
+        with self._lock:
+            self._task_count += 1
+            self._queue_depth += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+            self._total_queue_depth += self._queue_depth
+            depth = self._queue_depth
+        try:
+            return super().submit(self._started, fn, *args, **kwargs)
+        except RuntimeError:
+            # the executor was shut down, so the task will never start
+            with self._lock:
+                self._task_count -= 1
+                self._queue_depth -= 1
+                self._total_queue_depth -= depth
+            raise
+
+    def _started(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            self._queue_depth -= 1
+        return fn(*args, **kwargs)
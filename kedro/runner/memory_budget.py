@@ -0,0 +1,394 @@
+"""``MemoryBudget`` keeps the data held by the default datasets of a run
+within a memory budget, by spilling data to disk and by holding back nodes.
+"""
+from __future__ import annotations
+
+import logging
+import pickle
+import re
+import shutil
+import sys
+import tempfile
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from kedro.io import MemoryDataset
+from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+
+_MEMORY_SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-z]*)\s*$", re.IGNORECASE)
+_MEMORY_UNITS = {
+    "": 1,
+    "b": 1,
+    "kb": 1000,
+    "mb": 1000**2,
+    "gb": 1000**3,
+    "tb": 1000**4,
+    "k": 1024,
+    "m": 1024**2,
+    "g": 1024**3,
+    "t": 1024**4,
+    "kib": 1024,
+    "mib": 1024**2,
+    "gib": 1024**3,
+    "tib": 1024**4,
+}
+
+
+def parse_memory_size(size: int | str) -> int:
+    """Parses a memory size given in bytes or with a unit, e.g. ``512MB``,
+    ``16GiB`` or ``16G``. ``KB``, ``MB``, ``GB`` and ``TB`` are powers of
+    1000, ``K``, ``M``, ``G`` and ``T`` and the ``iB`` units powers of 1024.
+
+    Args:
+        size: The memory size, in bytes if it is an integer.
+
+    Returns:
+        The memory size in bytes.
+
+    Raises:
+        ValueError: If the memory size is invalid.
+    """
+    if isinstance(size, int):
+        number, unit = size, ""
+    else:
+        match = _MEMORY_SIZE_PATTERN.match(size)
+        if not match or match.group(2).lower() not in _MEMORY_UNITS:
+            raise ValueError(
+                f"Invalid memory size '{size}'. Specify a number of bytes, "
+                f"optionally followed by a unit such as 'MB', 'GB' or 'GiB'."
+            )
+        number, unit = float(match.group(1)), match.group(2).lower()
+    size_in_bytes = int(number * _MEMORY_UNITS[unit])
+    if size_in_bytes <= 0:
+        raise ValueError(f"Invalid memory size '{size}'. It should be positive.")
+    return size_in_bytes
+
+
+def estimate_size(data: Any) -> int:
+    """Estimates the number of bytes of memory held by an object. pandas
+    objects report their deep memory usage, NumPy arrays and Arrow tables
+    the size of their buffers. Other objects are measured shallowly.
+
+    Args:
+        data: The object to measure.
+
+    Returns:
+        The estimated size of the object in bytes.
+    """
+    memory_usage = getattr(data, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+        except TypeError:
+            pass
+        else:
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(data)
+
+
+_IMMUTABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, range)
+
+
+def _is_immutable(data: Any) -> bool:
+    if isinstance(data, _IMMUTABLE_TYPES):
+        return True
+    if isinstance(data, (tuple, frozenset)):
+        return all(_is_immutable(item) for item in data)
+    return False
+
+
+class _TransferMemoryDataset(MemoryDataset):
+    """``_TransferMemoryDataset`` is a ``MemoryDataset`` which, once it knows
+    how many times its data will be loaded, hands the data over to the last
+    of these loads without copying it. The earlier loads receive a copy,
+    unless the data is immutable, and the data is not copied when saved.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._transfer_lock = Lock()
+        self._expected_loads: int | None = None
+        self._loads_left = 0
+
+    def expect_loads(self, loads: int) -> None:
+        """Sets the number of times the data saved will be loaded."""
+        self._expected_loads = loads
+        self._loads_left = loads
+
+    def _load(self) -> Any:
+        if self._expected_loads is None:
+            return super()._load()
+        with self._transfer_lock:
+            if not super()._exists():
+                return super()._load()
+            self._loads_left -= 1
+            # the copies are made under the lock, so that the data is not
+            # modified by the last load while it is copied
+            if self._loads_left == 0 or _is_immutable(self._data):
+                return self._data
+            return super()._load()
+
+    def _save(self, data: Any):
+        if self._expected_loads is None:
+            super()._save(data)
+            return
+        with self._transfer_lock:
+            self._data = data
+            self._loads_left = self._expected_loads
+
+
+class _SpillableMemoryDataset(_TransferMemoryDataset):
+    """``_SpillableMemoryDataset`` is a ``MemoryDataset`` whose data can be
+    spilled to a pickle file, from which it is loaded until the next save.
+    Each load from the file returns new data, which is not copied.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = Lock()
+        self._size = 0
+        self._spill_path: Path | None = None
+
+    @property
+    def size(self) -> int:
+        """The estimated size of the data held in memory, in bytes."""
+        return self._size
+
+    def spill(self, directory: Path) -> int:
+        """Moves the data held in memory to a file in ``directory``.
+
+        Returns:
+            The estimated number of bytes freed.
+        """
+        with self._lock:
+            if not super()._exists():
+                return 0
+            path = directory / f"{uuid.uuid4().hex}.pkl"
+            with path.open("wb") as file:
+                pickle.dump(self._data, file, protocol=pickle.HIGHEST_PROTOCOL)
+            super()._release()
+            self._spill_path = path
+            freed, self._size = self._size, 0
+            return freed
+
+    def _load(self) -> Any:
+        with self._lock:
+            if self._spill_path is None:
+                return super()._load()
+            with self._spill_path.open("rb") as file:
+                return pickle.load(file)
+
+    def _save(self, data: Any):
+        with self._lock:
+            self._remove_spilled()
+            super()._save(data)
+            self._size = estimate_size(self._data)
+
+    def _exists(self) -> bool:
+        return self._spill_path is not None or super()._exists()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._remove_spilled()
+            super()._release()
+            self._size = 0
+
+    def _remove_spilled(self) -> None:
+        if self._spill_path is not None:
+            self._spill_path.unlink()
+            self._spill_path = None
+
+
+class MemoryBudget:
+    """``MemoryBudget`` keeps the data held by the default datasets of a run
+    within ``max_memory`` bytes, as estimated by ``estimate_size``. Runners
+    create their default datasets with ``create_data_set`` and report the
+    nodes they start and complete. Without ``max_memory``, the memory is not
+    limited and the default datasets are plain ``MemoryDataset`` objects.
+
+    With ``transfer_ownership``, the default datasets do not copy the data
+    saved, and hand it over to the last node loading it in the run without
+    copying it, since no other node uses it afterwards. The nodes loading it
+    before receive a copy, unless the data is immutable.
+
+    When the budget is exceeded, the data needed furthest in the future is
+    spilled to disk, and loaded from there on demand. Data needed by running
+    nodes and the outputs of the pipeline are never spilled. While the
+    budget is still exceeded, ``can_start`` holds back new nodes.
+    """
+
+    def __init__(
+        self,
+        max_memory: int | str = None,
+        spill_dir: str | Path = None,
+        transfer_ownership: bool = False,
+    ):
+        """Creates a new instance of ``MemoryBudget``.
+
+        Args:
+            max_memory: The memory budget, in bytes or with a unit, e.g.
+                ``16GB``. See ``parse_memory_size``. If not set, the memory
+                is not limited.
+            spill_dir: The directory to spill data to. Each run spills to a
+                new temporary directory inside it, which is removed at the end
+                of the run. If not set, the system temporary directory is used.
+            transfer_ownership: If True, the data of the default datasets is
+                handed over to the last node loading it without copying it.
+                Defaults to False.
+
+        Raises:
+            ValueError: If the memory budget is invalid.
+        """
+        self._max_memory = (
+            parse_memory_size(max_memory) if max_memory is not None else None
+        )
+        self._spill_dir = spill_dir
+        self._transfer_ownership = transfer_ownership
+        self._data_sets: dict[str, _SpillableMemoryDataset] = {}
+        self._transfers: dict[str, _TransferMemoryDataset] = {}
+        self._directory: Path | None = None
+        self._plan: ExecutionPlan | None = None
+        self._consumers: dict[str, list[int]] = {}
+        self._done: set[int] = set()
+        self._running: set[int] = set()
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def max_memory(self) -> int | None:
+        """The memory budget, in bytes, or None if the memory is not limited."""
+        return self._max_memory
+
+    @property
+    def transfer_ownership(self) -> bool:
+        """Whether the data of the default datasets is handed over to the last
+        node loading it without copying it.
+        """
+        return self._transfer_ownership
+
+    @property
+    def live_size(self) -> int:
+        """The estimated size of the data held in memory, in bytes."""
+        return sum(data_set.size for data_set in self._data_sets.values())
+
+    def create_data_set(self, ds_name: str) -> MemoryDataset:
+        """Creates a ``MemoryDataset`` whose data is kept within the budget.
+
+        Args:
+            ds_name: The name of the dataset.
+
+        Returns:
+            A ``MemoryDataset``, which can spill its data to disk if the
+            memory is limited.
+        """
+        if self._max_memory is None:
+            if not self._transfer_ownership:
+                return MemoryDataset()
+            data_set: _TransferMemoryDataset = _TransferMemoryDataset()
+        else:
+            data_set = self._data_sets[ds_name] = _SpillableMemoryDataset()
+        if self._transfer_ownership:
+            self._transfers[ds_name] = data_set
+        return data_set
+
+    def start(self, plan: ExecutionPlan) -> None:
+        """Starts keeping track of a run.
+
+        Args:
+            plan: The ``ExecutionPlan`` of the run.
+        """
+        self._plan = plan
+        consumers = defaultdict(list)
+        for node_id in range(len(plan)):
+            for name in plan.node_inputs(node_id):
+                consumers[name].append(node_id)
+        self._consumers = dict(consumers)
+        load_counts = plan.load_counts()
+        for name, data_set in self._transfers.items():
+            # the outputs of the pipeline are loaded once more by the runner
+            data_set.expect_loads(load_counts[name] + (name in plan.free_outputs))
+        self._done = set()
+        self._running = set()
+
+    def can_start(self) -> bool:
+        """Whether more nodes can be started without exceeding the budget."""
+        return self._max_memory is None or self.live_size < self._max_memory
+
+    def node_started(self, node: Node) -> None:
+        """Records that a node started, so its inputs are not spilled.
+
+        Args:
+            node: The node which started.
+        """
+        self._running.add(self._plan.node_id(node))  # type: ignore
+
+    def node_completed(self, node: Node) -> None:
+        """Records that a node completed, and spills data to disk if the
+        budget is exceeded. Call it after releasing the datasets which are no
+        longer needed.
+
+        Args:
+            node: The node which completed.
+        """
+        node_id = self._plan.node_id(node)  # type: ignore
+        self._running.discard(node_id)
+        self._done.add(node_id)
+        self._spill()
+
+    def close(self) -> None:
+        """Stops keeping track of the run and removes the spilled data."""
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+        self._data_sets = {}
+        self._transfers = {}
+        self._plan = None
+
+    def _next_use(self, ds_name: str) -> float:
+        return next(
+            (i for i in self._consumers.get(ds_name, ()) if i not in self._done),
+            float("inf"),
+        )
+
+    def _spill(self) -> None:
+        if self._max_memory is None:
+            return
+        excess = self.live_size - self._max_memory
+        if excess <= 0:
+            return
+
+        in_use = {
+            name
+            for node_id in self._running
+            for name in self._plan.node_inputs(node_id)  # type: ignore
+        }
+        candidates = sorted(
+            (
+                (self._next_use(name), name)
+                for name, data_set in self._data_sets.items()
+                if data_set.size
+                and name not in in_use
+                and name not in self._plan.free_outputs  # type: ignore
+            ),
+            reverse=True,
+        )
+        for _, name in candidates:
+            if excess <= 0:
+                break
+            if self._directory is None:
+                self._directory = Path(
+                    tempfile.mkdtemp(prefix="kedro-spill-", dir=self._spill_dir)
+                )
+            excess -= self._data_sets[name].spill(self._directory)
+            self._logger.info(
+                "Spilled '%s' to disk to stay within the memory budget.", name
+            )
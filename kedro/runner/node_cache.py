@@ -0,0 +1,226 @@
+"""``NodeCache`` stores the outputs of nodes by a hash of their code and
+inputs, so that runners can restore them instead of running the nodes again.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import io
+import logging
+import os
+import pickle
+import sys
+import time
+import uuid
+from contextlib import suppress
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+from kedro.pipeline.node import Node
+from kedro.runner.memory_budget import parse_memory_size
+
+_KEY_VERSION = b"kedro-node-cache-1"
+
+
+def _function_fingerprint(func: Callable) -> bytes:
+    if isinstance(func, partial):
+        arguments = repr((func.args, sorted(func.keywords.items())))
+        return _function_fingerprint(func.func) + arguments.encode()
+    try:
+        return inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        code = getattr(func, "__code__", None)
+        if code is not None:
+            # nested code objects are left out, as their repr has an address
+            consts = tuple(c for c in code.co_consts if not inspect.iscode(c))
+            return code.co_code + repr((consts, code.co_names)).encode()
+        return getattr(func, "__qualname__", repr(func)).encode()
+
+
+def _unlink(path: Path) -> None:
+    # the file may be removed concurrently, e.g. by another process evicting it
+    with suppress(OSError):
+        path.unlink()
+
+
+class _KeyPickler(pickle.Pickler):
+    """Pickles the inputs of a node for its key. Sets are pickled as their
+    sorted pickled elements, as the iteration order of sets of strings
+    depends on ``PYTHONHASHSEED``.
+    """
+
+    def persistent_id(self, obj):  # noqa: no-self-use
+        if type(obj) in (set, frozenset):  # noqa: unidiomatic-typecheck
+            return type(obj).__name__, sorted(_pickle_for_key(item) for item in obj)
+        return None
+
+
+def _pickle_for_key(obj: Any) -> bytes:
+    buffer = io.BytesIO()
+    _KeyPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    return buffer.getvalue()
+
+
+class NodeCache:
+    """``NodeCache`` is a content-addressed store of node outputs on the
+    local file system. Outputs are stored by a key hashing the source code of
+    the node function, the names of its inputs and outputs, and the content of
+    its inputs, including parameters. Runners given a ``NodeCache`` restore
+    the outputs of a node from it when the key is found, instead of running
+    the node.
+
+    The source code of the functions called by the node function is not part
+    of the key, so changing it does not invalidate the cached outputs. Nodes
+    without outputs, generator nodes, and nodes whose inputs or outputs cannot
+    be pickled are never cached. The elements of ``set`` and ``frozenset``
+    inputs are sorted before hashing, so that their keys do not depend on
+    ``PYTHONHASHSEED``.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import NodeCache, SequentialRunner
+        >>>
+        >>> cache = NodeCache("data/cache", max_size="20GB", max_age=3600 * 24)
+        >>> SequentialRunner(node_cache=cache).run(pipeline, catalog)
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_size: int | str | None = "10GB",
+        max_age: timedelta | float | None = timedelta(days=30),
+    ):
+        """Creates a new instance of ``NodeCache``.
+
+        Args:
+            directory: The directory to store the node outputs in.
+            max_size: The maximum size of the stored outputs, in bytes or with
+                a unit, e.g. ``10GB``. The least recently used outputs are
+                evicted first. Not limited if None.
+            max_age: How long the outputs are kept after they were last used,
+                as a ``timedelta`` or in seconds. Not limited if None.
+
+        Raises:
+            ValueError: If ``max_size`` or ``max_age`` is invalid.
+        """
+        if isinstance(max_age, timedelta):
+            max_age = max_age.total_seconds()
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age should be positive")
+        self._directory = Path(directory)
+        self._max_size = parse_memory_size(max_size) if max_size is not None else None
+        self._max_age = max_age
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def directory(self) -> Path:
+        """The directory the node outputs are stored in."""
+        return self._directory
+
+    def key(self, node: Node, inputs: dict[str, Any]) -> str | None:
+        """Computes the key the outputs of a node are stored by.
+
+        Args:
+            node: The node.
+            inputs: The inputs the node is run with, by dataset name.
+
+        Returns:
+            The key, or None if the node cannot be cached.
+        """
+        if not node.outputs or inspect.isgeneratorfunction(node.func):
+            return None
+        digest = hashlib.sha256(_KEY_VERSION)
+        digest.update(repr(sys.version_info[:2]).encode())
+        digest.update(_function_fingerprint(node.func))
+        digest.update(repr((node.inputs, node.outputs)).encode())
+        for name in sorted(inputs):
+            try:
+                data = _pickle_for_key(inputs[name])
+            except Exception:  # pylint: disable=broad-except
+                self._logger.debug(
+                    "Not caching node '%s', as input '%s' cannot be pickled.",
+                    node.name,
+                    name,
+                )
+                return None
+            digest.update(name.encode())
+            digest.update(hashlib.sha256(data).digest())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Loads the outputs stored by ``key``.
+
+        Args:
+            key: The key computed by ``key``.
+
+        Returns:
+            The outputs by dataset name, or None if they are not stored.
+        """
+        path = self._path(key)
+        try:
+            with path.open("rb") as file:
+                outputs = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            self._logger.warning("Ignoring corrupt node cache entry '%s'.", path)
+            _unlink(path)
+            return None
+        # the modification time records when the outputs were last used
+        with suppress(OSError):
+            os.utime(path)
+        return outputs
+
+    def put(self, key: str, outputs: dict[str, Any]) -> None:
+        """Stores the outputs of a node by ``key``. Outputs which cannot be
+        pickled are not stored.
+
+        Args:
+            key: The key computed by ``key``.
+            outputs: The outputs by dataset name.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so concurrent readers never see
+        # a partially written entry
+        tmp_path = path.with_name(f".{uuid.uuid4().hex}.tmp")
+        try:
+            with tmp_path.open("wb") as file:
+                pickle.dump(outputs, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:  # pylint: disable=broad-except
+            _unlink(tmp_path)
+            self._logger.debug("Not caching outputs which cannot be pickled.")
+
+    def evict(self) -> None:
+        """Removes the outputs last used longer than ``max_age`` ago, then the
+        least recently used outputs until their size is within ``max_size``.
+        """
+        if not self._directory.is_dir():
+            return
+        entries = []
+        for path in self._directory.glob("*/*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:  # evicted concurrently
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        oldest = time.time() - self._max_age if self._max_age is not None else None
+        for mtime, size, path in entries:
+            too_old = oldest is not None and mtime < oldest
+            too_large = self._max_size is not None and total_size > self._max_size
+            if not (too_old or too_large):
+                break
+            _unlink(path)
+            total_size -= size
+
+    def _path(self, key: str) -> Path:
+        return self._directory / key[:2] / f"{key}.pkl"
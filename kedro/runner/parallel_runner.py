@@ -7,14 +7,18 @@ import multiprocessing
 import os
 import pickle
 import sys
+import time
+import uuid
 import warnings
-from collections import Counter
-from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
-from itertools import chain
-from multiprocessing.managers import BaseProxy, SyncManager  # type: ignore
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.managers import BaseProxy, DictProxy, SyncManager  # type: ignore
 from multiprocessing.reduction import ForkingPickler
+from multiprocessing.shared_memory import SharedMemory
 from pickle import PicklingError
-from typing import Any, Iterable
+from typing import AbstractSet, Any, Iterable, Iterator
 
 from pluggy import PluginManager
 
@@ -27,7 +31,16 @@ from kedro.framework.project import settings
 from kedro.io import DataCatalog, DatasetError, MemoryDataset
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+from kedro.runner.fusion import find_linear_chains
+from kedro.runner.io_executor import IOExecutor
 from kedro.runner.runner import AbstractRunner, run_node
+from kedro.runner.scheduler import (
+    DependencyScheduler,
+    NodeTimings,
+    create_scheduler,
+    validate_scheduler,
+)
 
 # see https://github.com/python/cpython/blob/master/Lib/concurrent/futures/process.py#L114
 _MAX_WINDOWS_WORKERS = 61
@@ -36,6 +49,25 @@ _MAX_WINDOWS_WORKERS = 61
 _SharedMemoryDataSet: type[_SharedMemoryDataset]
 
 
+class _WorkerState:  # noqa: too-few-public-methods
+    """The state a ``ParallelRunner`` worker process keeps across the tasks
+    it runs.
+    """
+
+    def __init__(self):
+        # The hook manager, set once by ``_bootstrap_worker``.
+        self.hook_manager: PluginManager | None = None
+        # The runner's store of pickled run payloads, set once by ``_bootstrap_worker``.
+        self.run_payloads: DictProxy | None = None
+        # The id, catalog and nodes of the last run the worker took part in.
+        self.run: tuple[str, DataCatalog, tuple[Node, ...]] | None = None
+        # The I/O thread pool, created by the first async node of the worker.
+        self.io_executor: IOExecutor | None = None
+
+
+_worker_state = _WorkerState()
+
+
 class _SharedMemoryDataset:
     """``_SharedMemoryDataset`` is a wrapper class for a shared MemoryDataset in SyncManager.
     It is not inherited from AbstractDataSet class.
@@ -73,6 +105,131 @@ class _SharedMemoryDataset:
             raise exc
 
 
+# The shared memory segments a process attached to, kept open for as long as
+# the objects loaded from them are alive.
+_attached_segments: list[SharedMemory] = []
+
+
+def _close_unused_segments() -> None:
+    """Closes the attached segments which no loaded object uses any more."""
+    for segment in list(_attached_segments):
+        try:
+            segment.close()
+        except BufferError:
+            continue
+        _attached_segments.remove(segment)
+
+
+class _SharedMemoryBuffersDataset(_SharedMemoryDataset):
+    """``_SharedMemoryBuffersDataset`` is a ``_SharedMemoryDataset`` which
+    moves the buffers of the saved data through a ``multiprocessing``
+    shared memory segment instead of the ``SyncManager``. The data is pickled
+    with protocol 5, so the buffers of NumPy arrays, pandas DataFrames, Arrow
+    tables and any other object supporting out-of-band pickling are copied
+    once into a new segment on save and loaded as read-only zero-copy views
+    of it. Only the pickle stream and the layout of the segment go through
+    the shared ``MemoryDataset``.
+
+    The segment is unlinked when the dataset is released, or when new data
+    is saved to it.
+    """
+
+    def save(self, data: Any):
+        """Copies the buffers of ``data`` to a new shared memory segment and
+        saves its layout to the shared MemoryDataset in SyncManager.
+        """
+        buffers: list[pickle.PickleBuffer] = []
+        try:
+            header = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+        except Exception as serialisation_exc:  # SKIP_IF_NO_SPARK
+            raise DatasetError(
+                f"{str(data.__class__)} cannot be serialised. ParallelRunner "
+                "implicit memory datasets can only be used with serialisable data"
+            ) from serialisation_exc
+
+        raw_buffers = [buffer.raw() for buffer in buffers]
+        layout, offset = [], 0
+        for raw in raw_buffers:
+            layout.append((offset, raw.nbytes))
+            offset += raw.nbytes
+
+        segment_name = None
+        if raw_buffers:
+            segment = SharedMemory(create=True, size=max(offset, 1))
+            for (start, size), raw in zip(layout, raw_buffers):
+                segment.buf[start : start + size] = raw
+                raw.release()
+            segment_name = segment.name
+            segment.close()
+        # a generator node saves once per chunk, the segments of the chunks
+        # saved before are not loaded any more
+        self._unlink_saved_segment()
+        self.shared_memory_dataset.save((segment_name, header, layout))
+
+    def load(self) -> Any:
+        """Loads the data saved by ``save``, with its buffers as views of
+        the shared memory segment.
+        """
+        segment_name, header, layout = self.shared_memory_dataset.load()
+        if segment_name is None:
+            return pickle.loads(header)
+
+        _close_unused_segments()
+        segment = SharedMemory(name=segment_name)
+        _attached_segments.append(segment)
+        buffer = segment.buf.toreadonly()
+        return pickle.loads(
+            header, buffers=[buffer[start : start + size] for start, size in layout]
+        )
+
+    def release(self) -> None:
+        """Unlinks the shared memory segment and releases the shared
+        MemoryDataset in SyncManager.
+        """
+        self._unlink_saved_segment()
+        self.shared_memory_dataset.release()
+
+    def _unlink_saved_segment(self) -> None:
+        """Unlinks the shared memory segment of the data saved last, if any.
+        The objects loaded from it stay valid, as unlinking does not unmap it.
+        """
+        try:
+            segment_name, _, _ = self.shared_memory_dataset.load()
+        except DatasetError:
+            return
+        if segment_name is None:
+            return
+        try:
+            segment = SharedMemory(name=segment_name)
+        except FileNotFoundError:
+            return
+        segment.close()
+        segment.unlink()
+
+
+class _ChainDataset:
+    """``_ChainDataset`` stands for a default dataset passed between the nodes
+    of a chain run as a single task. Only the worker running the chain holds
+    its data, so it is never loaded or saved through the runner's catalog.
+    Like ``_SharedMemoryDataset``, it is not inherited from AbstractDataSet
+    class, so it is not taken for a persisted dataset.
+    """
+
+    def load(self) -> Any:
+        """Raises an error, as the data is only held by the worker."""
+        raise DatasetError(
+            "The data passed between the nodes of a chain is only held by the "
+            "worker running the chain."
+        )
+
+    def save(self, data: Any) -> None:
+        """Raises an error, as the data is only held by the worker."""
+        self.load()
+
+    def release(self) -> None:
+        """Does nothing, as the data is only held by the worker."""
+
+
 def __getattr__(name):
     if name == "_SharedMemoryDataSet":
         alias = _SharedMemoryDataset
@@ -103,6 +260,151 @@ def _bootstrap_subprocess(package_name: str, logging_config: dict[str, Any]):
     configure_logging(logging_config)
 
 
+def _create_worker_hook_manager(
+    package_name: str = None, logging_config: dict[str, Any] = None
+) -> PluginManager:
+    if multiprocessing.get_start_method() == "spawn" and package_name:
+        _bootstrap_subprocess(package_name, logging_config)  # type: ignore
+
+    hook_manager = _create_hook_manager()
+    _register_hooks(hook_manager, settings.HOOKS)
+    _register_hooks_setuptools(hook_manager, settings.DISABLE_HOOKS_FOR_PLUGINS)
+    return hook_manager
+
+
+def _bootstrap_worker(
+    package_name: str = None,
+    logging_config: dict[str, Any] = None,
+    run_payloads: DictProxy = None,
+):
+    """Initializer of the ``ParallelRunner`` worker processes. It configures
+    the project and logging and creates the hook manager once per worker,
+    instead of once per node.
+    """
+    _worker_state.hook_manager = _create_worker_hook_manager(
+        package_name, logging_config
+    )
+    _worker_state.run_payloads = run_payloads
+
+
+def _create_worker_pool(
+    max_workers: int, run_payloads: DictProxy = None
+) -> ProcessPoolExecutor:
+    """Creates a process pool whose workers are bootstrapped for the current
+    project and fetch the payloads of runs from ``run_payloads``.
+    """
+    # noqa: import-outside-toplevel,cyclic-import
+    from kedro.framework.project import LOGGING, PACKAGE_NAME
+
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_bootstrap_worker,
+        initargs=(PACKAGE_NAME, LOGGING, run_payloads),
+    )
+
+
+def _get_worker_run(run_id: str) -> tuple[DataCatalog, tuple[Node, ...]]:
+    """Returns the catalog and nodes of a run, fetching them from the
+    runner on the first task of the run the worker process gets.
+    """
+    worker_run = _worker_state.run
+    if worker_run is None or worker_run[0] != run_id:
+        payload = _worker_state.run_payloads[run_id]  # type: ignore
+        worker_run = (run_id, *pickle.loads(payload))
+        _worker_state.run = worker_run
+    return worker_run[1], worker_run[2]
+
+
+def _get_worker_io_executor(max_workers: int = None) -> IOExecutor:
+    """Returns the I/O thread pool shared by all the nodes a worker process
+    runs, creating it on the first call.
+    """
+    if _worker_state.io_executor is None:
+        _worker_state.io_executor = IOExecutor(max_workers)
+    return _worker_state.io_executor
+
+
+def _run_node_by_id(
+    run_id: str,
+    node_id: int,
+    is_async: bool = False,
+    session_id: str = None,
+    io_workers: int = None,
+) -> int:
+    """Run the node of a run with the given id in a bootstrapped worker.
+
+    Args:
+        run_id: The id of the run, under which the catalog and nodes were
+            stored by the runner.
+        node_id: The id of the node in the ``ExecutionPlan`` of the run.
+        is_async: If True, the node inputs and outputs are loaded and saved
+            asynchronously with the threads of the worker. Defaults to False.
+        session_id: The session id of the pipeline run.
+        io_workers: The number of threads of the worker loading and saving
+            data, used when the worker runs its first async node.
+
+    Returns:
+        The node_id argument.
+    """
+    catalog, nodes = _get_worker_run(run_id)
+    io_executor = _get_worker_io_executor(io_workers) if is_async else None
+    _run_node_synchronization(
+        nodes[node_id], catalog, is_async, session_id, io_executor=io_executor
+    )
+    return node_id
+
+
+def _run_chain_by_id(
+    run_id: str,
+    node_ids: tuple[int, ...],
+    is_async: bool = False,
+    session_id: str = None,
+    io_workers: int = None,
+) -> list[float]:
+    """Run a chain of nodes of a run found by ``find_linear_chains``, one
+    after the other in a bootstrapped worker. The datasets passed between the
+    nodes of the chain are held in the worker, and never go through the
+    ``SyncManager``. Each node runs with its hooks as if it ran on its own.
+
+    Args:
+        run_id: The id of the run, under which the catalog and nodes were
+            stored by the runner.
+        node_ids: The ids of the nodes of the chain in the ``ExecutionPlan``
+            of the run, in running order.
+        is_async: If True, the node inputs and outputs are loaded and saved
+            asynchronously with the threads of the worker. Defaults to False.
+        session_id: The session id of the pipeline run.
+        io_workers: The number of threads of the worker loading and saving
+            data, used when the worker runs its first async node.
+
+    Returns:
+        The duration of each node of the chain, in seconds.
+    """
+    catalog, nodes = _get_worker_run(run_id)
+    io_executor = _get_worker_io_executor(io_workers) if is_async else None
+    chain = [nodes[node_id] for node_id in node_ids]
+    chain_catalog = catalog.shallow_copy()
+    linked = [
+        set(parent.outputs) & set(child.inputs)
+        for parent, child in zip(chain, chain[1:])
+    ]
+    # the only consumer of the data is the next node of the chain
+    chain_catalog._data_sets.update(  # noqa: protected-access
+        (name, MemoryDataset(copy_mode="assign")) for names in linked for name in names
+    )
+
+    durations = []
+    for index, node in enumerate(chain):
+        start = time.perf_counter()
+        _run_node_synchronization(
+            node, chain_catalog, is_async, session_id, io_executor=io_executor
+        )
+        durations.append(time.perf_counter() - start)
+        for name in linked[index - 1] if index else ():
+            chain_catalog.release(name)
+    return durations
+
+
 def _run_node_synchronization(  # noqa: too-many-arguments
     node: Node,
     catalog: DataCatalog,
@@ -110,11 +412,14 @@ def _run_node_synchronization(  # noqa: too-many-arguments
     session_id: str = None,
     package_name: str = None,
     logging_config: dict[str, Any] = None,
+    io_executor: IOExecutor = None,
 ) -> Node:
     """Run a single `Node` with inputs from and outputs to the `catalog`.
 
     A ``PluginManager`` instance is created in each subprocess because the
-    ``PluginManager`` can't be serialised.
+    ``PluginManager`` can't be serialised. Workers bootstrapped by
+    ``_bootstrap_worker`` reuse the one they created at startup, otherwise
+    the project is bootstrapped for this node only.
 
     Args:
         node: The ``Node`` to run.
@@ -124,19 +429,17 @@ def _run_node_synchronization(  # noqa: too-many-arguments
         session_id: The session id of the pipeline run.
         package_name: The name of the project Python package.
         logging_config: A dictionary containing logging configuration.
+        io_executor: The executor to load and save data in when ``is_async``
+            is True.
 
     Returns:
         The node argument.
 
     """
-    if multiprocessing.get_start_method() == "spawn" and package_name:
-        _bootstrap_subprocess(package_name, logging_config)  # type: ignore
-
-    hook_manager = _create_hook_manager()
-    _register_hooks(hook_manager, settings.HOOKS)
-    _register_hooks_setuptools(hook_manager, settings.DISABLE_HOOKS_FOR_PLUGINS)
-
-    return run_node(node, catalog, hook_manager, is_async, session_id)
+    hook_manager = _worker_state.hook_manager or _create_worker_hook_manager(
+        package_name, logging_config
+    )
+    return run_node(node, catalog, hook_manager, is_async, session_id, io_executor)
 
 
 class ParallelRunner(AbstractRunner):
@@ -147,7 +450,17 @@ class ParallelRunner(AbstractRunner):
     single process only using the `_SINGLE_PROCESS` dataset attribute.
     """
 
-    def __init__(self, max_workers: int = None, is_async: bool = False):
+    def __init__(  # noqa: too-many-arguments
+        self,
+        max_workers: int = None,
+        is_async: bool = False,
+        scheduler: str = "topological",
+        node_timings: NodeTimings = None,
+        reuse_workers: bool = False,
+        shared_memory: bool = False,
+        io_workers: int = None,
+        fuse_chains: bool = False,
+    ):
         """
         Instantiates the runner by creating a Manager.
 
@@ -158,13 +471,45 @@ class ParallelRunner(AbstractRunner):
                 cannot be larger than 61 and will be set to min(61, max_workers).
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
+            scheduler: The order in which ready nodes are run, either
+                ``topological`` or ``critical-path``. ``critical-path`` runs
+                the nodes starting the longest chains first, estimated from
+                ``node_timings``. Defaults to ``topological``.
+            node_timings: The ``NodeTimings`` used to estimate node durations
+                and updated with the durations of this run.
+            reuse_workers: If True, the worker processes are kept alive
+                after a run and reused by the next runs of this runner,
+                which saves starting and bootstrapping them again. The
+                workers are shut down with the runner. Defaults to False.
+            shared_memory: If True, the data of the default datasets is moved
+                between processes through shared memory segments, and the
+                buffers of NumPy arrays, pandas DataFrames and Arrow tables
+                are loaded as read-only zero-copy views. Not supported on
+                Windows. Defaults to False.
+            io_workers: The number of threads each worker process loads and
+                saves data with when ``is_async`` is True. If not set,
+                calculated automatically by ``ThreadPoolExecutor``.
+            fuse_chains: If True, the linear chains of nodes connected only
+                through default datasets used by no other node, as found by
+                ``find_linear_chains``, each run as a single task in one
+                worker, which holds the data passed between their nodes.
+                Defaults to False.
 
         Raises:
             ValueError: bad parameters passed
         """
-        super().__init__(is_async=is_async)
+        if shared_memory and sys.platform == "win32":
+            warnings.warn(
+                "'ParallelRunner' doesn't support moving data through shared "
+                "memory segments on Windows. Setting 'shared_memory' to False."
+            )
+            shared_memory = False
+        super().__init__(is_async=is_async, io_workers=io_workers)
+        self._pool: ProcessPoolExecutor | None = None
         self._manager = ParallelRunnerManager()
         self._manager.start()  # noqa: consider-using-with
+        self._run_payloads = self._manager.dict()  # type: ignore
+        validate_scheduler(scheduler)
 
         # This code comes from the concurrent.futures library
         # https://github.com/python/cpython/blob/master/Lib/concurrent/futures/process.py#L588
@@ -176,8 +521,18 @@ class ParallelRunner(AbstractRunner):
                 max_workers = min(_MAX_WINDOWS_WORKERS, max_workers)
 
         self._max_workers = max_workers
+        self._scheduler = scheduler
+        self._node_timings = node_timings
+        self._reuse_workers = reuse_workers
+        self._shared_memory = shared_memory
+        self._fuse_chains = fuse_chains
+        self._segment_datasets: list[_SharedMemoryBuffersDataset] = []
+        self._chains: dict[int, tuple[int, ...]] = {}
+        self._chained_data_sets: set[str] = set()
 
     def __del__(self):
+        if self._pool is not None:
+            self._pool.shutdown()
         self._manager.shutdown()
 
     def create_default_data_set(  # type: ignore
@@ -193,8 +548,49 @@ class ParallelRunner(AbstractRunner):
             unregistered datasets.
 
         """
+        if ds_name in self._chained_data_sets:
+            # held by the worker running the chain, without the SyncManager
+            return _ChainDataset()  # type: ignore
+        if self._shared_memory:
+            data_set = _SharedMemoryBuffersDataset(self._manager)
+            self._segment_datasets.append(data_set)
+            return data_set
         return _SharedMemoryDataset(self._manager)
 
+    def run(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager = None,
+        session_id: str = None,
+    ) -> dict[str, Any]:
+        """Run the ``Pipeline`` using the datasets provided by ``catalog``
+        and save results back to the same objects.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            session_id: The id of the session.
+
+        Returns:
+            Any node outputs that cannot be processed by the ``DataCatalog``.
+            These are returned in a dictionary, where the keys are defined
+            by the node outputs.
+
+        """
+        self._find_chains(pipeline, catalog)
+        try:
+            return super().run(pipeline, catalog, hook_manager, session_id)
+        finally:
+            self._chains = {}
+            self._chained_data_sets = set()
+            # Free outputs and the datasets of a failed run are not released
+            # by the run itself. The loaded results stay valid, as unlinking
+            # a segment does not unmap it.
+            while self._segment_datasets:
+                self._segment_datasets.pop().release()
+
     @classmethod
     def _validate_nodes(cls, nodes: Iterable[Node]):
         """Ensure all tasks are serialisable."""
@@ -245,9 +641,10 @@ class ParallelRunner(AbstractRunner):
             )
 
         memory_datasets = []
+        all_outputs = pipeline.all_outputs()
         for name, data_set in data_sets.items():
             if (
-                name in pipeline.all_outputs()
+                name in all_outputs
                 and isinstance(data_set, MemoryDataset)
                 and not isinstance(data_set, BaseProxy)
             ):
@@ -261,6 +658,24 @@ class ParallelRunner(AbstractRunner):
                 f"MemoryDatasets"
             )
 
+    def _find_chains(self, pipeline: Pipeline, catalog: DataCatalog) -> None:
+        """Finds the chains of nodes run as a single task, linked by datasets
+        not registered in the catalog, if ``fuse_chains`` is set.
+        """
+        if not self._fuse_chains:
+            return
+        plan = ExecutionPlan.from_pipeline(pipeline)
+        unregistered = {name for name in plan.data_sets if name not in catalog}
+        chains = find_linear_chains(plan, unregistered)
+        self._chains = {chain[0]: chain for chain in chains}
+        self._chained_data_sets = {
+            name
+            for chain in chains
+            for parent_id, child_id in zip(chain, chain[1:])
+            for name in plan.node_outputs(parent_id)
+            if name in plan.node_inputs(child_id)
+        }
+
     def _get_required_workers_count(self, pipeline: Pipeline):
         """
         Calculate the max number of processes required for the pipeline,
@@ -271,10 +686,85 @@ class ParallelRunner(AbstractRunner):
         # because each layer means some nodes depend on other nodes
         # and they can not run in parallel.
         # It might be not a perfect solution, but good enough and simple.
-        required_processes = len(pipeline.nodes) - len(pipeline.grouped_nodes) + 1
+        plan = ExecutionPlan.from_pipeline(pipeline)
+        required_processes = len(plan) - plan.group_count + 1
 
         return min(required_processes, self._max_workers)
 
+    def _create_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        if self._shared_memory:
+            # The workers must share the resource tracker of this process,
+            # which unlinks the segments, so start it before them.
+            resource_tracker.ensure_running()
+        return _create_worker_pool(max_workers, self._run_payloads)
+
+    @staticmethod
+    def _worker_catalog(
+        catalog: DataCatalog, data_set_names: AbstractSet[str]
+    ) -> DataCatalog:
+        """Returns the part of the catalog the workers need for the run,
+        i.e. the datasets used by the nodes they run.
+        """
+        data_sets = catalog._data_sets  # noqa: protected-access
+        return DataCatalog(
+            data_sets={
+                name: data_set
+                for name, data_set in data_sets.items()
+                if name in data_set_names
+            },
+            layers=catalog.layers,
+            dataset_patterns=catalog._dataset_patterns,  # noqa: protected-access
+            load_versions=catalog._load_versions,  # noqa: protected-access
+            save_version=catalog._save_version,  # noqa: protected-access
+        )
+
+    @contextmanager
+    def _get_pool(self, pipeline: Pipeline) -> Iterator[ProcessPoolExecutor]:
+        """Yields the pool to run ``pipeline`` with. Unless workers are
+        reused, a pool sized for the pipeline is created and shut down
+        afterwards.
+        """
+        if not self._reuse_workers:
+            with self._create_pool(self._get_required_workers_count(pipeline)) as pool:
+                yield pool
+            return
+
+        if self._pool is None:
+            self._pool = self._create_pool(self._max_workers)
+        try:
+            yield self._pool
+        except BrokenProcessPool:
+            self._pool = None
+            raise
+
+    def _submit(
+        self,
+        pool: ProcessPoolExecutor,
+        run_id: str,
+        node_id: int,
+        session_id: str | None,
+    ) -> Future:
+        """Submits a node to the pool, with the rest of its chain if it
+        starts one.
+        """
+        if node_id in self._chains:
+            return pool.submit(
+                _run_chain_by_id,
+                run_id,
+                self._chains[node_id],
+                self._is_async,
+                session_id,
+                self._io_workers,
+            )
+        return pool.submit(
+            _run_node_by_id,
+            run_id,
+            node_id,
+            self._is_async,
+            session_id,
+            self._io_workers,
+        )
+
     def _run(  # noqa: too-many-locals,useless-suppression
         self,
         pipeline: Pipeline,
@@ -298,72 +788,92 @@ class ParallelRunner(AbstractRunner):
             Exception: In case of any downstream node failure.
 
         """
-        # noqa: import-outside-toplevel,cyclic-import
-
-        nodes = pipeline.nodes
+        plan = ExecutionPlan.from_pipeline(pipeline)
+        nodes = plan.nodes
         self._validate_catalog(catalog, pipeline)
         self._validate_nodes(nodes)
 
-        load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
-        node_dependencies = pipeline.node_dependencies
-        todo_nodes = set(node_dependencies.keys())
+        load_counts = plan.load_counts()
+        scheduler = create_scheduler(self._scheduler, plan, self._node_timings)
         done_nodes: set[Node] = set()
         futures = set()
+        started = {}
         done = None
         max_workers = self._get_required_workers_count(pipeline)
 
-        from kedro.framework.project import LOGGING, PACKAGE_NAME
-
-        with ProcessPoolExecutor(max_workers=max_workers) as pool:
-            while True:
-                ready = {n for n in todo_nodes if node_dependencies[n] <= done_nodes}
-                todo_nodes -= ready
-                for node in ready:
-                    futures.add(
-                        pool.submit(
-                            _run_node_synchronization,
-                            node,
-                            catalog,
-                            self._is_async,
-                            session_id,
-                            package_name=PACKAGE_NAME,
-                            logging_config=LOGGING,  # type: ignore
-                        )
-                    )
-                if not futures:
-                    if todo_nodes:
-                        debug_data = {
-                            "todo_nodes": todo_nodes,
-                            "done_nodes": done_nodes,
-                            "ready_nodes": ready,
-                            "done_futures": done,
-                        }
-                        debug_data_str = "\n".join(
-                            f"{k} = {v}" for k, v in debug_data.items()
-                        )
-                        raise RuntimeError(
-                            f"Unable to schedule new tasks although some nodes "
-                            f"have not been run:\n{debug_data_str}"
+        # The catalog and nodes are sent to each worker once per run, tasks
+        # only carry the run id and the node id.
+        run_id = uuid.uuid4().hex
+        self._run_payloads[run_id] = bytes(
+            ForkingPickler.dumps((self._worker_catalog(catalog, plan.data_sets), nodes))
+        )
+
+        try:
+            with self._get_pool(pipeline) as pool:
+                while True:
+                    # Only hand out as many nodes as there are idle workers, so
+                    # the scheduler picks among all nodes ready at that time.
+                    ready = scheduler.pop_ready(max_workers - len(futures))
+                    for node in ready:
+                        node_id = plan.node_id(node)
+                        future = self._submit(pool, run_id, node_id, session_id)
+                        started[future] = (
+                            self._chains.get(node_id, (node_id,)),
+                            time.perf_counter(),
                         )
-                    break  # pragma: no cover
-                done, futures = wait(futures, return_when=FIRST_COMPLETED)
-                for future in done:
-                    node = future.result()
-                    done_nodes.add(node)
-
-                    # Decrement load counts, and release any datasets we
-                    # have finished with. This is particularly important
-                    # for the shared, default datasets we created above.
-                    for data_set in node.inputs:
-                        load_counts[data_set] -= 1
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.inputs()
-                        ):
-                            catalog.release(data_set)
-                    for data_set in node.outputs:
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.outputs()
-                        ):
-                            catalog.release(data_set)
+                        futures.add(future)
+                    if not futures:
+                        todo_nodes = scheduler.todo_nodes
+                        if todo_nodes:
+                            debug_data = {
+                                "todo_nodes": todo_nodes,
+                                "done_nodes": done_nodes,
+                                "ready_nodes": ready,
+                                "done_futures": done,
+                            }
+                            debug_data_str = "\n".join(
+                                f"{k} = {v}" for k, v in debug_data.items()
+                            )
+                            raise RuntimeError(
+                                f"Unable to schedule new tasks although some nodes "
+                                f"have not been run:\n{debug_data_str}"
+                            )
+                        break  # pragma: no cover
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        node_ids, start = started.pop(future)
+                        chain = [nodes[node_id] for node_id in node_ids]
+                        durations = _complete_task(scheduler, chain, result, start)
+                        for node, duration in zip(chain, durations):
+                            if self._node_timings:
+                                self._node_timings.record(node.name, duration)
+                            done_nodes.add(node)
+                            self._record_completed(node, catalog)
+
+                            # Decrement load counts, and release any datasets
+                            # we have finished with. This is particularly
+                            # important for the shared, default datasets we
+                            # created above.
+                            self._release_datasets(node, catalog, load_counts, plan)
+        finally:
+            # A reused pool outlives the run, so wait for the nodes still
+            # running after a failure like shutting down the pool would.
+            wait(futures)
+            self._run_payloads.pop(run_id, None)
+            if self._node_timings:
+                self._node_timings.save()
+
+
+def _complete_task(
+    scheduler: DependencyScheduler, chain: list[Node], result: Any, start: float
+) -> list[float]:
+    """Completes the nodes of a task in the scheduler and returns their
+    durations. A chain reports the duration of each of its nodes, the duration
+    of a single node is measured from ``start``.
+    """
+    if len(chain) > 1:
+        scheduler.complete_chain(chain)
+        return result
+    scheduler.complete(chain[0])
+    return [time.perf_counter() - start]
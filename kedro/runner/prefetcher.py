@@ -0,0 +1,207 @@
+"""``Prefetcher`` loads the persisted inputs of the next nodes of a run on
+background threads, while the current node runs.
+"""
+from __future__ import annotations
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Iterable
+
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline.node import Node
+from kedro.pipeline.pipeline import _strip_transcoding
+from kedro.runner.execution_plan import ExecutionPlan
+from kedro.runner.memory_budget import estimate_size, parse_memory_size
+
+
+class Prefetcher:
+    """``Prefetcher`` starts loading the persisted inputs of the next
+    ``lookahead`` nodes of a run in plan order on background threads, while
+    the current node runs, so that the nodes do not wait for slow reads.
+    Runners report the nodes they start with ``node_started`` and load the
+    inputs of the nodes with ``load``.
+
+    Only the datasets registered in the catalog which are not ``MemoryDataset``
+    are prefetched, once the nodes producing them have completed. Each node
+    receives the data loaded for it, and the ``before_dataset_loaded`` and
+    ``after_dataset_loaded`` hooks run when the node uses the data, in the
+    same order as without prefetching. The data prefetched and not used yet
+    is kept within ``max_memory`` bytes, as estimated by ``estimate_size``.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import SequentialRunner
+        >>>
+        >>> runner = SequentialRunner(prefetch=2, max_prefetch_memory="4GB")
+        >>> runner.run(pipeline, catalog)
+    """
+
+    def __init__(
+        self, lookahead: int, max_memory: int | str = None, max_workers: int = None
+    ):
+        """Creates a new instance of ``Prefetcher``.
+
+        Args:
+            lookahead: The number of nodes after the running node whose
+                inputs are prefetched.
+            max_memory: The maximum size of the data prefetched and not used
+                yet, in bytes or with a unit, e.g. ``4GB``. See
+                ``parse_memory_size``. No more data is prefetched while it is
+                exceeded. If not set, the memory is not limited.
+            max_workers: The number of threads loading the data. If not set,
+                calculated automatically by ``ThreadPoolExecutor``.
+
+        Raises:
+            ValueError: If ``lookahead`` or ``max_memory`` is invalid.
+        """
+        if lookahead < 1:
+            raise ValueError("lookahead should be positive")
+        self._lookahead = lookahead
+        self._max_memory = (
+            parse_memory_size(max_memory) if max_memory is not None else None
+        )
+        self._max_workers = max_workers
+        self._lock = Lock()
+        self._plan: ExecutionPlan | None = None
+        self._catalog: DataCatalog | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._prefetchable: list[tuple[str, ...]] = []
+        self._producers: dict[str, int] = {}
+        self._started: set[tuple[int, str]] = set()
+        self._futures: dict[tuple[int, str], Future] = {}
+        self._size = 0
+        # loads still in progress when a run is closed do not count towards
+        # the size of the data prefetched by the next run
+        self._run = 0
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def lookahead(self) -> int:
+        """The number of nodes after the running node whose inputs are
+        prefetched.
+        """
+        return self._lookahead
+
+    @property
+    def max_memory(self) -> int | None:
+        """The maximum size of the data prefetched and not used yet, in
+        bytes, or None if the memory is not limited.
+        """
+        return self._max_memory
+
+    @property
+    def prefetched_size(self) -> int:
+        """The estimated size of the data prefetched and not used yet, in
+        bytes.
+        """
+        return self._size
+
+    def start(
+        self, plan: ExecutionPlan, catalog: DataCatalog, exclude: Iterable[str] = ()
+    ) -> None:
+        """Starts prefetching the inputs of a run.
+
+        Args:
+            plan: The ``ExecutionPlan`` of the run, whose nodes run in order.
+            catalog: The ``DataCatalog`` of the run.
+            exclude: The datasets not to prefetch, e.g. the outputs kept in
+                memory by ``WriteBehind``.
+        """
+        self._plan = plan
+        self._catalog = catalog
+        # the transcodings of a dataset are produced by the same node
+        self._producers = {
+            _strip_transcoding(name): node_id
+            for node_id in range(len(plan))
+            for name in plan.node_outputs(node_id)
+        }
+        persisted = {
+            name
+            for name in plan.data_sets - set(exclude)
+            if name in catalog
+            and not isinstance(
+                catalog._get_dataset(name), MemoryDataset  # noqa: protected-access
+            )
+        }
+        self._prefetchable = [
+            tuple(name for name in plan.node_inputs(node_id) if name in persisted)
+            for node_id in range(len(plan))
+        ]
+        self._started = set()
+        self._futures = {}
+        self._size = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="kedro-prefetch"
+        )
+
+    def node_started(self, node: Node) -> None:
+        """Starts loading the persisted inputs of the nodes following a node
+        which started, once the nodes before it have completed.
+
+        Args:
+            node: The node which started.
+        """
+        node_id = self._plan.node_id(node)  # type: ignore
+        last = min(node_id + self._lookahead, len(self._prefetchable) - 1)
+        for next_id in range(node_id + 1, last + 1):
+            for name in self._prefetchable[next_id]:
+                key = (next_id, name)
+                producer_id = self._producers.get(_strip_transcoding(name), -1)
+                if key in self._started or producer_id >= node_id:
+                    continue
+                if self._max_memory is not None and self._size >= self._max_memory:
+                    return
+                self._started.add(key)
+                self._futures[key] = self._executor.submit(  # type: ignore
+                    self._load, self._catalog, name, self._run
+                )
+
+    def load(self, node: Node, name: str) -> Any:
+        """Loads an input of a node, waiting for the data prefetched for the
+        node if its loading has started.
+
+        Args:
+            node: The node loading the input.
+            name: The name of the input.
+
+        Returns:
+            The loaded data.
+        """
+        key = (self._plan.node_id(node), name)  # type: ignore
+        future = self._futures.pop(key, None)
+        if future is None:
+            return self._catalog.load(name)  # type: ignore
+        data, size = future.result()
+        with self._lock:
+            self._size -= size
+        return data
+
+    def close(self) -> None:
+        """Stops prefetching, e.g. when a node failed. Loads which have not
+        started are cancelled and the data prefetched is dropped.
+        """
+        for future in self._futures.values():
+            future.cancel()
+        if self._executor is not None:
+            # loads in progress are not waited for
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._futures = {}
+        self._size = 0
+        self._run += 1
+        self._plan = None
+        self._catalog = None
+
+    def _load(self, catalog: DataCatalog, name: str, run: int) -> tuple[Any, int]:
+        data = catalog.load(name)
+        size = estimate_size(data)
+        with self._lock:
+            if run == self._run:
+                self._size += size
+        self._logger.debug("Prefetched '%s'.", name)
+        return data, size
@@ -0,0 +1,153 @@
+"""``RunCache`` keeps the persisted outputs of nodes in memory once they are
+saved, so that the nodes of the same run do not load them from storage again.
+"""
+from __future__ import annotations
+
+import logging
+from threading import Lock
+from typing import Any, Iterable
+
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.runner.execution_plan import ExecutionPlan
+from kedro.runner.memory_budget import estimate_size, parse_memory_size
+
+
+class RunCache:
+    """``RunCache`` keeps the data of the node outputs registered in the
+    catalog, other than ``MemoryDataset``, in memory once they are saved, and
+    the nodes of the run using them load them from memory instead of loading
+    them from their datasets again. Runners store the outputs they save with
+    ``put``, load the inputs it holds with ``load`` and ``release`` them once
+    the nodes using them have completed, as for ``MemoryDataset``.
+
+    Each node loads a copy of the data, as returned by ``MemoryDataset``. The
+    data is only kept while its estimated size, as given by ``estimate_size``,
+    fits within ``max_memory`` with the data already kept.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import RunCache, SequentialRunner
+        >>>
+        >>> run_cache = RunCache(max_memory="8GB", exclude=["model"])
+        >>> SequentialRunner(run_cache=run_cache).run(pipeline, catalog)
+    """
+
+    def __init__(self, max_memory: int | str = None, exclude: Iterable[str] = ()):
+        """Creates a new instance of ``RunCache``.
+
+        Args:
+            max_memory: The maximum size of the data kept in memory, in bytes
+                or with a unit, e.g. ``8GB``. See ``parse_memory_size``. If
+                not set, the memory is not limited.
+            exclude: The names of the datasets whose data is never kept, e.g.
+                because loading them returns a different object than the one
+                saved.
+
+        Raises:
+            ValueError: If ``max_memory`` is invalid.
+        """
+        self._max_memory = (
+            parse_memory_size(max_memory) if max_memory is not None else None
+        )
+        self._exclude = frozenset(exclude)
+        self._lock = Lock()
+        self._data_sets: frozenset[str] = frozenset()
+        self._held: dict[str, MemoryDataset] = {}
+        self._sizes: dict[str, int] = {}
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def max_memory(self) -> int | None:
+        """The maximum size of the data kept in memory, in bytes, or None if
+        the memory is not limited.
+        """
+        return self._max_memory
+
+    @property
+    def data_sets(self) -> frozenset[str]:
+        """The names of the outputs of the run which can be kept in memory."""
+        return self._data_sets
+
+    @property
+    def size(self) -> int:
+        """The estimated size of the data kept in memory, in bytes."""
+        return sum(self._sizes.values())
+
+    def start(self, plan: ExecutionPlan, catalog: DataCatalog) -> None:
+        """Starts keeping the outputs of a run.
+
+        Args:
+            plan: The ``ExecutionPlan`` of the run.
+            catalog: The ``DataCatalog`` of the run.
+        """
+        load_counts = plan.load_counts()
+        outputs = plan.data_sets - plan.free_inputs - self._exclude
+        self._data_sets = frozenset(
+            name
+            for name in outputs
+            if load_counts[name]
+            and name in catalog
+            and not isinstance(
+                catalog._get_dataset(name), MemoryDataset  # noqa: protected-access
+            )
+        )
+        self._held = {}
+        self._sizes = {}
+
+    def put(self, name: str, data: Any) -> None:
+        """Keeps the data of an output which was saved, if it fits within
+        ``max_memory``.
+
+        Args:
+            name: The name of the output.
+            data: The data saved.
+        """
+        if name not in self._data_sets:
+            return
+        size = estimate_size(data)
+        with self._lock:
+            if self._max_memory is not None and self.size + size > self._max_memory:
+                self._logger.debug(
+                    "Not keeping '%s' in memory, as it would exceed %d bytes.",
+                    name,
+                    self._max_memory,
+                )
+                return
+            self._held[name] = MemoryDataset(data)
+            self._sizes[name] = size
+
+    def holds(self, name: str) -> bool:
+        """Whether the data of an output is kept in memory."""
+        return name in self._held
+
+    def load(self, name: str) -> Any:
+        """Loads the data of an output kept in memory.
+
+        Args:
+            name: The name of the output.
+
+        Returns:
+            A copy of the data, as returned by ``MemoryDataset``.
+        """
+        return self._held[name].load()
+
+    def release(self, name: str) -> None:
+        """Stops keeping the data of an output, once the nodes using it in
+        the run have completed.
+
+        Args:
+            name: The name of the output.
+        """
+        with self._lock:
+            self._held.pop(name, None)
+            self._sizes.pop(name, None)
+
+    def close(self) -> None:
+        """Stops keeping the outputs of the run and drops their data."""
+        with self._lock:
+            self._held = {}
+            self._sizes = {}
@@ -0,0 +1,170 @@
+"""``RunJournal`` records the nodes a run completed and the versions of the
+outputs they persisted, so that a failed run can be resumed.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from contextlib import suppress
+from pathlib import Path
+from typing import Dict, Optional
+
+from kedro.io import (
+    AbstractDataSet,
+    AbstractVersionedDataSet,
+    DataCatalog,
+    MemoryDataset,
+)
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+
+# the persisted outputs of the completed nodes by node name, each mapping the
+# output name to the version it was saved with, or None if it is not versioned
+JournalEntries = Dict[str, Dict[str, Optional[str]]]
+
+
+class RunJournal:
+    """``RunJournal`` is an append-only record of the nodes a run completed and
+    of the outputs they persisted, with the versions they were saved with. It
+    is written one line per node as the run goes, so that it survives the run
+    failing or being interrupted.
+
+    Outputs held in memory are not recorded, as they are lost with the run.
+    ``resume`` uses the journal to find the nodes still to run, including the
+    completed nodes recomputing the outputs held in memory they need, and the
+    versions to load the persisted outputs with.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import RunJournal, SequentialRunner
+        >>>
+        >>> runner = SequentialRunner()
+        >>> runner.journal = RunJournal("sessions/2023-08-01T10.00.00.000Z/journal.jsonl")
+        >>> runner.run(pipeline, catalog)
+        >>>
+        >>> # after a failure, run the nodes which did not complete
+        >>> remaining, load_versions = journal.resume(pipeline)
+    """
+
+    def __init__(self, filepath: str | Path):
+        """Creates a new instance of ``RunJournal``.
+
+        Args:
+            filepath: The JSON lines file to record the run in. Records are
+                appended to the file if it exists.
+        """
+        self._filepath = Path(filepath)
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def filepath(self) -> Path:
+        """The file the run is recorded in."""
+        return self._filepath
+
+    def exists(self) -> bool:
+        """Whether any node was recorded."""
+        return self._filepath.is_file()
+
+    def clear(self) -> None:
+        """Removes all the records, to record a new run."""
+        with suppress(FileNotFoundError):
+            self._filepath.unlink()
+
+    def record(self, node: Node, catalog: DataCatalog) -> None:
+        """Records that a node completed, with the persisted outputs it saved
+        to ``catalog``.
+
+        Args:
+            node: The completed node.
+            catalog: The ``DataCatalog`` of the run.
+        """
+        outputs = {}
+        for name in node.outputs:
+            data_set = catalog._get_dataset(name)  # noqa: protected-access
+            # the default datasets of the runners may not be ``AbstractDataSet``s
+            if not isinstance(data_set, AbstractDataSet) or isinstance(
+                data_set, MemoryDataset
+            ):
+                continue
+            outputs[name] = (
+                data_set.resolve_save_version()
+                if isinstance(data_set, AbstractVersionedDataSet)
+                else None
+            )
+        self._append({node.name: outputs})
+
+    def extend(self, entries: JournalEntries) -> None:
+        """Records the entries of another journal, e.g. of the run resumed.
+
+        Args:
+            entries: The entries, as returned by ``load``.
+        """
+        if entries:
+            self._append(entries)
+
+    def load(self) -> JournalEntries:
+        """Loads the recorded nodes and their persisted outputs.
+
+        Returns:
+            The persisted outputs of the completed nodes by node name, each
+            mapping the output name to the version it was saved with, or None
+            if it is not versioned. Empty if no node was recorded.
+        """
+        entries: JournalEntries = {}
+        if not self.exists():
+            return entries
+        with self._filepath.open(encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entries.update(json.loads(line))
+                except ValueError:
+                    # the last line is incomplete if the run was killed
+                    # while writing it
+                    self._logger.warning(
+                        "Ignoring incomplete record in run journal '%s'.",
+                        self._filepath,
+                    )
+        return entries
+
+    def resume(self, pipeline: Pipeline) -> tuple[Pipeline, dict[str, str]]:
+        """Finds what to run to resume the run recorded in the journal.
+
+        Args:
+            pipeline: The ``Pipeline`` of the run.
+
+        Returns:
+            The ``Pipeline`` of the nodes which did not complete and of the
+            completed nodes producing the outputs held in memory they need,
+            and the versions to load the persisted outputs of the completed
+            nodes with.
+        """
+        entries = self.load()
+        persisted = {name for outputs in entries.values() for name in outputs}
+        remaining = Pipeline(
+            [node for node in pipeline.nodes if node.name not in entries]
+        )
+        # completed nodes whose outputs were held in memory run again, and
+        # so do their own producers of outputs held in memory
+        in_memory = pipeline.all_outputs() - persisted
+        needed = remaining.inputs() & in_memory
+        producers = pipeline.only_nodes_with_outputs(*in_memory)
+        to_run = remaining + producers.to_outputs(*needed)
+
+        inputs = to_run.inputs()
+        load_versions = {
+            name: version
+            for outputs in entries.values()
+            for name, version in outputs.items()
+            if version is not None and name in inputs
+        }
+        return to_run, load_versions
+
+    def _append(self, entries: JournalEntries) -> None:
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        # append and flush every record, so that it is kept if the run dies
+        with self._filepath.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(entries) + "\n")
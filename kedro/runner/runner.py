@@ -7,14 +7,16 @@ import inspect
 import itertools as it
 import logging
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import Counter, deque
 from concurrent.futures import (
     ALL_COMPLETED,
+    Executor,
     Future,
     ThreadPoolExecutor,
     as_completed,
     wait,
 )
+from contextlib import ExitStack
 from typing import Any, Iterable, Iterator
 
 from more_itertools import interleave
@@ -24,6 +26,14 @@ from kedro.framework.hooks.manager import _NullPluginManager
 from kedro.io import AbstractDataSet, DataCatalog, MemoryDataset
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+from kedro.runner.freshness import find_stale_nodes
+from kedro.runner.io_executor import IOExecutor
+from kedro.runner.node_cache import NodeCache
+from kedro.runner.prefetcher import Prefetcher
+from kedro.runner.run_cache import RunCache
+from kedro.runner.run_journal import RunJournal
+from kedro.runner.write_behind import WriteBehind
 
 
 class AbstractRunner(ABC):
@@ -31,20 +41,47 @@ class AbstractRunner(ABC):
     implementations.
     """
 
-    def __init__(self, is_async: bool = False):
+    def __init__(
+        self,
+        is_async: bool = False,
+        io_workers: int = None,
+        node_cache: NodeCache = None,
+    ):
         """Instantiates the runner class.
 
         Args:
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
+            io_workers: The number of threads loading and saving data for all
+                the nodes of a run when ``is_async`` is True. If not set,
+                calculated automatically by ``ThreadPoolExecutor``.
+            node_cache: The ``NodeCache`` to restore node outputs from instead
+                of running the nodes, and to store them in. Outputs are not
+                cached if not set.
 
         """
         self._is_async = is_async
+        self._io_workers = io_workers
+        self._io_executor: IOExecutor | None = None
+        self._node_cache = node_cache
+        self._journal: RunJournal | None = None
 
     @property
     def _logger(self):
         return logging.getLogger(self.__module__)
 
+    @property
+    def journal(self) -> RunJournal | None:
+        """The ``RunJournal`` the runs record their completed nodes and the
+        versions of their persisted outputs in, to be resumed if they fail.
+        Not recorded if None, the default.
+        """
+        return self._journal
+
+    @journal.setter
+    def journal(self, journal: RunJournal | None) -> None:
+        self._journal = journal
+
     def run(
         self,
         pipeline: Pipeline,
@@ -53,7 +90,8 @@ class AbstractRunner(ABC):
         session_id: str = None,
     ) -> dict[str, Any]:
         """Run the ``Pipeline`` using the datasets provided by ``catalog``
-        and save results back to the same objects.
+        and save results back to the same objects. The completed nodes are
+        recorded in the ``journal`` of the runner, if set.
 
         Args:
             pipeline: The ``Pipeline`` to run.
@@ -73,14 +111,15 @@ class AbstractRunner(ABC):
 
         hook_manager = hook_manager or _NullPluginManager()
         catalog = catalog.shallow_copy()
+        plan = ExecutionPlan.from_pipeline(pipeline)
 
         # Check which datasets used in the pipeline are in the catalog or match
         # a pattern in the catalog
-        registered_ds = [ds for ds in pipeline.data_sets() if ds in catalog]
+        registered_ds = [ds for ds in plan.data_sets if ds in catalog]
 
         # Check if there are any input datasets that aren't in the catalog and
         # don't match a pattern in the catalog.
-        unsatisfied = pipeline.inputs() - set(registered_ds)
+        unsatisfied = plan.free_inputs - set(registered_ds)
 
         if unsatisfied:
             raise ValueError(
@@ -89,8 +128,8 @@ class AbstractRunner(ABC):
 
         # Check if there's any output datasets that aren't in the catalog and don't match a pattern
         # in the catalog.
-        free_outputs = pipeline.outputs() - set(registered_ds)
-        unregistered_ds = pipeline.data_sets() - set(registered_ds)
+        free_outputs = plan.free_outputs - set(registered_ds)
+        unregistered_ds = plan.data_sets - set(registered_ds)
 
         # Create a default dataset for unregistered datasets
         for ds_name in unregistered_ds:
@@ -100,7 +139,16 @@ class AbstractRunner(ABC):
             self._logger.info(
                 "Asynchronous mode is enabled for loading and saving data"
             )
-        self._run(pipeline, catalog, hook_manager, session_id)
+            self._io_executor = IOExecutor(self._io_workers)
+        try:
+            self._run(pipeline, catalog, hook_manager, session_id)
+        finally:
+            if self._io_executor is not None:
+                self._io_executor.shutdown()
+                self._log_io_executor_metrics(self._io_executor)
+                self._io_executor = None
+            if self._node_cache is not None:
+                self._node_cache.evict()
 
         self._logger.info("Pipeline execution completed successfully.")
 
@@ -127,22 +175,67 @@ class AbstractRunner(ABC):
             the keys are defined by the node outputs.
 
         """
-        free_outputs = pipeline.outputs() - set(catalog.list())
-        missing = {ds for ds in catalog.list() if not catalog.exists(ds)}
+        registered_ds = set(catalog.list())
+        free_outputs = pipeline.outputs() - registered_ds
+        # only check the data sets of the pipeline, concurrently, as checking
+        # remote data sets one at a time can take minutes in large catalogs
+        exists = catalog.exists_many(pipeline.data_sets() & registered_ds)
+        missing = {ds for ds, ds_exists in exists.items() if not ds_exists}
         to_build = free_outputs | missing
         to_rerun = pipeline.only_nodes_with_outputs(*to_build) + pipeline.from_inputs(
             *to_build
         )
-
-        # We also need any missing datasets that are required to run the
-        # `to_rerun` pipeline, including any chains of missing datasets.
-        unregistered_ds = pipeline.data_sets() - set(catalog.list())
-        output_to_unregistered = pipeline.only_nodes_with_outputs(*unregistered_ds)
-        input_from_unregistered = to_rerun.inputs() & unregistered_ds
-        to_rerun += output_to_unregistered.to_outputs(*input_from_unregistered)
+        to_rerun = _add_unregistered_inputs(pipeline, catalog, to_rerun)
 
         return self.run(to_rerun, catalog, hook_manager)
 
+    def run_only_changed(  # noqa: too-many-arguments
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager = None,
+        session_id: str = None,
+        untimestamped: str = "fresh",
+    ) -> dict[str, Any]:
+        """Run only the nodes of the ``Pipeline`` whose outputs are missing or
+        older than their inputs, like ``make``, and the nodes downstream of
+        them. The modification times of the datasets are those reported by
+        their fsspec file systems.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            session_id: The id of the session.
+            untimestamped: How to treat persisted datasets without a
+                modification time. ``fresh`` considers them up to date with
+                their inputs, and ``stale`` considers them older than their
+                inputs and newer than their outputs. Defaults to ``fresh``.
+
+        Raises:
+            ValueError: Raised when ``Pipeline`` inputs cannot be
+                satisfied, or ``untimestamped`` is unknown.
+
+        Returns:
+            Any node outputs that cannot be processed by the
+            ``DataCatalog``. These are returned in a dictionary, where
+            the keys are defined by the node outputs.
+
+        """
+        free_outputs = pipeline.outputs() - set(catalog.list())
+        to_rerun = find_stale_nodes(
+            pipeline, catalog, untimestamped
+        ) + pipeline.only_nodes_with_outputs(*free_outputs)
+        to_rerun = _add_unregistered_inputs(pipeline, catalog, to_rerun)
+
+        skipped = len(pipeline.nodes) - len(to_rerun.nodes)
+        self._logger.info(
+            "Skipping %d out of %d nodes whose outputs are up to date.",
+            skipped,
+            len(pipeline.nodes),
+        )
+        return self.run(to_rerun, catalog, hook_manager, session_id)
+
     @abstractmethod  # pragma: no cover
     def _run(
         self,
@@ -176,6 +269,55 @@ class AbstractRunner(ABC):
         """
         pass
 
+    def _log_io_executor_metrics(self, io_executor: IOExecutor) -> None:
+        if not io_executor.task_count:
+            return
+        self._logger.info(
+            "Loaded and saved data in %d tasks on up to %d threads. At most %d "
+            "tasks, %.1f on average, were waiting for a thread.",
+            io_executor.task_count,
+            io_executor.max_workers,
+            io_executor.max_queue_depth,
+            io_executor.mean_queue_depth,
+        )
+
+    @staticmethod
+    def _release_datasets(
+        node: Node,
+        catalog: DataCatalog,
+        load_counts: Counter,
+        plan: ExecutionPlan,
+        run_cache: RunCache = None,
+    ) -> None:
+        """Decrement the load counts of a completed node and release any
+        datasets which are no longer needed by the rest of the run.
+
+        Args:
+            node: The ``Node`` which completed.
+            catalog: The ``DataCatalog`` of the run.
+            load_counts: The load counts of the run, see
+                ``ExecutionPlan.load_counts()``.
+            plan: The ``ExecutionPlan`` of the run.
+            run_cache: The ``RunCache`` of the run, to release the data it
+                keeps for the datasets too.
+
+        """
+        for data_set in plan.datasets_to_release(node, load_counts):
+            catalog.release(data_set)
+            if run_cache:
+                run_cache.release(data_set)
+
+    def _record_completed(self, node: Node, catalog: DataCatalog) -> None:
+        """Records a completed node in the journal of the run, if any.
+
+        Args:
+            node: The ``Node`` which completed.
+            catalog: The ``DataCatalog`` of the run.
+
+        """
+        if self._journal is not None:
+            self._journal.record(node, catalog)
+
     def _suggest_resume_scenario(
         self,
         pipeline: Pipeline,
@@ -194,16 +336,34 @@ class AbstractRunner(ABC):
 
         """
         remaining_nodes = set(pipeline.nodes) - set(done_nodes)
+        if self._journal is not None and done_nodes:
+            self._logger.warning(
+                "There are %d nodes that have not run.\n"
+                "The nodes which completed are recorded in the run journal "
+                "'%s', to resume the run from.",
+                len(remaining_nodes),
+                self._journal.filepath,
+            )
+            return
 
         postfix = ""
         if done_nodes:
-            node_names = (n.name for n in remaining_nodes)
-            resume_p = pipeline.only_nodes(*node_names)
-            start_p = resume_p.only_nodes_with_inputs(*resume_p.inputs())
+            # the remaining nodes using free inputs or outputs of done nodes
+            done_names = {n.name for n in done_nodes}
+            free_inputs = pipeline.inputs()
+            start_nodes = [
+                n
+                for n in remaining_nodes
+                if free_inputs.intersection(n.inputs)
+                or any(
+                    parent.name in done_names
+                    for parent in pipeline.ancestors(n.name, direct=True)
+                )
+            ]
 
-            # find the nearest persistent ancestors of the nodes in start_p
+            # find the nearest persistent ancestors of the start nodes
             start_p_persistent_ancestors = _find_persistent_ancestors(
-                pipeline, start_p.nodes, catalog
+                pipeline, start_nodes, catalog
             )
 
             start_node_names = (n.name for n in start_p_persistent_ancestors)
@@ -248,7 +408,7 @@ def _find_persistent_ancestors(
         if _has_persistent_inputs(current_node, catalog):
             ancestor_nodes_to_run.add(current_node)
             continue
-        for parent in _enumerate_parents(pipeline, current_node):
+        for parent in pipeline.ancestors(current_node.name, direct=True):
             if parent in visited:
                 continue
             visited.add(parent)
@@ -256,22 +416,6 @@ def _find_persistent_ancestors(
     return ancestor_nodes_to_run
 
 
-def _enumerate_parents(pipeline: Pipeline, child: Node) -> list[Node]:
-    """For a given ``Node``, returns a list containing the direct parents
-    of that ``Node`` in the given ``Pipeline``.
-
-    Args:
-        pipeline: the ``Pipeline`` to search for direct parents in.
-        child: the ``Node`` to find parents of.
-
-    Returns:
-        A list of all ``Node``s that are direct parents of ``child``.
-
-    """
-    parent_pipeline = pipeline.only_nodes_with_outputs(*child.inputs)
-    return parent_pipeline.nodes
-
-
 def _has_persistent_inputs(node: Node, catalog: DataCatalog) -> bool:
     """Check if a ``Node`` exclusively has persisted Datasets as inputs.
     If at least one input is a ``MemoryDataset``, return False.
@@ -292,12 +436,29 @@ def _has_persistent_inputs(node: Node, catalog: DataCatalog) -> bool:
     return True
 
 
-def run_node(
+def _add_unregistered_inputs(
+    pipeline: Pipeline, catalog: DataCatalog, to_rerun: Pipeline
+) -> Pipeline:
+    """Adds the nodes producing the datasets which are not in the catalog and
+    needed to run ``to_rerun``, including any chains of such datasets.
+    """
+    unregistered_ds = pipeline.data_sets() - set(catalog.list())
+    output_to_unregistered = pipeline.only_nodes_with_outputs(*unregistered_ds)
+    input_from_unregistered = to_rerun.inputs() & unregistered_ds
+    return to_rerun + output_to_unregistered.to_outputs(*input_from_unregistered)
+
+
+def run_node(  # noqa: too-many-arguments
     node: Node,
     catalog: DataCatalog,
     hook_manager: PluginManager,
     is_async: bool = False,
     session_id: str = None,
+    io_executor: Executor = None,
+    node_cache: NodeCache = None,
+    prefetcher: Prefetcher = None,
+    write_behind: WriteBehind = None,
+    run_cache: RunCache = None,
 ) -> Node:
     """Run a single `Node` with inputs from and outputs to the `catalog`.
 
@@ -308,6 +469,18 @@ def run_node(
         is_async: If True, the node inputs and outputs are loaded and saved
             asynchronously with threads. Defaults to False.
         session_id: The session id of the pipeline run.
+        io_executor: The executor to load and save data in when ``is_async``
+            is True, usually shared by all the nodes of a run. If not set,
+            a new ``ThreadPoolExecutor`` is created for the node.
+        node_cache: The ``NodeCache`` to restore the node outputs from instead
+            of running the node, and to store them in.
+        prefetcher: The ``Prefetcher`` of the run, to load the node inputs
+            with instead of the ``catalog``.
+        write_behind: The ``WriteBehind`` of the run, to save the node
+            outputs in its ``data_sets`` with in the background. The node
+            inputs it keeps in memory are loaded from it.
+        run_cache: The ``RunCache`` of the run, to keep the node outputs it
+            saves in and to load the node inputs it keeps from.
 
     Raises:
         ValueError: Raised if is_async is set to True for nodes wrapping
@@ -326,15 +499,51 @@ def run_node(
         )
 
     if is_async:
-        node = _run_node_async(node, catalog, hook_manager, session_id)
+        node = _run_node_async(
+            node,
+            catalog,
+            hook_manager,
+            session_id,
+            io_executor,
+            node_cache,
+            prefetcher,
+            write_behind,
+            run_cache,
+        )
     else:
-        node = _run_node_sequential(node, catalog, hook_manager, session_id)
+        node = _run_node_sequential(
+            node,
+            catalog,
+            hook_manager,
+            session_id,
+            node_cache,
+            prefetcher,
+            write_behind,
+            run_cache,
+        )
 
     for name in node.confirms:
         catalog.confirm(name)
     return node
 
 
+def _load_input(  # noqa: too-many-arguments
+    node: Node,
+    name: str,
+    catalog: DataCatalog,
+    prefetcher: Prefetcher = None,
+    write_behind: WriteBehind = None,
+    run_cache: RunCache = None,
+) -> Any:
+    if write_behind and write_behind.holds(name):
+        return write_behind.load(name)
+    if run_cache and run_cache.holds(name):
+        return run_cache.load(name)
+    if prefetcher:
+        return prefetcher.load(node, name)
+    return catalog.load(name)
+
+
 def _collect_inputs_from_hook(  # noqa: too-many-arguments
     node: Node,
     catalog: DataCatalog,
@@ -376,20 +585,29 @@ def _call_node_run(  # noqa: too-many-arguments
     is_async: bool,
     hook_manager: PluginManager,
     session_id: str = None,
+    node_cache: NodeCache = None,
 ) -> dict[str, Any]:
-
-    try:
-        outputs = node.run(inputs)
-    except Exception as exc:
-        hook_manager.hook.on_node_error(
-            error=exc,
-            node=node,
-            catalog=catalog,
-            inputs=inputs,
-            is_async=is_async,
-            session_id=session_id,
+    key = node_cache.key(node, inputs) if node_cache else None
+    outputs = node_cache.get(key) if key else None
+    if outputs is not None:
+        logging.getLogger(__name__).info(
+            "Restored the outputs of node '%s' from the node cache.", node.name
         )
-        raise exc
+    else:
+        try:
+            outputs = node.run(inputs)
+        except Exception as exc:
+            hook_manager.hook.on_node_error(
+                error=exc,
+                node=node,
+                catalog=catalog,
+                inputs=inputs,
+                is_async=is_async,
+                session_id=session_id,
+            )
+            raise exc
+        if key:
+            node_cache.put(key, outputs)  # type: ignore
     hook_manager.hook.after_node_run(
         node=node,
         catalog=catalog,
@@ -401,17 +619,23 @@ def _call_node_run(  # noqa: too-many-arguments
     return outputs
 
 
-def _run_node_sequential(
+def _run_node_sequential(  # noqa: too-many-arguments
     node: Node,
     catalog: DataCatalog,
     hook_manager: PluginManager,
     session_id: str = None,
+    node_cache: NodeCache = None,
+    prefetcher: Prefetcher = None,
+    write_behind: WriteBehind = None,
+    run_cache: RunCache = None,
 ) -> Node:
     inputs = {}
 
     for name in node.inputs:
         hook_manager.hook.before_dataset_loaded(dataset_name=name, node=node)
-        inputs[name] = catalog.load(name)
+        inputs[name] = _load_input(
+            node, name, catalog, prefetcher, write_behind, run_cache
+        )
         hook_manager.hook.after_dataset_loaded(
             dataset_name=name, data=inputs[name], node=node
         )
@@ -424,7 +648,13 @@ def _run_node_sequential(
     inputs.update(additional_inputs)
 
     outputs = _call_node_run(
-        node, catalog, inputs, is_async, hook_manager, session_id=session_id
+        node,
+        catalog,
+        inputs,
+        is_async,
+        hook_manager,
+        session_id=session_id,
+        node_cache=node_cache,
     )
 
     items: Iterable = outputs.items()
@@ -440,31 +670,49 @@ def _run_node_sequential(
         # with an interleaved iterator of the streams
         # [(a, chunk_a), (b, chunk_b), ...] until all outputs complete
         items = zip(it.cycle(keys), interleave(*streams))
+        # the chunks are saved in order, as they are produced, and only the
+        # last chunk could be kept in memory
+        write_behind = None
+        run_cache = None
 
     for name, data in items:
         hook_manager.hook.before_dataset_saved(dataset_name=name, data=data, node=node)
+        if write_behind and name in write_behind.data_sets:
+            # the hook after saving runs once the write completes
+            write_behind.save(node, name, data)
+            continue
         catalog.save(name, data)
+        if run_cache:
+            run_cache.put(name, data)
         hook_manager.hook.after_dataset_saved(dataset_name=name, data=data, node=node)
     return node
 
 
-def _run_node_async(
+def _run_node_async(  # noqa: too-many-arguments
     node: Node,
     catalog: DataCatalog,
     hook_manager: PluginManager,
     session_id: str = None,
+    io_executor: Executor = None,
+    node_cache: NodeCache = None,
+    prefetcher: Prefetcher = None,
+    write_behind: WriteBehind = None,
+    run_cache: RunCache = None,
 ) -> Node:
     def _synchronous_dataset_load(dataset_name: str):
         """Minimal wrapper to ensure Hooks are run synchronously
         within an asynchronous dataset load."""
         hook_manager.hook.before_dataset_loaded(dataset_name=dataset_name, node=node)
-        return_ds = catalog.load(dataset_name)
+        return_ds = _load_input(
+            node, dataset_name, catalog, prefetcher, write_behind, run_cache
+        )
         hook_manager.hook.after_dataset_loaded(
             dataset_name=dataset_name, data=return_ds, node=node
         )
         return return_ds
 
-    with ThreadPoolExecutor() as pool:
+    with ExitStack() as stack:
+        pool = io_executor or stack.enter_context(ThreadPoolExecutor())
         inputs: dict[str, Future] = {}
 
         for name in node.inputs:
@@ -479,7 +727,13 @@ def _run_node_async(
         inputs.update(additional_inputs)
 
         outputs = _call_node_run(
-            node, catalog, inputs, is_async, hook_manager, session_id=session_id
+            node,
+            catalog,
+            inputs,
+            is_async,
+            hook_manager,
+            session_id=session_id,
+            node_cache=node_cache,
         )
 
         future_dataset_mapping = {}
@@ -487,6 +741,9 @@ def _run_node_async(
             hook_manager.hook.before_dataset_saved(
                 dataset_name=name, data=data, node=node
             )
+            if write_behind and name in write_behind.data_sets:
+                write_behind.save(node, name, data)
+                continue
             future = pool.submit(catalog.save, name, data)
             future_dataset_mapping[future] = (name, data)
 
@@ -495,6 +752,8 @@ def _run_node_async(
             if exception:
                 raise exception
             name, data = future_dataset_mapping[future]
+            if run_cache:
+                run_cache.put(name, data)
             hook_manager.hook.after_dataset_saved(
                 dataset_name=name, data=data, node=node
             )
@@ -0,0 +1,280 @@
+"""``DependencyScheduler`` hands out the nodes of an ``ExecutionPlan`` as soon
+as all of their dependencies have completed. It can be used by any runner
+which executes nodes concurrently.
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+
+
+class DependencyScheduler:
+    """``DependencyScheduler`` keeps a counter of unfinished dependencies for
+    every node of an ``ExecutionPlan``. When a node completes, only the
+    counters of its children are decremented and the children which have no
+    unfinished dependencies left are pushed to the ready queue, so each
+    completion costs time proportional to the number of children of the node.
+
+    Ready nodes are handed out in topological order.
+
+    Example:
+    ::
+
+        >>> from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        >>> from kedro.runner import DependencyScheduler, ExecutionPlan
+        >>>
+        >>> scheduler = DependencyScheduler(ExecutionPlan.from_pipeline(pipeline))
+        >>> futures = set()
+        >>> with ThreadPoolExecutor() as pool:
+        >>>     while not scheduler.finished:
+        >>>         for node in scheduler.pop_ready():
+        >>>             futures.add(pool.submit(run_node, node, catalog, hook_manager))
+        >>>         done, futures = wait(futures, return_when=FIRST_COMPLETED)
+        >>>         for future in done:
+        >>>             scheduler.complete(future.result())
+    """
+
+    def __init__(self, plan: ExecutionPlan):
+        """Creates a scheduler for a single run of an ``ExecutionPlan``.
+
+        Args:
+            plan: The ``ExecutionPlan`` to schedule.
+        """
+        self._plan = plan
+        self._remaining = [plan.in_degree(node_id) for node_id in range(len(plan))]
+        self._ready: list[tuple[Any, int]] = []
+        self._completed = 0
+        for node_id, in_degree in enumerate(self._remaining):
+            if in_degree == 0:
+                self._push(node_id)
+
+    @property
+    def plan(self) -> ExecutionPlan:
+        """The ``ExecutionPlan`` being scheduled."""
+        return self._plan
+
+    @property
+    def finished(self) -> bool:
+        """Whether all the nodes of the plan have completed."""
+        return self._completed == len(self._plan)
+
+    @property
+    def has_ready(self) -> bool:
+        """Whether there are nodes ready to be run."""
+        return bool(self._ready)
+
+    @property
+    def completed_count(self) -> int:
+        """The number of nodes which have completed."""
+        return self._completed
+
+    @property
+    def todo_nodes(self) -> set[Node]:
+        """The nodes which have not been handed out yet."""
+        scheduled = {node_id for _, node_id in self._ready}
+        return {
+            node
+            for node_id, node in enumerate(self._plan.nodes)
+            if self._remaining[node_id] > 0 or node_id in scheduled
+        }
+
+    def pop_ready(self, limit: int = None) -> list[Node]:
+        """Hands out the nodes which are ready to be run.
+
+        Args:
+            limit: The maximum number of nodes to hand out. All the ready
+                nodes are returned if not set.
+
+        Returns:
+            The ready nodes, in scheduling order.
+        """
+        count = len(self._ready) if limit is None else min(limit, len(self._ready))
+        nodes = self._plan.nodes
+        return [nodes[heapq.heappop(self._ready)[1]] for _ in range(count)]
+
+    def complete(self, node: Node) -> None:
+        """Marks a node as completed and makes its children ready once all
+        of their dependencies have completed.
+
+        Args:
+            node: The node which completed.
+        """
+        self._completed += 1
+        for child_id in self._plan.children(self._plan.node_id(node)):
+            self._remaining[child_id] -= 1
+            if self._remaining[child_id] == 0:
+                self._push(child_id)
+
+    def complete_chain(self, nodes: Sequence[Node]) -> None:
+        """Marks the nodes of a chain found by ``find_linear_chains`` as
+        completed, in order. Only the first node of the chain is handed out,
+        the others are never made ready since they ran with it.
+
+        Args:
+            nodes: The nodes of the chain, which completed.
+        """
+        for node in nodes[:-1]:
+            self._completed += 1
+            for child_id in self._plan.children(self._plan.node_id(node)):
+                self._remaining[child_id] -= 1
+        self.complete(nodes[-1])
+
+    def _priority(self, node_id: int) -> Any:
+        """The key ready nodes are sorted by, lowest first."""
+        return node_id
+
+    def _push(self, node_id: int) -> None:
+        heapq.heappush(self._ready, (self._priority(node_id), node_id))
+
+
+class CriticalPathScheduler(DependencyScheduler):
+    """``CriticalPathScheduler`` is a ``DependencyScheduler`` which hands out
+    ready nodes ordered by the estimated length of the longest path from the
+    node to the end of the pipeline, longest first. Starting long chains early
+    shortens the total run time when there are more ready nodes than workers.
+
+    The length of a path is the sum of the estimated durations of its nodes.
+    Nodes without a recorded duration are estimated with the mean of the
+    recorded ones, so without any history the length of a path is the number
+    of nodes on it.
+    """
+
+    def __init__(self, plan: ExecutionPlan, node_durations: Mapping[str, float] = None):
+        """Creates a scheduler for a single run of an ``ExecutionPlan``.
+
+        Args:
+            plan: The ``ExecutionPlan`` to schedule.
+            node_durations: The durations of nodes recorded in earlier runs,
+                in seconds, by node name.
+        """
+        node_durations = node_durations or {}
+        known = [node_durations[n.name] for n in plan.nodes if n.name in node_durations]
+        default = sum(known) / len(known) if known else 1.0
+
+        # nodes are in topological order, so children come before parents
+        # when walking the plan backwards
+        self._path_lengths = [0.0] * len(plan)
+        for node_id in reversed(range(len(plan))):
+            downstream = max(
+                (self._path_lengths[c] for c in plan.children(node_id)), default=0.0
+            )
+            duration = node_durations.get(plan.nodes[node_id].name, default)
+            self._path_lengths[node_id] = duration + downstream
+
+        super().__init__(plan)
+
+    def path_length(self, node: Node) -> float:
+        """Returns the estimated length of the longest path from a node to
+        the end of the pipeline, including the node itself.
+        """
+        return self._path_lengths[self._plan.node_id(node)]
+
+    def _priority(self, node_id: int) -> Any:
+        return -self._path_lengths[node_id], node_id
+
+
+class NodeTimings:
+    """``NodeTimings`` keeps the durations of nodes recorded across runs,
+    by node name. The estimate of a node is a moving average which gives the
+    latest run as much weight as all the earlier ones together. Timings are
+    persisted to a JSON file when a ``filepath`` is given.
+    """
+
+    def __init__(self, filepath: str | Path = None):
+        """Creates a new instance of ``NodeTimings``, reading the timings
+        persisted to ``filepath`` if it exists.
+
+        Args:
+            filepath: Path of the JSON file the timings are persisted to.
+                The timings are only kept in memory if not set.
+        """
+        self._filepath = Path(filepath) if filepath else None
+        self._durations: dict[str, float] = {}
+        if self._filepath and self._filepath.is_file():
+            try:
+                self._durations = {
+                    str(name): float(duration)
+                    for name, duration in json.loads(
+                        self._filepath.read_text(encoding="utf-8")
+                    ).items()
+                }
+            except (ValueError, AttributeError):
+                logging.getLogger(__name__).warning(
+                    "Ignoring malformed node timings in '%s'.", self._filepath
+                )
+
+    @property
+    def durations(self) -> dict[str, float]:
+        """The estimated duration of each node, in seconds."""
+        return dict(self._durations)
+
+    def record(self, node_name: str, duration: float) -> None:
+        """Records the duration of a node run.
+
+        Args:
+            node_name: The name of the node.
+            duration: The duration of the run, in seconds.
+        """
+        previous = self._durations.get(node_name)
+        self._durations[node_name] = (
+            duration if previous is None else (previous + duration) / 2
+        )
+
+    def save(self) -> None:
+        """Persists the timings to ``filepath``, if set."""
+        if not self._filepath:
+            return
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._filepath.write_text(
+            json.dumps(self._durations, indent=2, sort_keys=True), encoding="utf-8"
+        )
+
+
+SCHEDULERS = ("topological", "critical-path")
+
+
+def validate_scheduler(name: str) -> None:
+    """Checks that ``name`` is the name of a known scheduling policy.
+
+    Args:
+        name: The name of the scheduling policy.
+
+    Raises:
+        ValueError: If the scheduling policy is unknown.
+    """
+    if name not in SCHEDULERS:
+        raise ValueError(
+            f"Unknown scheduler '{name}'. Available schedulers are: "
+            f"{', '.join(SCHEDULERS)}."
+        )
+
+
+def create_scheduler(
+    name: str, plan: ExecutionPlan, node_timings: NodeTimings = None
+) -> DependencyScheduler:
+    """Creates the scheduler implementing a scheduling policy.
+
+    Args:
+        name: The name of the scheduling policy, one of ``SCHEDULERS``.
+        plan: The ``ExecutionPlan`` to schedule.
+        node_timings: The node durations recorded in earlier runs, used by
+            the ``critical-path`` policy.
+
+    Returns:
+        A new scheduler for a single run of ``plan``.
+
+    Raises:
+        ValueError: If the scheduling policy is unknown.
+    """
+    validate_scheduler(name)
+    if name == "critical-path":
+        return CriticalPathScheduler(
+            plan, node_timings.durations if node_timings else None
+        )
+    return DependencyScheduler(plan)
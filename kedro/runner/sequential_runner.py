@@ -2,15 +2,25 @@
 used to run the ``Pipeline`` in a sequential manner using a topological sort
 of provided nodes.
 """
+from __future__ import annotations
 
-from collections import Counter
-from itertools import chain
+import time
+from contextlib import suppress
+from typing import Iterable
 
 from pluggy import PluginManager
 
-from kedro.io import AbstractDataSet, DataCatalog, MemoryDataset
+from kedro.io import AbstractDataSet, DataCatalog
 from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+from kedro.runner.memory_budget import MemoryBudget
+from kedro.runner.node_cache import NodeCache
+from kedro.runner.prefetcher import Prefetcher
+from kedro.runner.run_cache import RunCache
 from kedro.runner.runner import AbstractRunner, run_node
+from kedro.runner.scheduler import NodeTimings
+from kedro.runner.write_behind import WriteBehind
 
 
 class SequentialRunner(AbstractRunner):
@@ -19,15 +29,73 @@ class SequentialRunner(AbstractRunner):
     topological sort of provided nodes.
     """
 
-    def __init__(self, is_async: bool = False):
+    def __init__(  # noqa: too-many-arguments
+        self,
+        is_async: bool = False,
+        io_workers: int = None,
+        max_memory: int | str = None,
+        node_cache: NodeCache = None,
+        prefetch: int = None,
+        max_prefetch_memory: int | str = None,
+        write_behind: bool = False,
+        run_cache: RunCache = None,
+        transfer_ownership: bool = False,
+        node_timings: NodeTimings = None,
+    ):
         """Instantiates the runner classs.
 
         Args:
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
+            io_workers: The number of threads loading and saving data when
+                ``is_async`` is True. If not set, calculated automatically by
+                ``ThreadPoolExecutor``.
+            max_memory: The memory budget of the default data sets, in bytes or
+                with a unit, e.g. ``16GB``. When it is exceeded, the data
+                needed furthest in the future is spilled to disk. If not set,
+                the memory is not limited.
+            node_cache: The ``NodeCache`` to restore node outputs from instead
+                of running the nodes, and to store them in. Outputs are not
+                cached if not set.
+            prefetch: The number of nodes after the running node whose
+                persisted inputs are loaded on background threads while it
+                runs. Inputs are not prefetched if not set.
+            max_prefetch_memory: The maximum size of the data prefetched and
+                not used yet, in bytes or with a unit, e.g. ``4GB``. If not
+                set, the memory is not limited.
+            write_behind: If True, the node outputs registered in the catalog
+                are saved on background threads while the next nodes run,
+                and kept in memory for the nodes using them. The run completes
+                once all of them are saved. Defaults to False.
+            run_cache: The ``RunCache`` to keep the node outputs registered in
+                the catalog in once they are saved, to load them from for the
+                nodes of the run using them. Outputs are loaded from their
+                datasets if not set.
+            transfer_ownership: If True, the default datasets hand their data
+                over to the last node loading it without copying it, and the
+                nodes loading it before receive a copy, unless the data is
+                immutable. The nodes should then not return the same object
+                as several outputs. Defaults to False.
+            node_timings: The ``NodeTimings`` updated with the durations of
+                the nodes of this run, e.g. for the ``critical-path`` scheduler
+                of later runs. Durations are not recorded if not set.
 
+        Raises:
+            ValueError: If ``max_memory``, ``prefetch`` or
+                ``max_prefetch_memory`` is invalid.
         """
-        super().__init__(is_async=is_async)
+        super().__init__(
+            is_async=is_async, io_workers=io_workers, node_cache=node_cache
+        )
+        self._memory_budget = MemoryBudget(
+            max_memory, transfer_ownership=transfer_ownership
+        )
+        self._prefetcher = (
+            Prefetcher(prefetch, max_prefetch_memory) if prefetch is not None else None
+        )
+        self._write_behind = WriteBehind() if write_behind else None
+        self._run_cache = run_cache
+        self._node_timings = node_timings
 
     def create_default_data_set(self, ds_name: str) -> AbstractDataSet:
         """Factory method for creating the default data set for the runner.
@@ -40,7 +108,7 @@ class SequentialRunner(AbstractRunner):
             for all unregistered data sets.
 
         """
-        return MemoryDataset()
+        return self._memory_budget.create_data_set(ds_name)
 
     def _run(
         self,
@@ -60,28 +128,135 @@ class SequentialRunner(AbstractRunner):
         Raises:
             Exception: in case of any downstream node failure.
         """
-        nodes = pipeline.nodes
-        done_nodes = set()
-
-        load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
-
-        for exec_index, node in enumerate(nodes):
-            try:
-                run_node(node, catalog, hook_manager, self._is_async, session_id)
-                done_nodes.add(node)
-            except Exception:
-                self._suggest_resume_scenario(pipeline, done_nodes, catalog)
-                raise
-
-            # decrement load counts and release any data sets we've finished with
-            for data_set in node.inputs:
-                load_counts[data_set] -= 1
-                if load_counts[data_set] < 1 and data_set not in pipeline.inputs():
-                    catalog.release(data_set)
-            for data_set in node.outputs:
-                if load_counts[data_set] < 1 and data_set not in pipeline.outputs():
-                    catalog.release(data_set)
-
-            self._logger.info(
-                "Completed %d out of %d tasks", exec_index + 1, len(nodes)
+        plan = ExecutionPlan.from_pipeline(pipeline)
+        nodes = plan.nodes
+        done_nodes: set[Node] = set()
+        self._start_helpers(plan, catalog, hook_manager)
+
+        try:
+            for exec_index, node in enumerate(nodes):
+                self._memory_budget.node_started(node)
+                if self._prefetcher:
+                    self._prefetcher.node_started(node)
+                try:
+                    start = time.perf_counter()
+                    run_node(
+                        node,
+                        catalog,
+                        hook_manager,
+                        self._is_async,
+                        session_id,
+                        self._io_executor,
+                        self._node_cache,
+                        self._prefetcher,
+                        self._write_behind,
+                        self._run_cache,
+                    )
+                    if self._node_timings:
+                        self._node_timings.record(
+                            node.name, time.perf_counter() - start
+                        )
+                    self._node_completed(node, done_nodes, catalog)
+                except Exception:
+                    self._fail(pipeline, done_nodes, catalog)
+                    raise
+
+                # release any data sets we've finished with, nodes run in plan
+                # order
+                self._release(plan.release_schedule[exec_index], catalog)
+                self._memory_budget.node_completed(node)
+
+                self._logger.info(
+                    "Completed %d out of %d tasks", exec_index + 1, len(nodes)
+                )
+
+            if self._write_behind:
+                try:
+                    self._collect_persisted(done_nodes, catalog, wait_all=True)
+                except Exception:
+                    self._fail(pipeline, done_nodes, catalog)
+                    raise
+        finally:
+            self._close_helpers()
+
+    def _start_helpers(
+        self, plan: ExecutionPlan, catalog: DataCatalog, hook_manager: PluginManager
+    ) -> None:
+        """Starts the memory budget, write-behind, run cache and prefetcher
+        of the runner for a run.
+        """
+        self._memory_budget.start(plan)
+        writer = self._write_behind
+        if writer:
+            writer.start(plan, catalog, hook_manager)
+        run_cache = self._run_cache
+        if run_cache:
+            run_cache.start(plan, catalog)
+        if self._prefetcher:
+            # the outputs kept in memory are not prefetched
+            self._prefetcher.start(
+                plan,
+                catalog,
+                exclude=(writer.data_sets if writer else set())
+                | (run_cache.data_sets if run_cache else set()),
             )
+
+    def _close_helpers(self) -> None:
+        """Closes the helpers started by ``_start_helpers``, and saves the
+        durations of the nodes.
+        """
+        if self._node_timings:
+            self._node_timings.save()
+        self._memory_budget.close()
+        if self._prefetcher:
+            self._prefetcher.close()
+        if self._write_behind:
+            self._write_behind.close()
+        if self._run_cache:
+            self._run_cache.close()
+
+    def _node_completed(
+        self, node: Node, done_nodes: set[Node], catalog: DataCatalog
+    ) -> None:
+        """Records a node as completed, once its outputs have all been saved
+        if they are saved in the background.
+        """
+        if self._write_behind:
+            self._write_behind.node_completed(node)
+            self._collect_persisted(done_nodes, catalog)
+        else:
+            done_nodes.add(node)
+            self._record_completed(node, catalog)
+
+    def _release(self, data_sets: Iterable[str], catalog: DataCatalog) -> None:
+        """Releases the data sets no node of the run uses anymore, including
+        the data kept in memory for them.
+        """
+        for data_set in data_sets:
+            catalog.release(data_set)
+            if self._write_behind:
+                self._write_behind.release(data_set)
+            if self._run_cache:
+                self._run_cache.release(data_set)
+
+    def _collect_persisted(
+        self, done_nodes: set[Node], catalog: DataCatalog, wait_all: bool = False
+    ) -> None:
+        """Records the nodes whose outputs have all been saved in the
+        background as completed, and raises the error of a failed write.
+        """
+        writer: WriteBehind = self._write_behind  # type: ignore
+        for node in writer.pop_persisted(wait_all):
+            done_nodes.add(node)
+            self._record_completed(node, catalog)
+        writer.raise_error()
+
+    def _fail(
+        self, pipeline: Pipeline, done_nodes: set[Node], catalog: DataCatalog
+    ) -> None:
+        if self._write_behind:
+            # the outputs saved in the background count towards the nodes
+            # completed, the error of the run is raised instead of theirs
+            with suppress(Exception):
+                self._collect_persisted(done_nodes, catalog, wait_all=True)
+        self._suggest_resume_scenario(pipeline, done_nodes, catalog)
@@ -0,0 +1,355 @@
+"""Streaming of the chunks of generator nodes to the nodes consuming them
+through bounded queues, so that producers and consumers run concurrently.
+Used by ``ThreadRunner``.
+"""
+from __future__ import annotations
+
+import inspect
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from queue import Empty, Full, Queue
+from typing import Any, Iterator
+
+from pluggy import PluginManager
+
+from kedro.io import DataCatalog, DatasetError, MemoryDataset
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+from kedro.runner.node_cache import NodeCache
+from kedro.runner.run_cache import RunCache
+from kedro.runner.runner import run_node
+from kedro.runner.scheduler import DependencyScheduler
+
+# markers put in the queues after the last chunk
+_END = object()
+_ABORTED = object()
+# how often a producer blocked on a full queue checks if the stream was aborted
+_ABORT_POLL_INTERVAL = 0.1
+
+
+class _StreamDataset(MemoryDataset):
+    """``_StreamDataset`` passes the chunks saved by a generator node to the
+    nodes loading it through a bounded queue per consumer. Saving blocks while
+    the queue of any consumer is full, and each load returns an iterator over
+    the chunks of one of the queues.
+    """
+
+    def __init__(self, consumers: int, max_chunks: int):
+        super().__init__()
+        self._queues: list[Queue] = [Queue(max_chunks) for _ in range(consumers)]
+        self._detached = [False] * consumers
+        self._aborted = False
+        self._loaded = 0
+        self._readers: dict[int, list[int]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def _save(self, data: Any) -> None:
+        for index, chunk_queue in enumerate(self._queues):
+            if not self._detached[index]:
+                self._put(chunk_queue, data)
+
+    def _put(self, chunk_queue: Queue, data: Any) -> None:
+        while True:
+            if self._aborted:
+                raise DatasetError("The stream was aborted, as a node failed.")
+            # ``abort`` may fill the queue with its marker while the producer
+            # waits for room, so the producer wakes up to check for it
+            try:
+                chunk_queue.put(data, timeout=_ABORT_POLL_INTERVAL)
+                return
+            except Full:
+                continue
+
+    def _load(self) -> Iterator[Any]:
+        with self._lock:
+            if self._loaded == len(self._queues):
+                raise DatasetError("The stream has been loaded by all its consumers.")
+            index = self._loaded
+            self._loaded += 1
+            self._readers[threading.get_ident()].append(index)
+        return self._iterate(self._queues[index])
+
+    @staticmethod
+    def _iterate(chunk_queue: Queue) -> Iterator[Any]:
+        while True:
+            chunk = chunk_queue.get()
+            if chunk is _END:
+                return
+            if chunk is _ABORTED:
+                raise DatasetError("The stream was aborted, as a node failed.")
+            yield chunk
+
+    def _exists(self) -> bool:
+        return True
+
+    def _release(self) -> None:
+        for chunk_queue in self._queues:
+            _drain(chunk_queue)
+
+    def _describe(self) -> dict[str, Any]:
+        return {"consumers": len(self._queues), "max_chunks": self._queues[0].maxsize}
+
+    def close(self) -> None:
+        """Ends the stream, after the producer saved its last chunk."""
+        for index, chunk_queue in enumerate(self._queues):
+            if not self._detached[index]:
+                chunk_queue.put(_END)
+
+    def detach(self) -> None:
+        """Drops the chunks for the consumers which loaded the stream in the
+        current thread, after they completed, even if they did not read all
+        of the chunks.
+        """
+        with self._lock:
+            indices = self._readers.pop(threading.get_ident(), [])
+        for index in indices:
+            self._detached[index] = True
+            # makes room for a chunk the producer may be blocked on
+            _drain(self._queues[index])
+
+    def abort(self) -> None:
+        """Fails the producer and the consumers of the stream."""
+        self._aborted = True
+        for chunk_queue in self._queues:
+            while True:
+                _drain(chunk_queue)
+                try:
+                    chunk_queue.put_nowait(_ABORTED)
+                    break
+                except Full:  # pragma: no cover
+                    # the producer saved a chunk it was blocked on
+                    continue
+
+
+def _drain(chunk_queue: Queue) -> None:
+    while True:
+        try:
+            chunk_queue.get_nowait()
+        except Empty:
+            return
+
+
+class _StreamGroups:
+    """``_StreamGroups`` finds the outputs of generator nodes to stream to the
+    nodes consuming them in a run, and runs the nodes connected by streams
+    together.
+
+    An output is streamed if it is produced by a generator function, is not
+    registered in the catalog and is consumed by other nodes. The consumers
+    receive an iterator over the chunks instead of the last chunk. The nodes
+    connected by streams form a group, which starts once the nodes the group
+    depends on have completed and whose nodes run concurrently on their own
+    threads. Outputs are not streamed if a consumer would also need another
+    output of the group, which is only complete after the stream ended.
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline = None,
+        catalog: DataCatalog = None,
+        max_chunks: int = None,
+    ):
+        """Finds the outputs to stream in a run.
+
+        Args:
+            pipeline: The ``Pipeline`` of the run.
+            catalog: The ``DataCatalog`` of the run.
+            max_chunks: The number of chunks buffered for each consumer.
+                Nothing is streamed if not set.
+        """
+        self._max_chunks = max_chunks
+        self._consumers: dict[str, int] = {}
+        self._groups: list[tuple[Node, ...]] = []
+        self._external: list[frozenset[Node]] = []
+        self._members: frozenset[Node] = frozenset()
+        if max_chunks and pipeline is not None and catalog is not None:
+            self._find_groups(ExecutionPlan.from_pipeline(pipeline), catalog)
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def data_sets(self) -> frozenset[str]:
+        """The names of the streamed datasets."""
+        return frozenset(self._consumers)
+
+    def create_data_set(self, ds_name: str) -> MemoryDataset:
+        """Creates the dataset streaming the chunks of ``ds_name``.
+
+        Args:
+            ds_name: The name of a dataset in ``data_sets``.
+        """
+        return _StreamDataset(self._consumers[ds_name], self._max_chunks)  # type: ignore
+
+    def pop_ready(
+        self, scheduler: DependencyScheduler, limit: int, done_nodes: set[Node]
+    ) -> list[Node | tuple[Node, ...]]:
+        """Hands out the groups whose dependencies have completed and the
+        nodes the scheduler has ready which are not part of a group.
+
+        Args:
+            scheduler: The scheduler of the run.
+            limit: The maximum number of groups and nodes to hand out.
+            done_nodes: The nodes which have completed.
+
+        Returns:
+            The groups, as tuples of nodes in topological order, and the nodes.
+        """
+        tasks: list[Node | tuple[Node, ...]] = []
+        for index, group in enumerate(self._groups):
+            if group and len(tasks) < limit and self._external[index] <= done_nodes:
+                tasks.append(group)
+                self._groups[index] = ()
+        # the members of groups are run with their groups, so they are skipped
+        # when the scheduler hands them out
+        while len(tasks) < limit and scheduler.has_ready:
+            tasks.extend(
+                node
+                for node in scheduler.pop_ready(limit - len(tasks))
+                if node not in self._members
+            )
+        return tasks
+
+    def run_group(  # noqa: too-many-arguments
+        self,
+        group: tuple[Node, ...],
+        catalog: DataCatalog,
+        hook_manager: PluginManager,
+        session_id: str = None,
+        node_cache: NodeCache = None,
+        run_cache: RunCache = None,
+    ) -> tuple[Node, ...]:
+        """Runs the nodes of a group concurrently, each on its own thread. If
+        a node fails, the streams of the group are aborted.
+
+        Args:
+            group: The nodes of the group.
+            catalog: The ``DataCatalog`` of the run.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            session_id: The id of the session.
+            node_cache: The ``NodeCache`` to restore node outputs from.
+            run_cache: The ``RunCache`` to keep node outputs in.
+
+        Returns:
+            The nodes of the group.
+
+        Raises:
+            Exception: The error of the first node which failed.
+        """
+        streams = {
+            name: catalog._get_dataset(name)  # noqa: protected-access
+            for node in group
+            for name in node.outputs
+            if name in self._consumers
+        }
+
+        def run_member(node: Node) -> None:
+            try:
+                run_node(
+                    node,
+                    catalog,
+                    hook_manager,
+                    session_id=session_id,
+                    node_cache=node_cache,
+                    run_cache=run_cache,
+                )
+            finally:
+                for name in set(node.inputs) & streams.keys():
+                    streams[name].detach()
+            for name in set(node.outputs) & streams.keys():
+                streams[name].close()
+
+        with ThreadPoolExecutor(max_workers=len(group)) as pool:
+            futures = [pool.submit(run_member, node) for node in group]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            error = next((f.exception() for f in done if f.exception()), None)
+            if error is not None:
+                for stream in streams.values():
+                    stream.abort()
+                raise error
+        return group
+
+    def _find_groups(self, plan: ExecutionPlan, catalog: DataCatalog) -> None:
+        load_counts = plan.load_counts()
+        streamed = {
+            name
+            for node in plan.nodes
+            if inspect.isgeneratorfunction(node.func)
+            for name in node.outputs
+            if name not in catalog and load_counts[name]
+        }
+        producers = {
+            name: node_id
+            for node_id in range(len(plan))
+            for name in plan.node_outputs(node_id)
+        }
+
+        # join the producers and consumers of each stream
+        group_of = {node_id: {node_id} for node_id in range(len(plan))}
+        for node_id in range(len(plan)):
+            for name in set(plan.node_inputs(node_id)) & streamed:
+                producer_group = group_of[producers[name]]
+                if producer_group is not group_of[node_id]:
+                    producer_group |= group_of[node_id]
+                    for member in group_of[node_id]:
+                        group_of[member] = producer_group
+
+        seen: set[int] = set()
+        for node_id in range(len(plan)):
+            group = group_of[node_id]
+            if len(group) > 1 and node_id not in seen:
+                seen |= group
+                self._add_group(plan, sorted(group), streamed, producers)
+        self._members = frozenset(node for group in self._groups for node in group)
+
+    def _add_group(
+        self,
+        plan: ExecutionPlan,
+        group: list[int],
+        streamed: set[str],
+        producers: dict[str, int],
+    ) -> None:
+        members = set(group)
+        external = {
+            parent
+            for node_id in group
+            for parent in plan.parents(node_id)
+            if parent not in members
+        }
+        # the group cannot start before the nodes it depends on complete, so
+        # they must not depend on the group themselves, and the members can
+        # only depend on each other through streams
+        descendants = set()
+        stack = [c for node_id in group for c in plan.children(node_id)]
+        while stack:
+            node_id = stack.pop()
+            if node_id not in members and node_id not in descendants:
+                descendants.add(node_id)
+                stack.extend(plan.children(node_id))
+        names = {
+            name
+            for node_id in group
+            for name in plan.node_outputs(node_id)
+            if name in streamed
+        }
+        unstreamable = external & descendants or any(
+            name not in streamed and producers.get(name) in members
+            for node_id in group
+            for name in plan.node_inputs(node_id)
+        )
+        if unstreamable:
+            self._logger.warning(
+                "Not streaming %s, as the nodes consuming them depend on other "
+                "outputs of the nodes producing them.",
+                sorted(names),
+            )
+            return
+
+        load_counts = plan.load_counts()
+        self._consumers.update({name: load_counts[name] for name in names})
+        self._groups.append(tuple(plan.nodes[node_id] for node_id in group))
+        self._external.append(frozenset(plan.nodes[node_id] for node_id in external))
@@ -4,17 +4,24 @@ using threads.
 """
 from __future__ import annotations
 
+import time
 import warnings
 from collections import Counter
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from itertools import chain
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
 
 from pluggy import PluginManager
 
 from kedro.io import DataCatalog, MemoryDataset
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
+from kedro.runner.execution_plan import ExecutionPlan
+from kedro.runner.memory_budget import MemoryBudget
+from kedro.runner.node_cache import NodeCache
+from kedro.runner.run_cache import RunCache
 from kedro.runner.runner import AbstractRunner, run_node
+from kedro.runner.scheduler import NodeTimings, create_scheduler, validate_scheduler
+from kedro.runner.streaming import _StreamGroups
 
 
 class ThreadRunner(AbstractRunner):
@@ -23,7 +30,18 @@ class ThreadRunner(AbstractRunner):
     using threads.
     """
 
-    def __init__(self, max_workers: int = None, is_async: bool = False):
+    def __init__(  # noqa: too-many-arguments
+        self,
+        max_workers: int = None,
+        is_async: bool = False,
+        scheduler: str = "topological",
+        node_timings: NodeTimings = None,
+        max_memory: int | str = None,
+        node_cache: NodeCache = None,
+        stream_buffer: int = None,
+        run_cache: RunCache = None,
+        transfer_ownership: bool = False,
+    ):
         """
         Instantiates the runner.
 
@@ -34,6 +52,35 @@ class ThreadRunner(AbstractRunner):
             is_async: If True, set to False, because `ThreadRunner`
                 doesn't support loading and saving the node inputs and
                 outputs asynchronously with threads. Defaults to False.
+            scheduler: The order in which ready nodes are run, either
+                ``topological`` or ``critical-path``. ``critical-path`` runs
+                the nodes starting the longest chains first, estimated from
+                ``node_timings``. Defaults to ``topological``.
+            node_timings: The ``NodeTimings`` used to estimate node durations
+                and updated with the durations of this run.
+            max_memory: The memory budget of the default datasets, in bytes or
+                with a unit, e.g. ``16GB``. When it is exceeded, the data
+                needed furthest in the future is spilled to disk and no new
+                nodes are started. If not set, the memory is not limited.
+            node_cache: The ``NodeCache`` to restore node outputs from instead
+                of running the nodes, and to store them in. Outputs are not
+                cached if not set.
+            stream_buffer: The number of chunks of a generator node buffered
+                for each node consuming them. If set, the outputs of generator
+                nodes which are not registered in the catalog are streamed to
+                the nodes consuming them, which run concurrently with the
+                generator node and receive an iterator over the chunks. The
+                generator node waits while a buffer is full. If not set, the
+                consumers run after the generator node and load its last chunk.
+            run_cache: The ``RunCache`` to keep the node outputs registered in
+                the catalog in once they are saved, to load them from for the
+                nodes of the run using them. Outputs are loaded from their
+                datasets if not set.
+            transfer_ownership: If True, the default datasets hand their data
+                over to the last node loading it without copying it, and the
+                nodes loading it before receive a copy, unless the data is
+                immutable. The nodes should then not return the same object
+                as several outputs. Defaults to False.
 
         Raises:
             ValueError: bad parameters passed
@@ -44,12 +91,23 @@ class ThreadRunner(AbstractRunner):
                 "node inputs and outputs asynchronously with threads. "
                 "Setting 'is_async' to False."
             )
-        super().__init__(is_async=False)
+        super().__init__(is_async=False, node_cache=node_cache)
 
         if max_workers is not None and max_workers <= 0:
             raise ValueError("max_workers should be positive")
+        if stream_buffer is not None and stream_buffer <= 0:
+            raise ValueError("stream_buffer should be positive")
+        validate_scheduler(scheduler)
 
         self._max_workers = max_workers
+        self._scheduler = scheduler
+        self._node_timings = node_timings
+        self._memory_budget = MemoryBudget(
+            max_memory, transfer_ownership=transfer_ownership
+        )
+        self._stream_buffer = stream_buffer
+        self._streams = _StreamGroups()
+        self._run_cache = run_cache
 
     def create_default_data_set(self, ds_name: str) -> MemoryDataset:  # type: ignore
         """Factory method for creating the default dataset for the runner.
@@ -62,7 +120,37 @@ class ThreadRunner(AbstractRunner):
             unregistered datasets.
 
         """
-        return MemoryDataset()
+        if ds_name in self._streams.data_sets:
+            return self._streams.create_data_set(ds_name)
+        return self._memory_budget.create_data_set(ds_name)
+
+    def run(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        hook_manager: PluginManager = None,
+        session_id: str = None,
+    ) -> dict[str, Any]:
+        """Run the ``Pipeline`` using the datasets provided by ``catalog``
+        and save results back to the same objects.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            hook_manager: The ``PluginManager`` to activate hooks.
+            session_id: The id of the session.
+
+        Returns:
+            Any node outputs that cannot be processed by the ``DataCatalog``.
+            These are returned in a dictionary, where the keys are defined
+            by the node outputs.
+
+        """
+        self._streams = _StreamGroups(pipeline, catalog, self._stream_buffer)
+        try:
+            return super().run(pipeline, catalog, hook_manager, session_id)
+        finally:
+            self._streams = _StreamGroups()
 
     def _get_required_workers_count(self, pipeline: Pipeline):
         """
@@ -73,7 +161,8 @@ class ThreadRunner(AbstractRunner):
         # because each layer means some nodes depend on other nodes
         # and they can not run in parallel.
         # It might be not a perfect solution, but good enough and simple.
-        required_threads = len(pipeline.nodes) - len(pipeline.grouped_nodes) + 1
+        plan = ExecutionPlan.from_pipeline(pipeline)
+        required_threads = len(plan) - plan.group_count + 1
 
         return (
             min(required_threads, self._max_workers)
@@ -100,58 +189,112 @@ class ThreadRunner(AbstractRunner):
             Exception: in case of any downstream node failure.
 
         """
-        nodes = pipeline.nodes
-        load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
-        node_dependencies = pipeline.node_dependencies
-        todo_nodes = set(node_dependencies.keys())
+        plan = ExecutionPlan.from_pipeline(pipeline)
+        nodes = plan.nodes
+        load_counts = plan.load_counts()
+        scheduler = create_scheduler(self._scheduler, plan, self._node_timings)
         done_nodes: set[Node] = set()
         futures = set()
+        started = {}
         done = None
         max_workers = self._get_required_workers_count(pipeline)
+        self._memory_budget.start(plan)
+        if self._run_cache:
+            self._run_cache.start(plan, catalog)
 
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            while True:
-                ready = {n for n in todo_nodes if node_dependencies[n] <= done_nodes}
-                todo_nodes -= ready
-                for node in ready:
-                    futures.add(
-                        pool.submit(
-                            run_node,
-                            node,
-                            catalog,
-                            hook_manager,
-                            self._is_async,
-                            session_id,
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                while True:
+                    # Only hand out as many nodes as there are idle workers, so
+                    # the scheduler picks among all nodes ready at that time.
+                    limit = max_workers - len(futures)
+                    if not self._memory_budget.can_start():
+                        # Over the memory budget, wait for running nodes to
+                        # complete and free some memory before starting more,
+                        # or start a single node if none is running.
+                        limit = 0 if futures else 1
+                    ready = self._streams.pop_ready(scheduler, limit, done_nodes)
+                    for task in ready:
+                        future = self._submit(
+                            pool, task, catalog, hook_manager, session_id
                         )
-                    )
-                if not futures:
-                    assert not todo_nodes, (todo_nodes, done_nodes, ready, done)
-                    break
-                done, futures = wait(futures, return_when=FIRST_COMPLETED)
-                for future in done:
-                    try:
-                        node = future.result()
-                    except Exception:
-                        self._suggest_resume_scenario(pipeline, done_nodes, catalog)
-                        raise
-                    done_nodes.add(node)
-                    self._logger.info("Completed node: %s", node.name)
-                    self._logger.info(
-                        "Completed %d out of %d tasks", len(done_nodes), len(nodes)
-                    )
-
-                    # Decrement load counts, and release any datasets we
-                    # have finished with.
-                    for data_set in node.inputs:
-                        load_counts[data_set] -= 1
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.inputs()
-                        ):
-                            catalog.release(data_set)
-                    for data_set in node.outputs:
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.outputs()
-                        ):
-                            catalog.release(data_set)
+                        started[future] = time.perf_counter()
+                        futures.add(future)
+                    if not futures:
+                        todo_nodes = scheduler.todo_nodes
+                        assert not todo_nodes, (todo_nodes, done_nodes, ready, done)
+                        break
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            task = future.result()
+                        except Exception:
+                            self._suggest_resume_scenario(pipeline, done_nodes, catalog)
+                            raise
+                        duration = time.perf_counter() - started.pop(future)
+                        for node in _as_nodes(task):
+                            done_nodes.add(node)
+                            scheduler.complete(node)
+                            self._node_completed(
+                                node, duration, catalog, load_counts, plan
+                            )
+                            self._logger.info(
+                                "Completed %d out of %d tasks",
+                                len(done_nodes),
+                                len(nodes),
+                            )
+        finally:
+            if self._node_timings:
+                self._node_timings.save()
+            self._memory_budget.close()
+            if self._run_cache:
+                self._run_cache.close()
+
+    def _submit(  # noqa: too-many-arguments
+        self,
+        pool: ThreadPoolExecutor,
+        task: Node | tuple[Node, ...],
+        catalog: DataCatalog,
+        hook_manager: PluginManager,
+        session_id: str | None,
+    ) -> Future:
+        """Submits a task to the pool, running a group of streaming nodes
+        together and any other node on its own.
+        """
+        for node in _as_nodes(task):
+            self._memory_budget.node_started(node)
+        return pool.submit(
+            self._streams.run_group if isinstance(task, tuple) else run_node,
+            task,
+            catalog,
+            hook_manager,
+            session_id=session_id,
+            node_cache=self._node_cache,
+            run_cache=self._run_cache,
+        )
+
+    def _node_completed(  # noqa: too-many-arguments
+        self,
+        node: Node,
+        duration: float,
+        catalog: DataCatalog,
+        load_counts: Counter,
+        plan: ExecutionPlan,
+    ) -> None:
+        """Records the timing and completion of a node, and releases the
+        datasets the rest of the run does not need anymore.
+        """
+        if self._node_timings:
+            self._node_timings.record(node.name, duration)
+        self._record_completed(node, catalog)
+        self._logger.info("Completed node: %s", node.name)
+
+        # Decrement load counts, and release any datasets we
+        # have finished with.
+        self._release_datasets(node, catalog, load_counts, plan, self._run_cache)
+        self._memory_budget.node_completed(node)
+
+
+def _as_nodes(task: Node | tuple[Node, ...]) -> tuple[Node, ...]:
+    """The nodes of a task, which is a node or a group of streaming nodes."""
+    return task if isinstance(task, tuple) else (task,)
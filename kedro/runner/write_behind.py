@@ -0,0 +1,219 @@
+"""``WriteBehind`` saves the persisted outputs of nodes on background threads,
+while the next nodes run.
+"""
+from __future__ import annotations
+
+import logging
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Any
+
+from pluggy import PluginManager
+
+from kedro.io import DataCatalog, DatasetError, MemoryDataset
+from kedro.pipeline.node import Node
+from kedro.pipeline.pipeline import _strip_transcoding
+from kedro.runner.execution_plan import ExecutionPlan
+
+
+class WriteBehind:
+    """``WriteBehind`` saves the outputs of nodes registered in the catalog,
+    other than ``MemoryDataset``, on background threads, so that the next
+    nodes do not wait for slow writes. The outputs loaded in the run under
+    another transcoding are not saved in the background, as the nodes loading
+    them read the saved data. Runners save the outputs in ``data_sets`` with
+    ``save``, report the nodes they complete with ``node_completed`` and get
+    the nodes whose outputs have all been saved with ``pop_persisted``.
+
+    Until the nodes using an output in the run complete, its data is kept in
+    memory and they load it with ``load``, so they do not wait for the write
+    either. The ``after_dataset_saved`` hook runs once the write completes,
+    on the thread which saved the data. A failed write is raised by
+    ``raise_error`` with the node which produced the output.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import SequentialRunner
+        >>>
+        >>> SequentialRunner(write_behind=True).run(pipeline, catalog)
+    """
+
+    def __init__(self, max_workers: int = None):
+        """Creates a new instance of ``WriteBehind``.
+
+        Args:
+            max_workers: The number of threads saving the data. If not set,
+                calculated automatically by ``ThreadPoolExecutor``.
+        """
+        self._max_workers = max_workers
+        self._lock = Lock()
+        self._catalog: DataCatalog | None = None
+        self._hook_manager: PluginManager | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._data_sets: frozenset[str] = frozenset()
+        self._load_counts: Counter = Counter()
+        self._held: dict[str, MemoryDataset] = {}
+        self._futures: set[Future] = set()
+        self._pending: Counter = Counter()
+        self._completed: list[Node] = []
+        self._errors: list[tuple[Node, str, Exception]] = []
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def data_sets(self) -> frozenset[str]:
+        """The names of the outputs of the run saved in the background."""
+        return self._data_sets
+
+    def start(
+        self, plan: ExecutionPlan, catalog: DataCatalog, hook_manager: PluginManager
+    ) -> None:
+        """Starts saving the outputs of a run in the background.
+
+        Args:
+            plan: The ``ExecutionPlan`` of the run.
+            catalog: The ``DataCatalog`` of the run.
+            hook_manager: The ``PluginManager`` to activate hooks.
+        """
+        self._catalog = catalog
+        self._hook_manager = hook_manager
+        self._load_counts = plan.load_counts()
+        loaded_as = defaultdict(set)
+        for name, count in self._load_counts.items():
+            if count:
+                loaded_as[_strip_transcoding(name)].add(name)
+        outputs = {
+            name for node_id in range(len(plan)) for name in plan.node_outputs(node_id)
+        }
+        # the outputs loaded under another transcoding are read from their
+        # dataset, so they are saved before the nodes loading them run
+        self._data_sets = frozenset(
+            name
+            for name in outputs
+            if name in catalog
+            and not isinstance(
+                catalog._get_dataset(name), MemoryDataset  # noqa: protected-access
+            )
+            and loaded_as[_strip_transcoding(name)] <= {name}
+        )
+        self._held = {}
+        self._futures = set()
+        self._pending = Counter()
+        self._completed = []
+        self._errors = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="kedro-write"
+        )
+
+    def save(self, node: Node, name: str, data: Any) -> None:
+        """Starts saving an output of a node in the background, and keeps its
+        data in memory for the nodes using it in the run.
+
+        Args:
+            node: The node which produced the output.
+            name: The name of the output, in ``data_sets``.
+            data: The data to save.
+        """
+        if self._load_counts[name]:
+            self._held[name] = MemoryDataset(data)
+        with self._lock:
+            self._pending[node] += 1
+        self._futures.add(
+            self._executor.submit(self._write, node, name, data)  # type: ignore
+        )
+
+    def holds(self, name: str) -> bool:
+        """Whether the data of an output is kept in memory."""
+        return name in self._held
+
+    def load(self, name: str) -> Any:
+        """Loads the data of an output kept in memory.
+
+        Args:
+            name: The name of the output.
+
+        Returns:
+            A copy of the data, as returned by ``MemoryDataset``.
+        """
+        return self._held[name].load()
+
+    def release(self, name: str) -> None:
+        """Stops keeping the data of an output in memory, once the nodes
+        using it in the run have completed.
+
+        Args:
+            name: The name of the output.
+        """
+        self._held.pop(name, None)
+
+    def node_completed(self, node: Node) -> None:
+        """Records that a node completed, after it started saving its outputs.
+
+        Args:
+            node: The node which completed.
+        """
+        with self._lock:
+            self._completed.append(node)
+
+    def pop_persisted(self, wait_all: bool = False) -> list[Node]:
+        """Returns the completed nodes whose outputs have all been saved
+        since the last call, in the order they completed.
+
+        Args:
+            wait_all: Whether to wait for all the writes in progress first.
+
+        Returns:
+            The nodes whose outputs have all been saved. Nodes with an output
+            which failed to save are never returned.
+        """
+        if wait_all:
+            wait(self._futures)
+        self._futures = {future for future in self._futures if not future.done()}
+        with self._lock:
+            failed = {node for node, _, _ in self._errors}
+            persisted = [node for node in self._completed if not self._pending[node]]
+            self._completed = [node for node in self._completed if self._pending[node]]
+        return [node for node in persisted if node not in failed]
+
+    def raise_error(self) -> None:
+        """Raises the error of the first write which failed, if any.
+
+        Raises:
+            DatasetError: If a write failed.
+        """
+        if self._errors:
+            node, name, error = self._errors[0]
+            raise DatasetError(
+                f"Failed to save '{name}', an output of node '{node.name}', "
+                f"in the background."
+            ) from error
+
+    def close(self) -> None:
+        """Waits for the writes in progress and stops saving in the background."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._futures = set()
+        self._held = {}
+        self._catalog = None
+        self._hook_manager = None
+
+    def _write(self, node: Node, name: str, data: Any) -> None:
+        try:
+            self._catalog.save(name, data)  # type: ignore
+            self._hook_manager.hook.after_dataset_saved(  # type: ignore
+                dataset_name=name, data=data, node=node
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.error(
+                "Failed to save '%s', an output of node '%s'.", name, node.name
+            )
+            with self._lock:
+                self._errors.append((node, name, exc))
+        finally:
+            with self._lock:
+                self._pending[node] -= 1
@@ -28,7 +28,13 @@ from kedro.framework.cli.utils import (
     get_pkg_version,
 )
 from kedro.framework.session import KedroSession
-from kedro.runner import ParallelRunner, SequentialRunner
+from kedro.runner import (
+    NodeCache,
+    NodeTimings,
+    ParallelRunner,
+    SequentialRunner,
+    ThreadRunner,
+)
 
 
 @click.group(name="stub_cli")
@@ -66,9 +72,10 @@ def requirements_file(tmp_path):
 
 
 @fixture
-def fake_session(mocker):
+def fake_session(mocker, tmp_path):
     mock_session_create = mocker.patch.object(KedroSession, "create")
     mocked_session = mock_session_create.return_value.__enter__.return_value
+    mocked_session._get_store_path.return_value = tmp_path / "sessions"
     return mocked_session
 
 
@@ -474,6 +481,10 @@ class TestRunCommand:
             load_versions={},
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -514,6 +525,10 @@ class TestRunCommand:
             load_versions={},
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -554,6 +569,10 @@ class TestRunCommand:
             load_versions={},
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -585,11 +604,19 @@ class TestRunCommand:
             load_versions={},
             pipeline_name=None,
             namespace="fake_namespace",
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
         assert isinstance(runner, SequentialRunner)
         assert not runner._is_async
+        # the durations recorded are used by the critical-path scheduler later
+        assert runner._node_timings._filepath == (
+            fake_session._get_store_path.return_value / "node_timings.json"
+        )
 
     def test_run_successfully_parallel(
         self, fake_project_cli, fake_metadata, fake_session, mocker
@@ -609,6 +636,10 @@ class TestRunCommand:
             load_versions={},
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -624,6 +655,91 @@ class TestRunCommand:
         assert isinstance(runner, SequentialRunner)
         assert runner._is_async
 
+    def test_run_with_scheduler(self, fake_project_cli, fake_metadata, fake_session):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", "--runner=ThreadRunner", "--scheduler=critical-path"],
+            obj=fake_metadata,
+        )
+        assert not result.exit_code
+        runner = fake_session.run.call_args_list[0][1]["runner"]
+        assert isinstance(runner, ThreadRunner)
+        assert runner._scheduler == "critical-path"
+        assert isinstance(runner._node_timings, NodeTimings)
+        assert runner._node_timings._filepath == (
+            fake_session._get_store_path.return_value / "node_timings.json"
+        )
+
+    def test_run_with_unsupported_scheduler(
+        self, fake_project_cli, fake_metadata, fake_session
+    ):
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--scheduler=critical-path"], obj=fake_metadata
+        )
+        assert result.exit_code
+        assert "SequentialRunner does not support '--scheduler'" in result.output
+        fake_session.run.assert_not_called()
+
+    def test_run_with_max_memory(self, fake_project_cli, fake_metadata, fake_session):
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--max-memory=2GiB"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        runner = fake_session.run.call_args_list[0][1]["runner"]
+        assert isinstance(runner, SequentialRunner)
+        assert runner._memory_budget.max_memory == 2 * 1024**3
+
+    def test_run_with_cache(self, fake_project_cli, fake_metadata, fake_session):
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--cache"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        runner = fake_session.run.call_args_list[0][1]["runner"]
+        assert isinstance(runner, SequentialRunner)
+        assert isinstance(runner._node_cache, NodeCache)
+        assert runner._node_cache.directory == (
+            fake_session._get_store_path.return_value / "node_cache"
+        )
+
+    def test_run_with_unsupported_cache(
+        self, fake_project_cli, fake_metadata, fake_session
+    ):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", "--runner=ParallelRunner", "--cache"],
+            obj=fake_metadata,
+        )
+        assert result.exit_code
+        assert "ParallelRunner does not support '--cache'" in result.output
+        fake_session.run.assert_not_called()
+
+    def test_run_with_unsupported_max_memory(
+        self, fake_project_cli, fake_metadata, fake_session
+    ):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", "--runner=ParallelRunner", "--max-memory=2GB"],
+            obj=fake_metadata,
+        )
+        assert result.exit_code
+        assert "ParallelRunner does not support '--max-memory'" in result.output
+        fake_session.run.assert_not_called()
+
+    def test_run_with_journal(self, fake_project_cli, fake_metadata, fake_session):
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--journal"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        assert fake_session.run.call_args_list[0][1]["journal"]
+
+    def test_run_with_resume(self, fake_project_cli, fake_metadata, fake_session):
+        session_id = "2023-08-01T10.00.00.000Z"
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--resume", session_id], obj=fake_metadata
+        )
+        assert not result.exit_code
+        assert fake_session.run.call_args_list[0][1]["resume"] == session_id
+
     @mark.parametrize("config_flag", ["--config", "-c"])
     def test_run_with_config(
         self,
@@ -649,6 +765,10 @@ class TestRunCommand:
             load_versions={},
             pipeline_name="pipeline1",
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
     @mark.parametrize(
@@ -693,6 +813,10 @@ class TestRunCommand:
             load_versions={},
             pipeline_name="pipeline1",
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
         mock_session_create.assert_called_once_with(
             env=mocker.ANY, conf_source=None, extra_params=expected
@@ -793,6 +917,10 @@ class TestRunCommand:
             load_versions={ds: t},
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
     @mark.parametrize(
@@ -833,6 +961,10 @@ class TestRunCommand:
             load_versions=lv_dict,
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
     def test_fail_reformat_load_versions(self, fake_project_cli, fake_metadata):
@@ -909,6 +1041,10 @@ class TestRunCommand:
             load_versions={},
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
     def test_run_with_alternative_conf_source(self, fake_project_cli, fake_metadata):
@@ -964,6 +1100,10 @@ class TestRunCommand:
             load_versions={},
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
     def test_both_tag_flags(
@@ -993,6 +1133,10 @@ class TestRunCommand:
             load_versions={},
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
 
     def test_both_load_version_flags(
@@ -1022,4 +1166,8 @@ class TestRunCommand:
             load_versions=lv_dict,
             pipeline_name=None,
             namespace=None,
+            changed_only=False,
+            untimestamped="fresh",
+            journal=False,
+            resume=None,
         )
@@ -25,6 +25,10 @@ from kedro.framework.session import KedroSession
 from kedro.framework.session.session import KedroSessionError
 from kedro.framework.session.shelvestore import ShelveStore
 from kedro.framework.session.store import BaseSessionStore
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.io import DataCatalog
+from kedro.runner import RunJournal, SequentialRunner
 
 _FAKE_PROJECT_NAME = "fake_project"
 _FAKE_PIPELINE_NAME = "fake_pipeline"
@@ -231,6 +235,10 @@ def fake_username(mocker):
     return username
 
 
+def identity(arg):
+    return arg
+
+
 class FakeException(Exception):
     """Fake exception class for testing purposes"""
 
@@ -442,6 +450,20 @@ class TestKedroSession:
         ]
         assert actual_log_messages == expected_log_messages
 
+    def test_store_path(self, fake_project, mock_package_name):
+        session = KedroSession.create(mock_package_name, fake_project)
+        assert session._get_store_path() == fake_project / "sessions"
+
+    def test_relative_store_path(self, fake_project, mock_package_name, mocker):
+        class MockSettings(_ProjectSettings):
+            _SESSION_STORE_ARGS = Validator(
+                "SESSION_STORE_ARGS", default={"path": "nested/sessions"}
+            )
+
+        _mock_imported_settings_paths(mocker, MockSettings())
+        session = KedroSession.create(mock_package_name, fake_project)
+        assert session._get_store_path() == fake_project / "nested" / "sessions"
+
     @pytest.mark.usefixtures("mock_settings_shelve_session_store")
     def test_shelve_store(
         self, fake_project, fake_session_id, caplog, mock_package_name, mocker
@@ -887,6 +909,100 @@ class TestKedroSession:
             catalog=mock_catalog,
         )
 
+    @pytest.fixture
+    def resumable_project(self, fake_project, mocker):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="second"),
+            ]
+        )
+        mocker.patch(
+            "kedro.framework.session.session.pipelines",
+            {"__default__": test_pipeline},
+        )
+        journal = RunJournal(fake_project / "sessions" / "failed" / "run_journal.jsonl")
+        journal.extend({"first": {"B": "2023-08-01T10.00.00.000Z"}})
+        return fake_project
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_resume(
+        self,
+        resumable_project,
+        fake_session_id,
+        mock_context_class,
+        mock_package_name,
+        mock_runner,
+    ):
+        with KedroSession.create(mock_package_name, resumable_project) as session:
+            session.run(runner=mock_runner, resume="failed", load_versions={"A": "1"})
+
+        mock_context_class.return_value._get_catalog.assert_called_once_with(
+            save_version=fake_session_id,
+            load_versions={"A": "1", "B": "2023-08-01T10.00.00.000Z"},
+        )
+        run_args = mock_runner.run.call_args
+        assert [n.name for n in run_args[0][0].nodes] == ["second"]
+        journal = RunJournal(
+            resumable_project / "sessions" / fake_session_id / "run_journal.jsonl"
+        )
+        assert journal.load() == {"first": {"B": "2023-08-01T10.00.00.000Z"}}
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_journal(
+        self, resumable_project, fake_session_id, mock_package_name, mock_runner
+    ):
+        journals = []
+        mock_runner.run.side_effect = lambda *args: journals.append(mock_runner.journal)
+        with KedroSession.create(mock_package_name, resumable_project) as session:
+            session.run(runner=mock_runner, journal=True)
+
+        assert journals[0].filepath == (
+            resumable_project / "sessions" / fake_session_id / "run_journal.jsonl"
+        )
+        assert mock_runner.journal is None
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_without_journal(
+        self, resumable_project, fake_session_id, mock_context_class, mock_package_name
+    ):
+        class OldStyleRunner(SequentialRunner):
+            def run(self, pipeline, catalog, hook_manager=None, session_id=None):
+                return super().run(pipeline, catalog, hook_manager, session_id)
+
+        catalog = DataCatalog(feed_dict={"A": 42})
+        mock_context_class.return_value._get_catalog.return_value = catalog
+        with KedroSession.create(mock_package_name, resumable_project) as session:
+            assert session.run(runner=OldStyleRunner()) == {"C": 42}
+
+        assert not (resumable_project / "sessions" / fake_session_id).exists()
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_resume_not_recorded(
+        self, resumable_project, mock_package_name, mock_runner
+    ):
+        pattern = "Cannot resume the run of session 'unknown'"
+        with pytest.raises(KedroSessionError, match=pattern), KedroSession.create(
+            mock_package_name, resumable_project
+        ) as session:
+            session.run(runner=mock_runner, resume="unknown")
+        mock_runner.run.assert_not_called()
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_exception_suggests_resume(
+        self, resumable_project, fake_session_id, mock_package_name, mock_runner, caplog
+    ):
+        def fail(*args):
+            mock_runner.journal.extend({"first": {"B": None}})
+            raise FakeException("You shall not pass!")
+
+        mock_runner.run.side_effect = fail
+        with pytest.raises(FakeException), KedroSession.create(
+            mock_package_name, resumable_project
+        ) as session:
+            session.run(runner=mock_runner, journal=True)
+        assert f"--resume {fake_session_id}" in caplog.text
+
     @pytest.mark.usefixtures("mock_settings_context_class")
     def test_session_raise_error_with_invalid_runner_instance(
         self,
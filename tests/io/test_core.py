@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from fractions import Fraction
-from pathlib import PurePosixPath
+from pathlib import Path, PurePosixPath
 from typing import Any
 
 import pytest
@@ -11,6 +13,9 @@ import pytest
 from kedro.io.core import (
     _DEPRECATED_ERROR_CLASSES,
     AbstractDataSet,
+    AbstractVersionedDataSet,
+    DatasetError,
+    Version,
     _parse_filepath,
     get_filepath_str,
 )
@@ -54,6 +59,96 @@ class MyDataSet(AbstractDataSet):
         pass  # pragma: no cover
 
 
+class MyAsyncDataSet(AbstractDataSet):
+    def __init__(self, var=None):
+        self.var = var
+
+    def _describe(self):
+        return {}
+
+    def _load(self):
+        raise AssertionError("load should be awaited")  # pragma: no cover
+
+    def _save(self, data):
+        raise AssertionError("save should be awaited")  # pragma: no cover
+
+    async def _load_async(self):
+        if self.var is None:
+            raise ValueError("nothing saved")
+        return self.var
+
+    async def _save_async(self, data):
+        if data == "bad":
+            raise ValueError("bad data")
+        self.var = data
+
+
+class MyVersionedAsyncDataSet(AbstractVersionedDataSet):
+    def __init__(self, filepath, version=None, exists_function=None):
+        super().__init__(PurePosixPath(filepath), version, exists_function)
+
+    def _describe(self):
+        return {}
+
+    def _load(self):
+        return self._get_load_path().as_posix()
+
+    def _save(self, data):
+        raise AssertionError("save should be awaited")  # pragma: no cover
+
+    async def _save_async(self, data):
+        path = self._get_save_path()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(data)
+
+
+class TestAsyncDataSet:
+    def test_load_and_save_async(self):
+        data_set = MyAsyncDataSet()
+        asyncio.run(data_set.save_async(42))
+        assert asyncio.run(data_set.load_async()) == 42
+
+    def test_load_async_error(self):
+        pattern = r"Failed while loading data from data set MyAsyncDataSet\(\)"
+        with pytest.raises(DatasetError, match=pattern):
+            asyncio.run(MyAsyncDataSet().load_async())
+
+    def test_save_async_error(self):
+        pattern = r"Failed while saving data to data set MyAsyncDataSet\(\)"
+        with pytest.raises(DatasetError, match=pattern):
+            asyncio.run(MyAsyncDataSet().save_async("bad"))
+
+    def test_save_async_none(self):
+        with pytest.raises(DatasetError, match="Saving 'None' to a 'Dataset'"):
+            asyncio.run(MyAsyncDataSet().save_async(None))
+
+    def test_sync_data_set_runs_in_executor(self, mocker):
+        data_set = MyDataSet()
+        load = mocker.patch.object(MyDataSet, "_load", return_value=42)
+        save = mocker.patch.object(MyDataSet, "_save")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            asyncio.run(data_set.save_async(42, executor))
+            assert asyncio.run(data_set.load_async(executor)) == 42
+        save.assert_called_once_with(42)
+        load.assert_called_once_with()
+
+    def test_versioned_save_async(self, tmp_path):
+        filepath = (tmp_path / "data.txt").as_posix()
+        data_set = MyVersionedAsyncDataSet(filepath, Version(None, "2023-01-01"))
+        asyncio.run(data_set.save_async("data"))
+        assert (tmp_path / "data.txt" / "2023-01-01" / "data.txt").read_text() == "data"
+
+    def test_versioned_save_async_file_conflict(self, tmp_path):
+        (tmp_path / "data.txt").write_text("unversioned")
+        filepath = (tmp_path / "data.txt").as_posix()
+        data_set = MyVersionedAsyncDataSet(
+            filepath, Version(None, None), exists_function=lambda _: False
+        )
+        pattern = r"Cannot save versioned dataset 'data.txt'"
+        with pytest.raises(DatasetError, match=pattern):
+            asyncio.run(data_set.save_async("data"))
+
+
 class TestCoreFunctions:
     @pytest.mark.parametrize("var", [1, True] + FALSE_BUILTINS)
     def test_str_representation(self, var):
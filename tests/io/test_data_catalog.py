@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import re
+import threading
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
@@ -234,6 +236,21 @@ class TestDataCatalog:
 
         assert_frame_equal(reloaded_df, dummy_dataframe)
 
+    def test_save_and_load_async(self, data_catalog, dummy_dataframe, caplog):
+        caplog.set_level(logging.INFO, logger="kedro.io.data_catalog")
+        asyncio.run(data_catalog.save_async("test", dummy_dataframe))
+        reloaded_df = asyncio.run(data_catalog.load_async("test"))
+
+        assert_frame_equal(reloaded_df, dummy_dataframe)
+        assert "Saving data to 'test' (CSVDataSet)..." in caplog.text
+        assert "Loading data from 'test' (CSVDataSet)..." in caplog.text
+
+    def test_load_async_from_unregistered(self):
+        catalog = DataCatalog(data_sets={})
+        pattern = r"Dataset 'test' not found in the catalog"
+        with pytest.raises(DatasetNotFoundError, match=pattern):
+            asyncio.run(catalog.load_async("test"))
+
     def test_load_error(self, data_catalog):
         """Check the error when attempting to load a data set
         from nonexistent source"""
@@ -292,6 +309,32 @@ class TestDataCatalog:
         """Check the error when calling `exists` on invalid data set"""
         assert not data_catalog.exists("wrong_key")
 
+    def test_exists_many(self, data_catalog, dummy_dataframe):
+        data_catalog.add("saved", MemoryDataset(dummy_dataframe))
+        assert data_catalog.exists_many(["test", "saved", "wrong_key"]) == {
+            "test": False,
+            "saved": True,
+            "wrong_key": False,
+        }
+
+    def test_exists_many_single(self, data_catalog):
+        assert data_catalog.exists_many(["test"]) == {"test": False}
+
+    def test_exists_many_concurrently(self):
+        """Each data set waits for all of them to be checked at once"""
+        barrier = threading.Barrier(3, timeout=10)
+        catalog = DataCatalog(
+            {
+                f"ds_{i}": LambdaDataset(None, None, lambda: barrier.wait() >= 0)
+                for i in range(3)
+            }
+        )
+        assert catalog.exists_many(catalog.list(), max_workers=3) == {
+            "ds_0": True,
+            "ds_1": True,
+            "ds_2": True,
+        }
+
     def test_release_unregistered(self, data_catalog):
         """Check the error when calling `release` on unregistered data set"""
         pattern = r"Dataset \'wrong_key\' not found in the catalog"
@@ -777,6 +820,17 @@ class TestDataCatalogDatasetFactories:
         catalog = DataCatalog.from_config(**config_with_dataset_factories)
         assert (dataset_name in catalog) == expected
 
+    def test_exists_many_with_patterns(self, config_with_dataset_factories):
+        """Check that the datasets matching patterns are added to the catalog
+        before checking whether they exist"""
+        catalog = DataCatalog.from_config(**config_with_dataset_factories)
+        assert catalog.exists_many(["tesla_cars", "row_boats", "boats"]) == {
+            "tesla_cars": False,
+            "row_boats": False,
+            "boats": False,
+        }
+        assert {"tesla_cars", "row_boats"} <= set(catalog._data_sets)
+
     def test_patterns_not_in_catalog_datasets(self, config_with_dataset_factories):
         """Check that the pattern is not in the catalog datasets"""
         catalog = DataCatalog.from_config(**config_with_dataset_factories)
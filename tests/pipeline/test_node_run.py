@@ -1,4 +1,5 @@
 # pylint: disable=unused-argument
+import asyncio
 
 import pytest
 
@@ -139,3 +140,37 @@ class TestNodeRunInvalidOutput:
         pattern += r"the node definition contains 3 output\(s\)\."
         with pytest.raises(ValueError, match=pattern):
             node(one_in_two_out, "ds1", ["A", "B", "C"]).run({"ds1": mocked_dataset})
+
+
+async def async_one_in_one_out(arg):
+    await asyncio.sleep(0)
+    return arg
+
+
+class TestNodeRunAsync:
+    def test_async_function(self):
+        node_ = node(async_one_in_one_out, "ds1", "dsOut")
+        assert asyncio.run(node_.run_async({"ds1": 42})) == {"dsOut": 42}
+
+    def test_sync_function(self, valid_nodes_with_inputs):
+        for node_, input_ in valid_nodes_with_inputs:
+            assert asyncio.run(node_.run_async(input_))["dsOut"] == 42
+
+    def test_invalid_input(self, mocked_dataset):
+        pattern = r"Node.run\(\) expects a dictionary or None"
+        with pytest.raises(ValueError, match=pattern):
+            asyncio.run(node(one_in_one_out, "ds1", "A").run_async(mocked_dataset))
+
+    def test_async_function_error(self, caplog):
+        async def fail(arg):
+            raise ValueError("async failure")
+
+        with pytest.raises(ValueError, match="async failure"):
+            asyncio.run(node(fail, "ds1", "A", name="fail").run_async({"ds1": 42}))
+        assert "Node 'fail: fail([ds1]) -> [A]' failed with error" in caplog.text
+
+    def test_run_async_function_synchronously(self):
+        node_ = node(async_one_in_one_out, "ds1", "dsOut")
+        pattern = r"wraps a coroutine function.*'Node.run_async\(\)' or 'AsyncRunner'"
+        with pytest.raises(ValueError, match=pattern):
+            node_.run({"ds1": 42})
@@ -1,3 +1,4 @@
+import pickle
 import re
 from itertools import chain
 
@@ -10,6 +11,7 @@ from kedro.pipeline.pipeline import (
     CircularDependencyError,
     ConfirmNotUniqueError,
     OutputNotUniqueError,
+    _NodeMaps,
     _strip_transcoding,
     _transcode_split,
 )
@@ -307,6 +309,57 @@ class TestValidPipeline:
         }
         assert actual == expected
 
+    def test_index_computed_once(self, complex_pipeline):
+        index = complex_pipeline._index
+        complex_pipeline.nodes
+        complex_pipeline.inputs()
+        assert complex_pipeline._index is index
+
+    def test_index_adjacency(self, complex_pipeline):
+        index = complex_pipeline._index
+        assert list(index.nodes) == complex_pipeline.nodes
+        for node_id, node_ in enumerate(index.nodes):
+            assert index.node_ids[node_] == node_id
+            for child_id in index.children[node_id]:
+                assert node_id in index.parents[child_id]
+            for output in node_.outputs:
+                assert index.producers[output] == node_id
+                assert set(index.consumers.get(output, ())) == set(
+                    index.children[node_id]
+                ) & {
+                    child_id
+                    for child_id in index.children[node_id]
+                    if output in index.nodes[child_id].inputs
+                }
+
+    def test_properties_return_copies(self, complex_pipeline):
+        complex_pipeline.nodes.clear()
+        complex_pipeline.data_sets().clear()
+        complex_pipeline.all_inputs().clear()
+        complex_pipeline.all_outputs().clear()
+        node_dependencies = complex_pipeline.node_dependencies
+        node_dependencies[complex_pipeline.nodes[0]].add(complex_pipeline.nodes[1])
+        node_dependencies.clear()
+        assert len(complex_pipeline.nodes) == 9
+        assert complex_pipeline.data_sets()
+        assert complex_pipeline.all_inputs()
+        assert complex_pipeline.all_outputs()
+        assert len(complex_pipeline.node_dependencies) == 9
+        assert not complex_pipeline.node_dependencies[complex_pipeline.nodes[0]]
+
+    def test_own_transcoded_output_not_a_dependency(self):
+        test_node = node(identity, "ds@pandas", "ds@spark", name="n")
+        test_pipeline = modular_pipeline([test_node])
+        assert test_pipeline._index.parents == ((),)
+        assert test_pipeline._index.children == ((),)
+        assert test_pipeline.node_dependencies == {test_node: set()}
+
+    def test_pickle_without_index(self, complex_pipeline):
+        assert complex_pipeline.node_dependencies
+        unpickled = pickle.loads(pickle.dumps(complex_pipeline))
+        assert unpickled._cached_index is None
+        assert unpickled.node_dependencies == complex_pipeline.node_dependencies
+
 
 @pytest.fixture
 def pipeline_with_circle():
@@ -334,6 +387,32 @@ class TestInvalidPipeline:
         with pytest.raises(CircularDependencyError, match=pattern):
             modular_pipeline(pipeline_with_circle)
 
+    def test_circle_case_lists_nodes(self, pipeline_with_circle):
+        """The error lists the nodes in the cycle and the nodes depending on
+        them, in the order they were given."""
+        nodes = pipeline_with_circle + [
+            node(identity, "C", "D", name="downstream"),
+            node(identity, "X", "Y", name="independent"),
+        ]
+        pattern = re.escape(
+            "Circular dependencies exist among these items: "
+            f"{[str(n) for n in nodes[:4]]}"
+        )
+        with pytest.raises(CircularDependencyError, match=pattern):
+            modular_pipeline(nodes)
+
+    def test_transcoded_self_dependency(self):
+        """Nodes depend on each other through transcoded datasets, but a node
+        loading its own output with another transcoding is not a cycle."""
+        nodes = [
+            node(identity, "A@pandas", "B", name="node1"),
+            node(identity, "B", "A@spark", name="node2"),
+        ]
+        with pytest.raises(CircularDependencyError):
+            modular_pipeline(nodes)
+        pipeline = modular_pipeline([node(identity, "C@pandas", "C@spark", name="n")])
+        assert pipeline.grouped_nodes == [pipeline.nodes]
+
     def test_unique_outputs(self, non_unique_node_outputs):
         with pytest.raises(OutputNotUniqueError, match=r"\['D', 'E'\]"):
             modular_pipeline(non_unique_node_outputs)
@@ -590,6 +669,108 @@ class TestPipelineOperators:
         with pytest.raises(TypeError, match=pattern):
             p | "hello"  # pylint: disable=pointless-statement
 
+    def test_union_method(self):
+        pipelines = [
+            modular_pipeline([node(identity, f"ds{i}", f"ds{i + 1}", name=f"n{i}")])
+            for i in range(4)
+        ]
+        new_pipeline = pipelines[0].union(*pipelines[1:])
+        assert new_pipeline.inputs() == {"ds0"}
+        assert new_pipeline.outputs() == {"ds4"}
+        assert [n.name for n in new_pipeline.nodes] == ["n0", "n1", "n2", "n3"]
+        assert new_pipeline.nodes == sum(pipelines).nodes
+
+    def test_union_reuses_nodes(self):
+        shared = node(identity, "input", "shared", name="shared")
+        pipeline1 = modular_pipeline([shared, node(identity, "shared", "a", name="a")])
+        pipeline2 = modular_pipeline([shared, node(identity, "shared", "b", name="b")])
+        pipeline3 = modular_pipeline([node(identity, "input", "c", name="c")])
+        new_pipeline = pipeline1.union(pipeline2, pipeline3)
+        assert sorted(n.name for n in new_pipeline.nodes) == ["a", "b", "c", "shared"]
+        assert {id(n) for n in new_pipeline.nodes} == {
+            id(n) for n in pipeline1.nodes + pipeline2.nodes + pipeline3.nodes
+        }
+
+    def test_union_equal_nodes(self, mocker):
+        pipeline1 = modular_pipeline([node(identity, "input", "shared", name="s")])
+        pipeline2 = modular_pipeline(
+            [
+                node(identity, "input", "shared", name="s"),
+                node(identity, "shared", "output", name="a"),
+            ]
+        )
+        spy = mocker.spy(_NodeMaps, "__init__")
+        new_pipeline = pipeline1 + pipeline2
+        # the nodes are equal, so the pipelines are combined without
+        # validating every node again
+        assert not spy.called
+        assert sorted(n.name for n in new_pipeline.nodes) == ["a", "s"]
+
+    def test_sum_reuses_maps(self, mocker):
+        pipelines = [
+            modular_pipeline([node(identity, f"ds{i}", f"ds{i + 1}", name=f"n{i}")])
+            for i in range(50)
+        ]
+        spy = mocker.spy(_NodeMaps, "__init__")
+        new_pipeline = sum(pipelines)
+        # the nodes of every pipeline are appended to the same maps, so the
+        # cost grows with the number of nodes, not the number of additions
+        assert not spy.called
+        assert new_pipeline.inputs() == {"ds0"}
+        assert new_pipeline.outputs() == {"ds50"}
+        assert len(new_pipeline.nodes) == 50
+
+    def test_combined_pipelines_unchanged(self):
+        pipeline1 = modular_pipeline([node(identity, "a", "b", name="ab")])
+        pipeline2 = modular_pipeline([node(identity, "b", "c", name="bc")])
+        pipeline3 = modular_pipeline([node(identity, "c", "d", name="cd")])
+        first = pipeline1 + pipeline2
+        second = pipeline1 + pipeline3
+        assert [n.name for n in pipeline1.nodes] == ["ab"]
+        assert pipeline1.outputs() == {"b"}
+        assert [n.name for n in first.nodes] == ["ab", "bc"]
+        assert first.outputs() == {"c"}
+        assert sorted(n.name for n in second.nodes) == ["ab", "cd"]
+        assert (first + pipeline3).outputs() == {"d"}
+
+    def test_union_circular_leaves_pipelines_unchanged(self):
+        pipeline1 = modular_pipeline([node(identity, "a", "b", name="ab")])
+        pipeline2 = modular_pipeline([node(identity, "b", "a", name="ba")])
+        with pytest.raises(CircularDependencyError):
+            pipeline1 + pipeline2  # pylint: disable=pointless-statement
+        assert [n.name for n in pipeline1.nodes] == ["ab"]
+        assert pipeline1.outputs() == {"b"}
+        assert [n.name for n in pipeline2.nodes] == ["ba"]
+
+    def test_union_conflicting_outputs(self):
+        pipeline1 = modular_pipeline([node(identity, "input", "output", name="a")])
+        pipeline2 = modular_pipeline([node(identity, "input", "other", name="b")])
+        pipeline3 = modular_pipeline([node(identity, "other", "output", name="c")])
+        with pytest.raises(OutputNotUniqueError, match=r"\['output'\]"):
+            pipeline1.union(pipeline2, pipeline3)
+
+    def test_union_invalid(self):
+        p = modular_pipeline([])
+        with pytest.raises(TypeError, match="Cannot combine a 'Pipeline' with 'str'"):
+            p.union("hello")
+
+    @pytest.mark.parametrize("count", [2, 3])
+    def test_union_circular(self, count):
+        pipelines = [
+            modular_pipeline([node(identity, "a", "b", name="ab")]),
+            modular_pipeline([node(identity, "b", "a", name="ba")]),
+            modular_pipeline([node(identity, "input", "c", name="c")]),
+        ][:count]
+        with pytest.raises(CircularDependencyError):
+            pipelines[0].union(*pipelines[1:])
+
+    @pytest.mark.parametrize("names", [("ds@pandas", "ds"), ("ds", "ds@pandas")])
+    def test_union_transcoded_without_separator(self, names):
+        pipeline1 = modular_pipeline([node(identity, "input", names[0], name="a")])
+        pipeline2 = modular_pipeline([node(identity, names[1], "output", name="b")])
+        with pytest.raises(ValueError, match="used with transcoding"):
+            pipeline1 + pipeline2  # pylint: disable=pointless-statement
+
     def test_node_unique_confirms(self):
         """Test that unique dataset confirms don't break pipeline concatenation"""
         pipeline1 = modular_pipeline(
@@ -751,6 +932,83 @@ class TestPipelineFilter:
                 to_nodes=["node4"],
             )
 
+    @pytest.mark.parametrize(
+        "filter_method",
+        [
+            {"tags": ["foo"]},
+            {"from_nodes": ["node4"]},
+            {"to_nodes": ["node4"]},
+            {"from_inputs": ["F"]},
+            {"to_outputs": ["F"]},
+            {"to_nodes": ["node2"], "node_names": ["node2", "node3", "node4", "node9"]},
+        ],
+    )
+    def test_filter_groups_like_constructor(self, filter_method, complex_pipeline):
+        """The filtered pipeline is not sorted again, but gives the same groups
+        as a pipeline constructed from its nodes."""
+        filtered_pipeline = complex_pipeline.filter(**filter_method)
+        constructed = modular_pipeline(filtered_pipeline.nodes)
+        assert filtered_pipeline.grouped_nodes == constructed.grouped_nodes
+        assert filtered_pipeline.inputs() == constructed.inputs()
+        assert filtered_pipeline.outputs() == constructed.outputs()
+        assert filtered_pipeline.node_dependencies == constructed.node_dependencies
+
+    def test_index_masks(self, complex_pipeline):
+        index = complex_pipeline._index
+        assert index.mask([]) == 0
+        assert index.mask([0, 2]) == 0b101
+        assert index.mask_ids(0b101) == [0, 2]
+        last = len(index.nodes) - 1
+        assert index.descendants([last]) == 1 << last
+        assert index.ancestors([0]) == 1
+        everything = index.descendants(range(len(index.nodes)))
+        assert index.mask_ids(everything) == list(range(len(index.nodes)))
+
+
+class TestPipelineAncestors:
+    @pytest.mark.parametrize(
+        "node_names,direct,expected",
+        [
+            (["node4"], False, ["node9", "node8", "node7"]),
+            (["node4"], True, ["node7"]),
+            (["node1"], True, ["node4", "node2", "node3"]),
+            (["node9"], False, []),
+            (["node4", "node2"], False, ["node9", "node8", "node7", "node4"]),
+        ],
+    )
+    def test_ancestors(self, complex_pipeline, node_names, direct, expected):
+        ancestors = complex_pipeline.ancestors(*node_names, direct=direct)
+        assert [n.name for n in ancestors] == expected
+
+    @pytest.mark.parametrize(
+        "node_names,direct,expected",
+        [
+            (["node4"], False, ["node2", "node3", "node1"]),
+            (["node4"], True, ["node2", "node3", "node1"]),
+            (["node7"], True, ["node4", "node6"]),
+            (["node1"], False, []),
+            (["node6", "node4"], False, ["node2", "node3", "node5", "node1"]),
+        ],
+    )
+    def test_descendants(self, complex_pipeline, node_names, direct, expected):
+        descendants = complex_pipeline.descendants(*node_names, direct=direct)
+        assert [n.name for n in descendants] == expected
+
+    def test_like_to_nodes_and_from_nodes(self, complex_pipeline):
+        for node_ in complex_pipeline.nodes:
+            ancestors = complex_pipeline.ancestors(node_.name)
+            descendants = complex_pipeline.descendants(node_.name)
+            assert set(ancestors) | {node_} == set(
+                complex_pipeline.to_nodes(node_.name).nodes
+            )
+            assert set(descendants) | {node_} == set(
+                complex_pipeline.from_nodes(node_.name).nodes
+            )
+
+    def test_invalid_node_name(self, complex_pipeline):
+        with pytest.raises(ValueError, match=r"does not contain nodes named \['foo'\]"):
+            complex_pipeline.ancestors("foo")
+
 
 class TestPipelineFilterHelpers:
     """Node selection functions called by Pipeline.filter."""
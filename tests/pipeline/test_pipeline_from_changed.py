@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from pathlib import PurePosixPath
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from kedro.framework.hooks import _create_hook_manager
+from kedro.io import AbstractDataSet, DataCatalog, LambdaDataset, MemoryDataset
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import SequentialRunner
+
+
+def identity(input1: str):
+    return input1  # pragma: no cover
+
+
+def biconcat(input1: str, input2: str):
+    return input1 + input2  # pragma: no cover
+
+
+class _FileSystem:
+    def __init__(self, mtime):
+        self.mtime = mtime
+
+    def info(self, path):
+        if self.mtime is None:
+            raise FileNotFoundError(path)
+        return {"name": path, "mtime": self.mtime}
+
+
+class TimestampedDataset(AbstractDataSet):
+    """A dataset on a file system reporting the modification time ``mtime``,
+    or which does not exist if it is None."""
+
+    def __init__(self, mtime: float = None):
+        self._fs = _FileSystem(mtime)
+        self._filepath = PurePosixPath("data")
+
+    def _load(self) -> Any:
+        raise NotImplementedError  # pragma: no cover
+
+    def _save(self, data: Any) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    def _exists(self) -> bool:
+        return self._fs.mtime is not None
+
+    def _describe(self) -> dict[str, Any]:
+        return {"mtime": self._fs.mtime}
+
+
+@pytest.fixture
+def hook_manager():
+    return _create_hook_manager()
+
+
+@pytest.fixture
+def branched_pipeline():
+    # #### Pipeline execution order ####
+    # Inputs: A, C
+    #
+    # left_in: identity([A]) -> [B]
+    # combine: biconcat([B,C]) -> [D]
+    # left_out: identity([D]) -> [E]
+    # right_out: identity([C]) -> [F]
+    #
+    #  A
+    #  |
+    # l-in
+    #  |
+    #  B     C
+    #   \   / \\
+    #  combine r-out
+    #     |     |
+    #     D     F
+    #     |
+    #   l-out
+    #     |
+    #     E
+    #
+    # ##################################
+    return modular_pipeline(
+        [
+            node(identity, "A", "B", name="left_in"),
+            node(biconcat, ["B", "C"], "D", name="combine"),
+            node(identity, "D", "E", name="left_out"),
+            node(identity, "C", "F", name="right_out"),
+        ]
+    )
+
+
+def _make_catalog(**mtimes):
+    """Creates a catalog of datasets modified at the given times."""
+    return DataCatalog(
+        {name: TimestampedDataset(mtime) for name, mtime in mtimes.items()}
+    )
+
+
+def _pipeline_contains(pipe, nodes):
+    return set(nodes) == {n.name for n in pipe.nodes}
+
+
+def _from_changed(pipeline, catalog, hook_manager, untimestamped="fresh"):
+    """Create a new pipeline based on changed inputs."""
+    name = "kedro.runner.runner.AbstractRunner.run"
+    with mock.patch(name) as run:
+        SequentialRunner().run_only_changed(
+            pipeline, catalog, hook_manager, untimestamped=untimestamped
+        )
+        _, args, _ = run.mock_calls[0]
+    new_pipeline = args[0]
+    return new_pipeline
+
+
+class TestPipelineChanged:
+    def test_none_changed(self, branched_pipeline, hook_manager):
+        catalog = _make_catalog(A=1, B=2, C=1, D=3, E=4, F=2)
+        new_pipeline = _from_changed(branched_pipeline, catalog, hook_manager)
+        assert _pipeline_contains(new_pipeline, [])
+
+    def test_input_changed(self, branched_pipeline, hook_manager):
+        catalog = _make_catalog(A=1, B=2, C=5, D=3, E=4, F=2)
+        new_pipeline = _from_changed(branched_pipeline, catalog, hook_manager)
+        assert _pipeline_contains(new_pipeline, ["combine", "left_out", "right_out"])
+
+    def test_intermediate_changed(self, branched_pipeline, hook_manager):
+        catalog = _make_catalog(A=1, B=5, C=1, D=3, E=4, F=2)
+        new_pipeline = _from_changed(branched_pipeline, catalog, hook_manager)
+        assert _pipeline_contains(new_pipeline, ["combine", "left_out"])
+
+    def test_output_missing(self, branched_pipeline, hook_manager):
+        catalog = _make_catalog(A=1, B=None, C=1, D=3, E=4, F=2)
+        new_pipeline = _from_changed(branched_pipeline, catalog, hook_manager)
+        assert _pipeline_contains(new_pipeline, ["left_in", "combine", "left_out"])
+
+    def test_unregistered_intermediate(self, branched_pipeline, hook_manager):
+        """``B`` and ``D`` are held in memory, so they are as old as ``A``
+        and ``C``, and the nodes producing them run again if needed."""
+        catalog = _make_catalog(A=5, C=1, E=4, F=2)
+        new_pipeline = _from_changed(branched_pipeline, catalog, hook_manager)
+        assert _pipeline_contains(new_pipeline, ["left_in", "combine", "left_out"])
+
+    def test_unregistered_intermediate_fresh(self, branched_pipeline, hook_manager):
+        catalog = _make_catalog(A=1, C=1, E=4, F=2)
+        new_pipeline = _from_changed(branched_pipeline, catalog, hook_manager)
+        assert _pipeline_contains(new_pipeline, [])
+
+    def test_free_outputs(self, branched_pipeline, hook_manager):
+        catalog = _make_catalog(A=1, B=2, C=1, D=3, F=2)
+        new_pipeline = _from_changed(branched_pipeline, catalog, hook_manager)
+        assert _pipeline_contains(new_pipeline, ["left_out"])
+
+    def test_empty_memory_dataset(self, branched_pipeline, hook_manager):
+        catalog = _make_catalog(A=1, B=2, C=1, E=4, F=2)
+        catalog.add("D", MemoryDataset())
+        new_pipeline = _from_changed(branched_pipeline, catalog, hook_manager)
+        assert _pipeline_contains(new_pipeline, ["combine", "left_out"])
+
+    @pytest.mark.parametrize(
+        "untimestamped,expected",
+        [("fresh", []), ("stale", ["combine", "left_out", "right_out"])],
+    )
+    def test_untimestamped_input(
+        self, branched_pipeline, hook_manager, untimestamped, expected
+    ):
+        catalog = _make_catalog(A=1, B=2, D=3, E=4, F=2)
+        catalog.add("C", LambdaDataset(None, None, lambda: True))
+        new_pipeline = _from_changed(
+            branched_pipeline, catalog, hook_manager, untimestamped
+        )
+        assert _pipeline_contains(new_pipeline, expected)
+
+    @pytest.mark.parametrize(
+        "untimestamped,expected", [("fresh", []), ("stale", ["left_out"])]
+    )
+    def test_untimestamped_output(
+        self, branched_pipeline, hook_manager, untimestamped, expected
+    ):
+        catalog = _make_catalog(A=1, B=2, C=1, D=3, F=2)
+        catalog.add("E", LambdaDataset(None, None, lambda: True))
+        new_pipeline = _from_changed(
+            branched_pipeline, catalog, hook_manager, untimestamped
+        )
+        assert _pipeline_contains(new_pipeline, expected)
+
+    def test_unknown_untimestamped(self, branched_pipeline, hook_manager):
+        catalog = _make_catalog(A=1, B=2, C=1, D=3, E=4, F=2)
+        with pytest.raises(ValueError, match="Unknown policy 'sometimes'"):
+            _from_changed(branched_pipeline, catalog, hook_manager, "sometimes")
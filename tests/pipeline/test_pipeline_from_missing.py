@@ -173,6 +173,15 @@ class TestPipelineMissing:
         new_pipeline = _from_missing(branched_pipeline, catalog, hook_manager)
         assert _pipeline_contains(new_pipeline, ["split", "right_out"])
 
+    def test_only_pipeline_data_sets_checked(self, branched_pipeline, hook_manager):
+        """Data sets the pipeline does not use are not checked."""
+        catalog = _make_catalog(non_existent=["F"], existent=["A", "B", "C", "D", "E"])
+        unused = mock.MagicMock(spec=LambdaDataset)
+        catalog.add("unused", unused)
+        new_pipeline = _from_missing(branched_pipeline, catalog, hook_manager)
+        assert _pipeline_contains(new_pipeline, ["split", "right_out"])
+        unused.exists.assert_not_called()
+
 
 class TestPipelineUnregistered:
     def test_propagate_up(self, branched_pipeline, hook_manager):
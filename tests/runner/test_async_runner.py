@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from typing import Any
+
+import pytest
+
+from kedro.framework.hooks import _create_hook_manager
+from kedro.io import AbstractDataSet, DataCatalog, DatasetError, MemoryDataset
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import AsyncRunner
+from tests.runner.conftest import exception_fn, identity, return_none, sink, source
+
+
+async def async_identity(arg):
+    await asyncio.sleep(0)
+    return arg
+
+
+def decorated(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+async def async_exception_fn(*args):
+    raise Exception("test exception")  # pylint: disable=broad-exception-raised
+
+
+def generator(arg):
+    yield from arg
+
+
+class AsyncDataset(AbstractDataSet):
+    def __init__(self, log, value=None):
+        self.log = log
+        self.value = value
+
+    def _load(self) -> Any:
+        raise AssertionError("load should be awaited")  # pragma: no cover
+
+    def _save(self, data: Any) -> None:
+        raise AssertionError("save should be awaited")  # pragma: no cover
+
+    async def _load_async(self) -> Any:
+        self.log.append(("load", threading.current_thread().name))
+        return self.value
+
+    async def _save_async(self, data: Any) -> None:
+        self.log.append(("save", threading.current_thread().name))
+        self.value = data
+
+    def _describe(self) -> dict[str, Any]:
+        return {}
+
+
+class LoggingDataset(AbstractDataSet):
+    def __init__(self, log, name, value=None):
+        self.log = log
+        self.name = name
+        self.value = value
+
+    def _load(self) -> Any:
+        self.log.append(("load", self.name))
+        return self.value
+
+    def _save(self, data: Any) -> None:
+        self.value = data
+
+    def _release(self) -> None:
+        self.log.append(("release", self.name))
+        self.value = None
+
+    def _describe(self) -> dict[str, Any]:
+        return {}
+
+
+class TestValidAsyncRunner:
+    def test_create_default_data_set(self):
+        data_set = AsyncRunner().create_default_data_set("")
+        assert isinstance(data_set, MemoryDataset)
+
+    def test_run(self, fan_out_fan_in, catalog):
+        catalog.add_feed_dict({"A": 42})
+        result = AsyncRunner().run(fan_out_fan_in, catalog)
+        assert result["Z"] == (42, 42, 42)
+
+    def test_run_with_plugin_manager(self, fan_out_fan_in, catalog):
+        catalog.add_feed_dict({"A": 42})
+        result = AsyncRunner().run(
+            fan_out_fan_in, catalog, hook_manager=_create_hook_manager()
+        )
+        assert result["Z"] == (42, 42, 42)
+
+    def test_async_nodes(self, catalog):
+        pipeline = modular_pipeline(
+            [
+                node(async_identity, "A", "B"),
+                node(identity, "B", "C"),
+                node(async_identity, "C", "D"),
+            ]
+        )
+        catalog.add_feed_dict({"A": 42})
+        assert AsyncRunner().run(pipeline, catalog) == {"D": 42}
+
+    def test_wrapped_async_nodes(self, catalog):
+        """Coroutine functions wrapped in ``functools.partial`` or a decorator
+        are awaited too, rather than returning an un-awaited coroutine."""
+
+        async def async_add(arg, offset):
+            await asyncio.sleep(0)
+            return arg + offset
+
+        pipeline = modular_pipeline(
+            [
+                node(functools.partial(async_add, offset=1), "A", "B"),
+                node(decorated(async_identity), "B", "C"),
+                node(decorated(functools.partial(async_add, offset=2)), "C", "D"),
+            ]
+        )
+        catalog.add_feed_dict({"A": 42})
+        assert AsyncRunner().run(pipeline, catalog) == {"D": 45}
+
+    def test_async_nodes_run_concurrently(self, catalog):
+        """Each node waits for all of them to have started, so the run
+        only completes if they all run at the same time."""
+        count = 5
+        started = []
+
+        async def wait_for_others(arg):
+            started.append(arg)
+            while len(started) < count:
+                await asyncio.sleep(0)
+            return arg
+
+        pipeline = modular_pipeline(
+            [node(wait_for_others, "A", f"out_{i}") for i in range(count)]
+        )
+        catalog.add_feed_dict({"A": 42})
+        result = AsyncRunner(max_workers=1).run(pipeline, catalog)
+        assert result == {f"out_{i}": 42 for i in range(count)}
+
+    def test_max_concurrency(self, catalog):
+        running, peak = [], []
+
+        async def track(arg):
+            running.append(arg)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(arg)
+            return arg
+
+        pipeline = modular_pipeline([node(track, "A", f"out_{i}") for i in range(6)])
+        catalog.add_feed_dict({"A": 42})
+        AsyncRunner(max_concurrency=2).run(pipeline, catalog)
+        assert max(peak) == 2
+
+    def test_async_datasets_in_event_loop(self):
+        log = []
+        pipeline = modular_pipeline([node(async_identity, "in", "out")])
+        out = AsyncDataset(log)
+        catalog = DataCatalog({"in": AsyncDataset(log, "stuff"), "out": out})
+        AsyncRunner().run(pipeline, catalog)
+
+        assert out.value == "stuff"
+        assert [action for action, _ in log] == ["load", "save"]
+        # the event loop runs in the thread calling the runner
+        assert {thread for _, thread in log} == {threading.current_thread().name}
+
+    def test_generator_node(self, catalog):
+        pipeline = modular_pipeline([node(generator, "A", "B")])
+        catalog.add_feed_dict({"A": [1, 2, 3]})
+        assert AsyncRunner().run(pipeline, catalog) == {"B": 3}
+
+    def test_confirms(self, mocker, catalog):
+        confirm = mocker.patch.object(DataCatalog, "confirm")
+        pipeline = modular_pipeline([node(async_identity, "A", "B", confirms="A")])
+        catalog.add_feed_dict({"A": 42})
+        AsyncRunner().run(pipeline, catalog)
+        confirm.assert_called_once_with("A")
+
+    def test_run_in_running_event_loop(self, fan_out_fan_in, catalog):
+        catalog.add_feed_dict({"A": 42})
+
+        async def main():
+            return AsyncRunner().run(fan_out_fan_in, catalog)
+
+        assert asyncio.run(main())["Z"] == (42, 42, 42)
+
+    @pytest.mark.parametrize("kwargs", [{"max_workers": 0}, {"max_concurrency": -1}])
+    def test_init_with_non_positive_values(self, kwargs):
+        with pytest.raises(ValueError, match="should be positive"):
+            AsyncRunner(**kwargs)
+
+
+class TestInvalidAsyncRunner:
+    @pytest.mark.parametrize("func", [exception_fn, async_exception_fn])
+    def test_task_exception(self, fan_out_fan_in, catalog, func):
+        catalog.add_feed_dict(feed_dict={"A": 42})
+        pipeline = modular_pipeline([fan_out_fan_in, node(func, "Z", "X")])
+        with pytest.raises(Exception, match="test exception"):
+            AsyncRunner().run(pipeline, catalog)
+
+    def test_pending_nodes_cancelled(self, catalog):
+        started, cancelled = [], []
+
+        async def wait_forever(arg):
+            started.append(arg)
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(arg)
+                raise
+
+        async def fail_once_started(arg):
+            while not started:
+                await asyncio.sleep(0)
+            await async_exception_fn(arg)
+
+        pipeline = modular_pipeline(
+            [node(wait_forever, "A", "B"), node(fail_once_started, "A", "C")]
+        )
+        catalog.add_feed_dict(feed_dict={"A": 42})
+        with pytest.raises(Exception, match="test exception"):
+            AsyncRunner().run(pipeline, catalog)
+        assert cancelled == [42]
+
+    def test_node_error_hook(self, catalog, mocker):
+        hook_manager = _create_hook_manager()
+        on_node_error = mocker.patch.object(hook_manager.hook, "on_node_error")
+        catalog.add_feed_dict(feed_dict={"A": 42})
+        pipeline = modular_pipeline([node(async_exception_fn, "A", "X")])
+        with pytest.raises(Exception, match="test exception"):
+            AsyncRunner().run(pipeline, catalog, hook_manager)
+        on_node_error.assert_called_once()
+        assert on_node_error.call_args.kwargs["is_async"] is True
+
+    def test_node_returning_none(self):
+        pipeline = modular_pipeline(
+            [node(identity, "A", "B"), node(return_none, "B", "C")]
+        )
+        catalog = DataCatalog({"A": MemoryDataset("42")})
+        pattern = "Saving 'None' to a 'Dataset' is not allowed"
+        with pytest.raises(DatasetError, match=pattern):
+            AsyncRunner().run(pipeline, catalog)
+
+    def test_suggest_resume_scenario(self, caplog):
+        pipeline = modular_pipeline(
+            [node(source, None, "first"), node(exception_fn, "first", "second")]
+        )
+        with pytest.raises(Exception, match="test exception"):
+            AsyncRunner().run(pipeline, DataCatalog())
+        assert "There are 1 nodes that have not run" in caplog.text
+
+
+class TestAsyncRunnerRelease:
+    def test_release_at_earliest_opportunity(self):
+        log = []
+        pipeline = modular_pipeline(
+            [
+                node(source, None, "first"),
+                node(async_identity, "first", "second"),
+                node(sink, "second", None),
+            ]
+        )
+        catalog = DataCatalog(
+            {
+                "first": LoggingDataset(log, "first"),
+                "second": LoggingDataset(log, "second"),
+            }
+        )
+        AsyncRunner().run(pipeline, catalog)
+
+        assert list(log) == [
+            ("load", "first"),
+            ("release", "first"),
+            ("load", "second"),
+            ("release", "second"),
+        ]
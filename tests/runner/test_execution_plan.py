@@ -0,0 +1,114 @@
+import pytest
+
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import ExecutionPlan
+from tests.runner.conftest import identity, sink, source
+
+
+@pytest.fixture
+def plan(fan_out_fan_in):
+    return ExecutionPlan.from_pipeline(fan_out_fan_in)
+
+
+class TestExecutionPlan:
+    def test_nodes_in_topological_order(self, plan, fan_out_fan_in):
+        assert list(plan.nodes) == fan_out_fan_in.nodes
+        assert len(plan) == 5
+
+    def test_node_ids(self, plan):
+        for node_id, node_ in enumerate(plan.nodes):
+            assert plan.node_id(node_) == node_id
+            assert plan.node_inputs(node_id) == tuple(node_.inputs)
+            assert plan.node_outputs(node_id) == tuple(node_.outputs)
+
+    def test_parents_and_children(self, plan, fan_out_fan_in):
+        dependencies = fan_out_fan_in.node_dependencies
+        for node_id, node_ in enumerate(plan.nodes):
+            parents = {plan.nodes[p] for p in plan.parents(node_id)}
+            assert parents == dependencies[node_]
+            assert plan.in_degree(node_id) == len(dependencies[node_])
+            for child_id in plan.children(node_id):
+                assert node_id in plan.parents(child_id)
+
+    def test_free_inputs_and_outputs(self, plan, fan_out_fan_in):
+        assert plan.free_inputs == fan_out_fan_in.inputs()
+        assert plan.free_outputs == fan_out_fan_in.outputs()
+        assert plan.data_sets == fan_out_fan_in.data_sets()
+        assert plan.group_count == len(fan_out_fan_in.grouped_nodes)
+
+    def test_load_counts(self, plan):
+        load_counts = plan.load_counts()
+        assert load_counts == {"A": 1, "B": 3, "C": 1, "D": 1, "E": 1}
+        # every call returns a fresh counter
+        load_counts["B"] -= 1
+        assert plan.load_counts()["B"] == 3
+
+    def test_release_schedule(self, plan):
+        released = {
+            plan.nodes[node_id].name: data_sets
+            for node_id, data_sets in enumerate(plan.release_schedule)
+        }
+        assert sorted(d for ds in released.values() for d in ds) == [
+            "B",
+            "C",
+            "D",
+            "E",
+        ]
+        # "A" is a free input and "Z" is a free output
+        assert "A" not in released
+        assert "Z" not in released
+
+    def test_datasets_to_release(self, plan):
+        load_counts = plan.load_counts()
+        first, *middle, last = plan.nodes
+        assert not list(plan.datasets_to_release(first, load_counts))
+        assert list(plan.datasets_to_release(middle[0], load_counts)) == []
+        assert list(plan.datasets_to_release(middle[1], load_counts)) == []
+        assert list(plan.datasets_to_release(middle[2], load_counts)) == ["B"]
+        assert sorted(plan.datasets_to_release(last, load_counts)) == [
+            "C",
+            "D",
+            "E",
+        ]
+
+    def test_own_transcoded_output_not_a_parent(self):
+        test_pipeline = modular_pipeline([node(identity, "ds@pandas", "ds@spark")])
+        plan = ExecutionPlan.from_pipeline(test_pipeline)
+        assert plan.in_degree(0) == 0
+        assert plan.parents(0) == plan.children(0) == ()
+
+    def test_release_unconsumed_transcoded_output(self):
+        test_pipeline = modular_pipeline(
+            [node(source, None, "ds@save"), node(sink, "ds@load", None)]
+        )
+        plan = ExecutionPlan.from_pipeline(test_pipeline)
+        assert plan.release_schedule == (("ds@save",), ("ds@load",))
+
+    def test_unknown_dependencies_are_counted(self, mocker):
+        test_pipeline = modular_pipeline([node(identity, "A", "B")])
+        mocker.patch(
+            "kedro.pipeline.Pipeline.node_dependencies",
+            new_callable=mocker.PropertyMock,
+            return_value={test_pipeline.nodes[0]: {"you_shall_not_pass"}},
+        )
+        plan = ExecutionPlan(test_pipeline)
+        assert plan.in_degree(0) == 1
+        assert plan.parents(0) == ()
+
+
+class TestExecutionPlanCache:
+    def test_plan_is_cached(self, fan_out_fan_in):
+        plan = ExecutionPlan.from_pipeline(fan_out_fan_in)
+        assert ExecutionPlan.from_pipeline(fan_out_fan_in) is plan
+
+    def test_plan_per_pipeline(self, fan_out_fan_in, branchless_pipeline):
+        assert ExecutionPlan.from_pipeline(
+            fan_out_fan_in
+        ) is not ExecutionPlan.from_pipeline(branchless_pipeline)
+
+    def test_plan_compiled_once(self, mocker, fan_out_fan_in):
+        spy = mocker.spy(ExecutionPlan, "_compile_release_schedule")
+        for _ in range(3):
+            ExecutionPlan.from_pipeline(fan_out_fan_in)
+        assert spy.call_count == 1
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from pathlib import PurePosixPath
+
+import pytest
+
+from kedro.extras.datasets.pickle import PickleDataSet
+from kedro.io import MemoryDataset, Version
+from kedro.runner.freshness import get_last_modified
+
+
+class _FileSystem:
+    def __init__(self, info):
+        self._info = info
+
+    def info(self, path):  # pylint: disable=unused-argument
+        return self._info
+
+
+class _Dataset:
+    def __init__(self, info):
+        self._fs = _FileSystem(info)
+        self._filepath = PurePosixPath("bucket/data.csv")
+
+
+class TestGetLastModified:
+    def test_local_file(self, tmp_path):
+        filepath = tmp_path / "data.pkl"
+        data_set = PickleDataSet(filepath=str(filepath))
+        data_set.save([1, 2, 3])
+        os.utime(filepath, (1000, 1000))
+        assert get_last_modified(data_set) == 1000
+
+    def test_versioned_file(self, tmp_path):
+        data_set = PickleDataSet(
+            filepath=str(tmp_path / "data.pkl"), version=Version(None, "v1")
+        )
+        data_set.save([1, 2, 3])
+        os.utime(tmp_path / "data.pkl" / "v1" / "data.pkl", (1000, 1000))
+        assert get_last_modified(data_set) == 1000
+
+    def test_missing_file(self, tmp_path):
+        data_set = PickleDataSet(filepath=str(tmp_path / "data.pkl"))
+        assert get_last_modified(data_set) is None
+
+    def test_missing_version(self, tmp_path):
+        data_set = PickleDataSet(
+            filepath=str(tmp_path / "data.pkl"), version=Version(None, None)
+        )
+        assert get_last_modified(data_set) is None
+
+    def test_no_file_system(self):
+        assert get_last_modified(MemoryDataset([1, 2, 3])) is None
+
+    @pytest.mark.parametrize(
+        "info",
+        [
+            {"LastModified": datetime(2023, 1, 1, tzinfo=timezone.utc)},
+            {"last_modified": datetime(2023, 1, 1, tzinfo=timezone.utc)},
+            {"updated": "2023-01-01T00:00:00Z"},
+            {"mtime": 1672531200},
+        ],
+    )
+    def test_object_stores(self, info):
+        expected = datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp()
+        assert get_last_modified(_Dataset(info)) == expected
+
+    @pytest.mark.parametrize(
+        "info", [{}, {"updated": "yesterday"}, {"mtime": None, "ETag": "abc"}]
+    )
+    def test_no_modification_time(self, info):
+        assert get_last_modified(_Dataset(info)) is None
@@ -0,0 +1,78 @@
+import pytest
+
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import ExecutionPlan, find_linear_chains
+from tests.runner.conftest import fan_in, identity
+
+
+def _chains(test_pipeline, in_memory):
+    plan = ExecutionPlan.from_pipeline(test_pipeline)
+    return [
+        [plan.nodes[node_id].name for node_id in chain]
+        for chain in find_linear_chains(plan, in_memory)
+    ]
+
+
+@pytest.fixture
+def chain():
+    return modular_pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="second"),
+            node(identity, "C", "D", name="third"),
+        ]
+    )
+
+
+class TestFindLinearChains:
+    def test_maximal_chain(self, chain):
+        assert _chains(chain, {"B", "C", "D"}) == [["first", "second", "third"]]
+
+    def test_persisted_link(self, chain):
+        assert _chains(chain, {"B", "D"}) == [["first", "second"]]
+        assert not _chains(chain, set())
+
+    def test_branches(self, fan_out_fan_in):
+        in_memory = {"B", "C", "D", "E", "Z"}
+        assert not _chains(fan_out_fan_in, in_memory)
+
+        extended = modular_pipeline(
+            [fan_out_fan_in, node(identity, "Z", "Y", name="after_fan_in")]
+        )
+        assert _chains(extended, in_memory | {"Y"}) == [
+            ["fan_in([C,D,E]) -> [Z]", "after_fan_in"]
+        ]
+
+    def test_link_used_by_other_node(self):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="second"),
+                node(fan_in, ["B", "C"], "D", name="third"),
+            ]
+        )
+        # 'B' is also used by 'third', which depends on two nodes
+        assert not _chains(test_pipeline, {"B", "C", "D"})
+
+    def test_several_chains(self):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="a_1"),
+                node(identity, "B", "C", name="a_2"),
+                node(identity, "X", "Y", name="x_1"),
+                node(identity, "Y", "Z", name="x_2"),
+                node(identity, "Z", "W", name="x_3"),
+            ]
+        )
+        chains = _chains(test_pipeline, {"B", "C", "Y", "Z", "W"})
+        assert sorted(chains) == [["a_1", "a_2"], ["x_1", "x_2", "x_3"]]
+
+    def test_transcoded_link(self):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B@pandas", name="first"),
+                node(identity, "B@spark", "C", name="second"),
+            ]
+        )
+        assert not _chains(test_pipeline, {"B@pandas", "B@spark", "C"})
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from typing import Any
+
+import pytest
+
+from kedro.io import AbstractDataSet, DataCatalog, MemoryDataset
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import HybridRunner
+from kedro.runner.parallel_runner import _SharedMemoryDataset
+from tests.runner.conftest import exception_fn, identity, sink, source
+
+
+def where(*args):  # pylint: disable=unused-argument
+    return os.getpid(), threading.current_thread() is threading.main_thread()
+
+
+class SingleProcessDataset(AbstractDataSet):
+    _SINGLE_PROCESS = True
+
+    def __init__(self, value=None):
+        self.value = value
+
+    def _load(self) -> Any:
+        return self.value
+
+    def _save(self, data: Any) -> None:
+        self.value = data
+
+    def _describe(self) -> dict[str, Any]:
+        return {}
+
+
+class LoggingDataset(AbstractDataSet):
+    def __init__(self, log, name, value=None):
+        self.log = log
+        self.name = name
+        self.value = value
+
+    def _load(self) -> Any:
+        self.log.append(("load", self.name))
+        return self.value
+
+    def _save(self, data: Any) -> None:
+        self.value = data
+
+    def _release(self) -> None:
+        self.log.append(("release", self.name))
+        self.value = None
+
+    def _describe(self) -> dict[str, Any]:
+        return {}
+
+
+@pytest.fixture
+def routed_pipeline():
+    return modular_pipeline(
+        [
+            node(where, "A", "in_process", name="process", tags="process"),
+            node(where, "A", "in_thread", name="thread", tags="thread"),
+            node(where, "A", "in_main", name="main", tags="main"),
+        ]
+    )
+
+
+class TestRoute:
+    def test_default_tag_routes(self, routed_pipeline):
+        runner = HybridRunner()
+        catalog = DataCatalog()
+        routes = {n.name: runner.route(n, catalog) for n in routed_pipeline.nodes}
+        assert routes == {"process": "process", "thread": "thread", "main": "main"}
+
+    def test_default_route(self):
+        runner = HybridRunner(default_route="process")
+        assert runner.route(node(identity, "A", "B"), DataCatalog()) == "process"
+
+    def test_custom_tag_routes(self):
+        runner = HybridRunner(tag_routes={"io": "thread", "cpu": "process"})
+        catalog = DataCatalog()
+        assert runner.route(node(identity, "A", "B", tags="cpu"), catalog) == "process"
+        assert runner.route(node(identity, "A", "B", tags="io"), catalog) == "thread"
+        assert runner.route(node(identity, "A", "B", tags="main"), catalog) == "thread"
+
+    def test_conflicting_tags(self):
+        runner = HybridRunner()
+        node_ = node(identity, "A", "B", name="both", tags=["process", "main"])
+        pattern = r"Node 'both' is tagged to run in more than one way"
+        with pytest.raises(ValueError, match=pattern):
+            runner.route(node_, DataCatalog())
+
+    def test_single_process_dataset_runs_in_main(self, caplog):
+        runner = HybridRunner(default_route="process")
+        catalog = DataCatalog({"B": SingleProcessDataset()})
+        assert runner.route(node(identity, "A", "B", name="spark"), catalog) == "main"
+        assert "Running node 'spark' in the main thread" in caplog.text
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"default_route": "gpu"}, {"tag_routes": {"fast": "gpu"}}]
+    )
+    def test_invalid_route(self, kwargs):
+        with pytest.raises(ValueError, match=r"Invalid routes \['gpu'\]"):
+            HybridRunner(**kwargs)
+
+    def test_negative_workers(self):
+        with pytest.raises(ValueError, match="should be positive"):
+            HybridRunner(max_threads=0)
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+class TestHybridRunner:
+    def test_nodes_run_where_routed(self, routed_pipeline):
+        catalog = DataCatalog(feed_dict={"A": 42})
+        result = HybridRunner().run(routed_pipeline, catalog)
+
+        assert result["in_process"][0] != os.getpid()
+        assert result["in_thread"] == (os.getpid(), False)
+        assert result["in_main"] == (os.getpid(), True)
+
+    def test_data_shared_across_routes(self, fan_out_fan_in):
+        pipeline = modular_pipeline(fan_out_fan_in, tags="process")
+        thread_node = node(identity, "Z", "Y", tags="thread")
+        catalog = DataCatalog(feed_dict={"A": 42})
+        result = HybridRunner().run(pipeline + modular_pipeline([thread_node]), catalog)
+        assert result == {"Y": (42, 42, 42)}
+
+    def test_process_data_sets_are_shared(self, mocker, routed_pipeline):
+        runner = HybridRunner()
+        create = mocker.spy(runner, "create_default_data_set")
+        runner.run(routed_pipeline, DataCatalog(feed_dict={"A": 42}))
+        created = {
+            call.args[0]: ret
+            for call, ret in zip(create.call_args_list, create.spy_return_list)
+        }
+        assert isinstance(created["in_process"], _SharedMemoryDataset)
+        assert isinstance(created["in_thread"], MemoryDataset)
+
+    def test_no_manager_without_process_nodes(self, mocker, fan_out_fan_in):
+        manager = mocker.patch("kedro.runner.hybrid_runner.ParallelRunnerManager")
+        catalog = DataCatalog(feed_dict={"A": 42})
+        result = HybridRunner().run(fan_out_fan_in, catalog)
+        assert result == {"Z": (42, 42, 42)}
+        manager.assert_not_called()
+
+    def test_task_exception(self, fan_out_fan_in):
+        pipeline = fan_out_fan_in + modular_pipeline(
+            [node(exception_fn, "Z", "X", tags="process")]
+        )
+        catalog = DataCatalog(feed_dict={"A": 42})
+        with pytest.raises(Exception, match="test exception"):
+            HybridRunner().run(pipeline, catalog)
+
+    def test_main_node_exception(self, fan_out_fan_in):
+        pipeline = fan_out_fan_in + modular_pipeline(
+            [node(exception_fn, "Z", "X", tags="main")]
+        )
+        catalog = DataCatalog(feed_dict={"A": 42})
+        with pytest.raises(Exception, match="test exception"):
+            HybridRunner().run(pipeline, catalog)
+
+    def test_unserialisable_process_node(self):
+        pipeline = modular_pipeline(
+            [
+                node(lambda x: x, "A", "B", name="in_thread"),
+                node(lambda x: x, "B", "C", name="in_process", tags="process"),
+            ]
+        )
+        catalog = DataCatalog(feed_dict={"A": 42})
+        with pytest.raises(AttributeError, match="cannot be serialised"):
+            HybridRunner().run(pipeline, catalog)
+
+    def test_unserialisable_process_data_set(self):
+        class Unserialisable(SingleProcessDataset):
+            _SINGLE_PROCESS = False
+
+        pipeline = modular_pipeline([node(identity, "A", "B", tags="process")])
+        catalog = DataCatalog({"A": Unserialisable(42)})
+        with pytest.raises(AttributeError, match=r"cannot be serialised: \['A'\]"):
+            HybridRunner().run(pipeline, catalog)
+
+    def test_memory_dataset_output(self):
+        pipeline = modular_pipeline([node(identity, "A", "B", tags="process")])
+        catalog = DataCatalog({"A": MemoryDataset(42), "B": MemoryDataset()})
+        with pytest.raises(AttributeError, match=r"memory data sets: \['B'\]"):
+            HybridRunner().run(pipeline, catalog)
+
+
+class TestHybridRunnerRelease:
+    def test_release_at_earliest_opportunity(self):
+        log = []
+        pipeline = modular_pipeline(
+            [
+                node(source, None, "first", tags="main"),
+                node(identity, "first", "second"),
+                node(sink, "second", None, tags="main"),
+            ]
+        )
+        catalog = DataCatalog(
+            {
+                "first": LoggingDataset(log, "first"),
+                "second": LoggingDataset(log, "second"),
+            }
+        )
+        HybridRunner().run(pipeline, catalog)
+
+        assert list(log) == [
+            ("load", "first"),
+            ("release", "first"),
+            ("load", "second"),
+            ("release", "second"),
+        ]
@@ -0,0 +1,50 @@
+from threading import Event
+
+import pytest
+
+from kedro.runner import IOExecutor
+
+
+class TestIOExecutor:
+    def test_submit(self):
+        with IOExecutor(max_workers=2) as executor:
+            assert executor.submit(pow, 2, 3).result() == 8
+        assert executor.max_workers == 2
+        assert executor.task_count == 1
+        assert executor.queue_depth == 0
+        assert executor.max_queue_depth == 1
+        assert executor.mean_queue_depth == 1.0
+
+    def test_queue_depth(self):
+        release = Event()
+        with IOExecutor(max_workers=1) as executor:
+            blocking = executor.submit(release.wait)
+            while executor.queue_depth:  # wait for the first task to start
+                pass
+            queued = [executor.submit(pow, 2, i) for i in range(3)]
+            assert executor.queue_depth == 3
+            release.set()
+            assert blocking.result()
+            assert [future.result() for future in queued] == [1, 2, 4]
+
+        assert executor.task_count == 4
+        assert executor.queue_depth == 0
+        assert executor.max_queue_depth == 3
+        assert executor.mean_queue_depth == (1 + 1 + 2 + 3) / 4
+
+    def test_no_tasks(self):
+        executor = IOExecutor()
+        assert executor.mean_queue_depth == 0.0
+        executor.shutdown()
+
+    def test_submit_after_shutdown(self):
+        executor = IOExecutor()
+        executor.shutdown()
+        with pytest.raises(RuntimeError):
+            executor.submit(pow, 2, 3)
+        assert executor.task_count == 0
+        assert executor.queue_depth == 0
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError):
+            IOExecutor(max_workers=0)
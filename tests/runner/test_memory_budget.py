@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kedro.io import DatasetError, MemoryDataset
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import ExecutionPlan, MemoryBudget
+from kedro.runner.memory_budget import (
+    _SpillableMemoryDataset,
+    _TransferMemoryDataset,
+    estimate_size,
+    parse_memory_size,
+)
+from tests.runner.conftest import identity
+
+DATA = b"x" * 1000
+
+
+def duplicate(arg):
+    return arg, arg
+
+
+def concat(*args):
+    return b"".join(args)
+
+
+@pytest.fixture
+def chain():
+    return modular_pipeline(
+        [
+            node(duplicate, "A", ["B", "C"], name="split"),
+            node(identity, "B", "D", name="first"),
+            node(concat, ["C", "D"], "E", name="second"),
+        ]
+    )
+
+
+class TestParseMemorySize:
+    @pytest.mark.parametrize(
+        "size,expected",
+        [
+            (1024, 1024),
+            ("10", 10),
+            ("10B", 10),
+            ("1KB", 1000),
+            ("1K", 1024),
+            ("512mb", 512 * 1000**2),
+            ("1.5 GiB", int(1.5 * 1024**3)),
+            ("2T", 2 * 1024**4),
+        ],
+    )
+    def test_valid(self, size, expected):
+        assert parse_memory_size(size) == expected
+
+    @pytest.mark.parametrize("size", ["", "GB", "10 XB", "-1GB", "1,5GB"])
+    def test_invalid(self, size):
+        with pytest.raises(ValueError, match="Invalid memory size"):
+            parse_memory_size(size)
+
+    @pytest.mark.parametrize("size", [0, -1, "0MB"])
+    def test_not_positive(self, size):
+        with pytest.raises(ValueError, match="It should be positive"):
+            parse_memory_size(size)
+
+
+class TestEstimateSize:
+    def test_pandas(self):
+        data = pd.DataFrame({"col": ["a" * 100] * 10})
+        assert estimate_size(data) == data.memory_usage(deep=True).sum()
+
+    def test_numpy(self):
+        assert estimate_size(np.zeros(100)) == 800
+
+    def test_memory_usage_without_deep(self):
+        class Data:
+            nbytes = 10
+
+            def memory_usage(self):
+                return 20  # pragma: no cover
+
+        assert estimate_size(Data()) == 10
+
+    def test_other(self):
+        assert estimate_size(DATA) > len(DATA)
+
+
+class TestSpillableMemoryDataset:
+    def test_spill(self, tmp_path):
+        data_set = _SpillableMemoryDataset()
+        data_set.save(DATA)
+        assert data_set.size > len(DATA)
+
+        assert data_set.spill(tmp_path) > len(DATA)
+        assert data_set.size == 0
+        assert len(list(tmp_path.iterdir())) == 1
+        assert data_set.exists()
+        assert data_set.load() == DATA
+
+    def test_spill_nothing(self, tmp_path):
+        assert _SpillableMemoryDataset().spill(tmp_path) == 0
+        assert not list(tmp_path.iterdir())
+
+    def test_save_after_spill(self, tmp_path):
+        data_set = _SpillableMemoryDataset()
+        data_set.save(DATA)
+        data_set.spill(tmp_path)
+        data_set.save(b"new")
+        assert not list(tmp_path.iterdir())
+        assert data_set.load() == b"new"
+
+    def test_release_after_spill(self, tmp_path):
+        data_set = _SpillableMemoryDataset()
+        data_set.save(DATA)
+        data_set.spill(tmp_path)
+        data_set.release()
+        assert not list(tmp_path.iterdir())
+        assert not data_set.exists()
+
+
+class TestTransferMemoryDataset:
+    def test_transfer_to_last_load(self):
+        data_set = _TransferMemoryDataset()
+        data_set.expect_loads(2)
+        data = [1]
+        data_set.save(data)
+        first = data_set.load()
+        assert first == data
+        assert first is not data
+        assert data_set.load() is data
+
+    def test_extra_loads_copied(self):
+        data_set = _TransferMemoryDataset()
+        data_set.expect_loads(1)
+        data = [1]
+        data_set.save(data)
+        assert data_set.load() is data
+        assert data_set.load() is not data
+
+    def test_save_resets_loads(self):
+        data_set = _TransferMemoryDataset()
+        data_set.expect_loads(1)
+        data_set.save([1])
+        data_set.load()
+        data = [2]
+        data_set.save(data)
+        assert data_set.load() is data
+
+    @pytest.mark.parametrize("data", [DATA, 1, "a", (1, None, (2.0, b"b"))])
+    def test_immutable_not_copied(self, data, mocker):
+        data_set = _TransferMemoryDataset()
+        data_set.expect_loads(3)
+        data_set.save(data)
+        copy = mocker.spy(MemoryDataset, "_load")
+        assert data_set.load() is data
+        assert data_set.load() is data
+        copy.assert_not_called()
+
+    def test_mutable_tuple_copied(self):
+        data_set = _TransferMemoryDataset()
+        data_set.expect_loads(2)
+        data = (1, [2])
+        data_set.save(data)
+        assert data_set.load() is not data
+
+    def test_without_expected_loads(self):
+        data_set = _TransferMemoryDataset()
+        data = [1]
+        data_set.save(data)
+        assert data_set.load() is not data
+
+    def test_load_before_save(self):
+        data_set = _TransferMemoryDataset()
+        data_set.expect_loads(1)
+        with pytest.raises(DatasetError, match="has not been saved yet"):
+            data_set.load()
+
+
+class TestMemoryBudget:
+    def test_unlimited(self):
+        budget = MemoryBudget()
+        assert budget.max_memory is None
+        assert type(budget.create_data_set("B")) is MemoryDataset
+        assert budget.can_start()
+
+    def test_spill_data_needed_last(self, chain, tmp_path):
+        plan = ExecutionPlan.from_pipeline(chain)
+        budget = MemoryBudget(1500, spill_dir=tmp_path)
+        data_sets = {name: budget.create_data_set(name) for name in "BCD"}
+        budget.start(plan)
+
+        budget.node_started(chain.nodes[0])
+        data_sets["B"].save(DATA)
+        data_sets["C"].save(DATA)
+        assert not budget.can_start()
+        budget.node_completed(chain.nodes[0])
+
+        assert budget.can_start()
+        assert data_sets["B"].size
+        assert not data_sets["C"].size
+        assert data_sets["C"].load() == DATA
+
+    def test_inputs_of_running_nodes_not_spilled(self, chain, tmp_path):
+        plan = ExecutionPlan.from_pipeline(chain)
+        budget = MemoryBudget(1, spill_dir=tmp_path)
+        data_sets = {name: budget.create_data_set(name) for name in "BCD"}
+        budget.start(plan)
+
+        budget.node_started(chain.nodes[0])
+        data_sets["B"].save(DATA)
+        budget.node_started(chain.nodes[1])
+        data_sets["C"].save(DATA)
+        budget.node_completed(chain.nodes[0])
+
+        assert data_sets["B"].size
+        assert not data_sets["C"].size
+
+    def test_free_outputs_not_spilled(self, tmp_path):
+        test_pipeline = modular_pipeline([node(identity, "A", "B")])
+        budget = MemoryBudget(1, spill_dir=tmp_path)
+        data_set = budget.create_data_set("B")
+        budget.start(ExecutionPlan.from_pipeline(test_pipeline))
+
+        budget.node_started(test_pipeline.nodes[0])
+        data_set.save(DATA)
+        budget.node_completed(test_pipeline.nodes[0])
+
+        assert data_set.size
+        assert not list(tmp_path.iterdir())
+
+    def test_close(self, chain, tmp_path):
+        budget = MemoryBudget("1", spill_dir=tmp_path)
+        data_set = budget.create_data_set("C")
+        budget.start(ExecutionPlan.from_pipeline(chain))
+        data_set.save(DATA)
+        budget.node_completed(chain.nodes[0])
+        assert list(tmp_path.iterdir())
+
+        budget.close()
+        assert not list(tmp_path.iterdir())
+        assert budget.live_size == 0
+
+    def test_transfer_ownership(self, chain):
+        budget = MemoryBudget(transfer_ownership=True)
+        assert budget.transfer_ownership
+        data_sets = {name: budget.create_data_set(name) for name in "BCDE"}
+        budget.start(ExecutionPlan.from_pipeline(chain))
+        data = [1]
+        for data_set in data_sets.values():
+            data_set.save(data)
+
+        assert all(data_sets[name].load() is data for name in "BCD")
+        # the outputs of the pipeline are handed over to the runner
+        assert data_sets["E"].load() is data
+        budget.close()
+
+    def test_transfer_ownership_with_max_memory(self, chain, tmp_path):
+        budget = MemoryBudget(1, spill_dir=tmp_path, transfer_ownership=True)
+        data_set = budget.create_data_set("B")
+        assert isinstance(data_set, _SpillableMemoryDataset)
+        budget.start(ExecutionPlan.from_pipeline(chain))
+        data = [1]
+        data_set.save(data)
+        assert data_set.load() is data
+        budget.close()
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from kedro.pipeline import node
+from kedro.runner import NodeCache
+from tests.runner.conftest import identity, sink
+
+
+def add(left, right):
+    return left + right
+
+
+def subtract(left, right):
+    return left - right
+
+
+def generator(arg):
+    yield arg
+
+
+@pytest.fixture
+def node_cache(tmp_path):
+    return NodeCache(tmp_path / "cache")
+
+
+def _entries(cache):
+    return sorted(cache.directory.glob("*/*.pkl"))
+
+
+class TestNodeCacheKey:
+    def test_same_node_and_inputs(self, node_cache):
+        add_node = node(add, ["a", "b"], "c")
+        assert node_cache.key(add_node, {"a": 1, "b": 2}) == node_cache.key(
+            node(add, ["a", "b"], "c"), {"b": 2, "a": 1}
+        )
+
+    @pytest.mark.parametrize(
+        "other_node,other_inputs",
+        [
+            (node(add, ["a", "b"], "c"), {"a": 1, "b": 3}),
+            (node(subtract, ["a", "b"], "c"), {"a": 1, "b": 2}),
+            (node(add, ["a", "b"], "d"), {"a": 1, "b": 2}),
+            (node(add, ["b", "a"], "c"), {"a": 1, "b": 2}),
+        ],
+    )
+    def test_changes(self, node_cache, other_node, other_inputs):
+        key = node_cache.key(node(add, ["a", "b"], "c"), {"a": 1, "b": 2})
+        assert key != node_cache.key(other_node, other_inputs)
+
+    def test_partial(self, node_cache):
+        def key(func):
+            return node_cache.key(node(func, "a", "c", name="n"), {"a": 1})
+
+        assert key(partial(add, right=1)) == key(partial(add, right=1))
+        assert key(partial(add, right=1)) != key(partial(add, right=2))
+
+    def test_function_without_source(self, node_cache):
+        func = eval("lambda x: x + 1")  # pylint: disable=eval-used
+        other = eval("lambda x: x + 2")  # pylint: disable=eval-used
+        assert node_cache.key(node(func, "a", "c"), {"a": 1}) != node_cache.key(
+            node(other, "a", "c"), {"a": 1}
+        )
+
+    def test_callable_without_code(self, node_cache):
+        assert node_cache.key(node(max, ["a", "b"], "c"), {"a": 1, "b": 2})
+
+    def test_set_inputs(self, node_cache):
+        identity_node = node(identity, "a", "b")
+        tags = [f"tag_{i}" for i in range(20)]
+        assert node_cache.key(identity_node, {"a": set(tags)}) == node_cache.key(
+            identity_node, {"a": set(reversed(tags))}
+        )
+        assert node_cache.key(identity_node, {"a": set(tags)}) != node_cache.key(
+            identity_node, {"a": frozenset(tags)}
+        )
+
+    def test_set_inputs_independent_of_hash_seed(self):
+        code = (
+            "from kedro.pipeline import node; from kedro.runner import NodeCache; "
+            "from tests.runner.conftest import identity; "
+            "data = {'tags': {f'tag_{i}' for i in range(20)}, "
+            "'names': frozenset('abcdefgh')}; "
+            "print(NodeCache('cache').key(node(identity, 'a', 'b'), {'a': data}))"
+        )
+        keys = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+            for seed in ("1", "2", "3")
+        }
+        assert len(keys) == 1
+
+    @pytest.mark.parametrize(
+        "uncached_node,inputs",
+        [
+            (node(sink, "a", None), {"a": 1}),
+            (node(generator, "a", "b"), {"a": 1}),
+            (node(identity, "a", "b"), {"a": threading.Lock()}),
+        ],
+    )
+    def test_not_cached(self, node_cache, uncached_node, inputs):
+        assert node_cache.key(uncached_node, inputs) is None
+
+
+class TestNodeCacheStore:
+    def test_put_and_get(self, node_cache):
+        node_cache.put("abcdef", {"c": [1, 2, 3]})
+        assert node_cache.get("abcdef") == {"c": [1, 2, 3]}
+        assert _entries(node_cache) == [node_cache.directory / "ab" / "abcdef.pkl"]
+
+    def test_get_missing(self, node_cache):
+        assert node_cache.get("abcdef") is None
+
+    def test_get_corrupt(self, node_cache, caplog):
+        path = node_cache.directory / "ab" / "abcdef.pkl"
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not a pickle")
+        assert node_cache.get("abcdef") is None
+        assert "Ignoring corrupt node cache entry" in caplog.text
+        assert not path.exists()
+
+    def test_put_not_picklable(self, node_cache):
+        node_cache.put("abcdef", {"c": threading.Lock()})
+        assert node_cache.get("abcdef") is None
+        assert not list((node_cache.directory / "ab").iterdir())
+
+    def test_get_marks_as_used(self, node_cache):
+        node_cache.put("abcdef", {"c": 1})
+        path = _entries(node_cache)[0]
+        os.utime(path, (0, 0))
+        node_cache.get("abcdef")
+        assert path.stat().st_mtime > 0
+
+
+class TestNodeCacheEvict:
+    def test_evict_nothing_stored(self, node_cache):
+        node_cache.evict()
+        assert not node_cache.directory.exists()
+
+    def test_evict_old(self, tmp_path):
+        node_cache = NodeCache(tmp_path, max_age=timedelta(hours=1))
+        node_cache.put("aa", {"c": 1})
+        node_cache.put("bb", {"c": 2})
+        old = time.time() - 2 * 3600
+        os.utime(tmp_path / "aa" / "aa.pkl", (old, old))
+        node_cache.evict()
+        assert _entries(node_cache) == [tmp_path / "bb" / "bb.pkl"]
+
+    def test_evict_least_recently_used(self, tmp_path):
+        node_cache = NodeCache(tmp_path, max_size=None, max_age=None)
+        for i, key in enumerate(["aa", "bb", "cc"]):
+            node_cache.put(key, {"c": b"x" * 100})
+            os.utime(tmp_path / key / f"{key}.pkl", (i, i))
+        size = (tmp_path / "aa" / "aa.pkl").stat().st_size
+
+        NodeCache(tmp_path, max_size=2 * size, max_age=None).evict()
+        assert _entries(node_cache) == [
+            tmp_path / "bb" / "bb.pkl",
+            tmp_path / "cc" / "cc.pkl",
+        ]
+
+    def test_evict_concurrently_removed(self, tmp_path, mocker):
+        node_cache = NodeCache(tmp_path, max_size=1, max_age=None)
+        node_cache.put("aa", {"c": 1})
+        node_cache.put("bb", {"c": 2})
+        stat = Path.stat
+
+        def removed_stat(path, *args, **kwargs):
+            if path.name == "aa.pkl":
+                raise FileNotFoundError(path)
+            return stat(path, *args, **kwargs)
+
+        mocker.patch.object(Path, "stat", removed_stat)
+        mocker.patch.object(Path, "unlink", side_effect=FileNotFoundError)
+        node_cache.evict()
+        Path.unlink.assert_called_once_with()
+
+    @pytest.mark.parametrize("max_age", [0, -1, timedelta(0)])
+    def test_invalid_max_age(self, tmp_path, max_age):
+        with pytest.raises(ValueError, match="max_age should be positive"):
+            NodeCache(tmp_path, max_age=max_age)
+
+    def test_invalid_max_size(self, tmp_path):
+        with pytest.raises(ValueError, match="Invalid memory size"):
+            NodeCache(tmp_path, max_size="lots")
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import importlib
+import os
+import pickle
 import sys
-from concurrent.futures.process import ProcessPoolExecutor
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from typing import Any
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from kedro.framework.hooks import _create_hook_manager
@@ -17,12 +24,20 @@ from kedro.io import (
 )
 from kedro.pipeline import node
 from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
-from kedro.runner import ParallelRunner
+from kedro.runner import ExecutionPlan, IOExecutor, NodeTimings, ParallelRunner
 from kedro.runner.parallel_runner import (
     _MAX_WINDOWS_WORKERS,
     ParallelRunnerManager,
+    _attached_segments,
+    _bootstrap_worker,
+    _ChainDataset,
+    _get_worker_run,
+    _run_chain_by_id,
+    _run_node_by_id,
     _run_node_synchronization,
+    _SharedMemoryBuffersDataset,
     _SharedMemoryDataset,
+    _WorkerState,
 )
 from tests.runner.conftest import (
     exception_fn,
@@ -76,6 +91,56 @@ class TestValidParallelRunner:
         assert len(result["Z"]) == 3
         assert result["Z"] == ("42", "42", "42")
 
+    def test_critical_path_scheduler(self, fan_out_fan_in, catalog, tmp_path):
+        catalog.add_feed_dict({"A": 42})
+        filepath = tmp_path / "node_timings.json"
+        result = ParallelRunner(
+            scheduler="critical-path", node_timings=NodeTimings(filepath)
+        ).run(fan_out_fan_in, catalog)
+        assert result == {"Z": (42, 42, 42)}
+        durations = NodeTimings(filepath).durations
+        assert set(durations) == {n.name for n in fan_out_fan_in.nodes}
+
+    def test_unknown_scheduler(self):
+        with pytest.raises(ValueError, match="Unknown scheduler 'fastest'"):
+            ParallelRunner(scheduler="fastest")
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+class TestReuseWorkers:
+    def test_pool_reused_across_runs(self, mocker, fan_out_fan_in, catalog):
+        executor_cls_mock = mocker.patch(
+            "kedro.runner.parallel_runner.ProcessPoolExecutor",
+            wraps=ProcessPoolExecutor,
+        )
+        runner = ParallelRunner(max_workers=2, reuse_workers=True)
+        for _ in range(2):
+            catalog.add_feed_dict({"A": 42}, replace=True)
+            assert runner.run(fan_out_fan_in, catalog) == {"Z": (42, 42, 42)}
+
+        executor_cls_mock.assert_called_once_with(
+            max_workers=2, initializer=_bootstrap_worker, initargs=mocker.ANY
+        )
+
+    def test_pool_dropped_when_broken(self, mocker, fan_out_fan_in, catalog):
+        runner = ParallelRunner(reuse_workers=True)
+        mocker.patch(
+            "kedro.runner.parallel_runner._run_node_by_id",
+            side_effect=BrokenProcessPool,
+        )
+        # the workers are threads of this process, so do not bootstrap them
+        mocker.patch("kedro.runner.parallel_runner._bootstrap_worker")
+        mocker.patch(
+            "kedro.runner.parallel_runner.ProcessPoolExecutor",
+            ThreadPoolExecutor,
+        )
+        catalog.add_feed_dict({"A": 42})
+        with pytest.raises(BrokenProcessPool):
+            runner.run(fan_out_fan_in, catalog)
+        assert runner._pool is None
+
 
 @pytest.mark.skipif(
     sys.platform.startswith("win"), reason="Due to bug in parallel runner"
@@ -122,7 +187,11 @@ class TestMaxWorkers:
         ).run(fan_out_fan_in, catalog)
         assert result == {"Z": (42, 42, 42)}
 
-        executor_cls_mock.assert_called_once_with(max_workers=expected_number)
+        executor_cls_mock.assert_called_once_with(
+            max_workers=expected_number,
+            initializer=_bootstrap_worker,
+            initargs=mocker.ANY,
+        )
 
     def test_max_worker_windows(self, mocker):
         """The ProcessPoolExecutor on Python 3.7+
@@ -136,6 +205,199 @@ class TestMaxWorkers:
         assert parallel_runner._max_workers == _MAX_WINDOWS_WORKERS
 
 
+def _segments() -> set[str]:
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+def _leaked_segments(before: set[str], timeout: float = 5.0) -> set[str]:
+    """Returns the segments created since ``before`` which are still there
+    after ``timeout`` seconds, as tests running concurrently in other
+    processes create short-lived segments of their own.
+    """
+    deadline = time.monotonic() + timeout
+    leaked = _segments() - before
+    while leaked and time.monotonic() < deadline:
+        time.sleep(0.1)
+        leaked &= _segments()
+    return leaked
+
+
+def _double(data):
+    return data * 2
+
+
+def _chunks(data):
+    for chunk in range(5):
+        yield data + chunk
+
+
+@pytest.fixture
+def manager():
+    manager = ParallelRunnerManager()
+    manager.start()
+    yield manager
+    manager.shutdown()
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Shared memory is not supported"
+)
+class TestSharedMemory:
+    @pytest.mark.parametrize(
+        "data",
+        [np.arange(10.0), pd.DataFrame({"a": np.arange(5.0), "b": np.arange(5)})],
+    )
+    def test_parallel_run(self, data):
+        segments = _segments()
+        pipeline = modular_pipeline(
+            [node(_double, "A", "B"), node(_double, "B", "C"), node(identity, "C", "D")]
+        )
+        catalog = DataCatalog(feed_dict={"A": data})
+        result = ParallelRunner(shared_memory=True).run(pipeline, catalog)
+        assert (result["D"] == data * 4).all(axis=None)
+        assert not _leaked_segments(segments)
+
+    def test_zero_copy_load(self, manager):
+        data_set = _SharedMemoryBuffersDataset(manager)
+        data_set.save(np.arange(10.0))
+        loaded = data_set.load()
+        segment = _attached_segments[-1]
+        assert np.shares_memory(loaded, np.frombuffer(segment.buf))
+        assert not loaded.flags.writeable
+        assert (loaded == np.arange(10.0)).all()
+
+        name = segment.name
+        data_set.release()
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+        del loaded
+
+    def test_save_unlinks_previous_segment(self, manager):
+        data_set = _SharedMemoryBuffersDataset(manager)
+        segment_names = []
+        for chunk in range(5):
+            data_set.save(np.arange(10.0) + chunk)
+            segment_names.append(data_set.shared_memory_dataset.load()[0])
+        assert _segments() & set(segment_names) == {segment_names[-1]}
+        assert (data_set.load() == np.arange(10.0) + 4).all()
+        data_set.release()
+        assert not _segments() & set(segment_names)
+
+    def test_generator_node_segments_unlinked(self):
+        segments = _segments()
+        pipeline = modular_pipeline([node(_chunks, "A", "B"), node(identity, "B", "C")])
+        catalog = DataCatalog(feed_dict={"A": np.arange(10.0)})
+        result = ParallelRunner(shared_memory=True).run(pipeline, catalog)
+        assert (result["C"] == np.arange(10.0) + 4).all()
+        assert not _leaked_segments(segments)
+
+    def test_release_unlinked_segment(self, manager):
+        data_set = _SharedMemoryBuffersDataset(manager)
+        data_set.save(np.arange(10.0))
+        segment_name, _, _ = data_set.shared_memory_dataset.load()
+        segment = SharedMemory(name=segment_name)
+        segment.close()
+        segment.unlink()
+        data_set.release()
+        with pytest.raises(DatasetError):
+            data_set.shared_memory_dataset.load()
+
+    def test_data_without_buffers(self, manager):
+        data_set = _SharedMemoryBuffersDataset(manager)
+        data_set.save({"a": 1})
+        assert data_set.load() == {"a": 1}
+        data_set.release()
+        data_set.release()
+
+    def test_unserialisable_data(self, manager):
+        data_set = _SharedMemoryBuffersDataset(manager)
+        pattern = "cannot be serialised. ParallelRunner implicit memory datasets"
+        with pytest.raises(DatasetError, match=pattern):
+            data_set.save(return_not_serialisable(None))
+
+    def test_segments_unlinked_on_failure(self, catalog):
+        segments = _segments()
+        pipeline = modular_pipeline(
+            [node(_double, "A", "B"), node(exception_fn, "B", "C")]
+        )
+        catalog.add_feed_dict({"A": np.arange(10.0)})
+        with pytest.raises(Exception, match="test exception"):
+            ParallelRunner(shared_memory=True).run(pipeline, catalog)
+        assert not _leaked_segments(segments)
+
+    def test_windows_not_supported(self, mocker):
+        mocker.patch("sys.platform", "win32")
+        with pytest.warns(UserWarning, match="Setting 'shared_memory' to False"):
+            runner = ParallelRunner(shared_memory=True)
+        assert not runner._shared_memory
+
+
+@pytest.fixture
+def chained_pipeline():
+    return modular_pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="second"),
+            node(identity, "C", "D", name="third"),
+            node(identity, "A", "E", name="other"),
+        ]
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+class TestFuseChains:
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_parallel_run(self, is_async, chained_pipeline, mocker, tmp_path):
+        submit = mocker.spy(ProcessPoolExecutor, "submit")
+        filepath = tmp_path / "node_timings.json"
+        runner = ParallelRunner(
+            is_async=is_async, fuse_chains=True, node_timings=NodeTimings(filepath)
+        )
+        result = runner.run(chained_pipeline, DataCatalog(feed_dict={"A": 42}))
+
+        assert result == {"D": 42, "E": 42}
+        assert {call.args[1] for call in submit.call_args_list} == {
+            _run_chain_by_id,
+            _run_node_by_id,
+        }
+        assert submit.call_count == 2
+        # the durations of the nodes of the chain are recorded separately
+        durations = NodeTimings(filepath).durations
+        assert set(durations) == {n.name for n in chained_pipeline.nodes}
+
+    def test_chained_data_sets_held_by_worker(self, chained_pipeline, mocker):
+        runner = ParallelRunner(fuse_chains=True)
+        create = mocker.spy(runner, "create_default_data_set")
+        runner.run(chained_pipeline, DataCatalog(feed_dict={"A": 42}))
+        chained = {
+            call.args[0]
+            for call, data_set in zip(create.call_args_list, create.spy_return_list)
+            if isinstance(data_set, _ChainDataset)
+        }
+        assert chained == {"B", "C"}
+
+        data_set = _ChainDataset()
+        pattern = "only held by the worker running the chain"
+        with pytest.raises(DatasetError, match=pattern):
+            data_set.load()
+        with pytest.raises(DatasetError, match=pattern):
+            data_set.save(42)
+
+    def test_node_failure_in_chain(self):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(exception_fn, "B", "C", name="failing"),
+                node(identity, "C", "D", name="last"),
+            ]
+        )
+        catalog = DataCatalog(feed_dict={"A": 42})
+        with pytest.raises(Exception, match="test exception"):
+            ParallelRunner(fuse_chains=True).run(test_pipeline, catalog)
+
+
 @pytest.mark.skipif(
     sys.platform.startswith("win"), reason="Due to bug in parallel runner"
 )
@@ -409,3 +671,118 @@ class TestRunNodeSynchronisationHelper:
         )
         mock_run_node.assert_called_once()
         mock_logging.assert_not_called()
+
+
+class TestBootstrapWorker:
+    @pytest.fixture(autouse=True)
+    def mock_logging(self, mocker):
+        return mocker.patch("logging.config.dictConfig")
+
+    @pytest.fixture(autouse=True)
+    def worker_state(self, mocker):
+        return mocker.patch(
+            "kedro.runner.parallel_runner._worker_state", _WorkerState()
+        )
+
+    @pytest.fixture
+    def mock_run_node(self, mocker):
+        return mocker.patch("kedro.runner.parallel_runner.run_node")
+
+    def test_hook_manager_created_once(self, mock_run_node, mocker):
+        mocker.patch("multiprocessing.get_start_method", return_value="fork")
+        create_hook_manager = mocker.patch(
+            "kedro.runner.parallel_runner._create_hook_manager"
+        )
+        _bootstrap_worker("fake_package", {"fake_logging_config": True})
+        for _ in range(3):
+            _run_node_synchronization(mocker.sentinel.node, mocker.sentinel.catalog)
+
+        create_hook_manager.assert_called_once_with()
+        assert mock_run_node.call_count == 3
+        assert mock_run_node.call_args[0][2] is create_hook_manager.return_value
+
+    def test_project_configured_under_spawn(self, mock_logging, mocker):
+        mocker.patch("multiprocessing.get_start_method", return_value="spawn")
+        mock_configure_project = mocker.patch(
+            "kedro.framework.project.configure_project"
+        )
+        _bootstrap_worker("fake_package", {"fake_logging_config": True})
+
+        mock_configure_project.assert_called_once_with("fake_package")
+        mock_logging.assert_called_once_with({"fake_logging_config": True})
+
+
+class TestWorkerRunPayload:
+    @pytest.fixture(autouse=True)
+    def worker_state(self, mocker):
+        return mocker.patch(
+            "kedro.runner.parallel_runner._worker_state", _WorkerState()
+        )
+
+    @pytest.fixture
+    def run_payloads(self, mocker, fan_out_fan_in, worker_state):
+        catalog = DataCatalog(feed_dict={"A": 42})
+        payloads = mocker.MagicMock()
+        payloads.__getitem__.return_value = pickle.dumps(
+            (catalog, tuple(fan_out_fan_in.nodes))
+        )
+        worker_state.run_payloads = payloads
+        return payloads
+
+    def test_payload_fetched_once_per_run(self, mocker, run_payloads):
+        mock_run_node = mocker.patch("kedro.runner.parallel_runner.run_node")
+        for node_id in range(3):
+            assert _run_node_by_id("run_1", node_id) == node_id
+        run_payloads.__getitem__.assert_called_once_with("run_1")
+        assert mock_run_node.call_count == 3
+        assert mock_run_node.call_args[0][0].name == "identity([B]) -> [D]"
+
+        _run_node_by_id("run_2", 0)
+        assert run_payloads.__getitem__.call_count == 2
+
+    def test_io_executor_created_once(self, mocker, run_payloads):
+        mock_run_node = mocker.patch("kedro.runner.parallel_runner.run_node")
+        _run_node_by_id("run_1", 0, is_async=True, io_workers=2)
+        _run_node_by_id("run_1", 1, is_async=True, io_workers=2)
+
+        first, second = (call.args[5] for call in mock_run_node.call_args_list)
+        assert isinstance(first, IOExecutor)
+        assert first is second
+        assert first.max_workers == 2
+        first.shutdown()
+
+        _run_node_by_id("run_1", 2)
+        assert mock_run_node.call_args.args[5] is None
+
+    def test_run_chain(self, mocker, worker_state):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="second"),
+                node(identity, "C", "D", name="third"),
+            ]
+        )
+        catalog = DataCatalog({"D": MemoryDataset()}, feed_dict={"A": 42})
+        payloads = mocker.MagicMock()
+        payloads.__getitem__.return_value = pickle.dumps(
+            (catalog, tuple(test_pipeline.nodes))
+        )
+        worker_state.run_payloads = payloads
+
+        durations = _run_chain_by_id("run_1", (0, 1, 2))
+        assert len(durations) == 3
+        worker_catalog, _ = _get_worker_run("run_1")
+        assert worker_catalog.load("D") == 42
+        # the datasets passed along the chain are only held by the chain
+        assert sorted(worker_catalog.list()) == ["A", "D"]
+
+    def test_worker_catalog_subset(self, fan_out_fan_in):
+        catalog = DataCatalog(
+            {"A": MemoryDataset(42), "unused": MemoryDataset(0)},
+            layers={"raw": {"A", "unused"}},
+        )
+        plan = ExecutionPlan.from_pipeline(fan_out_fan_in)
+        worker_catalog = ParallelRunner._worker_catalog(catalog, plan.data_sets)
+        assert worker_catalog.list() == ["A"]
+        assert worker_catalog.load("A") == 42
+        assert worker_catalog.layers == catalog.layers
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from kedro.io import DataCatalog, DatasetError, LambdaDataset, MemoryDataset
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import ExecutionPlan, Prefetcher
+from tests.runner.conftest import identity
+
+
+def add(*args):
+    return sum(args)
+
+
+class CountingDataset(LambdaDataset):
+    def __init__(self, value=1, release=None):
+        self.loads = 0
+        self._release_event = release
+
+        def load():
+            if self._release_event is not None:
+                self._release_event.wait(5)
+            self.loads += 1
+            return value
+
+        super().__init__(load=load, save=lambda data: None)
+
+
+@pytest.fixture
+def chain():
+    return modular_pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(add, ["B", "C"], "D", name="second"),
+            node(add, ["D", "E"], "F", name="third"),
+        ]
+    )
+
+
+@pytest.fixture
+def catalog():
+    return DataCatalog(
+        {
+            "A": CountingDataset(),
+            "B": CountingDataset(),
+            "C": CountingDataset(),
+            "E": MemoryDataset(1),
+        }
+    )
+
+
+def start(prefetcher, test_pipeline, catalog):
+    plan = ExecutionPlan.from_pipeline(test_pipeline)
+    prefetcher.start(plan, catalog)
+    return {n.name: n for n in plan.nodes}
+
+
+class TestPrefetcher:
+    def test_prefetch_next_nodes(self, chain, catalog):
+        prefetcher = Prefetcher(lookahead=1)
+        nodes = start(prefetcher, chain, catalog)
+
+        prefetcher.node_started(nodes["first"])
+        # 'B' is only prefetched once 'first' has completed
+        assert set(prefetcher._futures) == {(1, "C")}
+        assert prefetcher.load(nodes["second"], "C") == 1
+        assert catalog._data_sets["C"].loads == 1
+        assert prefetcher.prefetched_size == 0
+
+        prefetcher.node_started(nodes["second"])
+        # the inputs held in memory are not prefetched
+        assert not prefetcher._futures
+        prefetcher.close()
+
+    def test_prefetch_after_producer_completed(self, chain, catalog):
+        prefetcher = Prefetcher(lookahead=2)
+        nodes = start(prefetcher, chain, catalog)
+
+        prefetcher.node_started(nodes["first"])
+        assert set(prefetcher._futures) == {(1, "C")}
+        prefetcher.node_started(nodes["second"])
+        assert set(prefetcher._futures) == {(1, "C")}
+        prefetcher.close()
+
+    def test_prefetch_transcoded_after_producer_completed(self, catalog):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B@w", name="first"),
+                node(identity, "B@r", "D", name="second"),
+            ]
+        )
+        catalog.add("B@r", CountingDataset())
+        prefetcher = Prefetcher(lookahead=1)
+        nodes = start(prefetcher, test_pipeline, catalog)
+
+        prefetcher.node_started(nodes["first"])
+        assert not prefetcher._futures
+        prefetcher.close()
+
+    def test_load_not_prefetched(self, chain, catalog):
+        prefetcher = Prefetcher(lookahead=1)
+        nodes = start(prefetcher, chain, catalog)
+        assert prefetcher.load(nodes["first"], "A") == 1
+        assert prefetcher.load(nodes["third"], "E") == 1
+        prefetcher.close()
+
+    def test_load_each_consumer(self, catalog):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "C", "D", name="second"),
+                node(identity, "C", "E", name="third"),
+            ]
+        )
+        prefetcher = Prefetcher(lookahead=2)
+        nodes = start(prefetcher, test_pipeline, catalog)
+        prefetcher.node_started(nodes["first"])
+        assert prefetcher.load(nodes["second"], "C") == 1
+        assert prefetcher.load(nodes["third"], "C") == 1
+        assert catalog._data_sets["C"].loads == 2
+        prefetcher.close()
+
+    def test_max_memory(self, chain, catalog):
+        catalog.add("E", CountingDataset(), replace=True)
+        prefetcher = Prefetcher(lookahead=1, max_memory=1)
+        nodes = start(prefetcher, chain, catalog)
+
+        prefetcher.node_started(nodes["first"])
+        prefetcher._futures[(1, "C")].result()
+        assert prefetcher.prefetched_size > 0
+        prefetcher.node_started(nodes["second"])
+        # no more data is prefetched until the data prefetched is used
+        assert set(prefetcher._futures) == {(1, "C")}
+
+        prefetcher.load(nodes["second"], "C")
+        prefetcher.node_started(nodes["second"])
+        assert set(prefetcher._futures) == {(2, "E")}
+        prefetcher.close()
+
+    def test_load_error(self, chain, catalog):
+        def fail():
+            raise ValueError("cannot load")
+
+        catalog.add("C", LambdaDataset(load=fail, save=None), replace=True)
+        prefetcher = Prefetcher(lookahead=1)
+        nodes = start(prefetcher, chain, catalog)
+        prefetcher.node_started(nodes["first"])
+        with pytest.raises(DatasetError, match="cannot load"):
+            prefetcher.load(nodes["second"], "C")
+        prefetcher.close()
+
+    def test_close(self, catalog):
+        release = threading.Event()
+        catalog.add("C", CountingDataset(release=release), replace=True)
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "C", "D", name="second"),
+                node(identity, "A", "E", name="third"),
+            ]
+        )
+        prefetcher = Prefetcher(lookahead=2, max_workers=1)
+        nodes = start(prefetcher, test_pipeline, catalog)
+        prefetcher.node_started(nodes["first"])
+        pending = prefetcher._futures[(2, "A")]
+
+        prefetcher.close()
+        release.set()
+        assert pending.cancelled()
+        assert catalog._data_sets["A"].loads == 0
+        assert prefetcher.prefetched_size == 0
+
+    @pytest.mark.parametrize("lookahead", [0, -1])
+    def test_invalid_lookahead(self, lookahead):
+        with pytest.raises(ValueError, match="lookahead should be positive"):
+            Prefetcher(lookahead)
+
+    def test_invalid_max_memory(self):
+        with pytest.raises(ValueError, match="Invalid memory size"):
+            Prefetcher(1, max_memory="lots")
+
+    def test_properties(self):
+        prefetcher = Prefetcher(2, max_memory="1KB")
+        assert prefetcher.lookahead == 2
+        assert prefetcher.max_memory == 1000
+
+    def test_load_in_progress_when_closed(self, catalog):
+        release = threading.Event()
+        catalog.add("C", CountingDataset(release=release), replace=True)
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "C", "D", name="second"),
+            ]
+        )
+        prefetcher = Prefetcher(lookahead=1)
+        nodes = start(prefetcher, test_pipeline, catalog)
+        prefetcher.node_started(nodes["first"])
+        in_progress = prefetcher._futures[(1, "C")]
+
+        prefetcher.close()
+        release.set()
+        in_progress.result()
+        assert prefetcher.prefetched_size == 0
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pytest
+
+from kedro.io import DataCatalog, LambdaDataset, MemoryDataset
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import ExecutionPlan, RunCache, SequentialRunner, ThreadRunner
+from tests.runner.conftest import fan_in, identity
+
+DATA = b"x" * 1000
+
+
+class CountingDataset(LambdaDataset):
+    def __init__(self):
+        self.loads = 0
+        self.saved = None
+
+        def load():
+            self.loads += 1
+            return self.saved
+
+        def save(data):
+            self.saved = data
+
+        super().__init__(load=load, save=save)
+
+
+@pytest.fixture
+def fan_out():
+    # 'B' is saved once and used by three nodes
+    return modular_pipeline(
+        [
+            node(identity, "A", "B", name="produce"),
+            node(identity, "B", "C", name="first"),
+            node(identity, "B", "D", name="second"),
+            node(fan_in, ["B", "C", "D"], "E", name="third"),
+        ]
+    )
+
+
+@pytest.fixture
+def catalog():
+    return DataCatalog(
+        {"A": MemoryDataset(DATA), "B": CountingDataset(), "E": CountingDataset()}
+    )
+
+
+class TestRunCache:
+    def test_data_sets(self, fan_out, catalog):
+        run_cache = RunCache()
+        run_cache.start(ExecutionPlan.from_pipeline(fan_out), catalog)
+        # 'E' is not used in the run, and 'A' is not an output
+        assert run_cache.data_sets == {"B"}
+
+    def test_put_and_load(self, fan_out, catalog):
+        run_cache = RunCache()
+        run_cache.start(ExecutionPlan.from_pipeline(fan_out), catalog)
+        data = [1]
+        run_cache.put("B", data)
+        run_cache.put("C", data)
+        assert run_cache.holds("B")
+        assert not run_cache.holds("C")
+        assert run_cache.load("B") == data
+        assert run_cache.load("B") is not data
+        assert run_cache.size > 0
+
+        run_cache.release("B")
+        assert not run_cache.holds("B")
+        assert run_cache.size == 0
+
+    def test_max_memory(self, fan_out, catalog, caplog):
+        caplog.set_level("DEBUG", logger="kedro.runner.run_cache")
+        run_cache = RunCache(max_memory=len(DATA) - 1)
+        run_cache.start(ExecutionPlan.from_pipeline(fan_out), catalog)
+        run_cache.put("B", DATA)
+        assert not run_cache.holds("B")
+        assert "Not keeping 'B' in memory" in caplog.text
+
+    def test_exclude(self, fan_out, catalog):
+        run_cache = RunCache(exclude=["B"])
+        run_cache.start(ExecutionPlan.from_pipeline(fan_out), catalog)
+        assert not run_cache.data_sets
+
+    def test_close(self, fan_out, catalog):
+        run_cache = RunCache(max_memory="1KB")
+        run_cache.start(ExecutionPlan.from_pipeline(fan_out), catalog)
+        run_cache.put("B", [1])
+        run_cache.close()
+        assert not run_cache.holds("B")
+        assert run_cache.max_memory == 1000
+
+    def test_invalid_max_memory(self):
+        with pytest.raises(ValueError, match="Invalid memory size"):
+            RunCache(max_memory="lots")
+
+
+@pytest.mark.parametrize(
+    "runner_factory",
+    [
+        lambda run_cache: SequentialRunner(run_cache=run_cache),
+        lambda run_cache: SequentialRunner(is_async=True, run_cache=run_cache),
+        lambda run_cache: ThreadRunner(run_cache=run_cache),
+    ],
+)
+class TestRunnerRunCache:
+    def test_load_from_memory(self, runner_factory, fan_out, catalog, mocker):
+        release = mocker.spy(RunCache, "release")
+        runner_factory(RunCache()).run(fan_out, catalog)
+        assert catalog._data_sets["B"].loads == 0
+        assert catalog._data_sets["E"].saved == (DATA, DATA, DATA)
+        release.assert_any_call(mocker.ANY, "B")
+
+    def test_not_kept(self, runner_factory, fan_out, catalog):
+        runner_factory(RunCache(exclude=["B"])).run(fan_out, catalog)
+        assert catalog._data_sets["B"].loads == 3
+
+    def test_without_run_cache(self, runner_factory, fan_out, catalog):
+        runner_factory(None).run(fan_out, catalog)
+        assert catalog._data_sets["B"].loads == 3
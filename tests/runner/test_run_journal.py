@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from kedro.extras.datasets.pickle import PickleDataSet
+from kedro.io import DataCatalog, LambdaDataset, MemoryDataset, Version
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import (
+    AsyncRunner,
+    ParallelRunner,
+    RunJournal,
+    SequentialRunner,
+    ThreadRunner,
+)
+from tests.runner.conftest import exception_fn, identity
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return RunJournal(tmp_path / "session" / "run_journal.jsonl")
+
+
+@pytest.fixture
+def chain():
+    # A -> first -> B (persisted) -> second -> C (memory) -> third -> D
+    return modular_pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="second"),
+            node(identity, "C", "D", name="third"),
+        ]
+    )
+
+
+@pytest.fixture
+def versioned_catalog(tmp_path):
+    return DataCatalog(
+        {
+            "A": MemoryDataset(1),
+            "B": PickleDataSet(
+                filepath=(tmp_path / "B.pkl").as_posix(), version=Version(None, "v1")
+            ),
+        }
+    )
+
+
+class TestRunJournalRecord:
+    def test_record(self, journal, tmp_path):
+        catalog = DataCatalog(
+            {
+                "versioned": PickleDataSet(
+                    filepath=(tmp_path / "a.pkl").as_posix(),
+                    version=Version(None, "v1"),
+                ),
+                "unversioned": PickleDataSet(filepath=(tmp_path / "b.pkl").as_posix()),
+                "memory": MemoryDataset(),
+            }
+        )
+        catalog.add("default", object())  # e.g. the shared datasets of processes
+        journal.record(
+            node(
+                identity,
+                "A",
+                ["versioned", "unversioned", "memory", "default"],
+                name="n",
+            ),
+            catalog,
+        )
+        assert journal.load() == {"n": {"versioned": "v1", "unversioned": None}}
+
+    def test_load_nothing_recorded(self, journal):
+        assert not journal.exists()
+        assert journal.load() == {}
+
+    def test_load_later_records_first(self, journal):
+        journal.extend({"n": {"B": "v1"}, "m": {}})
+        journal.extend({"n": {"B": "v2"}})
+        assert journal.load() == {"n": {"B": "v2"}, "m": {}}
+
+    def test_load_incomplete_record(self, journal, caplog):
+        journal.extend({"n": {}})
+        with journal.filepath.open("a") as file:
+            file.write('{"m": {')
+        assert journal.load() == {"n": {}}
+        assert "Ignoring incomplete record" in caplog.text
+
+    def test_clear(self, journal):
+        journal.extend({"n": {}})
+        journal.clear()
+        journal.clear()
+        assert not journal.exists()
+
+
+class TestRunJournalResume:
+    def test_nothing_completed(self, journal, chain):
+        to_run, load_versions = journal.resume(chain)
+        assert to_run.nodes == chain.nodes
+        assert load_versions == {}
+
+    def test_load_persisted_versions(self, journal, chain):
+        journal.extend({"first": {"B": "v1"}, "second": {"C": "v2"}})
+        to_run, load_versions = journal.resume(chain)
+        assert [n.name for n in to_run.nodes] == ["third"]
+        assert load_versions == {"C": "v2"}
+
+    def test_recompute_outputs_in_memory(self, journal, chain):
+        journal.extend({"first": {"B": "v1"}, "second": {}})
+        to_run, load_versions = journal.resume(chain)
+        assert [n.name for n in to_run.nodes] == ["second", "third"]
+        assert load_versions == {"B": "v1"}
+
+    def test_recompute_chain_in_memory(self, journal, chain):
+        journal.extend({"first": {}, "second": {}})
+        to_run, load_versions = journal.resume(chain)
+        assert to_run.nodes == chain.nodes
+        assert load_versions == {}
+
+
+class TestRunnerJournal:
+    @pytest.mark.parametrize(
+        "runner", [SequentialRunner(), ThreadRunner(), AsyncRunner(), ParallelRunner()]
+    )
+    def test_record_completed(self, journal, chain, versioned_catalog, runner):
+        runner.journal = journal
+        runner.run(chain, versioned_catalog)
+        assert journal.load() == {"first": {"B": "v1"}, "second": {}, "third": {}}
+
+    def test_failed_run(self, journal, chain, versioned_catalog, caplog):
+        caplog.set_level(logging.WARNING)
+        failing = chain + modular_pipeline(
+            [node(exception_fn, "B", "E", name="failing")]
+        )
+        runner = SequentialRunner()
+        runner.journal = journal
+        with pytest.raises(Exception, match="test exception"):
+            runner.run(failing, versioned_catalog)
+
+        assert "first" in journal.load()
+        assert "failing" not in journal.load()
+        assert "recorded in the run journal" in caplog.text
+        assert "--from-nodes" not in caplog.text
+
+    def test_resume_saved_version(self, journal, chain, tmp_path):
+        filepath = (tmp_path / "B.pkl").as_posix()
+        PickleDataSet(filepath=filepath, version=Version(None, "v1")).save(1)
+        # a later run saved a newer version
+        PickleDataSet(filepath=filepath, version=Version(None, "v2")).save(2)
+        journal.extend({"first": {"B": "v1"}})
+
+        to_run, load_versions = journal.resume(chain)
+        catalog = DataCatalog(
+            {
+                "B": PickleDataSet(
+                    filepath=filepath, version=Version(load_versions["B"], "v3")
+                )
+            }
+        )
+        assert SequentialRunner().run(to_run, catalog) == {"D": 1}
+
+    def test_not_recorded_without_journal(self, journal, chain):
+        runner = SequentialRunner()
+        assert runner.journal is None
+        runner.journal = journal
+        runner.run(chain, DataCatalog({"A": MemoryDataset(1)}))
+        journal.clear()
+        runner.journal = None
+        runner.run(chain, DataCatalog({"A": LambdaDataset(lambda: 1, None)}))
+        assert not journal.exists()
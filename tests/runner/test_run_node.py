@@ -1,8 +1,9 @@
 import pytest
 
 from kedro.framework.hooks.manager import _NullPluginManager
+from kedro.io import MemoryDataset
 from kedro.pipeline import node
-from kedro.runner import run_node
+from kedro.runner import IOExecutor, run_node
 
 
 def generate_one():
@@ -87,3 +88,27 @@ class TestRunGeneratorNode:
         assert left.save.call_args_list == expected_left
         assert 10 == right.save.call_count
         assert right.save.call_args_list == expected_right
+
+
+class TestRunNodeIOExecutor:
+    def test_shared_io_executor(self, mocker, catalog):
+        thread_pool = mocker.patch("kedro.runner.runner.ThreadPoolExecutor")
+        catalog.add_feed_dict({"A": 42, "B": MemoryDataset(), "C": MemoryDataset()})
+        n = node(lambda x: (x, x), "A", ["B", "C"])
+        with IOExecutor(max_workers=1) as io_executor:
+            run_node(n, catalog, _NullPluginManager(), True, io_executor=io_executor)
+
+        thread_pool.assert_not_called()
+        assert io_executor.task_count == 3
+        assert catalog.load("B") == catalog.load("C") == 42
+
+    def test_io_executor_save_error(self, mocker, catalog):
+        failing = mocker.Mock()
+        failing.save.side_effect = ValueError("save failed")
+        catalog.add("B", failing)
+        n = node(lambda: 42, None, "B")
+        with IOExecutor() as io_executor:
+            with pytest.raises(ValueError, match="save failed"):
+                run_node(
+                    n, catalog, _NullPluginManager(), True, io_executor=io_executor
+                )
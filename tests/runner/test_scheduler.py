@@ -0,0 +1,180 @@
+import json
+
+import pytest
+
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import (
+    CriticalPathScheduler,
+    DependencyScheduler,
+    ExecutionPlan,
+    NodeTimings,
+)
+from kedro.runner.scheduler import create_scheduler
+from tests.runner.conftest import identity
+
+
+@pytest.fixture
+def scheduler(fan_out_fan_in):
+    return DependencyScheduler(ExecutionPlan.from_pipeline(fan_out_fan_in))
+
+
+def _names(nodes):
+    return [n.name for n in nodes]
+
+
+class TestDependencyScheduler:
+    def test_initial_ready_nodes(self, scheduler):
+        assert scheduler.has_ready
+        ready = scheduler.pop_ready()
+        assert _names(ready) == ["identity([A]) -> [B]"]
+        assert not scheduler.has_ready
+        assert not scheduler.finished
+
+    def test_children_ready_after_completion(self, scheduler):
+        (first,) = scheduler.pop_ready()
+        assert scheduler.pop_ready() == []
+        scheduler.complete(first)
+        ready = scheduler.pop_ready()
+        assert _names(ready) == [
+            "identity([B]) -> [C]",
+            "identity([B]) -> [D]",
+            "identity([B]) -> [E]",
+        ]
+
+    def test_fan_in_waits_for_all_parents(self, scheduler):
+        scheduler.complete(*scheduler.pop_ready())
+        middle = scheduler.pop_ready()
+        for node_ in middle[:-1]:
+            scheduler.complete(node_)
+            assert not scheduler.has_ready
+        scheduler.complete(middle[-1])
+        (last,) = scheduler.pop_ready()
+        assert last.name == "fan_in([C,D,E]) -> [Z]"
+        scheduler.complete(last)
+        assert scheduler.finished
+        assert scheduler.completed_count == len(scheduler.plan)
+
+    def test_pop_ready_limit(self, scheduler):
+        scheduler.complete(*scheduler.pop_ready())
+        assert len(scheduler.pop_ready(limit=2)) == 2
+        assert len(scheduler.pop_ready(limit=2)) == 1
+        assert scheduler.pop_ready(limit=2) == []
+
+    def test_todo_nodes(self, scheduler, fan_out_fan_in):
+        assert scheduler.todo_nodes == set(fan_out_fan_in.nodes)
+        (first,) = scheduler.pop_ready()
+        assert scheduler.todo_nodes == set(fan_out_fan_in.nodes) - {first}
+
+    def test_complete_chain(self, unbalanced_pipeline):
+        plan = ExecutionPlan.from_pipeline(unbalanced_pipeline)
+        scheduler = DependencyScheduler(plan)
+        nodes = {n.name: n for n in plan.nodes}
+        assert _names(scheduler.pop_ready()) == ["long_1", "short"]
+
+        scheduler.complete_chain([nodes["long_1"], nodes["long_2"], nodes["long_3"]])
+        # the nodes of the chain are never handed out
+        assert scheduler.pop_ready() == []
+        assert scheduler.completed_count == 3
+        scheduler.complete_chain([nodes["short"]])
+        assert scheduler.finished
+
+    def test_independent_nodes_in_topological_order(
+        self, two_branches_crossed_pipeline
+    ):
+        plan = ExecutionPlan.from_pipeline(two_branches_crossed_pipeline)
+        scheduler = DependencyScheduler(plan)
+        order = []
+        while not scheduler.finished:
+            ready = scheduler.pop_ready()
+            order.extend(ready)
+            for node_ in ready:
+                scheduler.complete(node_)
+        assert order == list(plan.nodes)
+
+
+@pytest.fixture
+def unbalanced_pipeline():
+    """A short branch ``A -> B`` and a long branch ``C -> D -> E -> F``."""
+    return modular_pipeline(
+        [
+            node(identity, "A", "B", name="short"),
+            node(identity, "C", "D", name="long_1"),
+            node(identity, "D", "E", name="long_2"),
+            node(identity, "E", "F", name="long_3"),
+        ]
+    )
+
+
+class TestCriticalPathScheduler:
+    def test_longest_chain_first_without_history(self, unbalanced_pipeline):
+        plan = ExecutionPlan.from_pipeline(unbalanced_pipeline)
+        scheduler = CriticalPathScheduler(plan)
+        assert _names(scheduler.pop_ready()) == ["long_1", "short"]
+
+    def test_path_length(self, unbalanced_pipeline):
+        plan = ExecutionPlan.from_pipeline(unbalanced_pipeline)
+        scheduler = CriticalPathScheduler(plan, {"long_1": 2.0, "long_3": 4.0})
+        lengths = {n.name: scheduler.path_length(n) for n in plan.nodes}
+        # unknown nodes are estimated with the mean of the known durations
+        assert lengths == {"short": 3.0, "long_1": 9.0, "long_2": 7.0, "long_3": 4.0}
+
+    def test_uses_node_durations(self, unbalanced_pipeline):
+        plan = ExecutionPlan.from_pipeline(unbalanced_pipeline)
+        durations = {"short": 10.0, "long_1": 1.0, "long_2": 1.0, "long_3": 1.0}
+        scheduler = CriticalPathScheduler(plan, durations)
+        assert _names(scheduler.pop_ready(limit=1)) == ["short"]
+
+    def test_fan_in_waits_for_all_parents(self, fan_out_fan_in):
+        scheduler = CriticalPathScheduler(ExecutionPlan.from_pipeline(fan_out_fan_in))
+        order = []
+        while not scheduler.finished:
+            (node_,) = scheduler.pop_ready(limit=1)
+            order.append(node_)
+            scheduler.complete(node_)
+        assert order[0].name == "identity([A]) -> [B]"
+        assert order[-1].name == "fan_in([C,D,E]) -> [Z]"
+
+
+class TestCreateScheduler:
+    def test_topological(self, fan_out_fan_in):
+        plan = ExecutionPlan.from_pipeline(fan_out_fan_in)
+        assert type(create_scheduler("topological", plan)) is DependencyScheduler
+
+    def test_critical_path(self, unbalanced_pipeline):
+        plan = ExecutionPlan.from_pipeline(unbalanced_pipeline)
+        timings = NodeTimings()
+        for name, duration in [("short", 10), ("long_1", 1), ("long_2", 1)]:
+            timings.record(name, duration)
+        scheduler = create_scheduler("critical-path", plan, timings)
+        assert isinstance(scheduler, CriticalPathScheduler)
+        assert _names(scheduler.pop_ready(limit=1)) == ["short"]
+
+    def test_unknown(self, fan_out_fan_in):
+        plan = ExecutionPlan.from_pipeline(fan_out_fan_in)
+        with pytest.raises(ValueError, match="Unknown scheduler 'fastest'"):
+            create_scheduler("fastest", plan)
+
+
+class TestNodeTimings:
+    def test_record(self):
+        timings = NodeTimings()
+        timings.record("a", 2.0)
+        assert timings.durations == {"a": 2.0}
+        timings.record("a", 4.0)
+        assert timings.durations == {"a": 3.0}
+        timings.save()
+
+    def test_save_and_load(self, tmp_path):
+        filepath = tmp_path / "sessions" / "node_timings.json"
+        timings = NodeTimings(filepath)
+        timings.record("a", 2.0)
+        timings.save()
+        assert json.loads(filepath.read_text()) == {"a": 2.0}
+        assert NodeTimings(filepath).durations == {"a": 2.0}
+
+    def test_malformed_file(self, tmp_path, caplog):
+        filepath = tmp_path / "node_timings.json"
+        filepath.write_text("[1, 2]")
+        assert NodeTimings(filepath).durations == {}
+        assert "Ignoring malformed node timings" in caplog.text
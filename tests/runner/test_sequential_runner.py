@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import re
+import threading
+import time
 from typing import Any
 
 import pandas as pd
 import pytest
 
-from kedro.framework.hooks import _create_hook_manager
+from kedro.framework.hooks import _create_hook_manager, hook_impl
 from kedro.io import AbstractDataSet, DataCatalog, DatasetError, LambdaDataset
 from kedro.pipeline import node
 from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
-from kedro.runner import SequentialRunner
-from tests.runner.conftest import exception_fn, identity, sink, source
+from kedro.runner import (
+    NodeCache,
+    NodeTimings,
+    Prefetcher,
+    RunJournal,
+    SequentialRunner,
+)
+from kedro.runner import runner as runner_module
+from tests.runner.conftest import exception_fn, fan_in, identity, sink, source
 
 
 class TestValidSequentialRunner:
@@ -30,6 +39,391 @@ class TestValidSequentialRunner:
         assert result["Z"] == (42, 42, 42)
 
 
+class TestIOExecutor:
+    def test_shared_by_all_nodes(self, mocker, fan_out_fan_in, catalog):
+        thread_pool = mocker.patch("kedro.runner.runner.ThreadPoolExecutor")
+        io_executor = mocker.spy(runner_module, "IOExecutor")
+        catalog.add_feed_dict({"A": 42})
+        runner = SequentialRunner(is_async=True, io_workers=2)
+        result = runner.run(fan_out_fan_in, catalog)
+
+        assert result["Z"] == (42, 42, 42)
+        io_executor.assert_called_once_with(2)
+        thread_pool.assert_not_called()
+        assert runner._io_executor is None
+
+    def test_metrics_logged(self, fan_out_fan_in, catalog, caplog):
+        catalog.add_feed_dict({"A": 42})
+        SequentialRunner(is_async=True, io_workers=2).run(fan_out_fan_in, catalog)
+        # 5 nodes, loading 7 and saving 5 datasets
+        assert "Loaded and saved data in 12 tasks on up to 2 threads" in caplog.text
+
+    def test_not_created_without_is_async(self, mocker, fan_out_fan_in, catalog):
+        io_executor = mocker.spy(runner_module, "IOExecutor")
+        catalog.add_feed_dict({"A": 42})
+        SequentialRunner(io_workers=2).run(fan_out_fan_in, catalog)
+        io_executor.assert_not_called()
+
+
+class TestTransferOwnership:
+    def test_transfer_to_last_consumer(self):
+        produced, received = [], {}
+
+        def produce(arg):
+            produced.append([arg])
+            return produced[-1]
+
+        def record(name):
+            def func(arg):
+                received[name] = arg
+                return arg
+
+            return func
+
+        test_pipeline = modular_pipeline(
+            [
+                node(produce, "A", "B", name="produce"),
+                node(record("first"), "B", "C", name="first"),
+                node(record("second"), "B", "D", name="second"),
+            ]
+        )
+        catalog = DataCatalog(feed_dict={"A": 1})
+        result = SequentialRunner(transfer_ownership=True).run(test_pipeline, catalog)
+
+        assert result == {"C": [1], "D": [1]}
+        # the last consumer receives the data produced, the other a copy
+        assert [data is produced[0] for data in received.values()].count(True) == 1
+        # the outputs of the pipeline are handed over without a copy
+        assert result["C"] is received["first"]
+        assert result["D"] is received["second"]
+
+    def test_not_copied(self, mocker):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="second"),
+            ]
+        )
+        data = pd.DataFrame({"col": [1, 2]})
+        catalog = DataCatalog(feed_dict={"A": data})
+        copy = mocker.spy(pd.DataFrame, "copy")
+        result = SequentialRunner(transfer_ownership=True).run(test_pipeline, catalog)
+
+        # only the free input registered in the catalog is copied
+        assert copy.call_count == 1
+        assert result["C"].equals(data)
+
+
+class TestMaxMemory:
+    def test_spill(self, caplog):
+        test_pipeline = modular_pipeline(
+            [
+                node(lambda x: (x, x), "A", ["B", "C"], name="split"),
+                node(identity, "B", "D", name="first"),
+                node(lambda *args: b"".join(args), ["C", "D"], "E", name="second"),
+            ]
+        )
+        catalog = DataCatalog(feed_dict={"A": b"x" * 1000})
+        result = SequentialRunner(max_memory=1500).run(test_pipeline, catalog)
+
+        assert result == {"E": b"x" * 2000}
+        assert "Spilled 'C' to disk to stay within the memory budget." in caplog.text
+        assert "Spilled 'B'" not in caplog.text
+
+    def test_invalid_max_memory(self):
+        with pytest.raises(ValueError, match="Invalid memory size"):
+            SequentialRunner(max_memory="lots")
+
+
+class TestNodeTimings:
+    def test_timings_recorded(self, fan_out_fan_in, catalog, tmp_path):
+        catalog.add_feed_dict({"A": 42})
+        filepath = tmp_path / "node_timings.json"
+        runner = SequentialRunner(node_timings=NodeTimings(filepath))
+        assert runner.run(fan_out_fan_in, catalog) == {"Z": (42, 42, 42)}
+        durations = NodeTimings(filepath).durations
+        assert set(durations) == {n.name for n in fan_out_fan_in.nodes}
+
+    def test_timings_saved_on_failure(self, fan_out_fan_in, catalog, tmp_path):
+        catalog.add_feed_dict({"A": 42})
+        pipeline = modular_pipeline([fan_out_fan_in, node(exception_fn, "Z", "X")])
+        filepath = tmp_path / "node_timings.json"
+        runner = SequentialRunner(node_timings=NodeTimings(filepath))
+        with pytest.raises(Exception, match="test exception"):
+            runner.run(pipeline, catalog)
+        durations = NodeTimings(filepath).durations
+        assert set(durations) == {n.name for n in fan_out_fan_in.nodes}
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+class TestNodeCache:
+    def test_restore_unchanged_nodes(self, is_async, tmp_path, caplog):
+        calls = []
+
+        def double(arg):
+            calls.append(arg)
+            return arg * 2
+
+        test_pipeline = modular_pipeline(
+            [
+                node(double, "A", "B", name="first"),
+                node(double, "B", "C", name="second"),
+            ]
+        )
+        runner = SequentialRunner(is_async=is_async, node_cache=NodeCache(tmp_path))
+
+        def run(value):
+            return runner.run(test_pipeline, DataCatalog(feed_dict={"A": value}))
+
+        assert run(1) == {"C": 4}
+        assert run(1) == {"C": 4}
+        assert calls == [1, 2]
+        assert "Restored the outputs of node 'first'" in caplog.text
+
+        assert run(2) == {"C": 8}
+        assert calls == [1, 2, 2, 4]
+
+    def test_evict_after_run(self, is_async, tmp_path, mocker):
+        evict = mocker.patch.object(NodeCache, "evict")
+        test_pipeline = modular_pipeline([node(identity, "A", "B")])
+        runner = SequentialRunner(is_async=is_async, node_cache=NodeCache(tmp_path))
+        runner.run(test_pipeline, DataCatalog(feed_dict={"A": 42}))
+        evict.assert_called_once_with()
+
+
+class RecordingHooks:
+    def __init__(self):
+        self.calls = []
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name, node):
+        self.calls.append(("before_dataset_loaded", dataset_name, node.name))
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name, data, node):
+        self.calls.append(("after_dataset_loaded", dataset_name, node.name, data))
+
+    @hook_impl
+    def before_node_run(self, node):
+        self.calls.append(("before_node_run", node.name))
+
+    @hook_impl
+    def after_node_run(self, node):
+        self.calls.append(("after_node_run", node.name))
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+class TestPrefetch:
+    @pytest.fixture
+    def test_pipeline(self):
+        return modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(fan_in, ["B", "C"], "D", name="second"),
+                node(fan_in, ["D", "E"], "F", name="third"),
+            ]
+        )
+
+    @staticmethod
+    def make_catalog(saved):
+        return DataCatalog(
+            {
+                name: LambdaDataset(
+                    load=lambda name=name: saved.get(name, name),
+                    save=lambda data, name=name: saved.__setitem__(name, data),
+                )
+                for name in "ABCE"
+            }
+        )
+
+    def test_hooks_in_order(self, is_async, test_pipeline):
+        def run(runner):
+            hooks = RecordingHooks()
+            hook_manager = _create_hook_manager()
+            hook_manager.register(hooks)
+            result = runner.run(test_pipeline, self.make_catalog({}), hook_manager)
+            if not is_async:
+                return result, hooks.calls
+            # the inputs of a node are loaded concurrently when is_async is True
+            segments, segment = [], []
+            for call in hooks.calls:
+                if call[0].endswith("node_run"):
+                    segments.extend([sorted(segment, key=str), call])
+                    segment = []
+                else:
+                    segment.append(call)
+            return result, segments
+
+        expected = run(SequentialRunner(is_async=is_async))
+        assert run(SequentialRunner(is_async=is_async, prefetch=2)) == expected
+
+    def test_transcoded_input_after_producer(self, is_async):
+        stored = {"a": "STALE"}
+
+        def transcoded():
+            return LambdaDataset(
+                load=lambda: stored["a"],
+                save=lambda data: stored.__setitem__("a", data),
+            )
+
+        test_pipeline = modular_pipeline(
+            [
+                node(lambda: "FRESH", None, "a@w", name="producer"),
+                node(identity, "a@r", "res", name="consumer"),
+            ]
+        )
+        catalog = DataCatalog({"a@w": transcoded(), "a@r": transcoded()})
+        runner = SequentialRunner(is_async=is_async, prefetch=2)
+        assert runner.run(test_pipeline, catalog) == {"res": "FRESH"}
+
+    def test_close_on_failure(self, is_async, test_pipeline, mocker):
+        close = mocker.spy(Prefetcher, "close")
+        failing = test_pipeline + modular_pipeline(
+            [node(exception_fn, "F", "G", name="failing")]
+        )
+        runner = SequentialRunner(is_async=is_async, prefetch=1)
+        with pytest.raises(Exception, match="test exception"):
+            runner.run(failing, self.make_catalog({}))
+        close.assert_called_once()
+
+    def test_invalid_prefetch(self, is_async):
+        with pytest.raises(ValueError, match="lookahead should be positive"):
+            SequentialRunner(is_async=is_async, prefetch=0)
+
+
+@pytest.mark.parametrize("is_async", [False, True])
+class TestWriteBehind:
+    @pytest.fixture
+    def test_pipeline(self):
+        return modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="second"),
+                node(identity, "C", "D", name="third"),
+            ]
+        )
+
+    @staticmethod
+    def make_catalog(saved, save=None):
+        def default_save(name, data):
+            saved[name] = data
+
+        save = save or default_save
+        return DataCatalog(
+            {
+                "A": LambdaDataset(load=lambda: 42, save=None),
+                **{
+                    name: LambdaDataset(
+                        load=lambda name=name: saved[name],
+                        save=lambda data, name=name: save(name, data),
+                    )
+                    for name in "BD"
+                },
+            }
+        )
+
+    def test_save_while_next_nodes_run(self, is_async, test_pipeline, tmp_path):
+        saved = {}
+        second_ran = threading.Event()
+
+        def save(name, data):
+            # 'B' is saved once the node using it has run
+            if name == "B":
+                assert second_ran.wait(5)
+            saved[name] = data
+
+        def second(arg):
+            second_ran.set()
+            return arg
+
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(second, "B", "C", name="second"),
+                node(identity, "C", "D", name="third"),
+            ]
+        )
+        journal = RunJournal(tmp_path / "journal.jsonl")
+        runner = SequentialRunner(is_async=is_async, write_behind=True)
+        runner.journal = journal
+        runner.run(test_pipeline, self.make_catalog(saved, save))
+
+        assert saved == {"B": 42, "D": 42}
+        assert set(journal.load()) == {"first", "second", "third"}
+
+    def test_failed_write(self, is_async, test_pipeline, tmp_path, caplog):
+        def save(name, data):
+            raise ValueError(f"cannot save {name}")
+
+        journal = RunJournal(tmp_path / "journal.jsonl")
+        runner = SequentialRunner(is_async=is_async, write_behind=True)
+        runner.journal = journal
+        pattern = "Failed to save 'B', an output of node 'first'"
+        with pytest.raises(DatasetError, match=pattern):
+            runner.run(test_pipeline, self.make_catalog({}, save))
+        assert "first" not in journal.load()
+        assert f"{pattern}." in caplog.text
+
+    def test_failed_last_write(self, is_async, test_pipeline, tmp_path):
+        def save(name, data):
+            if name == "D":
+                raise ValueError("cannot save D")
+
+        journal = RunJournal(tmp_path / "journal.jsonl")
+        runner = SequentialRunner(is_async=is_async, write_behind=True)
+        runner.journal = journal
+        with pytest.raises(DatasetError, match="an output of node 'third'"):
+            runner.run(test_pipeline, self.make_catalog({}, save))
+        assert set(journal.load()) == {"first", "second"}
+
+    def test_node_failure_waits_for_writes(self, is_async, tmp_path):
+        saved = {}
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(exception_fn, "B", "C", name="failing"),
+            ]
+        )
+        journal = RunJournal(tmp_path / "journal.jsonl")
+        runner = SequentialRunner(is_async=is_async, write_behind=True)
+        runner.journal = journal
+        with pytest.raises(Exception, match="test exception"):
+            runner.run(test_pipeline, self.make_catalog(saved))
+        assert saved == {"B": 42}
+        assert set(journal.load()) == {"first"}
+
+    def test_prefetch_outputs_kept_in_memory(self, is_async, test_pipeline, mocker):
+        start = mocker.spy(Prefetcher, "start")
+        runner = SequentialRunner(is_async=is_async, prefetch=1, write_behind=True)
+        runner.run(test_pipeline, self.make_catalog({}))
+        assert start.call_args.kwargs["exclude"] == {"B", "D"}
+
+    @pytest.mark.parametrize("prefetch", [None, 2])
+    def test_transcoded_output_saved_before_load(self, is_async, prefetch):
+        stored = {"a": "STALE"}
+
+        def save(data):
+            time.sleep(0.2)
+            stored["a"] = data
+
+        test_pipeline = modular_pipeline(
+            [
+                node(lambda: "FRESH", None, "a@w", name="producer"),
+                node(identity, "a@r", "res", name="consumer"),
+            ]
+        )
+        catalog = DataCatalog(
+            {
+                "a@w": LambdaDataset(load=None, save=save),
+                "a@r": LambdaDataset(load=lambda: stored["a"], save=None),
+            }
+        )
+        runner = SequentialRunner(
+            is_async=is_async, prefetch=prefetch, write_behind=True
+        )
+        assert runner.run(test_pipeline, catalog) == {"res": "FRESH"}
+
+
 @pytest.mark.parametrize("is_async", [False, True])
 class TestSeqentialRunnerBranchlessPipeline:
     def test_no_input_seq(self, is_async, branchless_no_input_pipeline, catalog):
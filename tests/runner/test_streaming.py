@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from kedro.io import DataCatalog, DatasetError, MemoryDataset
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import DependencyScheduler, ExecutionPlan
+from kedro.runner.streaming import _StreamDataset, _StreamGroups
+from tests.runner.conftest import identity
+
+
+def produce(count):
+    yield from range(count)
+
+
+def _in_thread(func, *args):
+    thread = threading.Thread(target=func, args=args, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestStreamDataset:
+    def test_stream(self):
+        data_set = _StreamDataset(consumers=2, max_chunks=4)
+        first, second = data_set.load(), data_set.load()
+        for chunk in range(3):
+            data_set.save(chunk)
+        data_set.close()
+        assert list(first) == list(second) == [0, 1, 2]
+
+    def test_load_too_many_times(self):
+        data_set = _StreamDataset(consumers=1, max_chunks=1)
+        data_set.load()
+        with pytest.raises(DatasetError, match="loaded by all its consumers"):
+            data_set.load()
+
+    def test_backpressure(self):
+        data_set = _StreamDataset(consumers=1, max_chunks=1)
+        chunks = data_set.load()
+        data_set.save(0)
+        producer = _in_thread(data_set.save, 1)
+        # the producer keeps waiting after checking if the stream was aborted
+        producer.join(0.3)
+        assert producer.is_alive()
+
+        assert next(chunks) == 0
+        producer.join(5)
+        assert not producer.is_alive()
+
+    def test_detach(self):
+        data_set = _StreamDataset(consumers=2, max_chunks=1)
+        data_set.load()
+        data_set.load()
+        data_set.save(0)
+        producer = _in_thread(data_set.save, 1)
+        producer.join(0.1)
+        assert producer.is_alive()
+
+        # the consumers which loaded the stream in this thread completed
+        data_set.detach()
+        producer.join(5)
+        assert not producer.is_alive()
+        # the chunks of detached consumers are dropped
+        data_set.save(2)
+        data_set.close()
+        assert [queue.qsize() for queue in data_set._queues] == [1, 0]
+
+    def test_abort(self):
+        data_set = _StreamDataset(consumers=1, max_chunks=1)
+        chunks = data_set.load()
+        data_set.save(0)
+        data_set.abort()
+        with pytest.raises(DatasetError, match="stream was aborted"):
+            data_set.save(1)
+        with pytest.raises(DatasetError, match="stream was aborted"):
+            list(chunks)
+
+    def test_release(self):
+        data_set = _StreamDataset(consumers=1, max_chunks=2)
+        data_set.save(0)
+        data_set.release()
+        assert data_set.exists()
+        assert not data_set._queues[0].qsize()
+        assert "max_chunks=2" in str(data_set)
+
+
+class TestStreamGroups:
+    def test_streamed_data_sets(self):
+        test_pipeline = modular_pipeline(
+            [
+                node(produce, "count", "streamed"),
+                node(produce, "count", "registered"),
+                node(produce, "count", "free"),
+                node(identity, "count", "not_generated"),
+                node(identity, "streamed", "a"),
+                node(identity, "registered", "b"),
+                node(identity, "not_generated", "c"),
+            ]
+        )
+        catalog = DataCatalog({"registered": MemoryDataset()})
+        streams = _StreamGroups(test_pipeline, catalog, max_chunks=1)
+        assert streams.data_sets == {"streamed"}
+        assert isinstance(streams.create_data_set("streamed"), _StreamDataset)
+
+    def test_nothing_streamed_without_max_chunks(self):
+        test_pipeline = modular_pipeline(
+            [node(produce, "count", "chunks"), node(identity, "chunks", "a")]
+        )
+        streams = _StreamGroups(test_pipeline, DataCatalog(), max_chunks=None)
+        assert not streams.data_sets
+
+    def test_pop_ready(self):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "in", "count", name="before"),
+                node(produce, "count", "chunks", name="producer"),
+                node(identity, "chunks", "last", name="consumer"),
+                node(identity, "in", "other", name="other"),
+            ]
+        )
+        plan = ExecutionPlan.from_pipeline(test_pipeline)
+        scheduler = DependencyScheduler(plan)
+        streams = _StreamGroups(test_pipeline, DataCatalog(), max_chunks=1)
+        nodes = {n.name: n for n in test_pipeline.nodes}
+        before, producer, consumer = (
+            nodes[n] for n in ["before", "producer", "consumer"]
+        )
+
+        assert set(streams.pop_ready(scheduler, 10, set())) == {before, nodes["other"]}
+        scheduler.complete(before)
+        # the producer is handed out by the scheduler, but runs with its group
+        assert streams.pop_ready(scheduler, 10, {before}) == [(producer, consumer)]
+        assert streams.pop_ready(scheduler, 10, {before}) == []
+
+    def test_consumer_depending_on_producer_through_other_nodes(self, caplog):
+        test_pipeline = modular_pipeline(
+            [
+                node(produce, "count", ["chunks", "saved"]),
+                node(identity, "saved", "other"),
+                node(lambda *args: args, ["chunks", "other"], "out"),
+            ]
+        )
+        catalog = DataCatalog({"saved": MemoryDataset()})
+        streams = _StreamGroups(test_pipeline, catalog, max_chunks=1)
+        assert not streams.data_sets
+        assert "Not streaming ['chunks']" in caplog.text
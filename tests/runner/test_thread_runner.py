@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import pandas as pd
 import pytest
 
 from kedro.framework.hooks import _create_hook_manager
 from kedro.io import AbstractDataSet, DataCatalog, DatasetError, MemoryDataset
 from kedro.pipeline import node
 from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
-from kedro.runner import ThreadRunner
+from kedro.runner import MemoryBudget, NodeCache, NodeTimings, ThreadRunner
 from tests.runner.conftest import exception_fn, identity, return_none, sink, source
 
 
@@ -38,6 +40,14 @@ class TestValidThreadRunner:
         assert "Z" in result
         assert result["Z"] == ("42", "42", "42")
 
+    def test_own_transcoded_output(self):
+        test_pipeline = modular_pipeline([node(identity, "ds@pandas", "ds@spark")])
+        catalog = DataCatalog(
+            {"ds@pandas": MemoryDataset(42), "ds@spark": MemoryDataset()}
+        )
+        # the node is scheduled although it loads its own output
+        assert ThreadRunner().run(test_pipeline, catalog) == {}
+
 
 class TestMaxWorkers:
     @pytest.mark.parametrize(
@@ -80,6 +90,258 @@ class TestMaxWorkers:
             ThreadRunner(max_workers=-1)
 
 
+class TestScheduler:
+    def test_unknown_scheduler(self):
+        with pytest.raises(ValueError, match="Unknown scheduler 'fastest'"):
+            ThreadRunner(scheduler="fastest")
+
+    def test_critical_path(self, fan_out_fan_in, catalog, tmp_path):
+        catalog.add_feed_dict({"A": 42})
+        filepath = tmp_path / "node_timings.json"
+        runner = ThreadRunner(
+            scheduler="critical-path", node_timings=NodeTimings(filepath)
+        )
+        result = runner.run(fan_out_fan_in, catalog)
+        assert result == {"Z": (42, 42, 42)}
+        durations = NodeTimings(filepath).durations
+        assert set(durations) == {n.name for n in fan_out_fan_in.nodes}
+
+    def test_timings_saved_on_failure(self, fan_out_fan_in, catalog, tmp_path):
+        catalog.add_feed_dict({"A": 42})
+        pipeline = modular_pipeline([fan_out_fan_in, node(exception_fn, "Z", "X")])
+        filepath = tmp_path / "node_timings.json"
+        runner = ThreadRunner(node_timings=NodeTimings(filepath))
+        with pytest.raises(Exception, match="test exception"):
+            runner.run(pipeline, catalog)
+        assert "fan_in([C,D,E]) -> [Z]" in NodeTimings(filepath).durations
+
+
+class TestTransferOwnership:
+    def test_transfer_to_last_consumer(self):
+        produced, received = [], {}
+
+        def produce(arg):
+            produced.append([arg])
+            return produced[-1]
+
+        def record(name):
+            def func(arg):
+                received[name] = arg
+                return arg
+
+            return func
+
+        test_pipeline = modular_pipeline(
+            [
+                node(produce, "A", "B", name="produce"),
+                node(record("first"), "B", "C", name="first"),
+                node(record("second"), "B", "D", name="second"),
+            ]
+        )
+        catalog = DataCatalog(feed_dict={"A": 1})
+        result = ThreadRunner(transfer_ownership=True).run(test_pipeline, catalog)
+
+        assert result == {"C": [1], "D": [1]}
+        # the last consumer receives the data produced, the other a copy
+        assert [data is produced[0] for data in received.values()].count(True) == 1
+        # the outputs of the pipeline are handed over without a copy
+        assert result["C"] is received["first"]
+        assert result["D"] is received["second"]
+
+    def test_not_copied(self, mocker):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="second"),
+            ]
+        )
+        data = pd.DataFrame({"col": [1, 2]})
+        catalog = DataCatalog(feed_dict={"A": data})
+        copy = mocker.spy(pd.DataFrame, "copy")
+        result = ThreadRunner(transfer_ownership=True).run(test_pipeline, catalog)
+
+        # only the free input registered in the catalog is copied
+        assert copy.call_count == 1
+        assert result["C"].equals(data)
+
+
+class TestMaxMemory:
+    def test_spill(self, caplog):
+        test_pipeline = modular_pipeline(
+            [
+                node(lambda x: (x, x), "A", ["B", "C"], name="split"),
+                node(identity, "B", "D", name="first"),
+                node(lambda *args: b"".join(args), ["C", "D"], "E", name="second"),
+            ]
+        )
+        catalog = DataCatalog(feed_dict={"A": b"x" * 1000})
+        result = ThreadRunner(max_memory=1500).run(test_pipeline, catalog)
+
+        assert result == {"E": b"x" * 2000}
+        assert "Spilled 'C' to disk to stay within the memory budget." in caplog.text
+
+    def test_hold_back_nodes_over_budget(self, mocker):
+        mocker.patch.object(MemoryBudget, "can_start", return_value=False)
+        running, peak = [], []
+
+        def track(arg):
+            running.append(arg)
+            peak.append(len(running))
+            time.sleep(0.01)
+            running.remove(arg)
+            return arg
+
+        test_pipeline = modular_pipeline(
+            [node(track, "A", f"out_{i}") for i in range(3)]
+        )
+        catalog = DataCatalog(feed_dict={"A": 42})
+        result = ThreadRunner(max_workers=3, max_memory="1GB").run(
+            test_pipeline, catalog
+        )
+        assert result == {f"out_{i}": 42 for i in range(3)}
+        assert max(peak) == 1
+
+
+class TestNodeCache:
+    def test_restore_unchanged_nodes(self, fan_out_fan_in, tmp_path, mocker):
+        runner = ThreadRunner(node_cache=NodeCache(tmp_path))
+
+        def run():
+            return runner.run(fan_out_fan_in, DataCatalog(feed_dict={"A": 42}))
+
+        assert run() == {"Z": (42, 42, 42)}
+        node_run = mocker.patch("kedro.pipeline.node.Node.run")
+        assert run() == {"Z": (42, 42, 42)}
+        node_run.assert_not_called()
+
+
+def produce(count):
+    yield from range(count)
+
+
+def produce_pairs(count):
+    for i in range(count):
+        yield i, -i
+
+
+def total(chunks):
+    return sum(chunks)
+
+
+def first_chunk(chunks):
+    return next(iter(chunks))
+
+
+def failing_consumer(chunks):
+    next(iter(chunks))
+    raise ValueError("consumer failed")
+
+
+def failing_producer(count):
+    yield count
+    raise ValueError("producer failed")
+
+
+class TestStreaming:
+    def test_producer_and_consumer_interleave(self):
+        log = []
+
+        def logged_produce(count):
+            for i in produce(count):
+                log.append(("produced", i))
+                yield i
+
+        def logged_total(chunks):
+            for chunk in chunks:
+                log.append(("consumed", chunk))
+            return len(log)
+
+        test_pipeline = modular_pipeline(
+            [
+                node(logged_produce, "count", "chunks"),
+                node(logged_total, "chunks", "total"),
+            ]
+        )
+        catalog = DataCatalog({"count": MemoryDataset(10)})
+        result = ThreadRunner(stream_buffer=1).run(test_pipeline, catalog)
+
+        assert result == {"total": 20}
+        assert log.index(("consumed", 0)) < log.index(("produced", 9))
+        # the producer is never ahead of the consumer by more than the chunk
+        # in the buffer, the one being saved and the one being produced
+        ahead = 0
+        for event, _ in log:
+            ahead += 1 if event == "produced" else -1
+            assert ahead <= 3
+
+    def test_fan_out_and_chain(self):
+        test_pipeline = modular_pipeline(
+            [
+                node(produce, "count", "chunks"),
+                node(produce_pairs, "count", ["pos", "neg"]),
+                node(total, "chunks", "total"),
+                node(total, "pos", "pos_total"),
+                node(total, "neg", "neg_total"),
+                node(first_chunk, "chunks", "first"),
+            ]
+        )
+        catalog = DataCatalog({"count": MemoryDataset(5)})
+        result = ThreadRunner(max_workers=1, stream_buffer=2).run(
+            test_pipeline, catalog
+        )
+        assert result == {"total": 10, "pos_total": 10, "neg_total": -10, "first": 0}
+
+    def test_persisted_outputs_saved_per_chunk(self, mocker):
+        chunks = LoggingDataset([], "chunks")
+        save = mocker.spy(chunks, "_save")
+        catalog = DataCatalog({"count": MemoryDataset(3), "chunks": chunks})
+        test_pipeline = modular_pipeline(
+            [node(produce, "count", "chunks"), node(identity, "chunks", "last")]
+        )
+        result = ThreadRunner(stream_buffer=1).run(test_pipeline, catalog)
+        assert [call.args for call in save.call_args_list] == [(0,), (1,), (2,)]
+        assert result == {"last": 2}
+
+    def test_not_streamed_without_buffer(self):
+        test_pipeline = modular_pipeline(
+            [node(produce, "count", "chunks"), node(identity, "chunks", "last")]
+        )
+        catalog = DataCatalog({"count": MemoryDataset(3)})
+        assert ThreadRunner().run(test_pipeline, catalog) == {"last": 2}
+
+    @pytest.mark.parametrize(
+        "consumer,producer,error",
+        [
+            (failing_consumer, produce, "consumer failed"),
+            (total, failing_producer, "producer failed"),
+        ],
+    )
+    def test_failure(self, consumer, producer, error):
+        test_pipeline = modular_pipeline(
+            [node(producer, "count", "chunks"), node(consumer, "chunks", "out")]
+        )
+        catalog = DataCatalog({"count": MemoryDataset(100)})
+        with pytest.raises(ValueError, match=error):
+            ThreadRunner(stream_buffer=1).run(test_pipeline, catalog)
+
+    def test_consumer_depending_on_producer(self, caplog):
+        test_pipeline = modular_pipeline(
+            [
+                node(produce_pairs, "count", ["chunks", "other"]),
+                node(identity, "other", "last"),
+                node(lambda *args: args, ["chunks", "last"], "out"),
+            ]
+        )
+        catalog = DataCatalog({"count": MemoryDataset(3)})
+        result = ThreadRunner(stream_buffer=1).run(test_pipeline, catalog)
+        assert "Not streaming ['chunks', 'other']" in caplog.text
+        assert result == {"out": (2, -2)}
+
+    def test_invalid_stream_buffer(self):
+        with pytest.raises(ValueError, match="stream_buffer should be positive"):
+            ThreadRunner(stream_buffer=0)
+
+
 class TestIsAsync:
     def test_thread_run(self, fan_out_fan_in, catalog):
         catalog.add_feed_dict({"A": 42})
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from kedro.framework.hooks import _create_hook_manager
+from kedro.io import DataCatalog, DatasetError, LambdaDataset, MemoryDataset
+from kedro.pipeline import node
+from kedro.pipeline.modular_pipeline import pipeline as modular_pipeline
+from kedro.runner import ExecutionPlan, WriteBehind
+from tests.runner.conftest import identity
+
+
+class BlockingDataset(LambdaDataset):
+    def __init__(self, release=None, error=None):
+        self.saved = []
+        self._release_event = release
+
+        def save(data):
+            if self._release_event is not None:
+                self._release_event.wait(5)
+            if error is not None:
+                raise error
+            self.saved.append(data)
+
+        super().__init__(load=lambda: self.saved[-1], save=save)
+
+
+@pytest.fixture
+def test_pipeline():
+    return modular_pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="second"),
+            node(identity, "C", "D", name="third"),
+        ]
+    )
+
+
+@pytest.fixture
+def hook_manager(mocker):
+    hook_manager = _create_hook_manager()
+    mocker.patch.object(hook_manager.hook, "after_dataset_saved")
+    return hook_manager
+
+
+def start(writer, test_pipeline, catalog, hook_manager):
+    plan = ExecutionPlan.from_pipeline(test_pipeline)
+    writer.start(plan, catalog, hook_manager)
+    return {n.name: n for n in plan.nodes}
+
+
+class TestWriteBehind:
+    def test_data_sets(self, test_pipeline, hook_manager):
+        catalog = DataCatalog(
+            {
+                "A": BlockingDataset(),
+                "B": BlockingDataset(),
+                "C": MemoryDataset(),
+                "D": BlockingDataset(),
+            }
+        )
+        writer = WriteBehind()
+        start(writer, test_pipeline, catalog, hook_manager)
+        assert writer.data_sets == {"B", "D"}
+        writer.close()
+
+    def test_transcoded_data_sets(self, hook_manager):
+        test_pipeline = modular_pipeline(
+            [
+                node(identity, "A", "B@w", name="first"),
+                node(identity, "B@r", "C@w", name="second"),
+                node(identity, "C@w", "D", name="third"),
+            ]
+        )
+        catalog = DataCatalog(
+            {name: BlockingDataset() for name in ["A", "B@w", "B@r", "C@w", "D"]}
+        )
+        writer = WriteBehind()
+        start(writer, test_pipeline, catalog, hook_manager)
+        # 'B@w' is loaded as 'B@r', so it is saved before 'second' runs
+        assert writer.data_sets == {"C@w", "D"}
+        writer.close()
+
+    def test_save_in_background(self, test_pipeline, hook_manager):
+        release = threading.Event()
+        catalog = DataCatalog({"B": BlockingDataset(release)})
+        writer = WriteBehind()
+        nodes = start(writer, test_pipeline, catalog, hook_manager)
+
+        data = [1]
+        writer.save(nodes["first"], "B", data)
+        writer.node_completed(nodes["first"])
+        # the nodes using the output load a copy of it while it is saved
+        assert writer.holds("B")
+        assert writer.load("B") == data
+        assert writer.load("B") is not data
+        assert writer.pop_persisted() == []
+        hook_manager.hook.after_dataset_saved.assert_not_called()
+
+        release.set()
+        assert writer.pop_persisted(wait_all=True) == [nodes["first"]]
+        assert catalog._data_sets["B"].saved == [data]
+        hook_manager.hook.after_dataset_saved.assert_called_once_with(
+            dataset_name="B", data=data, node=nodes["first"]
+        )
+        writer.raise_error()
+        writer.close()
+
+    def test_not_held_without_consumers(self, test_pipeline, hook_manager):
+        catalog = DataCatalog({"D": BlockingDataset()})
+        writer = WriteBehind()
+        nodes = start(writer, test_pipeline, catalog, hook_manager)
+        writer.save(nodes["third"], "D", 1)
+        assert not writer.holds("D")
+        writer.close()
+        assert catalog._data_sets["D"].saved == [1]
+
+    def test_release(self, test_pipeline, hook_manager):
+        catalog = DataCatalog({"B": BlockingDataset()})
+        writer = WriteBehind()
+        nodes = start(writer, test_pipeline, catalog, hook_manager)
+        writer.save(nodes["first"], "B", 1)
+        writer.release("B")
+        writer.release("B")
+        assert not writer.holds("B")
+        writer.close()
+
+    def test_failed_write(self, test_pipeline, hook_manager, caplog):
+        catalog = DataCatalog(
+            {
+                "B": BlockingDataset(error=ValueError("disk full")),
+                "C": BlockingDataset(),
+            }
+        )
+        writer = WriteBehind()
+        nodes = start(writer, test_pipeline, catalog, hook_manager)
+        for name, output in [("first", "B"), ("second", "C")]:
+            writer.save(nodes[name], output, 1)
+            writer.node_completed(nodes[name])
+
+        assert writer.pop_persisted(wait_all=True) == [nodes["second"]]
+        pattern = "Failed to save 'B', an output of node 'first'"
+        with pytest.raises(DatasetError, match=pattern) as exc_info:
+            writer.raise_error()
+        assert "disk full" in str(exc_info.value.__cause__)
+        assert pattern in caplog.text
+        writer.close()
+
+    def test_close_waits_for_writes(self, test_pipeline, hook_manager):
+        release = threading.Event()
+        catalog = DataCatalog({"B": BlockingDataset(release)})
+        writer = WriteBehind()
+        nodes = start(writer, test_pipeline, catalog, hook_manager)
+        writer.save(nodes["first"], "B", 1)
+
+        threading.Timer(0.1, release.set).start()
+        writer.close()
+        assert catalog._data_sets["B"].saved == [1]
+        assert not writer.holds("B")